@@ -0,0 +1,52 @@
+"""Add job claim/lease columns for multi-worker claiming.
+
+Revision ID: 0015_job_claim_lease
+Revises: 0014_snapshot_deduplication
+Create Date: 2026-10-18
+
+Adds:
+- archive_jobs.claimed_by (worker identity)
+- archive_jobs.claimed_at
+- archive_jobs.lease_expires_at (indexed; expired leases are reclaimable)
+
+This is required by:
+- Worker job claiming (FOR UPDATE SKIP LOCKED / compare-and-set)
+- recover-stale-jobs lease-expiry recovery
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0015_job_claim_lease"
+down_revision = "0014_snapshot_deduplication"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("archive_jobs", sa.Column("claimed_by", sa.String(length=255), nullable=True))
+    op.add_column(
+        "archive_jobs",
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "archive_jobs",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_archive_jobs_lease_expires_at",
+        "archive_jobs",
+        ["lease_expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_archive_jobs_lease_expires_at", table_name="archive_jobs")
+    op.drop_column("archive_jobs", "lease_expires_at")
+    op.drop_column("archive_jobs", "claimed_at")
+    op.drop_column("archive_jobs", "claimed_by")
@@ -0,0 +1,47 @@
+"""Add a trigram index on snapshots.normalized_url_group.
+
+Revision ID: 0016_snapshot_url_group_trgm
+Revises: 0015_job_claim_lease
+Create Date: 2026-10-18
+
+Adds:
+- ix_snapshots_normalized_url_group_trgm (GIN, gin_trgm_ops)
+
+This is required by:
+- Boolean/field search compilation: url: terms are matched with ILIKE on the
+  raw url and normalized_url_group columns, each served by a trigram index.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0016_snapshot_url_group_trgm"
+down_revision = "0015_job_claim_lease"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_snapshots_normalized_url_group_trgm",
+        "snapshots",
+        ["normalized_url_group"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"normalized_url_group": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_snapshots_normalized_url_group_trgm", table_name="snapshots")
@@ -0,0 +1,66 @@
+"""Add a precomputed search vocabulary for "did you mean" corrections.
+
+Revision ID: 0017_search_vocabulary
+Revises: 0016_snapshot_url_group_trgm
+Create Date: 2026-10-18
+
+Adds:
+- search_vocabulary (distinct title terms + document frequency)
+- ix_search_vocabulary_term_trgm (GIN, gin_trgm_ops; Postgres only)
+
+This is required by:
+- Search query correction: misspelled tokens are matched against this small
+  table instead of running word_similarity over every snapshot title.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0017_search_vocabulary"
+down_revision = "0016_snapshot_url_group_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_vocabulary",
+        sa.Column("term", sa.Text(), primary_key=True),
+        sa.Column(
+            "doc_freq",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_search_vocabulary_term_trgm",
+        "search_vocabulary",
+        ["term"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"term": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.drop_index("ix_search_vocabulary_term_trgm", table_name="search_vocabulary")
+    op.drop_table("search_vocabulary")
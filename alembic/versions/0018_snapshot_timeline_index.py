@@ -0,0 +1,40 @@
+"""Add a covering index for page-group capture timelines.
+
+Revision ID: 0018_snapshot_timeline_index
+Revises: 0017_search_vocabulary
+Create Date: 2026-10-18
+
+Adds:
+- ix_snapshots_timeline (source_id, normalized_url_group, capture_timestamp, id)
+  INCLUDE (status_code, job_id) on Postgres; a plain composite index
+  elsewhere. Title and URL are unbounded text and are left out so a long
+  capture cannot exceed the btree tuple size limit (~2704 bytes).
+
+This is required by:
+- GET /api/snapshots/{id}/timeline: ordered reads of a page group's captures
+  (plus its capture-count cache version for groups without a pages row).
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0018_snapshot_timeline_index"
+down_revision = "0017_search_vocabulary"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_snapshots_timeline",
+        "snapshots",
+        ["source_id", "normalized_url_group", "capture_timestamp", "id"],
+        unique=False,
+        postgresql_include=["status_code", "job_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_snapshots_timeline", table_name="snapshots")
@@ -0,0 +1,76 @@
+"""Add snapshots.is_html and the latest HTML capture to pages.
+
+Revision ID: 0019_snapshot_is_html
+Revises: 0018_snapshot_timeline_index
+Create Date: 2026-10-18
+
+Adds:
+- snapshots.is_html (bool, default false; backfilled from mime_type)
+- pages.latest_html_snapshot_id (FK snapshots.id, ON DELETE SET NULL)
+- pages.latest_html_capture_timestamp
+
+This is required by:
+- /api/snapshots/{id}/latest and the raw snapshot compare-live link: the
+  latest HTML capture of a page group is read from its pages row instead of
+  an ORDER BY ... LIMIT 1 scan with mime_type ILIKE filters.
+
+pages.latest_html_* stay NULL until `ha-backend rebuild-pages` runs (the API
+falls back to a snapshots query for groups without a value).
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0019_snapshot_is_html"
+down_revision = "0018_snapshot_timeline_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "snapshots",
+        sa.Column(
+            "is_html",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+    )
+    op.execute(
+        """
+        UPDATE snapshots
+        SET is_html = true
+        WHERE lower(mime_type) LIKE 'text/html%'
+           OR lower(mime_type) LIKE 'application/xhtml+xml%'
+        """
+    )
+
+    # Batch mode so SQLite can add the foreign key (table copy); Postgres
+    # gets plain ALTER TABLE statements.
+    with op.batch_alter_table("pages") as batch_op:
+        batch_op.add_column(
+            sa.Column("latest_html_snapshot_id", sa.Integer(), nullable=True),
+        )
+        batch_op.add_column(
+            sa.Column("latest_html_capture_timestamp", sa.DateTime(timezone=True), nullable=True),
+        )
+        batch_op.create_foreign_key(
+            "fk_pages_latest_html_snapshot_id_snapshots",
+            "snapshots",
+            ["latest_html_snapshot_id"],
+            ["id"],
+            ondelete="SET NULL",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("pages") as batch_op:
+        batch_op.drop_constraint("fk_pages_latest_html_snapshot_id_snapshots", type_="foreignkey")
+        batch_op.drop_column("latest_html_capture_timestamp")
+        batch_op.drop_column("latest_html_snapshot_id")
+    op.drop_column("snapshots", "is_html")
@@ -0,0 +1,45 @@
+"""Record which rules built each snapshots.search_vector.
+
+Revision ID: 0020_search_vector_version
+Revises: 0019_snapshot_is_html
+Create Date: 2026-10-18
+
+Adds:
+- snapshots.search_vector_version (int, nullable)
+
+Existing vectors were built with the 'simple' config for every field and are
+marked as version 1. Search keeps matching them with a 'simple' query, so
+stemmed (english/french) queries only apply to rows whose vector was built
+with the row's language; `ha-backend backfill-search-vector` rebuilds the
+version 1 rows.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0020_search_vector_version"
+down_revision = "0019_snapshot_is_html"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "snapshots",
+        sa.Column("search_vector_version", sa.Integer(), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE snapshots
+        SET search_vector_version = 1
+        WHERE search_vector IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("snapshots", "search_vector_version")
@@ -0,0 +1,5 @@
+"""
+Local performance benchmarks (not shipped; not part of the test suite).
+
+See ``bench/README.md`` for usage.
+"""
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+"""
+Diff two benchmark result files (e.g. from two commits).
+
+Prints per-key p50/p95/p99 (or stage ``seconds``) deltas and exits 1 when any
+p95 or stage time regressed by more than ``--threshold`` (relative) and
+``--min-ms`` (absolute).
+
+Usage:
+    python -m bench.compare bench/results/base.json bench/results/head.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _load(path: Path) -> dict[str, Any]:
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _iter_stats(report: dict[str, Any]) -> dict[tuple[str, str], dict[str, Any]]:
+    """
+    Flatten ``results`` into ``{(target, key): stats}`` for any benchmark whose
+    per-target payload has a ``latency`` (or ``stages``) mapping.
+    """
+    out: dict[tuple[str, str], dict[str, Any]] = {}
+    for target, payload in report.get("results", {}).items():
+        for section in ("latency", "stages"):
+            for key, stats in (payload.get(section) or {}).items():
+                out[(target, key)] = stats
+    return out
+
+
+def compare_reports(
+    base: dict[str, Any], head: dict[str, Any], *, threshold: float, min_ms: float
+) -> tuple[list[str], list[str]]:
+    """
+    Return (report lines, regression lines).
+    """
+    base_stats = _iter_stats(base)
+    head_stats = _iter_stats(head)
+    lines: list[str] = []
+    regressions: list[str] = []
+    for target_key in sorted(set(base_stats) | set(head_stats)):
+        label = "/".join(target_key)
+        b, h = base_stats.get(target_key), head_stats.get(target_key)
+        if b is None or h is None:
+            lines.append(f"{label:<40} {'only in head' if b is None else 'only in base'}")
+            continue
+        cells = []
+        for metric, scale in (("p50_ms", 1), ("p95_ms", 1), ("p99_ms", 1), ("seconds", 1000)):
+            if metric not in b or metric not in h:
+                continue
+            bv, hv = float(b[metric]) * scale, float(h[metric]) * scale
+            delta = (hv - bv) / bv if bv else 0.0
+            name = metric.split("_")[0] if scale == 1 else "ms"
+            cells.append(f"{name} {bv:8.2f} -> {hv:8.2f} ({delta:+.0%})")
+            if metric in ("p95_ms", "seconds") and delta > threshold and (hv - bv) > min_ms:
+                regressions.append(f"{label}: {name} {bv:.2f}ms -> {hv:.2f}ms ({delta:+.0%})")
+        lines.append(f"{label:<40} " + "  ".join(cells))
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Diff two benchmark JSON result files.")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative p95 slowdown.")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="Ignore smaller p95 deltas.")
+    args = parser.parse_args(argv)
+
+    base, head = _load(args.base), _load(args.head)
+    print(f"base {base.get('meta', {}).get('commit')}  head {head.get('meta', {}).get('commit')}")
+    lines, regressions = compare_reports(base, head, threshold=args.threshold, min_ms=args.min_ms)
+    for line in lines:
+        print(line)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
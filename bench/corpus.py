@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+"""
+Reproducible synthetic corpus for search benchmarks.
+
+Generates ``sources x groups x captures`` snapshots with realistic-looking
+titles/snippets (built from the golden query list so benchmark queries hit
+real terms), a skewed outlink graph, and then runs the same derived-table
+steps indexing does (pages, page signals, search vocabulary, and Postgres
+search vectors). The same ``CorpusSpec`` always produces the same rows.
+"""
+
+import hashlib
+import os
+import random
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+QUERIES_PATH = REPO_ROOT / "scripts" / "search-eval-queries.txt"
+
+_SECTIONS = ["services", "news", "guidance", "programs", "publications", "corporate"]
+_AUDIENCES = ["health professionals", "the public", "employers", "schools", "travellers"]
+_FACETS = ["guidance", "symptoms and treatment", "prevention and risks", "data and surveillance"]
+_FR_TOPICS = ["grippe", "variole simienne", "vaccin covid", "sante mentale", "rougeole"]
+_FR_FACETS = ["conseils", "symptomes et traitement", "prevention et risques"]
+_FILLER = (
+    "This page provides information from the Government of Canada. "
+    "Content is updated regularly as new evidence becomes available."
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    sources: int = 3
+    groups_per_source: int = 200
+    captures_per_group: int = 3
+    max_outlinks: int = 8
+    french_share: float = 0.25
+    seed: int = 1234
+
+    @property
+    def snapshots(self) -> int:
+        return self.sources * self.groups_per_source * self.captures_per_group
+
+
+@dataclass(frozen=True)
+class CorpusStats:
+    spec: dict[str, Any]
+    snapshots: int
+    outlinks: int
+    pages: int
+    vocabulary_terms: int
+
+
+def load_query_terms(path: Path = QUERIES_PATH) -> list[str]:
+    """
+    Read the golden query list (one per line; blank lines and ``#`` ignored).
+    """
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _slug(text: str) -> str:
+    return "-".join("".join(ch if ch.isalnum() else " " for ch in text.lower()).split())
+
+
+def _title(rng: random.Random, topic: str, *, french: bool) -> str:
+    if french:
+        return f"{topic.capitalize()} : {rng.choice(_FR_FACETS)}"
+    template = rng.choice(
+        [
+            "{topic}: {facet}",
+            "{topic} - information for {audience}",
+            "About {topic}",
+            "{topic} {facet} for {audience}",
+        ]
+    )
+    return template.format(
+        topic=topic[:1].upper() + topic[1:],
+        facet=rng.choice(_FACETS),
+        audience=rng.choice(_AUDIENCES),
+    )
+
+
+def _snippet(rng: random.Random, topic: str, related: str) -> str:
+    return f"Learn about {topic} and {related}. {_FILLER}"
+
+
+def open_bench_database(database_url: str, *, reset: bool = True) -> None:
+    """
+    Point ha_backend at ``database_url`` and make sure the schema exists.
+
+    SQLite uses ``create_all``; Postgres runs ``alembic upgrade head`` so the
+    benchmark sees the production indexes (GIN/trigram).
+    """
+    from ha_backend import db as db_module
+    from ha_backend.db import Base, get_engine
+
+    os.environ["HEALTHARCHIVE_DATABASE_URL"] = database_url
+    db_module._engine = None
+    db_module._SessionLocal = None
+    engine = get_engine()
+
+    if engine.dialect.name == "postgresql":
+        if reset:
+            with engine.begin() as conn:
+                conn.exec_driver_sql("DROP SCHEMA public CASCADE")
+                conn.exec_driver_sql("CREATE SCHEMA public")
+        subprocess.run(  # nosec: B603 - trusted local command
+            [sys.executable, "-m", "alembic", "upgrade", "head"],
+            cwd=str(REPO_ROOT),
+            env=os.environ.copy(),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return
+
+    if database_url.startswith("sqlite:///"):
+        Path(database_url.removeprefix("sqlite:///")).parent.mkdir(parents=True, exist_ok=True)
+    if reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def _backfill_search_vectors(session: Session) -> None:
+    from ha_backend.models import Snapshot
+    from ha_backend.search import build_search_vector, language_partitions
+
+    for language, _config, language_filter in language_partitions(Snapshot.language):
+        session.execute(
+            update(Snapshot)
+            .where(language_filter)
+            .values(
+                search_vector=build_search_vector(
+                    Snapshot.title, Snapshot.snippet, Snapshot.url, language=language
+                )
+            )
+        )
+
+
+def generate_corpus(session: Session, spec: CorpusSpec) -> CorpusStats:
+    """
+    Insert the synthetic corpus described by ``spec`` and build derived tables.
+    """
+    from ha_backend.authority import recompute_page_signals
+    from ha_backend.models import Page, Snapshot, SnapshotOutlink, Source
+    from ha_backend.pages import rebuild_pages
+    from ha_backend.search_vocabulary import rebuild_search_vocabulary
+
+    rng = random.Random(spec.seed)
+    topics = load_query_terms()
+    base_ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    groups: list[str] = []
+    snapshot_rows: list[dict[str, Any]] = []
+    for s in range(spec.sources):
+        code = f"bench{s}"
+        source = Source(code=code, name=f"Benchmark source {s}", enabled=True)
+        session.add(source)
+        session.flush()
+        domain = f"www.bench{s}.example.ca"
+
+        for g in range(spec.groups_per_source):
+            french = rng.random() < spec.french_share
+            lang = "fr" if french else "en"
+            topic = rng.choice(_FR_TOPICS if french else topics)
+            section = rng.choice(_SECTIONS)
+            # Shallow hub pages are rarer than deep leaf pages.
+            depth = 1 + min(4, int(rng.expovariate(0.6)))
+            path = "/".join([section] + [f"{_slug(topic)}-{g}"] + ["detail"] * (depth - 1))
+            group = f"https://{domain}/{lang}/{path}.html"
+            groups.append(group)
+            title = _title(rng, topic, french=french)
+            snippet = _snippet(rng, topic, rng.choice(topics))
+
+            for c in range(spec.captures_per_group):
+                capture_ts = base_ts + timedelta(days=30 * c + rng.randint(0, 20), hours=g % 24)
+                # Most recaptures are unchanged; some pages get edited over time.
+                revision = c if rng.random() < 0.3 else 0
+                roll = rng.random()
+                status = 404 if roll < 0.03 else 301 if roll < 0.05 else 200
+                url = group if rng.random() < 0.8 else f"{group}?utm_source=bench&v={c}"
+                snapshot_rows.append(
+                    {
+                        "job_id": None,
+                        "source_id": source.id,
+                        "url": url,
+                        "normalized_url_group": group,
+                        "capture_timestamp": capture_ts,
+                        "mime_type": "text/html",
+                        "status_code": status,
+                        "title": title if revision == 0 else f"{title} (updated)",
+                        "snippet": snippet,
+                        "language": lang,
+                        "warc_path": f"/bench/{code}/capture-{c}.warc.gz",
+                        "warc_record_id": f"urn:uuid:bench-{s}-{g}-{c}",
+                        "content_hash": hashlib.sha256(f"{group}|{revision}".encode()).hexdigest(),
+                    }
+                )
+
+    snapshot_ids = list(
+        session.scalars(
+            insert(Snapshot).returning(Snapshot.id, sort_by_parameter_order=True),
+            snapshot_rows,
+        )
+    )
+
+    outlink_rows: list[dict[str, Any]] = []
+    for snapshot_id, row in zip(snapshot_ids, snapshot_rows):
+        targets: set[str] = set()
+        for _ in range(rng.randint(0, spec.max_outlinks)):
+            # Cubing the uniform draw skews links towards a few hub groups.
+            target = groups[int(len(groups) * rng.random() ** 3)]
+            if target != row["normalized_url_group"]:
+                targets.add(target)
+        outlink_rows.extend(
+            {"snapshot_id": snapshot_id, "to_normalized_url_group": t} for t in sorted(targets)
+        )
+    if outlink_rows:
+        session.execute(insert(SnapshotOutlink), outlink_rows)
+
+    session.flush()
+    rebuild_pages(session)
+    recompute_page_signals(session)
+    vocab = rebuild_search_vocabulary(session)
+    if session.get_bind().dialect.name == "postgresql":
+        _backfill_search_vectors(session)
+    session.commit()
+
+    if session.get_bind().dialect.name == "postgresql":
+        session.connection().exec_driver_sql("ANALYZE")
+        session.commit()
+
+    return CorpusStats(
+        spec=asdict(spec),
+        snapshots=len(snapshot_ids),
+        outlinks=len(outlink_rows),
+        pages=int(session.query(Page).count()),
+        vocabulary_terms=vocab.terms,
+    )
+
+
+__all__ = [
+    "CorpusSpec",
+    "CorpusStats",
+    "generate_corpus",
+    "load_query_terms",
+    "open_bench_database",
+]
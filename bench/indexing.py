@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+"""
+Indexing throughput benchmark.
+
+Generates synthetic WARCs (``bench/warcgen.py``), runs the real ``index_job``
+against them with per-stage timers, and separately times the building blocks
+(``iter_html_records``, text extraction, full ``recompute_page_signals``).
+
+Reports records/s, MB/s, peak RSS and a per-stage breakdown:
+
+- ``decompress``: gzip inflate of the WARC bytes (measured in a separate pass
+  and attributed out of ``read``).
+- ``parse``: WARC/HTTP record parsing in ``iter_html_records`` (read minus
+  decompress).
+- ``cdxj``: per-WARC CDXJ shard building.
+- ``extract``: title/text/snippet/language/outlink extraction.
+- ``map``: ``record_to_snapshot`` (and search vectors on Postgres).
+- ``db_write``: ORM flushes/commit (snapshot + outlink inserts, deletes).
+- ``pages_rebuild`` (incremental merge plus any re-index recompute), ``signals``,
+  ``vocabulary``, ``verify``, ``storage_stats``.
+- ``other``: everything not covered above.
+
+Usage:
+    python -m bench.indexing --records 5000 --output bench/results/indexing.json
+"""
+
+import argparse
+import gzip
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from unittest import mock
+
+from bench.corpus import REPO_ROOT, open_bench_database
+from bench.search_load import _git_commit, _redact
+from bench.warcgen import WarcGenStats, WarcSpec, write_synthetic_warcs
+
+DEFAULT_DATABASE_URL = f"sqlite:///{REPO_ROOT / 'bench' / '.data' / 'indexing.db'}"
+DEFAULT_WORK_DIR = REPO_ROOT / "bench" / ".data" / "indexing-job"
+DEFAULT_OUTPUT = REPO_ROOT / "bench" / "results" / "indexing.json"
+
+_EXTRACT_FUNCTIONS = (
+    "extract_title",
+    "extract_text",
+    "extract_content_text",
+    "make_snippet",
+    "detect_language",
+    "detect_is_archived",
+    "extract_outlink_groups",
+)
+
+
+@dataclass
+class StageClock:
+    """
+    Accumulates *self* time per stage; nested stages are excluded from their
+    parent so the breakdown sums to the measured total.
+    """
+
+    seconds: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    _stack: list[list[float]] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[0]
+            self.seconds[name] += elapsed - frame[1]
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.stage(name):
+                return fn(*args, **kwargs)
+
+        return timed
+
+    def wrap_iter(self, name: str, fn: Callable[..., Iterator[Any]]) -> Callable[..., Any]:
+        def timed(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            it = fn(*args, **kwargs)
+            while True:
+                with self.stage(name):
+                    try:
+                        item = next(it)
+                    except StopIteration:
+                        return
+                yield item
+
+        return timed
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _decompress_seconds(files: list[Path]) -> float:
+    started = time.perf_counter()
+    for path in files:
+        with gzip.open(path, "rb") as f:
+            while f.read(1 << 20):
+                pass
+    return time.perf_counter() - started
+
+
+@contextmanager
+def _instrument(clock: StageClock) -> Iterator[None]:
+    from sqlalchemy.orm import Session
+
+    import ha_backend.indexing.pipeline as pipeline
+    import ha_backend.pages as pages
+    import ha_backend.search as search
+    import ha_backend.search_vocabulary as search_vocabulary
+
+    class TimedCdxjShardBuilder(pipeline.CdxjShardBuilder):
+        def add(self, *args: Any, **kwargs: Any) -> Any:
+            with clock.stage("cdxj"):
+                return super().add(*args, **kwargs)
+
+        def write(self, *args: Any, **kwargs: Any) -> Any:
+            with clock.stage("cdxj"):
+                return super().write(*args, **kwargs)
+
+    with ExitStack() as stack:
+        patch = stack.enter_context
+
+        def wrap(target: Any, attr: str, stage: str) -> None:
+            patch(mock.patch.object(target, attr, clock.wrap(stage, getattr(target, attr))))
+
+        patch(
+            mock.patch.object(
+                pipeline,
+                "iter_html_records",
+                clock.wrap_iter("read", pipeline.iter_html_records),
+            )
+        )
+        patch(mock.patch.object(pipeline, "CdxjShardBuilder", TimedCdxjShardBuilder))
+        for name in _EXTRACT_FUNCTIONS:
+            wrap(pipeline, name, "extract")
+        wrap(pipeline, "record_to_snapshot", "map")
+        wrap(search, "build_search_vector", "map")
+        wrap(pipeline, "verify_warcs", "verify")
+        wrap(pipeline, "compute_job_storage_stats", "storage_stats")
+        wrap(pipeline, "recompute_page_signals", "signals")
+        wrap(pages, "rebuild_pages", "pages_rebuild")
+        wrap(pages, "merge_job_pages", "pages_rebuild")
+        wrap(pages, "discover_job_page_groups", "pages_rebuild")
+        wrap(search_vocabulary, "rebuild_search_vocabulary", "vocabulary")
+        wrap(search_vocabulary, "merge_job_search_vocabulary", "vocabulary")
+        wrap(Session, "flush", "db_write")
+        wrap(Session, "commit", "db_write")
+        yield
+
+
+def _create_job(work_dir: Path) -> int:
+    from ha_backend.db import get_session
+    from ha_backend.models import ArchiveJob, Source
+
+    with get_session() as session:
+        source = Source(code="bench", name="Benchmark", enabled=True)
+        session.add(source)
+        session.flush()
+        job = ArchiveJob(
+            source_id=source.id,
+            name="bench-indexing",
+            output_dir=str(work_dir),
+            status="completed",
+        )
+        session.add(job)
+        session.flush()
+        return int(job.id)
+
+
+def _time_components(files: list[Path]) -> dict[str, Any]:
+    """
+    Standalone timings for the indexing building blocks.
+    """
+    from ha_backend.indexing import text_extraction
+    from ha_backend.indexing.warc_reader import iter_html_records
+
+    started = time.perf_counter()
+    records = [rec for path in files for rec in iter_html_records(path)]
+    read_seconds = time.perf_counter() - started
+
+    extract: dict[str, float] = defaultdict(float)
+
+    def timed(name: str, *args: Any, **kwargs: Any) -> Any:
+        t0 = time.perf_counter()
+        try:
+            return getattr(text_extraction, name)(*args, **kwargs)
+        finally:
+            extract[name] += time.perf_counter() - t0
+
+    # Same call sequence as index_job, one function at a time.
+    for rec in records:
+        html = rec.body_bytes.decode("utf-8", errors="replace")
+        title = timed("extract_title", html)
+        text = timed("extract_text", html)
+        timed("make_snippet", text)
+        timed("detect_language", text, rec.headers)
+        timed("detect_is_archived", title, text)
+        timed("extract_content_text", html)
+        timed("extract_outlink_groups", html, base_url=rec.url)
+
+    body_mb = sum(len(rec.body_bytes) for rec in records) / (1024 * 1024)
+    return {
+        "iter_html_records": {
+            "seconds": round(read_seconds, 4),
+            "records": len(records),
+            "records_per_s": round(len(records) / read_seconds, 1) if read_seconds else None,
+            "html_mb_per_s": round(body_mb / read_seconds, 2) if read_seconds else None,
+        },
+        "extract_seconds": {name: round(sec, 4) for name, sec in extract.items()},
+    }
+
+
+def run_benchmark(
+    *,
+    database_url: str,
+    work_dir: Path,
+    spec: WarcSpec,
+    repeat: int = 1,
+    components: bool = True,
+) -> dict[str, Any]:
+    from ha_backend.authority import recompute_page_signals
+    from ha_backend.db import get_session
+    from ha_backend.indexing.pipeline import index_job
+
+    open_bench_database(database_url, reset=True)
+    warcs_dir = work_dir / "warcs"
+    for old in warcs_dir.glob("*.warc.gz") if warcs_dir.is_dir() else []:
+        old.unlink()
+    gen: WarcGenStats = write_synthetic_warcs(warcs_dir, spec)
+    job_id = _create_job(work_dir)
+
+    runs: list[dict[str, Any]] = []
+    decompress = _decompress_seconds(gen.files)
+    for _ in range(max(1, repeat)):
+        # Reindexing is idempotent; later runs also exercise the delete path.
+        for shard in (work_dir / "cdxj").glob("*") if (work_dir / "cdxj").is_dir() else []:
+            shard.unlink()
+        clock = StageClock()
+        with _instrument(clock):
+            started = time.perf_counter()
+            rc = index_job(job_id)
+            total = time.perf_counter() - started
+        if rc != 0:
+            raise RuntimeError(f"index_job({job_id}) failed with rc={rc}")
+
+        stages = dict(clock.seconds)
+        read = stages.pop("read", 0.0)
+        stages["decompress"] = min(decompress, read)
+        stages["parse"] = max(0.0, read - decompress)
+        stages["other"] = max(0.0, total - sum(stages.values()))
+        runs.append({"total": total, "stages": stages})
+
+    median_total = statistics.median(r["total"] for r in runs)
+    chosen = min(runs, key=lambda r: abs(r["total"] - median_total))
+    total = chosen["total"]
+
+    with get_session() as session:
+        t0 = time.perf_counter()
+        recompute_page_signals(session)
+        signals_full = time.perf_counter() - t0
+
+    results: dict[str, Any] = {
+        "index_job": {
+            "seconds": round(total, 4),
+            "runs_seconds": [round(r["total"], 4) for r in runs],
+            "records_per_s": round(gen.html_records / total, 1),
+            "warc_mb_per_s": round(gen.compressed_bytes / (1024 * 1024) / total, 2),
+            "html_mb_per_s": round(gen.html_body_bytes / (1024 * 1024) / total, 2),
+            "stages": {
+                name: {"seconds": round(sec, 4), "share": round(sec / total, 3)}
+                for name, sec in sorted(chosen["stages"].items(), key=lambda kv: -kv[1])
+            },
+        },
+        "recompute_page_signals_full": {"seconds": round(signals_full, 4)},
+    }
+    if components:
+        results["components"] = _time_components(gen.files)
+
+    return {
+        "benchmark": "indexing",
+        "meta": {
+            "commit": _git_commit(),
+            "createdAt": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "databaseUrl": _redact(database_url),
+            "warcSpec": asdict(spec),
+            "warcs": {
+                "files": len(gen.files),
+                "htmlRecords": gen.html_records,
+                "duplicateRecords": gen.duplicate_records,
+                "nonHtmlRecords": gen.non_html_records,
+                "compressedBytes": gen.compressed_bytes,
+                "htmlBodyBytes": gen.html_body_bytes,
+            },
+            "peakRssMb": _peak_rss_mb(),
+        },
+        "results": results,
+    }
+
+
+def _print_summary(report: dict[str, Any]) -> None:
+    idx = report["results"]["index_job"]
+    print(
+        f"index_job: {idx['seconds']}s  {idx['records_per_s']} records/s  "
+        f"{idx['warc_mb_per_s']} WARC MB/s  peak RSS {report['meta']['peakRssMb']} MB"
+    )
+    for name, stats in idx["stages"].items():
+        print(f"  {name:<14} {stats['seconds']:>9.3f}s  {stats['share']:>6.1%}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark index_job on synthetic WARCs.")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--work-dir", type=Path, default=DEFAULT_WORK_DIR)
+    parser.add_argument("--records", type=int, default=WarcSpec.records)
+    parser.add_argument("--warcs", type=int, default=WarcSpec.warcs)
+    parser.add_argument("--body-kb", type=float, default=WarcSpec.body_kb_median)
+    parser.add_argument("--body-sigma", type=float, default=WarcSpec.body_kb_sigma)
+    parser.add_argument("--complexity", type=int, default=WarcSpec.html_complexity)
+    parser.add_argument("--duplicate-ratio", type=float, default=WarcSpec.duplicate_ratio)
+    parser.add_argument("--links", type=int, default=WarcSpec.links_per_page)
+    parser.add_argument("--non-html-ratio", type=float, default=WarcSpec.non_html_ratio)
+    parser.add_argument("--seed", type=int, default=WarcSpec.seed)
+    parser.add_argument("--repeat", type=int, default=1, help="index_job runs (median reported).")
+    parser.add_argument("--no-components", action="store_true")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        database_url=args.database_url,
+        work_dir=args.work_dir,
+        spec=WarcSpec(
+            records=args.records,
+            warcs=args.warcs,
+            body_kb_median=args.body_kb,
+            body_kb_sigma=args.body_sigma,
+            html_complexity=args.complexity,
+            duplicate_ratio=args.duplicate_ratio,
+            links_per_page=args.links,
+            non_html_ratio=args.non_html_ratio,
+            seed=args.seed,
+        ),
+        repeat=args.repeat,
+        components=not args.no_components,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _print_summary(report)
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
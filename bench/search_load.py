@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+"""
+Search latency/throughput benchmark.
+
+Builds (or reuses) a synthetic corpus, replays a query mix derived from
+``scripts/search-eval-queries.txt`` and reports p50/p95/p99 per search mode
+and view, for two targets:
+
+- ``inner``: ``_search_snapshots_inner`` called directly (query planning + DB).
+- ``asgi``: the full FastAPI app over an in-process ASGI transport
+  (routing, validation, serialization, middleware), optionally concurrent.
+
+Usage:
+    python -m bench.search_load --output bench/results/search.json
+    python -m bench.search_load --database-url postgresql+psycopg://localhost/ha_bench \\
+        --groups 2000 --captures 4 --concurrency 8
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from bench.corpus import (
+    REPO_ROOT,
+    CorpusSpec,
+    generate_corpus,
+    load_query_terms,
+    open_bench_database,
+)
+
+DEFAULT_DATABASE_URL = f"sqlite:///{REPO_ROOT / 'bench' / '.data' / 'search.db'}"
+DEFAULT_OUTPUT = REPO_ROOT / "bench" / "results" / "search.json"
+
+
+@dataclass(frozen=True)
+class BenchRequest:
+    kind: str
+    params: dict[str, Any]
+
+    @property
+    def view(self) -> str:
+        return str(self.params.get("view", "snapshots"))
+
+    @property
+    def key(self) -> str:
+        return json.dumps(self.params, sort_keys=True)
+
+
+@dataclass
+class Sample:
+    kind: str
+    mode: str
+    view: str
+    seconds: float
+
+
+@dataclass
+class TargetRun:
+    samples: list[Sample] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+
+def _misspell(word: str) -> str:
+    # Drop one interior character: "influenza" -> "influnza".
+    mid = len(word) // 2
+    return word[:mid] + word[mid + 1 :]
+
+
+def build_query_mix(terms: list[str], *, url_samples: list[str], seed: int) -> list[BenchRequest]:
+    """
+    Expand golden queries into a mix covering every search mode and view.
+    """
+    rng = random.Random(seed)
+    mix: list[BenchRequest] = [
+        BenchRequest("browse", {}),
+        BenchRequest("browse_pages", {"view": "pages"}),
+    ]
+    for term in terms:
+        mix.append(BenchRequest("keyword", {"q": term}))
+        mix.append(BenchRequest("keyword_pages", {"q": term, "view": "pages"}))
+        mix.append(BenchRequest("keyword_newest", {"q": term, "sort": "newest"}))
+        words = term.split()
+        if len(words) > 1:
+            mix.append(BenchRequest("boolean", {"q": " OR ".join(words)}))
+        mix.append(BenchRequest("field", {"q": f"title:{words[0]}"}))
+        longest = max(words, key=len)
+        if len(longest) >= 6:
+            misspelled = term.replace(longest, _misspell(longest))
+            mix.append(BenchRequest("misspelled", {"q": misspelled}))
+    for _ in range(max(1, len(terms) // 10)):
+        mix.append(BenchRequest("deep_page", {"q": rng.choice(terms), "page": 5}))
+    for url in url_samples:
+        mix.append(BenchRequest("url", {"q": url}))
+    return mix
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100.0
+    lo = int(rank)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+def summarize(samples: list[Sample]) -> dict[str, dict[str, float | int]]:
+    """
+    Latency stats (milliseconds) keyed by ``"<mode>/<view>"`` plus ``"all"``.
+    """
+    groups: dict[str, list[float]] = {}
+    for s in samples:
+        groups.setdefault(f"{s.mode}/{s.view}", []).append(s.seconds)
+        groups.setdefault("all", []).append(s.seconds)
+    out: dict[str, dict[str, float | int]] = {}
+    for key in sorted(groups):
+        values = groups[key]
+        out[key] = {
+            "count": len(values),
+            "p50_ms": round(_percentile(values, 50) * 1000, 3),
+            "p95_ms": round(_percentile(values, 95) * 1000, 3),
+            "p99_ms": round(_percentile(values, 99) * 1000, 3),
+            "mean_ms": round(sum(values) / len(values) * 1000, 3),
+            "max_ms": round(max(values) * 1000, 3),
+        }
+    return out
+
+
+def run_inner(requests: list[BenchRequest], *, iterations: int) -> tuple[TargetRun, dict[str, str]]:
+    """
+    Time ``_search_snapshots_inner`` directly; also returns the mode per request.
+    """
+    from ha_backend.api.routes_public import SearchSort, SearchView, _search_snapshots_inner
+    from ha_backend.db import get_session
+
+    run = TargetRun()
+    modes: dict[str, str] = {}
+    started = time.perf_counter()
+    with get_session() as db:
+        for _ in range(iterations):
+            for req in requests:
+                params = req.params
+                t0 = time.perf_counter()
+                _, mode = _search_snapshots_inner(
+                    q=params.get("q"),
+                    source=None,
+                    sort=SearchSort(params["sort"]) if "sort" in params else None,
+                    view=SearchView(params["view"]) if "view" in params else None,
+                    includeNon2xx=False,
+                    includeDuplicates=False,
+                    from_date=None,
+                    to_date=None,
+                    page=int(params.get("page", 1)),
+                    pageSize=20,
+                    ranking=None,
+                    db=db,
+                )
+                elapsed = time.perf_counter() - t0
+                # The fuzzy path uses SET LOCAL; end the transaction like a request would.
+                db.rollback()
+                modes[req.key] = mode
+                run.samples.append(Sample(req.kind, mode, req.view, elapsed))
+    run.wall_seconds = time.perf_counter() - started
+    return run, modes
+
+
+def run_asgi(
+    requests: list[BenchRequest],
+    *,
+    iterations: int,
+    concurrency: int,
+    modes: dict[str, str],
+) -> TargetRun:
+    """
+    Time full ``GET /api/search`` requests through the ASGI app.
+    """
+    from fastapi.testclient import TestClient
+
+    from ha_backend.api import app
+    from ha_backend.rate_limiting import limiter
+
+    # httpx logs every request at INFO; keep benchmark output readable.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    run = TargetRun()
+    work = [req for _ in range(iterations) for req in requests]
+
+    limiter_was_enabled = limiter.enabled
+    limiter.enabled = False
+    try:
+        with TestClient(app) as client:
+            run.samples, run.wall_seconds = _replay(client, work, concurrency, modes)
+    finally:
+        limiter.enabled = limiter_was_enabled
+    return run
+
+
+def _replay(
+    client: Any, work: list[BenchRequest], concurrency: int, modes: dict[str, str]
+) -> tuple[list[Sample], float]:
+    def one(req: BenchRequest) -> Sample:
+        t0 = time.perf_counter()
+        resp = client.get("/api/search", params=req.params)
+        elapsed = time.perf_counter() - t0
+        if resp.status_code != 200:
+            raise RuntimeError(f"{req.params} -> HTTP {resp.status_code}: {resp.text[:200]}")
+        return Sample(req.kind, modes.get(req.key, "unknown"), req.view, elapsed)
+
+    started = time.perf_counter()
+    if concurrency <= 1:
+        samples = [one(req) for req in work]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(one, work))
+    return samples, time.perf_counter() - started
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(  # nosec: B603,B607 - trusted local command
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(REPO_ROOT),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _redact(database_url: str) -> str:
+    from sqlalchemy.engine import make_url
+
+    return make_url(database_url).render_as_string(hide_password=True)
+
+
+def run_benchmark(
+    *,
+    database_url: str,
+    spec: CorpusSpec,
+    reuse_corpus: bool,
+    targets: list[str],
+    iterations: int,
+    concurrency: int,
+    max_queries: int | None = None,
+) -> dict[str, Any]:
+    from ha_backend.db import get_session
+    from ha_backend.models import Page
+
+    os.environ.setdefault("HEALTHARCHIVE_RATE_LIMITING_ENABLED", "0")
+    open_bench_database(database_url, reset=not reuse_corpus)
+
+    corpus: dict[str, Any]
+    with get_session() as session:
+        if reuse_corpus:
+            corpus = {"reused": True}
+        else:
+            corpus = asdict(generate_corpus(session, spec))
+        url_samples = [
+            row[0]
+            for row in session.query(Page.normalized_url_group)
+            .order_by(Page.id)
+            .limit(max(1, spec.sources * 2))
+            .all()
+        ]
+        dialect = session.get_bind().dialect.name
+
+    terms = load_query_terms()[:max_queries] if max_queries else load_query_terms()
+    requests = build_query_mix(terms, url_samples=url_samples, seed=spec.seed)
+
+    # Warm caches (table-existence checks, correction cache, DB buffers) once.
+    _, modes = run_inner(requests, iterations=1)
+
+    results: dict[str, Any] = {}
+    if "inner" in targets:
+        inner, modes = run_inner(requests, iterations=iterations)
+        results["inner"] = {
+            "wall_seconds": round(inner.wall_seconds, 3),
+            "requests": len(inner.samples),
+            "latency": summarize(inner.samples),
+        }
+    if "asgi" in targets:
+        asgi = run_asgi(requests, iterations=iterations, concurrency=concurrency, modes=modes)
+        results["asgi"] = {
+            "wall_seconds": round(asgi.wall_seconds, 3),
+            "requests": len(asgi.samples),
+            "concurrency": concurrency,
+            "throughput_rps": round(len(asgi.samples) / asgi.wall_seconds, 2)
+            if asgi.wall_seconds
+            else None,
+            "latency": summarize(asgi.samples),
+        }
+
+    return {
+        "benchmark": "search",
+        "meta": {
+            "commit": _git_commit(),
+            "createdAt": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "dialect": dialect,
+            "databaseUrl": _redact(database_url),
+            "iterations": iterations,
+            "queryMixSize": len(requests),
+            "corpus": corpus,
+        },
+        "results": results,
+    }
+
+
+def _print_summary(report: dict[str, Any]) -> None:
+    for target, payload in report["results"].items():
+        print(f"[{target}] {payload['requests']} request(s) in {payload['wall_seconds']}s")
+        for key, stats in payload["latency"].items():
+            print(
+                f"  {key:<32} n={stats['count']:<5} p50={stats['p50_ms']:>8.2f}ms "
+                f"p95={stats['p95_ms']:>8.2f}ms p99={stats['p99_ms']:>8.2f}ms"
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0] if __doc__ else None)
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--sources", type=int, default=CorpusSpec.sources)
+    parser.add_argument("--groups", type=int, default=CorpusSpec.groups_per_source)
+    parser.add_argument("--captures", type=int, default=CorpusSpec.captures_per_group)
+    parser.add_argument("--seed", type=int, default=CorpusSpec.seed)
+    parser.add_argument(
+        "--reuse-corpus",
+        action="store_true",
+        help="Benchmark the existing database instead of regenerating the corpus.",
+    )
+    parser.add_argument("--targets", default="inner,asgi", help="Comma list: inner,asgi.")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument(
+        "--max-queries", type=int, default=None, help="Only use the first N golden queries."
+    )
+    parser.add_argument("--concurrency", type=int, default=1, help="ASGI worker threads.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        database_url=args.database_url,
+        spec=CorpusSpec(
+            sources=args.sources,
+            groups_per_source=args.groups,
+            captures_per_group=args.captures,
+            seed=args.seed,
+        ),
+        reuse_corpus=args.reuse_corpus,
+        targets=[t.strip() for t in args.targets.split(",") if t.strip()],
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        max_queries=args.max_queries,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _print_summary(report)
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
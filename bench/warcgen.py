@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+"""
+Synthetic WARC generator for indexing benchmarks.
+
+Writes gzipped WARCs (request + response pairs, like a real crawl) whose HTML
+pages have a configurable size distribution, markup complexity, link density,
+duplicate ratio and share of non-HTML records. The same ``WarcSpec`` always
+produces byte-identical files.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from html import escape
+from io import BytesIO
+from pathlib import Path
+
+from warcio.warcwriter import WARCWriter
+
+from bench.corpus import load_query_terms
+
+_WORDS = (
+    "health canada public guidance vaccine risk program information services "
+    "children adults symptoms treatment prevention report data provinces "
+    "territories update policy research safety travel food water air"
+).split()
+_FR_WORDS = (
+    "sante canada publique conseils vaccin risque programme information services "
+    "enfants adultes symptomes traitement prevention rapport donnees"
+).split()
+
+
+@dataclass(frozen=True)
+class WarcSpec:
+    records: int = 2000
+    warcs: int = 2
+    # Lognormal HTML body size: median in KiB and sigma of the underlying normal.
+    body_kb_median: float = 24.0
+    body_kb_sigma: float = 0.6
+    # Nesting depth / number of content sections per page.
+    html_complexity: int = 6
+    duplicate_ratio: float = 0.2
+    links_per_page: int = 40
+    non_html_ratio: float = 0.1
+    french_share: float = 0.25
+    seed: int = 4321
+
+
+@dataclass(frozen=True)
+class WarcGenStats:
+    files: list[Path]
+    html_records: int
+    duplicate_records: int
+    non_html_records: int
+    compressed_bytes: int
+    html_body_bytes: int
+
+
+def _sentence(rng: random.Random, words: list[str]) -> str:
+    picked = [rng.choice(words) for _ in range(rng.randint(8, 18))]
+    return (" ".join(picked)).capitalize() + "."
+
+
+def _page_html(
+    rng: random.Random,
+    spec: WarcSpec,
+    *,
+    title: str,
+    lang: str,
+    link_targets: list[str],
+    target_bytes: int,
+) -> bytes:
+    words = _FR_WORDS if lang == "fr" else _WORDS
+    nav = "".join(
+        f'<li><a href="{escape(url)}">{escape(rng.choice(words))}</a></li>'
+        for url in link_targets[: max(1, len(link_targets) // 4)]
+    )
+    body_links = link_targets[len(link_targets) // 4 :]
+    parts = [
+        f'<!DOCTYPE html><html lang="{lang}"><head><meta charset="utf-8">',
+        f"<title>{escape(title)}</title>",
+        "<style>body{font-family:sans-serif}</style>",
+        "<script>window.dataLayer=window.dataLayer||[];</script></head><body>",
+        f"<header><nav><ul>{nav}</ul></nav></header><main><h1>{escape(title)}</h1>",
+    ]
+    size = sum(len(p) for p in parts)
+    section = 0
+    while size < target_bytes:
+        depth = 1 + section % max(1, spec.html_complexity)
+        opening = "".join(f'<div class="s{d}">' for d in range(depth))
+        closing = "</div>" * depth
+        paragraph = " ".join(_sentence(rng, words) for _ in range(rng.randint(2, 5)))
+        if body_links:
+            url = body_links[section % len(body_links)]
+            paragraph += f' <a href="{escape(url)}">{escape(rng.choice(words))}</a>'
+        chunk = f"{opening}<h2>{escape(rng.choice(words))}</h2><p>{paragraph}</p>{closing}"
+        parts.append(chunk)
+        size += len(chunk)
+        section += 1
+    parts.append("</main><footer><p>Date modified: 2025-01-01</p></footer></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def _write_pair(
+    writer: WARCWriter,
+    *,
+    url: str,
+    warc_date: str,
+    content_type: str,
+    body: bytes,
+    status: str = "200 OK",
+) -> None:
+    writer.write_record(
+        writer.create_warc_record(
+            uri=url,
+            record_type="request",
+            payload=BytesIO(f"GET {url} HTTP/1.1\r\n\r\n".encode("utf-8")),
+            warc_headers_dict={"WARC-Date": warc_date},
+        )
+    )
+    head = (
+        f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode("utf-8")
+    writer.write_record(
+        writer.create_warc_record(
+            uri=url,
+            record_type="response",
+            payload=BytesIO(head + body),
+            warc_headers_dict={"WARC-Date": warc_date},
+        )
+    )
+
+
+def write_synthetic_warcs(out_dir: Path, spec: WarcSpec) -> WarcGenStats:
+    """
+    Write ``spec.records`` response records spread over ``spec.warcs`` files.
+    """
+    rng = random.Random(spec.seed)
+    topics = load_query_terms()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    n_unique = max(1, int(spec.records * (1.0 - spec.duplicate_ratio)))
+    urls = [
+        f"https://www.bench.example.ca/{'fr' if rng.random() < spec.french_share else 'en'}"
+        f"/{rng.choice(topics).replace(' ', '-')}/page-{i}.html"
+        for i in range(n_unique)
+    ]
+    base_ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    emitted: list[tuple[str, bytes]] = []
+    files: list[Path] = []
+    html_records = duplicates = non_html = html_bytes = 0
+    per_file = -(-spec.records // max(1, spec.warcs))
+
+    for file_index in range(max(1, spec.warcs)):
+        path = out_dir / f"bench-{file_index:05d}.warc.gz"
+        files.append(path)
+        with path.open("wb") as f:
+            writer = WARCWriter(f, gzip=True)
+            start = file_index * per_file
+            for i in range(start, min(spec.records, start + per_file)):
+                warc_date = (base_ts + timedelta(seconds=7 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+                if rng.random() < spec.non_html_ratio:
+                    blob = rng.randbytes(rng.randint(512, 4096))
+                    _write_pair(
+                        writer,
+                        url=f"https://www.bench.example.ca/assets/img-{i}.png",
+                        warc_date=warc_date,
+                        content_type="image/png",
+                        body=blob,
+                    )
+                    non_html += 1
+                    continue
+
+                if emitted and rng.random() < spec.duplicate_ratio:
+                    # Re-crawl of an unchanged page: same URL and identical body.
+                    url, body = emitted[rng.randrange(len(emitted))]
+                    duplicates += 1
+                else:
+                    url = urls[len(emitted) % len(urls)]
+                    lang = "fr" if "/fr/" in url else "en"
+                    target_kb = rng.lognormvariate(0.0, spec.body_kb_sigma) * spec.body_kb_median
+                    links = [rng.choice(urls) for _ in range(spec.links_per_page)]
+                    title = f"{url.rsplit('/', 2)[-2].replace('-', ' ').title()} - Canada.ca"
+                    body = _page_html(
+                        rng,
+                        spec,
+                        title=title,
+                        lang=lang,
+                        link_targets=links,
+                        target_bytes=int(target_kb * 1024),
+                    )
+                    emitted.append((url, body))
+
+                _write_pair(
+                    writer,
+                    url=url,
+                    warc_date=warc_date,
+                    content_type="text/html; charset=utf-8",
+                    body=body,
+                )
+                html_records += 1
+                html_bytes += len(body)
+
+    return WarcGenStats(
+        files=files,
+        html_records=html_records,
+        duplicate_records=duplicates,
+        non_html_records=non_html,
+        compressed_bytes=sum(p.stat().st_size for p in files),
+        html_body_bytes=html_bytes,
+    )
+
+
+__all__ = ["WarcGenStats", "WarcSpec", "write_synthetic_warcs"]
@@ -12,6 +12,16 @@
  *     --out "/out/source-hc-job-1.png" \
  *     --format jpeg --quality 80 \
  *     --width 1000 --height 540 --timeout-ms 45000
+ *
+ * Batch mode (one browser, N concurrent pages):
+ *   node /ha-scripts/generate_replay_preview.js --batch --concurrency 4 < jobs.jsonl
+ *
+ *   Each stdin line is a JSON job:
+ *     {"id": "hc", "url": "...", "out": "/out/x.jpg", "width": 1000, "height": 540,
+ *      "format": "jpeg", "quality": 80, "timeoutMs": 45000, "settleMs": 1200}
+ *   Each stdout line is a JSON result:
+ *     {"id": "hc", "ok": true, "ms": 2140}  /  {"id": "hc", "ok": false, "ms": ..., "error": "..."}
+ *   Exit code is 1 if any job failed.
  */
 
 function argValue(flag, fallback = null) {
@@ -29,6 +39,9 @@ function intValue(flag, fallback) {
   return Math.trunc(parsed);
 }
 
+const batchMode = process.argv.includes("--batch");
+const concurrency = intValue("--concurrency", 4);
+
 const url = argValue("--url");
 const outPath = argValue("--out");
 const requestedFormat = argValue("--format");
@@ -38,12 +51,126 @@ const height = intValue("--height", 540);
 const timeoutMs = intValue("--timeout-ms", 45000);
 const settleMs = intValue("--settle-ms", 1200);
 
-if (!url || !outPath) {
+if (!batchMode && (!url || !outPath)) {
   // eslint-disable-next-line no-console
-  console.error("Missing required args: --url and --out");
+  console.error("Missing required args: --url and --out (or pass --batch)");
   process.exit(2);
 }
 
+function positiveInt(value, fallback) {
+  const parsed = Number(value);
+  if (!Number.isFinite(parsed) || parsed <= 0) return fallback;
+  return Math.trunc(parsed);
+}
+
+function normalizeFormat(raw, out) {
+  const value = (raw || "").trim().toLowerCase();
+  if (value === "png") return "png";
+  if (value === "jpeg" || value === "jpg") return "jpeg";
+  const lowerOut = out.toLowerCase();
+  if (lowerOut.endsWith(".jpg") || lowerOut.endsWith(".jpeg")) return "jpeg";
+  return "png";
+}
+
+// Render one job into a fresh page on an already-running browser.
+async function renderPreview(browser, job) {
+  const page = await browser.newPage({
+    viewport: { width: job.width, height: job.height },
+    deviceScaleFactor: 1,
+  });
+  try {
+    page.setDefaultTimeout(job.timeoutMs);
+
+    await page.goto(job.url, { waitUntil: "load", timeout: job.timeoutMs });
+    await page.waitForTimeout(job.settleMs);
+
+    // Safety: if any banner slipped in, remove it before taking the screenshot.
+    try {
+      await page.evaluate(() => {
+        const banner = document.getElementById("ha-replay-banner");
+        if (banner && banner.parentNode) banner.parentNode.removeChild(banner);
+      });
+    } catch {
+      // Ignore JS evaluation failures.
+    }
+
+    const screenshotOpts = { path: job.out, fullPage: false };
+    if (normalizeFormat(job.format, job.out) === "jpeg") {
+      const boundedQuality = Math.min(95, Math.max(20, job.quality));
+      await page.screenshot({
+        ...screenshotOpts,
+        type: "jpeg",
+        quality: boundedQuality,
+      });
+    } else {
+      await page.screenshot({ ...screenshotOpts, type: "png" });
+    }
+  } finally {
+    await page.close().catch(() => {});
+  }
+}
+
+function readStdin() {
+  return new Promise((resolve, reject) => {
+    const chunks = [];
+    process.stdin.on("data", (chunk) => chunks.push(chunk));
+    process.stdin.on("end", () => resolve(Buffer.concat(chunks).toString("utf8")));
+    process.stdin.on("error", reject);
+  });
+}
+
+async function runBatch(browser) {
+  const jobs = (await readStdin())
+    .split("\n")
+    .map((line) => line.trim())
+    .filter(Boolean)
+    .map((line) => {
+      const raw = JSON.parse(line);
+      return {
+        id: String(raw.id ?? raw.out),
+        url: raw.url,
+        out: raw.out,
+        format: raw.format,
+        quality: positiveInt(raw.quality, quality),
+        width: positiveInt(raw.width, width),
+        height: positiveInt(raw.height, height),
+        timeoutMs: positiveInt(raw.timeoutMs, timeoutMs),
+        settleMs: positiveInt(raw.settleMs, settleMs),
+      };
+    });
+
+  let next = 0;
+  let failed = 0;
+  async function worker() {
+    while (next < jobs.length) {
+      const job = jobs[next];
+      next += 1;
+      const started = Date.now();
+      try {
+        if (!job.url || !job.out) throw new Error("job is missing url/out");
+        await renderPreview(browser, job);
+        process.stdout.write(
+          `${JSON.stringify({ id: job.id, ok: true, ms: Date.now() - started })}\n`,
+        );
+      } catch (err) {
+        failed += 1;
+        process.stdout.write(
+          `${JSON.stringify({
+            id: job.id,
+            ok: false,
+            ms: Date.now() - started,
+            error: String((err && err.message) || err),
+          })}\n`,
+        );
+      }
+    }
+  }
+
+  const pages = Math.max(1, Math.min(concurrency, jobs.length));
+  await Promise.all(Array.from({ length: pages }, () => worker()));
+  return failed;
+}
+
 async function main() {
   // Playwright is provided by the Playwright Docker image.
   // The official Playwright Docker image includes browser binaries, but it does
@@ -78,46 +205,26 @@ async function main() {
     args: ["--disable-dev-shm-usage"],
   });
 
-  const page = await browser.newPage({
-    viewport: { width, height },
-    deviceScaleFactor: 1,
-  });
-  page.setDefaultTimeout(timeoutMs);
-
-  await page.goto(url, { waitUntil: "load", timeout: timeoutMs });
-  await page.waitForTimeout(settleMs);
-
-  // Safety: if any banner slipped in, remove it before taking the screenshot.
+  let failed = 0;
   try {
-    await page.evaluate(() => {
-      const banner = document.getElementById("ha-replay-banner");
-      if (banner && banner.parentNode) banner.parentNode.removeChild(banner);
-    });
-  } catch {
-    // Ignore JS evaluation failures.
-  }
-
-  const normalizedFormat = (() => {
-    const raw = (requestedFormat || "").trim().toLowerCase();
-    if (raw === "png") return "png";
-    if (raw === "jpeg" || raw === "jpg") return "jpeg";
-    const lowerOut = outPath.toLowerCase();
-    if (lowerOut.endsWith(".jpg") || lowerOut.endsWith(".jpeg")) return "jpeg";
-    return "png";
-  })();
-
-  const screenshotOpts = { path: outPath, fullPage: false };
-  if (normalizedFormat === "jpeg") {
-    const boundedQuality = Math.min(95, Math.max(20, quality));
-    await page.screenshot({
-      ...screenshotOpts,
-      type: "jpeg",
-      quality: boundedQuality,
-    });
-  } else {
-    await page.screenshot({ ...screenshotOpts, type: "png" });
+    if (batchMode) {
+      failed = await runBatch(browser);
+    } else {
+      await renderPreview(browser, {
+        url,
+        out: outPath,
+        format: requestedFormat,
+        quality,
+        width,
+        height,
+        timeoutMs,
+        settleMs,
+      });
+    }
+  } finally {
+    await browser.close();
   }
-  await browser.close();
+  if (failed > 0) process.exitCode = 1;
 }
 
 main().catch((err) => {
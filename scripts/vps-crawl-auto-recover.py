@@ -13,10 +13,11 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from ha_backend.crawl_stats import parse_crawl_log_progress
+from ha_backend.crawl_stats import read_crawl_log_progress
 from ha_backend.db import get_session
 from ha_backend.job_registry import SOURCE_JOB_CONFIGS, reconcile_scope_passthrough_args
 from ha_backend.models import ArchiveJob, Source
+from ha_backend.ops_collector import hosted_main, hosted_subprocess_run
 
 DEFAULT_DEPLOY_LOCK_FILE = "/tmp/healtharchive-backend-deploy.lock"
 DEFAULT_STATE_FILE = "/srv/healtharchive/ops/watchdog/crawl-auto-recover.json"
@@ -466,11 +467,11 @@ def _find_job_log(job: RunningJob) -> Path | None:
 
 
 def _run(cmd: list[str]) -> None:
-    subprocess.run(cmd, check=True)  # nosec: B603
+    hosted_subprocess_run(cmd, check=True)  # nosec: B603
 
 
 def _run_capture(cmd: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, check=False, capture_output=True, text=True)  # nosec: B603
+    return hosted_subprocess_run(cmd, check=False, capture_output=True, text=True)  # nosec: B603
 
 
 def _parse_cmd_tokens(raw: str) -> list[str]:
@@ -1006,6 +1007,7 @@ def _write_textfile_metrics(
     tmp.replace(path)
 
 
+@hosted_main
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -1438,6 +1440,9 @@ def main(argv: list[str] | None = None) -> int:
                     continue
                 if orm_job.status == "running":
                     continue
+                if orm_job.status in ("completed", "indexing"):
+                    # The worker's index lane holds the job lock while indexing.
+                    continue
                 drift_job_ids.append(jid)
                 if args.apply and not simulate_mode:
                     orm_job.status = "running"
@@ -1633,7 +1638,7 @@ def main(argv: list[str] | None = None) -> int:
         log_path = _find_job_log(job)
         if log_path is None:
             continue
-        progress = parse_crawl_log_progress(log_path)
+        progress = read_crawl_log_progress(log_path)
         if progress is None:
             continue
         age = progress.last_progress_age_seconds(now_utc=now)
@@ -2022,7 +2027,7 @@ def main(argv: list[str] | None = None) -> int:
 
     # Resolve current crawled count for progress circuit-breaker checks.
     _recovery_log = _find_job_log(job)
-    _recovery_progress = parse_crawl_log_progress(_recovery_log) if _recovery_log else None
+    _recovery_progress = read_crawl_log_progress(_recovery_log) if _recovery_log else None
     current_crawled: int | None = (
         _recovery_progress.last_status.crawled if _recovery_progress else None
     )
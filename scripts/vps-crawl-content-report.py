@@ -16,7 +16,7 @@ from warcio.archiveiterator import ArchiveIterator
 from archive_tool.constants import HTTP_ERROR_PATTERNS, STATE_FILE_NAME, TIMEOUT_PATTERNS
 from archive_tool.utils import discover_temp_dirs, find_all_warc_files
 from ha_backend.archive_storage import get_job_warcs_dir
-from ha_backend.crawl_stats import parse_crawl_log_progress
+from ha_backend.crawl_stats import read_crawl_log_progress
 from ha_backend.db import get_session
 from ha_backend.models import ArchiveJob, Source
 
@@ -551,7 +551,7 @@ def generate_report(
 
     progress_summary: dict[str, Any] = {}
     if latest_log is not None and log_ok == 1:
-        progress = parse_crawl_log_progress(latest_log, max_bytes=max_log_bytes)
+        progress = read_crawl_log_progress(latest_log, max_bytes=max_log_bytes)
         if progress is not None:
             progress_summary = {
                 "crawl_rate_ppm": round(progress.crawl_rate_ppm, 3),
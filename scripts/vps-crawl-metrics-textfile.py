@@ -7,20 +7,16 @@ import json
 import os
 import re
 import stat
-import subprocess
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable
 
 from archive_tool.constants import STATE_FILE_NAME
-from ha_backend.crawl_stats import (
-    count_new_crawl_phase_events_from_log_tail,
-    count_resume_crawl_events_from_log_tail,
-    parse_crawl_log_progress,
-)
+from ha_backend.crawl_stats import open_log_cursor
 from ha_backend.db import get_session
 from ha_backend.models import ArchiveJob, Source
+from ha_backend.ops_collector import hosted_main, hosted_subprocess_run
 
 
 @dataclass(frozen=True)
@@ -159,7 +155,7 @@ def _probe_readable_file(path: Path) -> tuple[int, int]:
 
 def _systemctl_is_active(unit: str) -> int:
     try:
-        r = subprocess.run(  # nosec: B603
+        r = hosted_subprocess_run(  # nosec: B603
             ["systemctl", "is-active", unit],
             check=False,
             capture_output=True,
@@ -236,6 +232,7 @@ def _probe_dir_writable_for_user(path: Path, *, uid: int, gids: set[int]) -> tup
     return 1, -1
 
 
+@hosted_main
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -630,6 +627,16 @@ def main(argv: list[str] | None = None) -> int:
         "# HELP healtharchive_crawl_running_job_errors_other Other error count from .archive_state.json, or -1 when unknown.",
     )
     _emit(lines, "# TYPE healtharchive_crawl_running_job_errors_other gauge")
+    _emit(
+        lines,
+        "# HELP healtharchive_crawl_running_job_monitor_lines_per_second Log lines/s processed by the archive_tool monitor (from .archive_state.json), or -1 when unknown.",
+    )
+    _emit(lines, "# TYPE healtharchive_crawl_running_job_monitor_lines_per_second gauge")
+    _emit(
+        lines,
+        "# HELP healtharchive_crawl_running_job_monitor_parse_us_per_line Mean monitor parse time per log line in microseconds (from .archive_state.json), or -1 when unknown.",
+    )
+    _emit(lines, "# TYPE healtharchive_crawl_running_job_monitor_parse_us_per_line gauge")
 
     _emit(
         lines,
@@ -730,32 +737,28 @@ def main(argv: list[str] | None = None) -> int:
         new_crawl_phase_count = -1
         resume_crawl_count = -1
         if log_path is not None:
+            max_log_bytes = int(args.max_log_bytes)
             try:
-                progress = parse_crawl_log_progress(log_path, max_bytes=int(args.max_log_bytes))
+                # Shared incremental cursor: only bytes appended since the last
+                # timer run (by any consumer) are parsed.
+                cursor = open_log_cursor(log_path, max_bytes=max_log_bytes)
             except OSError as exc:
-                progress = None
+                cursor = None
                 log_probe_ok = 0
                 log_probe_errno = int(exc.errno or -1)
             except Exception:
-                progress = None
+                cursor = None
                 log_probe_ok = 0
                 log_probe_errno = -1
-            else:
+            if cursor is not None:
+                progress = cursor.progress(max_bytes=max_log_bytes)
                 if progress is not None:
                     progress_known = 1
                     age_seconds = progress.last_progress_age_seconds(now_utc=now)
                     stalled = 1 if age_seconds >= float(args.stall_threshold_seconds) else 0
                     crawl_rate_ppm = progress.crawl_rate_ppm
-            new_phase_count = count_new_crawl_phase_events_from_log_tail(
-                log_path, max_bytes=int(args.max_log_bytes)
-            )
-            if new_phase_count is not None:
-                new_crawl_phase_count = int(new_phase_count)
-            resume_count = count_resume_crawl_events_from_log_tail(
-                log_path, max_bytes=int(args.max_log_bytes)
-            )
-            if resume_count is not None:
-                resume_crawl_count = int(resume_count)
+                new_crawl_phase_count = cursor.new_crawl_phase_count(max_bytes=max_log_bytes)
+                resume_crawl_count = cursor.resume_crawl_count(max_bytes=max_log_bytes)
 
         state_file_ok = 0
         state_file_errno = 0
@@ -769,6 +772,8 @@ def main(argv: list[str] | None = None) -> int:
         errors_timeout = -1
         errors_http = -1
         errors_other = -1
+        monitor_lines_per_second = -1.0
+        monitor_parse_us_per_line = -1.0
 
         if output_dir_path and output_dir_ok:
             state_path = output_dir_path / STATE_FILE_NAME
@@ -822,6 +827,20 @@ def main(argv: list[str] | None = None) -> int:
                                 errors_other = int(error_counts.get("other", -1))
                             except (TypeError, ValueError):
                                 errors_other = -1
+                        monitor = data.get("monitor")
+                        if isinstance(monitor, dict):
+                            try:
+                                monitor_lines_per_second = float(
+                                    monitor.get("lines_per_second", -1)
+                                )
+                            except (TypeError, ValueError):
+                                monitor_lines_per_second = -1.0
+                            try:
+                                monitor_parse_us_per_line = float(
+                                    monitor.get("parse_us_per_line", -1)
+                                )
+                            except (TypeError, ValueError):
+                                monitor_parse_us_per_line = -1.0
 
         _emit(lines, f"healtharchive_crawl_running_job_progress_known{{{labels}}} {progress_known}")
         _emit(
@@ -891,6 +910,14 @@ def main(argv: list[str] | None = None) -> int:
             lines,
             f"healtharchive_crawl_running_job_errors_other{{{labels}}} {errors_other}",
         )
+        _emit(
+            lines,
+            f"healtharchive_crawl_running_job_monitor_lines_per_second{{{labels}}} {monitor_lines_per_second:.2f}",
+        )
+        _emit(
+            lines,
+            f"healtharchive_crawl_running_job_monitor_parse_us_per_line{{{labels}}} {monitor_parse_us_per_line:.2f}",
+        )
 
     out_dir.mkdir(parents=True, exist_ok=True)
     tmp = out_file.with_suffix(out_file.suffix + f".{os.getpid()}.tmp")
@@ -13,6 +13,17 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+# Optional ops-collector hosting; this script must also run when ha_backend
+# cannot be imported (recovery cannot depend on a healthy backend).
+try:
+    from ha_backend.ops_collector import hosted_main, hosted_subprocess_run
+except Exception:  # pragma: no cover - depends on the interpreter's environment
+    hosted_subprocess_run = subprocess.run
+
+    def hosted_main(func):  # type: ignore[no-redef]
+        return func
+
+
 DEFAULT_DEPLOY_LOCK_FILE = "/tmp/healtharchive-backend-deploy.lock"
 
 
@@ -166,13 +177,13 @@ def _read_manifest_hot_paths(manifest_path: Path) -> list[Path]:
 
 
 def _run_read(cmd: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, check=False, capture_output=True, text=True)  # nosec: B603
+    return hosted_subprocess_run(cmd, check=False, capture_output=True, text=True)  # nosec: B603
 
 
 def _run_apply(
     cmd: list[str], *, timeout_seconds: float | None = None
 ) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(  # nosec: B603
+    return hosted_subprocess_run(  # nosec: B603
         cmd,
         check=False,
         capture_output=True,
@@ -496,6 +507,7 @@ def _write_metrics(
     tmp.replace(path)
 
 
+@hosted_main
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(
         description=(
@@ -8,6 +8,16 @@ import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Optional ops-collector hosting; this script must also run when ha_backend
+# cannot be imported (its unit runs the system python3).
+try:
+    from ha_backend.ops_collector import hosted_main, hosted_subprocess_run
+except Exception:  # pragma: no cover - depends on the interpreter's environment
+    hosted_subprocess_run = subprocess.run
+
+    def hosted_main(func):  # type: ignore[no-redef]
+        return func
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -21,11 +31,11 @@ def _is_mountpoint(path: Path) -> bool:
     if not path.exists():
         return False
     try:
-        r = subprocess.run(["mountpoint", "-q", str(path)], check=False)
+        r = hosted_subprocess_run(["mountpoint", "-q", str(path)], check=False)
         return r.returncode == 0
     except FileNotFoundError:
         pass
-    out = subprocess.run(["mount"], check=False, capture_output=True, text=True).stdout
+    out = hosted_subprocess_run(["mount"], check=False, capture_output=True, text=True).stdout
     return f" on {path} " in out
 
 
@@ -44,7 +54,9 @@ def _probe_readable_dir(path: Path) -> tuple[int, int]:
 
 
 def _unit_exists(unit: str) -> bool:
-    r = subprocess.run(["systemctl", "cat", unit], check=False, capture_output=True, text=True)
+    r = hosted_subprocess_run(
+        ["systemctl", "cat", unit], check=False, capture_output=True, text=True
+    )
     return r.returncode == 0
 
 
@@ -57,10 +69,10 @@ def _unit_ok(unit: str) -> int:
     """
     if not _unit_exists(unit):
         return 0
-    active = subprocess.run(
+    active = hosted_subprocess_run(
         ["systemctl", "is-active", unit], check=False, capture_output=True, text=True
     ).stdout.strip()
-    failed = subprocess.run(
+    failed = hosted_subprocess_run(
         ["systemctl", "is-failed", unit], check=False, capture_output=True, text=True
     ).stdout.strip()
     return 1 if active == "active" and failed != "failed" else 0
@@ -69,7 +81,7 @@ def _unit_ok(unit: str) -> int:
 def _unit_failed(unit: str) -> int:
     if not _unit_exists(unit):
         return 0
-    failed = subprocess.run(
+    failed = hosted_subprocess_run(
         ["systemctl", "is-failed", unit], check=False, capture_output=True, text=True
     ).stdout.strip()
     return 1 if failed == "failed" else 0
@@ -102,6 +114,7 @@ def _emit(lines: list[str], line: str) -> None:
     lines.append(line.rstrip("\n"))
 
 
+@hosted_main
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(
         description=(
@@ -120,6 +120,26 @@ HTTP_ERROR_PATTERNS = [
     r"net::ERR_NETWORK_CHANGED",  # Network configuration changed mid-request
 ]  # Generic net errors or 4xx/5xx status
 
+# Both pattern lists compiled into a single automaton so the monitor scans each
+# text once. Timeout patterns keep their case-insensitive matching; a match in
+# the "timeout" group takes precedence over "http" (see monitor.classify_error_text).
+LOG_ERROR_PATTERN = re.compile(
+    "(?P<timeout>(?i:"
+    + "|".join(TIMEOUT_PATTERNS)
+    + "))|(?P<http>"
+    + "|".join(HTTP_ERROR_PATTERNS)
+    + ")"
+)
+
+# Substrings a JSON log line must contain to be worth decoding. Browsertrix
+# emits compact JSON, so anything else (info-level noise) is skipped unparsed.
+LOG_FAST_PATH_MARKERS = (
+    '"crawlStatus"',
+    '"pageStatus"',
+    '"logLevel":"error"',
+    '"logLevel":"warn"',
+)
+
 # Exit codes potentially indicating non-fatal completion (e.g., soft limits)
 # These might allow skipping resume/retries if encountered
 ACCEPTABLE_CRAWLER_EXIT_CODES = [
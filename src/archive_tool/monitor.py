@@ -3,21 +3,21 @@ import argparse  # Keep for type hint in __init__
 import json
 import logging
 import os
-import re
 import signal  # For killpg
 import subprocess
 import threading
 import time
 from queue import Queue
+from typing import Any, Callable, Optional
 
 from .constants import (
-    HTTP_ERROR_PATTERNS,
+    LOG_ERROR_PATTERN,
+    LOG_FAST_PATH_MARKERS,
     LOG_LINE_ERROR_TRUNCATE_LENGTH,
     LOG_LINE_TRUNCATE_LENGTH,
     MONITOR_LOG_PROCESS_TERM_TIMEOUT_SEC,
     MONITOR_STARTUP_DELAY_SEC,
     STATS_REGEX,
-    TIMEOUT_PATTERNS,
 )
 
 # Use absolute imports within the package
@@ -27,6 +27,31 @@ from .state import CrawlState
 
 logger = logging.getLogger("website_archiver.monitor")
 
+# Optional faster JSON decoder; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so error handling is the same either way.
+try:
+    import orjson
+
+    _json_loads: Callable[[str], Any] = orjson.loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    _json_loads = json.loads
+
+
+def classify_error_text(*texts: str) -> Optional[str]:
+    """
+    Classify log text as "timeout", "http" or None using LOG_ERROR_PATTERN.
+
+    A timeout match anywhere in any text wins over an HTTP/network match,
+    matching the order in which the pattern lists used to be tried.
+    """
+    kind = None
+    for text in texts:
+        for match in LOG_ERROR_PATTERN.finditer(text):
+            if match.group("timeout") is not None:
+                return "timeout"
+            kind = "http"
+    return kind
+
 
 class CrawlMonitor(threading.Thread):
     """Monitors a running zimit container via docker logs."""
@@ -51,8 +76,10 @@ class CrawlMonitor(threading.Thread):
 
         # Use pre-compiled regex patterns from constants
         self.stats_pattern = STATS_REGEX
-        self.timeout_pattern = re.compile("|".join(TIMEOUT_PATTERNS), re.IGNORECASE)
-        self.http_error_pattern = re.compile("|".join(HTTP_ERROR_PATTERNS))
+
+        # Throughput counters since the last progress report.
+        self._lines_since_report = 0
+        self._parse_seconds_since_report = 0.0
 
     def run(self):
         """
@@ -180,7 +207,10 @@ class CrawlMonitor(threading.Thread):
 
                 processed_lines += 1
                 now = time.monotonic()
+                parse_started = time.perf_counter()
                 self._parse_log_line(line.strip(), now)  # Update state based on line
+                self._parse_seconds_since_report += time.perf_counter() - parse_started
+                self._lines_since_report += 1
 
                 # Check stall/error conditions periodically
                 # Use configured interval, default 30s
@@ -204,6 +234,7 @@ class CrawlMonitor(threading.Thread):
                     # Only put progress update if no stall/error signal was just sent
                     # Check queue size? No, just rely on timestamp reset above.
                     self.output_queue.put({"status": "progress"})  # Signal main thread
+                    self._report_throughput(now - last_progress_report_time)
                     last_progress_report_time = now
 
         except FileNotFoundError:
@@ -263,8 +294,14 @@ class CrawlMonitor(threading.Thread):
         """
         if not line:
             return
+        if not line.startswith("{"):
+            self._classify_plain_line(line, timestamp)
+            return
+        # Fast path: skip info-level JSON noise without decoding it.
+        if not any(marker in line for marker in LOG_FAST_PATH_MARKERS):
+            return
         try:
-            log_data = json.loads(line)
+            log_data = _json_loads(line)
             message = log_data.get("message", "")
             context = log_data.get("context", "")
             details = log_data.get("details", {})
@@ -279,13 +316,13 @@ class CrawlMonitor(threading.Thread):
                 return
 
             if context == "pageStatus" and message == "Page Load Failed: will retry":
-                error_msg = details.get("msg", "")
-                if self.timeout_pattern.search(error_msg):
+                kind = classify_error_text(details.get("msg", ""))
+                if kind == "timeout":
                     self.state.record_error("timeout", timestamp)
                     logger.warning(
                         f"Timeout reported by pageStatus: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
                     )
-                elif self.http_error_pattern.search(error_msg):
+                elif kind == "http":
                     self.state.record_error("http", timestamp)
                     logger.warning(
                         f"HTTP/Network error reported by pageStatus: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
@@ -298,17 +335,13 @@ class CrawlMonitor(threading.Thread):
                 return
 
             if level in ["error", "warn"]:
-                full_log_check = line
-                if self.timeout_pattern.search(message) or self.timeout_pattern.search(
-                    full_log_check
-                ):
+                kind = classify_error_text(message, line)
+                if kind == "timeout":
                     self.state.record_error("timeout", timestamp)
                     logger.warning(
                         f"Timeout detected in logs: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
                     )
-                elif self.http_error_pattern.search(message) or self.http_error_pattern.search(
-                    full_log_check
-                ):
+                elif kind == "http":
                     self.state.record_error("http", timestamp)
                     logger.warning(
                         f"HTTP/Network error detected in logs: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
@@ -319,21 +352,37 @@ class CrawlMonitor(threading.Thread):
                         f"Generic error detected in logs: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
                     )
         except json.JSONDecodeError:
-            if self.timeout_pattern.search(line):
-                self.state.record_error("timeout", timestamp)
-                logger.warning(
-                    f"Timeout detected in non-JSON log: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
-                )
-            elif self.http_error_pattern.search(line):
-                self.state.record_error("http", timestamp)
-                logger.warning(
-                    f"HTTP/Network error detected in non-JSON log: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
-                )
+            self._classify_plain_line(line, timestamp)
         except Exception as e:
             logger.error(
                 f"Error parsing log line: '{line[:LOG_LINE_ERROR_TRUNCATE_LENGTH]}...' - {e}"
             )
 
+    def _classify_plain_line(self, line: str, timestamp: float) -> None:
+        """Record timeout/HTTP errors found in a non-JSON log line."""
+        kind = classify_error_text(line)
+        if kind == "timeout":
+            self.state.record_error("timeout", timestamp)
+            logger.warning(
+                f"Timeout detected in non-JSON log: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
+            )
+        elif kind == "http":
+            self.state.record_error("http", timestamp)
+            logger.warning(
+                f"HTTP/Network error detected in non-JSON log: {line[:LOG_LINE_TRUNCATE_LENGTH]}..."
+            )
+
+    def _report_throughput(self, elapsed_seconds: float) -> None:
+        """Publish monitor throughput since the last report into CrawlState."""
+        self.state.record_monitor_throughput(
+            lines=self._lines_since_report,
+            parse_seconds=self._parse_seconds_since_report,
+            elapsed_seconds=elapsed_seconds,
+        )
+        self._lines_since_report = 0
+        self._parse_seconds_since_report = 0.0
+        self.state.save_persistent_state()
+
     def _check_stall_and_error_conditions(self, now: float) -> bool:
         """
         Check for stall conditions and error thresholds, signaling main thread if needed.
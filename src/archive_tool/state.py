@@ -40,6 +40,10 @@ class CrawlState:
         self.previous_stats_timestamp: Optional[float] = None
         self.progress_rate_ppm: float = 0.0
         self.last_vpn_rotation_timestamp: Optional[float] = None
+        # Monitor thread throughput (runtime only; written to the state file for metrics)
+        self.monitor_lines_total: int = 0
+        self.monitor_lines_per_second: float = -1.0
+        self.monitor_parse_us_per_line: float = -1.0
 
         # Persistent state (loaded/saved)
         self.current_workers: int = initial_workers
@@ -211,6 +215,12 @@ class CrawlState:
                 # that get reset on progress, but persisting them allows monitoring to
                 # see current error situation)
                 "error_counts": dict(self.error_counts),
+                # Monitor throughput for the crawl metrics textfile (-1 = unknown).
+                "monitor": {
+                    "lines_total": self.monitor_lines_total,
+                    "lines_per_second": round(self.monitor_lines_per_second, 2),
+                    "parse_us_per_line": round(self.monitor_parse_us_per_line, 2),
+                },
             }
             # === Durable Write with fsync ===
             # Critical: Use fsync() to guarantee data reaches disk before returning.
@@ -384,6 +394,23 @@ class CrawlState:
             log_msg = f"Stats Update: Crawled={crawled}, Total={total}, Pending={pending}, Failed={failed}, Rate={self.progress_rate_ppm:.1f} ppm"
             logger.debug(log_msg)
 
+    def record_monitor_throughput(
+        self, *, lines: int, parse_seconds: float, elapsed_seconds: float
+    ) -> None:
+        """
+        Record log-monitor throughput for the interval since the last report.
+
+        Args:
+            lines: Log lines processed during the interval
+            parse_seconds: Time spent inside the line parser during the interval
+            elapsed_seconds: Wall-clock length of the interval
+        """
+        self.monitor_lines_total += int(lines)
+        if elapsed_seconds > 0:
+            self.monitor_lines_per_second = lines / elapsed_seconds
+        if lines > 0:
+            self.monitor_parse_us_per_line = (parse_seconds / lines) * 1_000_000
+
     def record_error(self, error_type: str, timestamp: float):
         """Increments error counts."""
         if error_type in self.error_counts:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from datetime import timezone
-from typing import Iterator
+from typing import AsyncIterator, Iterator
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -19,25 +20,40 @@ from ha_backend.config import (
     get_max_request_body_size,
     get_pages_fastpath_enabled,
 )
-from ha_backend.db import get_session
+from ha_backend.db import get_engine_pools, get_session, set_engine_role
+from ha_backend.live_compare import aclose_live_async_client
 from ha_backend.logging_config import configure_logging
 from ha_backend.models import ArchiveJob, Page, Snapshot, Source
 from ha_backend.rate_limiting import limiter
 from ha_backend.request_context import generate_request_id, set_request_id
-from ha_backend.runtime_metrics import render_search_metrics_prometheus
+from ha_backend.runtime_metrics import (
+    render_db_pool_metrics_prometheus,
+    render_search_metrics_prometheus,
+)
 
 from .deps import require_admin
 from .routes_admin import router as admin_router
 from .routes_public import router as public_router
 
 configure_logging()
+# Size DB pools with the API profile (see HEALTHARCHIVE_DB_API_*).
+set_engine_role("api")
 
 # API version for X-API-Version header (semantic versioning)
 API_VERSION = "1"
 
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Release the compare-live outbound connection pool.
+    await aclose_live_async_client()
+
+
 app = FastAPI(
     title="HealthArchive Backend API",
     version="0.1.0",
+    lifespan=_lifespan,
 )
 
 # Register rate limiter with the app
@@ -422,6 +438,7 @@ async def metrics(
         )
 
     lines.extend(render_search_metrics_prometheus())
+    lines.extend(render_db_pool_metrics_prometheus(get_engine_pools()))
 
     body = "\n".join(lines) + "\n"
     return PlainTextResponse(content=body)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+"""
+Opaque keyset-pagination cursors for list endpoints.
+
+A cursor encodes the sort-key values of the last row a client has seen, so the
+next page is fetched with ``WHERE (k1, k2, ...) after (v1, v2, ...)`` instead of
+``OFFSET``. Deep pages then cost the same as the first one for the outer query.
+
+Cursors are bound to a *scope* (endpoint + the parameters that shape the
+result set); replaying a cursor against a different query is rejected rather
+than silently returning a wrong page.
+"""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Sequence
+
+from sqlalchemy import and_, false, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class CursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    One ORDER BY term of a keyset-paginated query.
+
+    The ORDER BY is always the plain one, so existing (offset) orderings and
+    index scans are unchanged. ``nullable`` keys keep the dialect's default
+    NULL placement, which ``keyset_filter`` must be told (``nulls_high``).
+    """
+
+    expr: Any
+    descending: bool = True
+    nullable: bool = False
+
+    def order_by(self) -> Any:
+        return self.expr.desc() if self.descending else self.expr.asc()
+
+    def _after(self, value: Any, nulls_high: bool) -> ColumnElement[bool]:
+        # NULLs come after every value when they sort low under DESC or high
+        # under ASC, and before every value otherwise.
+        nulls_trail = nulls_high != self.descending
+        if value is None:
+            return false() if nulls_trail else self.expr.is_not(None)
+        after = self.expr < value if self.descending else self.expr > value
+        if self.nullable and nulls_trail:
+            return or_(after, self.expr.is_(None))
+        return after
+
+    def _equal(self, value: Any) -> ColumnElement[bool]:
+        if value is None:
+            return self.expr.is_(None)
+        return self.expr == value
+
+
+def keyset_order_by(keys: Sequence[SortKey]) -> list[Any]:
+    return [key.order_by() for key in keys]
+
+
+def nulls_sort_high(dialect_name: str) -> bool:
+    """
+    Whether the dialect's plain ORDER BY treats NULL as larger than any value.
+    """
+    return dialect_name in ("postgresql", "oracle")
+
+
+def keyset_filter(
+    keys: Sequence[SortKey], values: Sequence[Any], *, nulls_high: bool = False
+) -> ColumnElement[bool]:
+    """
+    Return the predicate selecting rows strictly after ``values`` in ``keys`` order.
+
+    ``nulls_high`` describes where the dialect puts NULLs of ``nullable`` keys
+    (see ``nulls_sort_high``).
+    """
+    if len(keys) != len(values):
+        raise CursorError("Cursor does not match this query.")
+    branches = []
+    for i, key in enumerate(keys):
+        ties = [keys[j]._equal(values[j]) for j in range(i)]
+        branches.append(and_(*ties, key._after(values[i], nulls_high)))
+    return or_(*branches)
+
+
+def cursor_scope(name: str, params: Sequence[Any]) -> str:
+    digest = hashlib.sha256(json.dumps([name, *map(str, params)]).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"t": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"d": str(value)}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise CursorError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "t" in value:
+            return datetime.fromisoformat(str(value["t"]))
+        if "d" in value:
+            return Decimal(str(value["d"]))
+        raise CursorError("Invalid cursor.")
+    return value
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    payload = json.dumps({"s": scope, "v": [_encode_value(v) for v in values]})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, scope: str) -> list[Any]:
+    """
+    Decode ``token`` into sort-key values, checking it was issued for ``scope``.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["v"]
+        token_scope = payload["s"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise CursorError("Invalid cursor.") from exc
+    if token_scope != scope or not isinstance(values, list):
+        raise CursorError("Cursor does not match this query.")
+    try:
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError) as exc:
+        raise CursorError("Invalid cursor.") from exc
+
+
+__all__ = [
+    "CursorError",
+    "SortKey",
+    "cursor_scope",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_filter",
+    "keyset_order_by",
+    "nulls_sort_high",
+]
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from typing import Any, Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import Float, Integer, and_, case, cast, func, inspect, literal, or_
 from sqlalchemy.orm import Session, load_only
 
 from ha_backend.db import get_session
 from ha_backend.models import ArchiveJob, IssueReport, PageSignal, Snapshot, Source
-from ha_backend.search import TS_CONFIG, build_search_vector
+from ha_backend.search import (
+    build_language_fts_filter,
+    build_language_tsquery,
+    build_search_vector,
+)
 from ha_backend.search_ranking import (
     QueryMode,
     RankingVersion,
@@ -18,6 +22,15 @@ from ha_backend.search_ranking import (
     tokenize_query,
 )
 
+from .cursors import (
+    CursorError,
+    SortKey,
+    cursor_scope,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_order_by,
+)
 from .deps import require_admin
 from .routes_public import SearchSort, SearchView
 from .schemas_admin import (
@@ -185,16 +198,30 @@ def get_job_detail(
 )
 def list_job_snapshots(
     job_id: int,
+    response: Response,
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, max_length=2048),
     db: Session = Depends(get_db),
 ) -> List[JobSnapshotSummarySchema]:
     """
     List snapshots associated with a given job.
+
+    When more rows exist, an ``X-Next-Cursor`` header carries a keyset cursor
+    for the next call (``cursor=...``, which overrides ``offset``).
     """
+    sort_keys = [SortKey(Snapshot.capture_timestamp), SortKey(Snapshot.id)]
+    scope = cursor_scope("job_snapshots", (job_id,))
+    query = db.query(Snapshot).filter(Snapshot.job_id == job_id)
+    if cursor:
+        try:
+            query = query.filter(keyset_filter(sort_keys, decode_cursor(cursor, scope)))
+        except CursorError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        offset = 0
+
     snapshots = (
-        db.query(Snapshot)
-        .options(
+        query.options(
             load_only(
                 Snapshot.id,
                 Snapshot.url,
@@ -204,12 +231,15 @@ def list_job_snapshots(
                 Snapshot.title,
             )
         )
-        .filter(Snapshot.job_id == job_id)
-        .order_by(Snapshot.capture_timestamp.desc(), Snapshot.id.desc())
+        .order_by(*keyset_order_by(sort_keys))
         .offset(offset)
-        .limit(limit)
+        .limit(limit + 1)
         .all()
     )
+    if len(snapshots) > limit:
+        snapshots = snapshots[:limit]
+        last = snapshots[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(scope, [last.capture_timestamp, last.id])
 
     return [
         JobSnapshotSummarySchema(
@@ -372,11 +402,25 @@ def search_debug(
     vector_expr = None
     if q_clean:
         if use_postgres_fts and effective_sort == SearchSort.relevance:
-            tsquery = func.websearch_to_tsquery(TS_CONFIG, q_clean)
-            computed_vector = build_search_vector(Snapshot.title, Snapshot.snippet, Snapshot.url)
+            fts_text = q_clean
+
+            def make_tsquery(config: Any) -> Any:
+                return func.websearch_to_tsquery(config, fts_text)
+
+            tsquery = build_language_tsquery(
+                make_tsquery, Snapshot.language, version_col=Snapshot.search_vector_version
+            )
+            computed_vector = build_search_vector(
+                Snapshot.title, Snapshot.snippet, Snapshot.url, language=Snapshot.language
+            )
             vector_expr = func.coalesce(Snapshot.search_vector, computed_vector)
             fts_filter = or_(
-                Snapshot.search_vector.op("@@")(tsquery),
+                build_language_fts_filter(
+                    Snapshot.search_vector,
+                    make_tsquery,
+                    Snapshot.language,
+                    version_col=Snapshot.search_vector_version,
+                ),
                 and_(Snapshot.search_vector.is_(None), computed_vector.op("@@")(tsquery)),
             )
             query = query.filter(fts_filter)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import csv
 import gzip
+import hashlib
 import html
 import io
 import json
 import re
 import time
+from collections import OrderedDict
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
@@ -15,8 +17,9 @@ from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 from urllib.parse import urlencode, urlsplit, urlunsplit
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, StreamingResponse
-from sqlalchemy import String, and_, case, cast, func, inspect, literal, or_, text
+from sqlalchemy import String, and_, case, cast, func, inspect, literal, or_, text, tuple_
 from sqlalchemy.orm import Session, joinedload, load_only
 
 from ha_backend.changes import CHANGE_TYPE_UNCHANGED, get_latest_job_ids_by_source
@@ -30,6 +33,7 @@ from ha_backend.config import (
     get_compare_live_max_render_lines,
     get_compare_live_timeout_seconds,
     get_compare_live_user_agent,
+    get_export_statement_timeout_ms,
     get_exports_default_limit,
     get_exports_enabled,
     get_exports_max_limit,
@@ -37,10 +41,11 @@ from ha_backend.config import (
     get_public_site_base_url,
     get_replay_base_url,
     get_replay_preview_dir,
+    get_search_statement_timeout_ms,
     get_usage_metrics_enabled,
     get_usage_metrics_window_days,
 )
-from ha_backend.db import get_session
+from ha_backend.db import get_read_session, get_session
 from ha_backend.indexing.viewer import find_record_for_snapshot
 from ha_backend.live_compare import (
     LiveCompareError,
@@ -48,11 +53,13 @@ from ha_backend.live_compare import (
     LiveFetchBlocked,
     LiveFetchError,
     LiveFetchNotHtml,
+    LiveFetchResult,
     LiveFetchTooLarge,
     build_compare_documents,
     build_compare_render_payload,
     compute_live_compare_from_docs,
-    fetch_live_html,
+    fetch_live_html_async,
+    get_live_fetch_cache,
     is_html_mime_type,
     load_snapshot_html,
     summarize_live_compare,
@@ -72,22 +79,20 @@ from ha_backend.rate_limiting import (
     RATE_LIMIT_SEARCH,
     limiter,
 )
-from ha_backend.runtime_metrics import observe_search_request
-from ha_backend.search import TS_CONFIG, build_search_vector
+from ha_backend.raw_render_cache import get_raw_render_cache
+from ha_backend.runtime_metrics import observe_search_request, search_sql_scope
+from ha_backend.search import (
+    build_language_fts_filter,
+    build_language_tsquery,
+    build_search_vector,
+    language_predicate,
+)
+from ha_backend.search_compiler import compile_query
 from ha_backend.search_fuzzy import (
     pick_word_similarity_threshold,
     should_use_url_similarity,
     token_variants,
 )
-from ha_backend.search_query import (
-    And as BoolAnd,
-)
-from ha_backend.search_query import (
-    Not as BoolNot,
-)
-from ha_backend.search_query import (
-    Or as BoolOr,
-)
 from ha_backend.search_query import (
     QueryNode as BoolNode,
 )
@@ -97,17 +102,16 @@ from ha_backend.search_query import (
     looks_like_advanced_query,
     parse_query,
 )
-from ha_backend.search_query import (
-    Term as BoolTerm,
-)
 from ha_backend.search_ranking import (
     QueryMode,
     RankingVersion,
     classify_query_mode,
     get_ranking_config,
     get_ranking_version,
+    pad_terms_to_bucket,
     tokenize_query,
 )
+from ha_backend.search_vocabulary import suggest_query
 from ha_backend.url_normalization import normalize_url_for_grouping
 from ha_backend.usage_metrics import (
     EVENT_CHANGES_LIST,
@@ -124,6 +128,16 @@ from ha_backend.usage_metrics import (
     record_usage_event,
 )
 
+from .cursors import (
+    CursorError,
+    SortKey,
+    cursor_scope,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_order_by,
+    nulls_sort_high,
+)
 from .schemas import (
     ArchiveStatsSchema,
     ChangeCompareSchema,
@@ -165,6 +179,13 @@ _COLUMN_EXISTS_LOCK = Lock()
 _PG_TRGM_EXISTS_CACHE: dict[int, bool] = {}
 _PG_TRGM_EXISTS_LOCK = Lock()
 
+# Rendered timelines keyed by page group, paging and a per-group data
+# version (the group's pages row and latest change event), so new captures or
+# change events miss the cache (LRU).
+_TIMELINE_CACHE: OrderedDict[tuple[Any, ...], SnapshotTimelineSchema] = OrderedDict()
+_TIMELINE_CACHE_LOCK = Lock()
+_TIMELINE_CACHE_MAX_ENTRIES = 512
+
 # We sometimes create synthetic test snapshots/sources for operational
 # verification (e.g., backup restore checks). These should not surface in
 # public browsing/search UI.
@@ -583,13 +604,6 @@ def _strip_url_query_and_fragment(value: str) -> str:
     return trimmed[:cut]
 
 
-def _escape_like(value: str) -> str:
-    """
-    Escape LIKE wildcards so user input is treated as a literal substring.
-    """
-    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-
-
 _URL_QUERY_PREFIX_RE = re.compile(r"^url:\s*", re.IGNORECASE)
 _URL_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)
 
@@ -1001,18 +1015,25 @@ def _search_snapshots_inner(
     pageSize: int,
     ranking: str | None,
     db: Session,
+    cursor: str | None = None,
+    lang: str | None = None,
 ) -> tuple[SearchResponseSchema, str]:
     """
     Implementation for the /api/search route.
 
+    ``cursor`` (from a previous response's ``nextCursor``) switches from OFFSET
+    paging to keyset paging; ``page`` is then ignored.
+
     Returns:
         (response, mode) where mode is one of:
         - "newest"
         - "relevance_fts"
         - "relevance_fallback"
         - "relevance_fuzzy"
+        - "relevance_corrected" / "newest_corrected"
         - "boolean"
         - "url"
+        - "pages_fastpath"
     """
     raw_q = q.strip() if q else None
     if raw_q == "":
@@ -1097,6 +1118,9 @@ def _search_snapshots_inner(
     if source:
         base_query = base_query.filter(Source.code == source.lower())
 
+    if lang:
+        base_query = base_query.filter(language_predicate(Snapshot.language, lang))
+
     if range_start is not None:
         base_query = base_query.filter(Snapshot.capture_timestamp >= range_start)
     if range_end_exclusive is not None:
@@ -1117,7 +1141,49 @@ def _search_snapshots_inner(
     if not includeDuplicates:
         base_query = base_query.filter(Snapshot.deduplicated.is_(False))
 
-    offset = (page - 1) * pageSize
+    offset = 0 if cursor else (page - 1) * pageSize
+    cursor_params = (
+        raw_q,
+        source,
+        effective_sort.value,
+        effective_view.value,
+        includeNon2xx,
+        includeDuplicates,
+        from_date,
+        to_date,
+        ranking_version.value,
+        lang,
+    )
+
+    def fetch_page(
+        ordered_query: Any, sort_keys: list[SortKey], path: str
+    ) -> tuple[list[Snapshot], str | None]:
+        """
+        Apply cursor/offset paging to an ordered Snapshot query.
+
+        Returns (snapshots, nextCursor). One extra row is fetched to decide
+        whether there is a next page.
+        """
+        scope = cursor_scope("search", (*cursor_params, path))
+        if cursor:
+            try:
+                values = decode_cursor(cursor, scope)
+                ordered_query = ordered_query.filter(keyset_filter(sort_keys, values))
+            except CursorError as exc:
+                raise HTTPException(status_code=422, detail=str(exc)) from exc
+        rows = (
+            ordered_query.add_columns(
+                *(key.expr.label(f"cursor_k{i}") for i, key in enumerate(sort_keys))
+            )
+            .offset(offset)
+            .limit(pageSize + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(rows) > pageSize:
+            rows = rows[:pageSize]
+            next_cursor = encode_cursor(scope, list(rows[-1])[1:])
+        return [row[0] for row in rows], next_cursor
 
     # Fast path: when browsing pages without a search query or date range,
     # prefer the Page table (if present) to avoid window functions over the
@@ -1127,6 +1193,7 @@ def _search_snapshots_inner(
         and raw_q is None
         and range_start is None
         and range_end_exclusive is None
+        and lang is None
         and get_pages_fastpath_enabled()
         and _has_table(db, "pages")
     ):
@@ -1158,7 +1225,12 @@ def _search_snapshots_inner(
                 else_=-1,
             )
 
-            items = (
+            fastpath_keys = [
+                SortKey(status_quality),
+                SortKey(Snapshot.capture_timestamp),
+                SortKey(Snapshot.id),
+            ]
+            items, next_cursor = fetch_page(
                 page_query.options(
                     load_only(
                         Snapshot.id,
@@ -1175,15 +1247,9 @@ def _search_snapshots_inner(
                         Snapshot.warc_record_id,
                     ),
                     joinedload(Snapshot.source),
-                )
-                .order_by(
-                    status_quality.desc(),
-                    Snapshot.capture_timestamp.desc(),
-                    Snapshot.id.desc(),
-                )
-                .offset(offset)
-                .limit(pageSize)
-                .all()
+                ).order_by(*keyset_order_by(fastpath_keys)),
+                fastpath_keys,
+                "pages_fastpath",
             )
 
             page_counts_by_snapshot_id: dict[int, int] = {}
@@ -1245,6 +1311,7 @@ def _search_snapshots_inner(
                     total=int(total),
                     page=page,
                     pageSize=pageSize,
+                    nextCursor=next_cursor,
                 ),
                 "pages_fastpath",
             )
@@ -1337,13 +1404,17 @@ def _search_snapshots_inner(
         )
 
     query = base_query
-    tsquery = None
+    tsquery: Any | None = None
     vector_expr = None
     score_override: Any | None = None
     search_mode: str | None = None
 
-    def apply_substring_filter(qry: Any) -> Any:
-        tokens = match_tokens[:8]
+    suggestions: list[str] = []
+
+    def apply_substring_filter(qry: Any, *, tokens_override: list[str] | None = None) -> Any:
+        tokens = pad_terms_to_bucket(
+            (tokens_override if tokens_override is not None else match_tokens)[:8]
+        )
         token_filters = []
         for token in tokens:
             pattern = f"%{token}%"
@@ -1356,19 +1427,36 @@ def _search_snapshots_inner(
             )
         return qry.filter(and_(*token_filters)) if token_filters else qry
 
-    def apply_fts_filter(qry: Any) -> Any:
+    def apply_fts_filter(qry: Any, *, text_override: str | None = None) -> Any:
         nonlocal tsquery, vector_expr
         if q_filter is None:
             raise ValueError("apply_fts_filter called without q_filter")
-        tsquery = func.websearch_to_tsquery(TS_CONFIG, q_filter)
-        computed_vector = build_search_vector(Snapshot.title, Snapshot.snippet, Snapshot.url)
+        fts_text = text_override or q_filter
+
+        def make_tsquery(config: Any) -> Any:
+            return func.websearch_to_tsquery(config, fts_text)
+
+        # Each row is matched (and ranked) with a query parsed by its own
+        # language's config, so stemming agrees with how its vector was built.
+        tsquery = build_language_tsquery(
+            make_tsquery, Snapshot.language, version_col=Snapshot.search_vector_version
+        )
+        computed_vector = build_search_vector(
+            Snapshot.title, Snapshot.snippet, Snapshot.url, language=Snapshot.language
+        )
 
         # Filter using the indexed column where possible so Postgres can use the
         # `ix_snapshots_search_vector` GIN index; only fall back to an on-the-fly
         # computed vector for rows that are missing the cached value.
         vector_expr = func.coalesce(Snapshot.search_vector, computed_vector)
         fts_filter = or_(
-            Snapshot.search_vector.op("@@")(tsquery),
+            build_language_fts_filter(
+                Snapshot.search_vector,
+                make_tsquery,
+                Snapshot.language,
+                version_col=Snapshot.search_vector_version,
+                languages=[lang] if lang else None,
+            ),
             and_(Snapshot.search_vector.is_(None), computed_vector.op("@@")(tsquery)),
         )
         return qry.filter(fts_filter)
@@ -1427,47 +1515,37 @@ def _search_snapshots_inner(
 
         return qry.filter(and_(*token_filters))
 
+    def suggest_correction() -> str | None:
+        if q_filter is None or not _has_table(db, "search_vocabulary"):
+            return None
+        return suggest_query(db, q_filter)
+
+    def adopt_correction(corrected: str) -> None:
+        # Rank the corrected results as if the corrected query had been typed.
+        nonlocal phrase_query, rank_text, match_tokens, query_tokens
+        suggestions.append(corrected)
+        phrase_query = corrected
+        rank_text = corrected
+        match_tokens = [t for t in tokenize_query(corrected) if len(t) >= 3] or [corrected]
+        if query_tokens:
+            query_tokens = tokenize_query(corrected)
+
     if url_search_targets:
         query = query.filter(group_key.in_(url_search_targets))
         total = compute_total(query)
         search_mode = "url"
     elif boolean_query:
-
-        def build_term_expr(term: BoolTerm) -> Any:
-            text_value = term.text.strip()
-            if not text_value:
-                return text("1=1")
-            escaped = _escape_like(text_value)
-            pattern = f"%{escaped}%"
-
-            title_expr = func.coalesce(Snapshot.title, "")
-            snippet_expr = func.coalesce(Snapshot.snippet, "")
-            url_expr = Snapshot.url
-            group_expr = func.coalesce(Snapshot.normalized_url_group, "")
-
-            def match(expr: Any) -> Any:
-                return expr.ilike(pattern, escape="\\")
-
-            if term.field == "title":
-                return match(title_expr)
-            if term.field == "snippet":
-                return match(snippet_expr)
-            if term.field == "url":
-                return or_(match(url_expr), match(group_expr))
-            return or_(match(title_expr), match(snippet_expr), match(url_expr))
-
-        def build_expr(node: BoolNode) -> Any:
-            if isinstance(node, BoolTerm):
-                return build_term_expr(node)
-            if isinstance(node, BoolNot):
-                return ~build_expr(node.child)
-            if isinstance(node, BoolAnd):
-                return and_(*(build_expr(c) for c in node.children))
-            if isinstance(node, BoolOr):
-                return or_(*(build_expr(c) for c in node.children))
-            return text("1=1")
-
-        query = query.filter(build_expr(boolean_query))
+        compiled = compile_query(boolean_query, dialect_name=dialect_name)
+        query = query.filter(compiled.filter)
+        if compiled.rank_tsquery is not None:
+            # Rank with the same ts_rank_cd blend as relevance_fts.
+            tsquery = compiled.rank_tsquery
+            vector_expr = func.coalesce(
+                Snapshot.search_vector,
+                build_search_vector(
+                    Snapshot.title, Snapshot.snippet, Snapshot.url, language=Snapshot.language
+                ),
+            )
         total = compute_total(query)
         search_mode = "boolean"
     elif q_filter:
@@ -1486,6 +1564,20 @@ def _search_snapshots_inner(
                 total = compute_total(query)
                 search_mode = "relevance_fallback"
 
+                # Correct misspellings against the precomputed vocabulary and
+                # retry the indexed FTS path before any trigram scan.
+                corrected = suggest_correction() if total == 0 else None
+                if corrected:
+                    corrected_query = apply_fts_filter(base_query, text_override=corrected)
+                    corrected_total = compute_total(corrected_query)
+                    if corrected_total > 0:
+                        query, total = corrected_query, corrected_total
+                        search_mode = "relevance_corrected"
+                        adopt_correction(corrected)
+                    else:
+                        tsquery = None
+                        vector_expr = None
+
                 if total == 0 and len(q_filter) >= 4 and _has_pg_trgm(db):
                     query = apply_fuzzy_filter(base_query)
                     total = compute_total(query)
@@ -1497,6 +1589,22 @@ def _search_snapshots_inner(
                 "relevance_fallback" if effective_sort == SearchSort.relevance else "newest"
             )
 
+            corrected = suggest_correction() if total == 0 else None
+            if corrected:
+                corrected_tokens = [t for t in tokenize_query(corrected) if len(t) >= 3]
+                corrected_query = apply_substring_filter(
+                    base_query, tokens_override=corrected_tokens or [corrected]
+                )
+                corrected_total = compute_total(corrected_query)
+                if corrected_total > 0:
+                    query, total = corrected_query, corrected_total
+                    search_mode = (
+                        "relevance_corrected"
+                        if effective_sort == SearchSort.relevance
+                        else "newest_corrected"
+                    )
+                    adopt_correction(corrected)
+
             if total == 0 and use_postgres_fts and len(q_filter) >= 4 and _has_pg_trgm(db):
                 score_override = None
                 query = apply_fuzzy_filter(base_query)
@@ -1675,7 +1783,9 @@ def _search_snapshots_inner(
                 (Snapshot.title.ilike(f"%{rank_text}%"), 0.2),
                 else_=0.0,
             )
-        token_match_exprs = [Snapshot.title.ilike(f"%{t}%") for t in query_tokens]
+        token_match_exprs = [
+            Snapshot.title.ilike(f"%{t}%") for t in pad_terms_to_bucket(query_tokens)
+        ]
         any_match = or_(*token_match_exprs)
         all_match = and_(*token_match_exprs) if len(token_match_exprs) > 1 else any_match
         return case(
@@ -1806,18 +1916,21 @@ def _search_snapshots_inner(
                 score = score + build_title_exact_match_boost() + build_recency_boost()
             return score
 
-        # DB-agnostic fallback: score by field match presence.
+        # DB-agnostic fallback: score by field match presence. Padding slots
+        # carry a bound weight of 0 so they keep the statement shape without
+        # counting twice.
         tokens = match_tokens[:8]
+        slots = list(zip(pad_terms_to_bucket(tokens), [1] * len(tokens) + [0] * 8))
         title_hits = sum(
-            (case((Snapshot.title.ilike(f"%{t}%"), 1), else_=0) for t in tokens),
+            (case((Snapshot.title.ilike(f"%{t}%"), w), else_=0) for t, w in slots),
             0,
         )
         url_hits = sum(
-            (case((Snapshot.url.ilike(f"%{t}%"), 1), else_=0) for t in tokens),
+            (case((Snapshot.url.ilike(f"%{t}%"), w), else_=0) for t, w in slots),
             0,
         )
         snippet_hits = sum(
-            (case((Snapshot.snippet.ilike(f"%{t}%"), 1), else_=0) for t in tokens),
+            (case((Snapshot.snippet.ilike(f"%{t}%"), w), else_=0) for t, w in slots),
             0,
         )
         phrase_boost = (
@@ -1862,9 +1975,9 @@ def _search_snapshots_inner(
             .filter(latest_ids_subq.c.rn == 1)
         )
 
-    def build_item_query_for_pages_v2() -> Any:
+    def build_item_query_for_pages_v2() -> tuple[Any, list[SortKey]]:
         if snapshot_score is None:
-            return build_item_query_for_pages_v1()
+            return build_item_query_for_pages_v1(), newest_keys
 
         row_number = (
             func.row_number()
@@ -1917,16 +2030,28 @@ def _search_snapshots_inner(
                 ),
             )
             .filter(latest_ids_subq.c.rn == 1)
-            .order_by(
-                status_quality.desc(),
-                group_scores_subq.c.group_score.desc(),
-                func.length(group_scores_subq.c.group_key).asc(),
-                Snapshot.capture_timestamp.desc(),
-                Snapshot.id.desc(),
-            )
-        )
+        ), [
+            SortKey(status_quality),
+            SortKey(group_scores_subq.c.group_score),
+            SortKey(func.length(group_scores_subq.c.group_key), descending=False),
+            SortKey(Snapshot.capture_timestamp),
+            SortKey(Snapshot.id),
+        ]
+
+    newest_keys = [
+        SortKey(status_quality),
+        SortKey(Snapshot.capture_timestamp),
+        SortKey(Snapshot.id),
+    ]
 
-    ordered = query
+    def relevance_keys(rank_score: Any, *, by_url_length: bool) -> list[SortKey]:
+        keys = [SortKey(status_quality), SortKey(rank_score)]
+        if by_url_length:
+            keys.append(SortKey(pages_url_length, descending=False))
+        return keys + [SortKey(Snapshot.capture_timestamp), SortKey(Snapshot.id)]
+
+    item_query = query
+    sort_keys = newest_keys
     if effective_view == SearchView.pages:
         if (
             ranking_version == RankingVersion.v2
@@ -1934,7 +2059,7 @@ def _search_snapshots_inner(
             and rank_text
             and score_override is None
         ):
-            ordered = build_item_query_for_pages_v2()
+            item_query, sort_keys = build_item_query_for_pages_v2()
         else:
             item_query = build_item_query_for_pages_v1()
             if use_page_signals:
@@ -1944,42 +2069,18 @@ def _search_snapshots_inner(
 
             if effective_sort == SearchSort.relevance and rank_text:
                 rank_score = snapshot_score if snapshot_score is not None else literal(0.0)
-                ordered = item_query.order_by(
-                    status_quality.desc(),
-                    rank_score.desc(),
-                    pages_url_length.asc(),
-                    Snapshot.capture_timestamp.desc(),
-                    Snapshot.id.desc(),
-                )
-            else:
-                ordered = item_query.order_by(
-                    status_quality.desc(),
-                    Snapshot.capture_timestamp.desc(),
-                    Snapshot.id.desc(),
-                )
+                sort_keys = relevance_keys(rank_score, by_url_length=True)
     else:
-        item_query = query
         if use_page_signals:
             item_query = item_query.outerjoin(
                 PageSignal, PageSignal.normalized_url_group == group_key
             )
         if effective_sort == SearchSort.relevance and rank_text:
             rank_score = snapshot_score if snapshot_score is not None else literal(0.0)
-            ordered = item_query.order_by(
-                status_quality.desc(),
-                rank_score.desc(),
-                Snapshot.capture_timestamp.desc(),
-                Snapshot.id.desc(),
-            )
-        else:
-            ordered = item_query.order_by(
-                status_quality.desc(),
-                Snapshot.capture_timestamp.desc(),
-                Snapshot.id.desc(),
-            )
+            sort_keys = relevance_keys(rank_score, by_url_length=False)
 
-    items = (
-        ordered.options(
+    items, next_cursor = fetch_page(
+        item_query.order_by(*keyset_order_by(sort_keys)).options(
             load_only(
                 Snapshot.id,
                 Snapshot.job_id,
@@ -1995,10 +2096,9 @@ def _search_snapshots_inner(
                 Snapshot.warc_record_id,
             ),
             joinedload(Snapshot.source),
-        )
-        .offset(offset)
-        .limit(pageSize)
-        .all()
+        ),
+        sort_keys,
+        "default",
     )
 
     search_results: List[SnapshotSummarySchema] = []
@@ -2014,13 +2114,10 @@ def _search_snapshots_inner(
             pairs.add((int(snap.source_id), group_val))
 
         if pairs:
-            conditions = [
-                and_(Page.source_id == sid, Page.normalized_url_group == group)
-                for sid, group in pairs
-            ]
+            # An expanding IN keeps one statement shape for any page size.
             page_rows = (
                 db.query(Page.source_id, Page.normalized_url_group, Page.snapshot_count)
-                .filter(or_(*conditions))
+                .filter(tuple_(Page.source_id, Page.normalized_url_group).in_(sorted(pairs)))
                 .all()
             )
             page_counts_by_key = {
@@ -2080,6 +2177,8 @@ def _search_snapshots_inner(
             total=total,
             page=page,
             pageSize=pageSize,
+            nextCursor=next_cursor,
+            suggestions=suggestions,
         ),
         mode,
     )
@@ -2093,6 +2192,30 @@ def get_db() -> Iterator[Session]:
         yield session
 
 
+def get_read_db() -> Iterator[Session]:
+    """
+    FastAPI dependency for read-only endpoints (read replica when configured).
+    """
+    with get_read_session() as session:
+        yield session
+
+
+def get_search_db() -> Iterator[Session]:
+    """
+    Read-only session bounded by HEALTHARCHIVE_DB_SEARCH_STATEMENT_TIMEOUT_MS.
+    """
+    with get_read_session(statement_timeout_ms=get_search_statement_timeout_ms()) as session:
+        yield session
+
+
+def get_export_db() -> Iterator[Session]:
+    """
+    Read-only session bounded by HEALTHARCHIVE_DB_EXPORT_STATEMENT_TIMEOUT_MS.
+    """
+    with get_read_session(statement_timeout_ms=get_export_statement_timeout_ms()) as session:
+        yield session
+
+
 def _build_usage_counts(raw: dict[str, int]) -> UsageMetricsCountsSchema:
     return UsageMetricsCountsSchema(
         searchRequests=raw.get(EVENT_SEARCH_REQUEST, 0),
@@ -2209,7 +2332,7 @@ def submit_issue_report(
 
 
 @router.get("/usage", response_model=UsageMetricsSchema)
-def get_usage_metrics(db: Session = Depends(get_db)) -> UsageMetricsSchema:
+def get_usage_metrics(db: Session = Depends(get_read_db)) -> UsageMetricsSchema:
     """
     Return aggregated usage metrics (daily counts).
     """
@@ -2286,7 +2409,7 @@ def export_snapshots(
     limit: Optional[int] = Query(default=None, ge=1),
     from_: Optional[date] = Query(default=None, alias="from"),
     to: Optional[date] = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_export_db),
 ) -> StreamingResponse:
     """
     Stream snapshot metadata exports in JSONL or CSV format.
@@ -2372,7 +2495,7 @@ def export_changes(
     limit: Optional[int] = Query(default=None, ge=1),
     from_: Optional[date] = Query(default=None, alias="from"),
     to: Optional[date] = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_export_db),
 ) -> StreamingResponse:
     """
     Stream change event exports in JSONL or CSV format.
@@ -2465,7 +2588,8 @@ def list_changes(
     to: Optional[date] = Query(default=None),
     page: int = Query(default=1, ge=1),
     pageSize: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(default=None, max_length=2048),
+    db: Session = Depends(get_read_db),
 ) -> ChangeFeedSchema:
     """
     Return a feed of precomputed change events.
@@ -2548,16 +2672,31 @@ def list_changes(
         query = query.filter(SnapshotChange.change_type != CHANGE_TYPE_UNCHANGED)
 
     total = query.count()
+    sort_keys = [
+        SortKey(SnapshotChange.to_capture_timestamp, nullable=True),
+        SortKey(SnapshotChange.id),
+    ]
+    scope = cursor_scope("changes", (source, jobId, latest, includeUnchanged, from_, to))
     offset = (page - 1) * pageSize
-    rows = (
-        query.order_by(
-            SnapshotChange.to_capture_timestamp.desc(),
-            SnapshotChange.id.desc(),
-        )
-        .offset(offset)
-        .limit(pageSize)
-        .all()
-    )
+    if cursor:
+        try:
+            values = decode_cursor(cursor, scope)
+            query = query.filter(
+                keyset_filter(
+                    sort_keys,
+                    values,
+                    nulls_high=nulls_sort_high(db.get_bind().dialect.name),
+                )
+            )
+        except CursorError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        offset = 0
+    rows = query.order_by(*keyset_order_by(sort_keys)).offset(offset).limit(pageSize + 1).all()
+    next_cursor = None
+    if len(rows) > pageSize:
+        rows = rows[:pageSize]
+        last = rows[-1]
+        next_cursor = encode_cursor(scope, [last.to_capture_timestamp, last.id])
 
     return ChangeFeedSchema(
         enabled=True,
@@ -2565,6 +2704,7 @@ def list_changes(
         page=page,
         pageSize=pageSize,
         results=[_build_change_event_schema(row) for row in rows],
+        nextCursor=next_cursor,
     )
 
 
@@ -2572,7 +2712,7 @@ def list_changes(
 def get_change_compare(
     toSnapshotId: int = Query(..., ge=1),
     fromSnapshotId: Optional[int] = Query(default=None, ge=1),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> ChangeCompareSchema:
     """
     Return a precomputed diff between two snapshots.
@@ -2616,15 +2756,118 @@ def get_change_compare(
     )
 
 
+def _load_compare_live_snapshot(snapshot_id: int) -> tuple[Snapshot, Dict[int, str]]:
+    """
+    Load a detached Snapshot (plus its job name) in a short-lived session.
+    """
+    with get_session() as db:
+        snapshot = db.query(Snapshot).filter(Snapshot.id == snapshot_id).first()
+        if not snapshot:
+            raise HTTPException(status_code=404, detail="Snapshot not found")
+        if not snapshot.url:
+            raise HTTPException(status_code=404, detail="Snapshot URL not found")
+        if not is_html_mime_type(snapshot.mime_type):
+            raise HTTPException(status_code=422, detail="Snapshot is not HTML")
+
+        job_names: Dict[int, str] = {}
+        if snapshot.job_id:
+            row = (
+                db.query(ArchiveJob.id, ArchiveJob.name)
+                .filter(ArchiveJob.id == snapshot.job_id)
+                .first()
+            )
+            if row:
+                job_names = {int(row[0]): row[1]}
+
+        db.expunge(snapshot)
+        return snapshot, job_names
+
+
+def _record_compare_live_usage() -> None:
+    with get_session() as db:
+        record_usage_event(db, EVENT_COMPARE_LIVE_VIEW)
+
+
+def _build_compare_live_response(
+    snapshot: Snapshot,
+    job_names: Dict[int, str],
+    archived_html: str,
+    live_result: LiveFetchResult,
+    mode: str,
+) -> CompareLiveSchema:
+    doc_a, doc_b, extraction = build_compare_documents(
+        archived_html,
+        live_result.html,
+        mode=mode,
+    )
+    compare = compute_live_compare_from_docs(doc_a, doc_b)
+    render_payload = build_compare_render_payload(
+        doc_a,
+        doc_b,
+        max_lines=get_compare_live_max_render_lines(),
+    )
+    summary = summarize_live_compare(compare.stats)
+
+    return CompareLiveSchema(
+        archivedSnapshot=_build_compare_snapshot(snapshot, job_names),
+        liveFetch=CompareLiveFetchSchema(
+            requestedUrl=live_result.requested_url,
+            finalUrl=live_result.final_url,
+            statusCode=live_result.status_code,
+            contentType=live_result.content_type,
+            bytesRead=live_result.bytes_read,
+            fetchedAt=live_result.fetched_at,
+        ),
+        stats=CompareLiveStatsSchema(
+            summary=summary,
+            addedSections=compare.stats.added_sections,
+            removedSections=compare.stats.removed_sections,
+            changedSections=compare.stats.changed_sections,
+            addedLines=compare.stats.added_lines,
+            removedLines=compare.stats.removed_lines,
+            changeRatio=compare.stats.change_ratio,
+            highNoise=compare.stats.high_noise,
+        ),
+        diff=CompareLiveDiffSchema(
+            diffFormat="html",
+            diffHtml=compare.diff_html,
+            diffTruncated=compare.diff_truncated,
+            diffVersion=compare.diff_version,
+            normalizationVersion=compare.normalization_version,
+        ),
+        render=CompareLiveRenderSchema(
+            archivedLines=render_payload.archived_lines,
+            liveLines=render_payload.live_lines,
+            renderInstructions=[
+                CompareLiveRenderInstructionSchema(
+                    type=instruction.type,
+                    lineIndexA=instruction.line_index_a,
+                    lineIndexB=instruction.line_index_b,
+                )
+                for instruction in render_payload.render_instructions
+            ],
+            renderTruncated=render_payload.render_truncated,
+            renderLineLimit=render_payload.render_line_limit,
+        ),
+        textModeRequested=extraction.requested_mode,
+        textModeUsed=extraction.used_mode,
+        textModeFallback=extraction.fallback_applied,
+    )
+
+
 @router.get("/snapshots/{snapshot_id}/compare-live", response_model=CompareLiveSchema)
-def get_compare_live(
+async def get_compare_live(
     snapshot_id: int,
     response: Response,
     mode: str = Query(default="main", pattern=r"^(main|full)$"),
-    db: Session = Depends(get_db),
 ) -> CompareLiveSchema:
     """
     Return a live diff between an archived snapshot and the current URL.
+
+    No database connection is held while the live page is fetched: snapshot
+    metadata is loaded (and the session closed) first, the fetch runs on a
+    shared async connection pool, and normalization/diffing run in a worker
+    thread.
     """
     if not get_compare_live_enabled():
         raise HTTPException(status_code=404, detail="Compare-live not enabled")
@@ -2637,16 +2880,11 @@ def get_compare_live(
         )
 
     try:
-        snapshot = db.query(Snapshot).filter(Snapshot.id == snapshot_id).first()
-        if not snapshot:
-            raise HTTPException(status_code=404, detail="Snapshot not found")
-        if not snapshot.url:
-            raise HTTPException(status_code=404, detail="Snapshot URL not found")
-        if not is_html_mime_type(snapshot.mime_type):
-            raise HTTPException(status_code=422, detail="Snapshot is not HTML")
+        snapshot, job_names = await run_in_threadpool(_load_compare_live_snapshot, snapshot_id)
 
         try:
-            archived_html = load_snapshot_html(
+            archived_html = await run_in_threadpool(
+                load_snapshot_html,
                 snapshot,
                 max_bytes=get_compare_live_max_archive_bytes(),
             )
@@ -2656,12 +2894,13 @@ def get_compare_live(
             raise HTTPException(status_code=404, detail=str(exc)) from exc
 
         try:
-            live_result = fetch_live_html(
+            live_result = await fetch_live_html_async(
                 snapshot.url,
                 timeout_seconds=get_compare_live_timeout_seconds(),
                 max_redirects=get_compare_live_max_redirects(),
                 max_bytes=get_compare_live_max_bytes(),
                 user_agent=get_compare_live_user_agent(),
+                cache=get_live_fetch_cache(),
             )
         except LiveFetchBlocked as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -2672,84 +2911,63 @@ def get_compare_live(
         except LiveFetchError as exc:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
-        doc_a, doc_b, extraction = build_compare_documents(
+        result = await run_in_threadpool(
+            _build_compare_live_response,
+            snapshot,
+            job_names,
             archived_html,
-            live_result.html,
-            mode=mode,
-        )
-        compare = compute_live_compare_from_docs(doc_a, doc_b)
-        render_payload = build_compare_render_payload(
-            doc_a,
-            doc_b,
-            max_lines=get_compare_live_max_render_lines(),
+            live_result,
+            mode,
         )
-        summary = summarize_live_compare(compare.stats)
-
-        job_names: Dict[int, str] = {}
-        if snapshot.job_id:
-            row = (
-                db.query(ArchiveJob.id, ArchiveJob.name)
-                .filter(ArchiveJob.id == snapshot.job_id)
-                .first()
-            )
-            if row:
-                job_names = {int(row[0]): row[1]}
-
-        record_usage_event(db, EVENT_COMPARE_LIVE_VIEW)
+        await run_in_threadpool(_record_compare_live_usage)
 
         response.headers["Cache-Control"] = "no-store"
         response.headers["Pragma"] = "no-cache"
         response.headers["X-Robots-Tag"] = "noindex, nofollow"
-
-        return CompareLiveSchema(
-            archivedSnapshot=_build_compare_snapshot(snapshot, job_names),
-            liveFetch=CompareLiveFetchSchema(
-                requestedUrl=live_result.requested_url,
-                finalUrl=live_result.final_url,
-                statusCode=live_result.status_code,
-                contentType=live_result.content_type,
-                bytesRead=live_result.bytes_read,
-                fetchedAt=live_result.fetched_at,
-            ),
-            stats=CompareLiveStatsSchema(
-                summary=summary,
-                addedSections=compare.stats.added_sections,
-                removedSections=compare.stats.removed_sections,
-                changedSections=compare.stats.changed_sections,
-                addedLines=compare.stats.added_lines,
-                removedLines=compare.stats.removed_lines,
-                changeRatio=compare.stats.change_ratio,
-                highNoise=compare.stats.high_noise,
-            ),
-            diff=CompareLiveDiffSchema(
-                diffFormat="html",
-                diffHtml=compare.diff_html,
-                diffTruncated=compare.diff_truncated,
-                diffVersion=compare.diff_version,
-                normalizationVersion=compare.normalization_version,
-            ),
-            render=CompareLiveRenderSchema(
-                archivedLines=render_payload.archived_lines,
-                liveLines=render_payload.live_lines,
-                renderInstructions=[
-                    CompareLiveRenderInstructionSchema(
-                        type=instruction.type,
-                        lineIndexA=instruction.line_index_a,
-                        lineIndexB=instruction.line_index_b,
-                    )
-                    for instruction in render_payload.render_instructions
-                ],
-                renderTruncated=render_payload.render_truncated,
-                renderLineLimit=render_payload.render_line_limit,
-            ),
-            textModeRequested=extraction.requested_mode,
-            textModeUsed=extraction.used_mode,
-            textModeFallback=extraction.fallback_applied,
-        )
+        return result
     finally:
         _COMPARE_LIVE_SEMAPHORE.release()
 
 
+def _latest_group_snapshot(
+    db: Session,
+    *,
+    source_id: int,
+    group: str,
+    require_html: bool,
+) -> Optional[tuple[int, Any, Optional[str]]]:
+    """
+    Return (id, capture_timestamp, mime_type) of a page group's newest capture.
+
+    Answered from the group's ``pages`` row (unique-key lookup joined to the
+    snapshot by primary key); falls back to scanning the group's snapshots when
+    the pages fast path is off or the row has no pointer yet.
+    """
+    if get_pages_fastpath_enabled() and _has_table(db, "pages"):
+        pointer = Page.latest_html_snapshot_id if require_html else Page.latest_snapshot_id
+        row = (
+            db.query(Snapshot.id, Snapshot.capture_timestamp, Snapshot.mime_type)
+            .join(Page, pointer == Snapshot.id)
+            .filter(Page.source_id == source_id)
+            .filter(Page.normalized_url_group == group)
+            .first()
+        )
+        if row:
+            return int(row[0]), row[1], row[2]
+
+    query = (
+        db.query(Snapshot.id, Snapshot.capture_timestamp, Snapshot.mime_type)
+        .filter(Snapshot.source_id == source_id)
+        .filter(Snapshot.normalized_url_group == group)
+    )
+    if require_html:
+        query = query.filter(Snapshot.is_html.is_(True))
+    row = query.order_by(Snapshot.capture_timestamp.desc(), Snapshot.id.desc()).first()
+    if not row:
+        return None
+    return int(row[0]), row[1], row[2]
+
+
 @router.get("/snapshots/{snapshot_id}/latest", response_model=SnapshotLatestSchema)
 def get_snapshot_latest(
     snapshot_id: int,
@@ -2757,7 +2975,7 @@ def get_snapshot_latest(
         default=True,
         description="When true (default), only return the most recent HTML snapshot for this page group.",
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SnapshotLatestSchema:
     """
     Return the most recent snapshot for the same normalized_url_group as snapshot_id.
@@ -2778,27 +2996,14 @@ def get_snapshot_latest(
     if not group or source_id is None:
         return SnapshotLatestSchema(found=False)
 
-    query = (
-        db.query(Snapshot.id, Snapshot.capture_timestamp, Snapshot.mime_type)
-        .filter(Snapshot.source_id == source_id)
-        .filter(Snapshot.normalized_url_group == group)
-    )
-    if requireHtml:
-        query = query.filter(
-            or_(
-                Snapshot.mime_type.ilike("text/html%"),
-                Snapshot.mime_type.ilike("application/xhtml+xml%"),
-            )
-        )
-
-    row = query.order_by(Snapshot.capture_timestamp.desc(), Snapshot.id.desc()).first()
+    row = _latest_group_snapshot(db, source_id=source_id, group=group, require_html=requireHtml)
     if not row:
         return SnapshotLatestSchema(found=False)
 
     latest_id, capture_ts, mime_type = row
     return SnapshotLatestSchema(
         found=True,
-        snapshotId=int(latest_id),
+        snapshotId=latest_id,
         captureTimestamp=_format_capture_timestamp(capture_ts),
         mimeType=mime_type,
     )
@@ -2810,86 +3015,171 @@ def get_snapshot_latest(
 )
 def get_snapshot_timeline(
     snapshot_id: int,
-    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=1000,
+        description="Maximum captures to return (default: all).",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        max_length=2048,
+        description="Opaque keyset cursor from a previous response's nextCursor.",
+    ),
+    db: Session = Depends(get_read_db),
 ) -> SnapshotTimelineSchema:
     """
     Return a timeline of captures for the same normalized URL group.
+
+    Captures are read column-only in ``ix_snapshots_timeline`` order with job
+    names and change predecessors joined in, and responses are cached until
+    the group's ``pages`` row or change events change.
     """
     snap = (
-        db.query(Snapshot)
-        .options(joinedload(Snapshot.source))
+        db.query(
+            Snapshot.source_id,
+            Snapshot.normalized_url_group,
+            Snapshot.url,
+            Source.code,
+            Source.name,
+        )
+        .outerjoin(Source, Source.id == Snapshot.source_id)
         .filter(Snapshot.id == snapshot_id)
         .first()
     )
     if not snap:
         raise HTTPException(status_code=404, detail="Snapshot not found")
+    source_id, stored_group, snap_url, source_code, source_name = snap
 
-    group = snap.normalized_url_group or normalize_url_for_grouping(snap.url)
+    group = stored_group or normalize_url_for_grouping(snap_url)
     if not group:
         raise HTTPException(status_code=404, detail="Snapshot not grouped")
 
-    snapshots = (
-        db.query(Snapshot)
-        .filter(Snapshot.source_id == snap.source_id)
-        .filter(Snapshot.normalized_url_group == group)
-        .order_by(Snapshot.capture_timestamp.asc(), Snapshot.id.asc())
-        .all()
+    record_usage_event(db, EVENT_TIMELINE_VIEW)
+
+    group_filters = (
+        Snapshot.source_id == source_id,
+        Snapshot.normalized_url_group == group,
+    )
+    latest_change_id = (
+        db.query(func.max(SnapshotChange.id))
+        .filter(
+            SnapshotChange.source_id == source_id,
+            SnapshotChange.normalized_url_group == group,
+        )
+        .scalar_subquery()
+    )
+    # The pages row is rewritten whenever indexing or a rebuild touches the
+    # group; groups not folded into pages yet fall back to their captures.
+    data_version = (
+        db.query(Page.snapshot_count, Page.latest_snapshot_id, Page.updated_at, latest_change_id)
+        .filter(Page.source_id == source_id, Page.normalized_url_group == group)
+        .first()
+    )
+    if data_version is None:
+        data_version = (
+            db.query(
+                func.count(Snapshot.id), func.max(Snapshot.id), literal(None), latest_change_id
+            )
+            .filter(*group_filters)
+            .one()
+        )
+    cache_key = (
+        id(db.get_bind()),
+        source_id,
+        group,
+        tuple(data_version),
+        limit,
+        cursor,
+        get_replay_base_url(),
     )
+    with _TIMELINE_CACHE_LOCK:
+        cached = _TIMELINE_CACHE.get(cache_key)
+        if cached is not None:
+            _TIMELINE_CACHE.move_to_end(cache_key)
+            return cached
 
-    snapshot_ids = [row.id for row in snapshots]
-    change_rows = (
-        db.query(SnapshotChange.to_snapshot_id, SnapshotChange.from_snapshot_id)
-        .filter(SnapshotChange.to_snapshot_id.in_(snapshot_ids))
-        .all()
+    sort_keys = [
+        SortKey(Snapshot.capture_timestamp, descending=False),
+        SortKey(Snapshot.id, descending=False),
+    ]
+    query = (
+        db.query(
+            Snapshot.id,
+            Snapshot.capture_timestamp,
+            Snapshot.job_id,
+            Snapshot.title,
+            Snapshot.status_code,
+            Snapshot.url,
+            ArchiveJob.name,
+            SnapshotChange.from_snapshot_id,
+        )
+        .outerjoin(ArchiveJob, ArchiveJob.id == Snapshot.job_id)
+        .outerjoin(SnapshotChange, SnapshotChange.to_snapshot_id == Snapshot.id)
+        .filter(*group_filters)
     )
-    compare_map = {row[0]: row[1] for row in change_rows}
+    scope = cursor_scope("timeline", (source_id, group))
+    if cursor:
+        try:
+            query = query.filter(keyset_filter(sort_keys, decode_cursor(cursor, scope)))
+        except CursorError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+    query = query.order_by(*keyset_order_by(sort_keys))
+    if limit is not None:
+        query = query.limit(limit + 1)
+    rows = query.all()
 
-    job_ids = {row.job_id for row in snapshots if row.job_id}
-    job_names: Dict[int, str] = {}
-    if job_ids:
-        rows = db.query(ArchiveJob.id, ArchiveJob.name).filter(ArchiveJob.id.in_(job_ids)).all()
-        job_names = {int(job_id): job_name for job_id, job_name in rows}
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, [rows[-1].capture_timestamp, rows[-1].id])
 
     items: List[SnapshotTimelineItemSchema] = []
-    for row in snapshots:
+    for (
+        row_id,
+        capture_ts,
+        job_id,
+        title,
+        status_code,
+        url,
+        job_name,
+        compare_from_id,
+    ) in rows:
         capture_date = (
-            row.capture_timestamp.date().isoformat()
-            if isinstance(row.capture_timestamp, datetime)
-            else str(row.capture_timestamp)
+            capture_ts.date().isoformat() if isinstance(capture_ts, datetime) else str(capture_ts)
         )
         items.append(
             SnapshotTimelineItemSchema(
-                snapshotId=row.id,
+                snapshotId=row_id,
                 captureDate=capture_date,
-                captureTimestamp=_format_capture_timestamp(row.capture_timestamp),
-                jobId=row.job_id,
-                jobName=job_names.get(row.job_id) if row.job_id else None,
-                title=row.title,
-                statusCode=row.status_code,
-                compareFromSnapshotId=compare_map.get(row.id),
-                browseUrl=_build_browse_url(
-                    row.job_id,
-                    row.url,
-                    row.capture_timestamp,
-                    row.id,
-                ),
+                captureTimestamp=_format_capture_timestamp(capture_ts),
+                jobId=job_id,
+                jobName=job_name if job_id else None,
+                title=title,
+                statusCode=status_code,
+                compareFromSnapshotId=compare_from_id,
+                browseUrl=_build_browse_url(job_id, url, capture_ts, row_id),
             )
         )
 
-    record_usage_event(db, EVENT_TIMELINE_VIEW)
-
-    return SnapshotTimelineSchema(
-        sourceCode=snap.source.code if snap.source else None,
-        sourceName=snap.source.name if snap.source else None,
+    result = SnapshotTimelineSchema(
+        sourceCode=source_code,
+        sourceName=source_name,
         normalizedUrlGroup=group,
         snapshots=items,
+        nextCursor=next_cursor,
     )
+    with _TIMELINE_CACHE_LOCK:
+        _TIMELINE_CACHE[cache_key] = result
+        while len(_TIMELINE_CACHE) > _TIMELINE_CACHE_MAX_ENTRIES:
+            _TIMELINE_CACHE.popitem(last=False)
+    return result
 
 
 @router.get("/changes/rss")
 def get_changes_rss(
     source: Optional[str] = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> Response:
     """
     Return an RSS feed for the latest change events.
@@ -3042,7 +3332,7 @@ def health_check_head(db: Session = Depends(get_db)) -> Response:
 
 
 @router.get("/stats", response_model=ArchiveStatsSchema)
-def get_archive_stats(response: Response, db: Session = Depends(get_db)) -> ArchiveStatsSchema:
+def get_archive_stats(response: Response, db: Session = Depends(get_read_db)) -> ArchiveStatsSchema:
     """
     Public archive stats used by the frontend (homepage snapshot metrics).
 
@@ -3098,7 +3388,7 @@ def get_archive_stats(response: Response, db: Session = Depends(get_db)) -> Arch
 @router.get("/sources", response_model=List[SourceSummarySchema])
 def list_sources(
     lang: Optional[str] = Query(default=None, pattern=r"^(en|fr)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> List[SourceSummarySchema]:
     """
     Return per-source summary statistics derived from Snapshot data.
@@ -3305,7 +3595,7 @@ def list_sources(
 
 @router.get("/sources/{source_code}/editions", response_model=List[SourceEditionSchema])
 def list_source_editions(
-    source_code: str, db: Session = Depends(get_db)
+    source_code: str, db: Session = Depends(get_read_db)
 ) -> List[SourceEditionSchema]:
     """
     Return replayable "editions" (ArchiveJobs) for a source.
@@ -3493,7 +3783,7 @@ def get_source_preview(
     source_code: str,
     jobId: int = Query(..., ge=1),
     lang: Optional[str] = Query(default=None, pattern=r"^(en|fr)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> Response:
     """
     Return a cached preview image for a source's replay homepage.
@@ -3509,7 +3799,7 @@ def head_source_preview(
     source_code: str,
     jobId: int = Query(..., ge=1),
     lang: Optional[str] = Query(default=None, pattern=r"^(en|fr)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> Response:
     resp = _source_preview_response(source_code, job_id=jobId, lang=lang, db=db)
     return Response(status_code=resp.status_code, headers=dict(resp.headers))
@@ -3520,7 +3810,7 @@ def resolve_replay_url(
     jobId: int = Query(..., ge=1),
     url: str = Query(..., min_length=1, max_length=4096),
     timestamp: Optional[str] = Query(default=None, pattern=r"^\d{14}$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> ReplayResolveSchema:
     """
     Resolve a replay URL within a specific job (pywb collection).
@@ -3639,12 +3929,22 @@ def search_snapshots(
     ),
     page: int = Query(default=1, ge=1),
     pageSize: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        default=None,
+        max_length=2048,
+        description="Opaque keyset cursor from a previous response's nextCursor; overrides page.",
+    ),
+    lang: Optional[str] = Query(
+        default=None,
+        pattern=r"^(en|fr)$",
+        description="Only return captures in this language (en|fr).",
+    ),
     ranking: Optional[str] = Query(
         default=None,
         description="Ranking version override (v1|v2). Default is controlled by HA_SEARCH_RANKING_VERSION.",
         pattern=r"^(v1|v2)$",
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_search_db),
 ) -> SearchResponseSchema:
     """
     Search snapshots by keyword and/or source with simple pagination.
@@ -3653,20 +3953,23 @@ def search_snapshots(
     mode = "newest"
 
     try:
-        response, mode = _search_snapshots_inner(
-            q=q,
-            source=source,
-            sort=sort,
-            view=view,
-            includeNon2xx=includeNon2xx,
-            includeDuplicates=includeDuplicates,
-            from_date=from_,
-            to_date=to,
-            page=page,
-            pageSize=pageSize,
-            ranking=ranking,
-            db=db,
-        )
+        with search_sql_scope():
+            response, mode = _search_snapshots_inner(
+                q=q,
+                source=source,
+                sort=sort,
+                view=view,
+                includeNon2xx=includeNon2xx,
+                includeDuplicates=includeDuplicates,
+                from_date=from_,
+                to_date=to,
+                page=page,
+                pageSize=pageSize,
+                ranking=ranking,
+                db=db,
+                cursor=cursor,
+                lang=lang,
+            )
     except Exception as exc:
         # Classify error type for metrics
         from fastapi import HTTPException
@@ -3705,7 +4008,7 @@ def search_snapshots(
 @router.get("/snapshot/{snapshot_id}", response_model=SnapshotDetailSchema)
 def get_snapshot_detail(
     snapshot_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> SnapshotDetailSchema:
     """
     Return metadata for a single snapshot.
@@ -3759,13 +4062,57 @@ def get_snapshot_detail(
     )
 
 
+# Bump when the banner splice logic changes; the banner text itself is hashed.
+_RAW_RENDER_VERSION = "1"
+_RAW_SNAPSHOT_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+_BODY_OPEN_TAG_RE = re.compile(rb"<body\b[^>]*>", flags=re.IGNORECASE)
+
+
+def _raw_snapshot_etag(snap: Snapshot, banner: str) -> str:
+    """
+    Strong ETag for a rendered raw snapshot.
+
+    Archived bytes never change for a given content hash (or WARC record), so
+    the tag only needs that identity plus everything that shapes the banner.
+    """
+    identity = snap.content_hash or f"{snap.warc_path}#{snap.warc_record_id}"
+    digest = hashlib.sha256()
+    for part in (_RAW_RENDER_VERSION, identity, banner):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f'"raw-{digest.hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in {c.removeprefix("W/") for c in candidates}
+
+
+def _inject_banner(body: bytes, banner: bytes) -> bytes:
+    """
+    Splice the banner right after the first ``<body ...>`` tag, without decoding.
+    """
+    match = _BODY_OPEN_TAG_RE.search(body)
+    if match is None:
+        return banner + body
+    insert_at = match.end()
+    return body[:insert_at] + banner + body[insert_at:]
+
+
 @router.get("/snapshots/raw/{snapshot_id}", response_class=HTMLResponse)
 def get_snapshot_raw(
     snapshot_id: int,
-    db: Session = Depends(get_db),
-) -> HTMLResponse:
+    request: Request,
+    db: Session = Depends(get_read_db),
+) -> Response:
     """
     Serve raw HTML content for a snapshot by reading the underlying WARC record.
+
+    Responses carry an ETag and long-lived Cache-Control; a matching
+    If-None-Match returns 304 before any WARC I/O. Rendered pages are also
+    kept in the optional on-disk render cache.
     """
     snap = (
         db.query(Snapshot)
@@ -3781,6 +4128,7 @@ def get_snapshot_raw(
                 Snapshot.language,
                 Snapshot.warc_path,
                 Snapshot.warc_record_id,
+                Snapshot.content_hash,
             ),
             joinedload(Snapshot.source).load_only(Source.name),
         )
@@ -3793,30 +4141,6 @@ def get_snapshot_raw(
     if not snap.warc_path:
         raise HTTPException(status_code=404, detail="No WARC path associated with this snapshot")
 
-    warc_path = Path(snap.warc_path)
-    if not warc_path.is_file():
-        raise HTTPException(
-            status_code=404,
-            detail="Underlying WARC file for this snapshot is missing",
-        )
-
-    record = find_record_for_snapshot(snap)
-    if record is None:
-        raise HTTPException(
-            status_code=404,
-            detail="Could not locate corresponding record in the WARC file",
-        )
-
-    record_usage_event(db, EVENT_SNAPSHOT_RAW)
-
-    try:
-        html_body = record.body_bytes.decode("utf-8", errors="replace")
-    except Exception:
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to decode archived HTML content",
-        )
-
     site_base = get_public_site_base_url()
     replay_url = _build_browse_url(snap.job_id, snap.url, snap.capture_timestamp, snap.id)
     snapshot_details_url = f"{site_base}/snapshot/{snap.id}"
@@ -3851,21 +4175,11 @@ def get_snapshot_raw(
     if is_html_mime_type(snap.mime_type):
         group = normalize_url_for_grouping(snap.url)
         if group and snap.source_id:
-            latest = (
-                db.query(Snapshot.id)
-                .filter(Snapshot.source_id == snap.source_id)
-                .filter(Snapshot.normalized_url_group == group)
-                .filter(
-                    or_(
-                        Snapshot.mime_type.ilike("text/html%"),
-                        Snapshot.mime_type.ilike("application/xhtml+xml%"),
-                    )
-                )
-                .order_by(Snapshot.capture_timestamp.desc(), Snapshot.id.desc())
-                .first()
+            latest = _latest_group_snapshot(
+                db, source_id=snap.source_id, group=group, require_html=True
             )
             if latest:
-                compare_snapshot_id = int(latest[0])
+                compare_snapshot_id = latest[0]
     if compare_snapshot_id is None and is_html_mime_type(snap.mime_type):
         compare_snapshot_id = snap.id
 
@@ -4166,18 +4480,42 @@ def get_snapshot_raw(
 </script>
 """
 
-    # Try to inject after the first <body ...> tag to avoid breaking <head> content.
-    try:
-        match = re.search(r"<body\\b[^>]*>", html_body, flags=re.IGNORECASE)
-        if match:
-            insert_at = match.end()
-            html_body = html_body[:insert_at] + banner + html_body[insert_at:]
-        else:
-            html_body = banner + html_body
-    except Exception:
-        html_body = banner + html_body
+    etag = _raw_snapshot_etag(snap, banner)
+    cache_headers = {"ETag": etag, "Cache-Control": _RAW_SNAPSHOT_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        record_usage_event(db, EVENT_SNAPSHOT_RAW)
+        return Response(status_code=304, headers=cache_headers)
+
+    render_cache = get_raw_render_cache()
+    cache_tag = etag.strip('"')
+    if render_cache is not None:
+        cached = render_cache.get(snap.id, cache_tag)
+        if cached is not None:
+            record_usage_event(db, EVENT_SNAPSHOT_RAW)
+            return HTMLResponse(content=cached, headers=cache_headers)
+
+    warc_path = Path(snap.warc_path)
+    if not warc_path.is_file():
+        raise HTTPException(
+            status_code=404,
+            detail="Underlying WARC file for this snapshot is missing",
+        )
+
+    record = find_record_for_snapshot(snap)
+    if record is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Could not locate corresponding record in the WARC file",
+        )
+
+    record_usage_event(db, EVENT_SNAPSHOT_RAW)
+
+    # Inject after the first <body ...> tag to avoid breaking <head> content.
+    rendered = _inject_banner(record.body_bytes, banner.encode("utf-8"))
+    if render_cache is not None:
+        render_cache.put(snap.id, cache_tag, rendered)
 
-    return HTMLResponse(content=html_body, media_type="text/html")
+    return HTMLResponse(content=rendered, headers=cache_headers)
 
 
 __all__ = ["router"]
@@ -67,6 +67,9 @@ class SearchResponseSchema(BaseModel):
     total: int
     page: int
     pageSize: int
+    nextCursor: Optional[str] = None
+    # "Did you mean" corrections; when present, results are for the first one.
+    suggestions: List[str] = []
 
 
 class SnapshotDetailSchema(BaseModel):
@@ -157,6 +160,7 @@ class ChangeFeedSchema(BaseModel):
     page: int
     pageSize: int
     results: List[ChangeEventSchema]
+    nextCursor: Optional[str] = None
 
 
 class ChangeCompareSnapshotSchema(BaseModel):
@@ -250,6 +254,7 @@ class SnapshotTimelineSchema(BaseModel):
     sourceName: Optional[str]
     normalizedUrlGroup: Optional[str]
     snapshots: List[SnapshotTimelineItemSchema]
+    nextCursor: Optional[str] = None
 
 
 class IssueReportCategory(str, Enum):
@@ -7,6 +7,8 @@ import os
 import re
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,6 +20,10 @@ from archive_tool.utils import find_latest_config_yaml
 STABLE_WARCS_DIRNAME = "warcs"
 WARC_MANIFEST_FILENAME = "manifest.json"
 PROVENANCE_DIRNAME = "provenance"
+WARC_HASH_CACHE_FILENAME = ".sha256-cache.json"
+
+HASH_WORKERS_ENV = "HEALTHARCHIVE_HASH_WORKERS"
+_HASH_READ_BYTES = 4 * 1024 * 1024
 
 _WARC_NAME_RE = re.compile(r"^warc-(\d+)\.(?:warc(?:\.gz)?)$")
 
@@ -113,14 +119,183 @@ def _iter_stable_warc_paths(warcs_dir: Path) -> list[Path]:
 
 
 def _compute_sha256(path: Path) -> str:
-    """Compute the SHA256 hash of a file."""
+    """
+    Compute the SHA256 hash of a file.
+
+    Reads in large chunks and advises the kernel that the file is read once
+    sequentially, dropping each chunk from the page cache after hashing so
+    multi-GB WARCs do not evict hot pages.
+    """
     sha256 = hashlib.sha256()
-    with path.open("rb") as f:
-        while chunk := f.read(8192):
-            sha256.update(chunk)
+    buf = bytearray(_HASH_READ_BYTES)
+    view = memoryview(buf)
+    fadvise = getattr(os, "posix_fadvise", None)
+    with path.open("rb", buffering=0) as f:
+        fd = f.fileno()
+        if fadvise is not None:
+            try:
+                fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                fadvise = None
+        offset = 0
+        while n := f.readinto(buf):
+            sha256.update(view[:n])
+            if fadvise is not None:
+                try:
+                    fadvise(fd, offset, n, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    fadvise = None
+            offset += n
     return sha256.hexdigest()
 
 
+def get_job_warc_hash_cache_path(output_dir: Path) -> Path:
+    return get_job_warcs_dir(output_dir) / WARC_HASH_CACHE_FILENAME
+
+
+class WarcHashCache:
+    """
+    SHA256 cache keyed by (dev, inode, size, mtime).
+
+    Hardlinks share an inode, so relinking a WARC (temp -> stable) or
+    re-verifying an unchanged file reuses the stored hash instead of reading
+    the file again.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path is not None:
+            data = _load_manifest(path)
+            entries = data.get("entries") if isinstance(data, dict) else None
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    @staticmethod
+    def _key(st: os.stat_result) -> tuple[str, int, int]:
+        return f"{st.st_dev}:{st.st_ino}", int(st.st_size), int(st.st_mtime_ns)
+
+    def get(self, st: os.stat_result) -> str | None:
+        key, size, mtime_ns = self._key(st)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+            value = entry.get("sha256")
+            return str(value) if value else None
+        return None
+
+    def put(self, st: os.stat_result, sha256: str) -> None:
+        key, size, mtime_ns = self._key(st)
+        with self._lock:
+            self._entries[key] = {"size": size, "mtime_ns": mtime_ns, "sha256": sha256}
+            self._dirty = True
+
+    def prune(self, paths: Iterable[Path]) -> int:
+        """
+        Drop entries that no longer describe any of ``paths`` (deleted,
+        replaced or rewritten WARCs), so the cache does not grow forever.
+
+        Returns:
+            Number of entries removed.
+        """
+        live: set[tuple[str, int, int]] = set()
+        for path in paths:
+            try:
+                live.add(self._key(path.stat()))
+            except OSError:
+                continue
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if (key, entry.get("size"), entry.get("mtime_ns")) not in live
+            ]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        try:
+            _dump_manifest(self.path, {"version": 1, "entries": self._entries})
+            self._dirty = False
+        except OSError:
+            # Best-effort: a missing cache only costs a rehash next time.
+            pass
+
+
+def _hash_workers() -> int:
+    raw = os.environ.get(HASH_WORKERS_ENV, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def hash_files(
+    paths: Iterable[Path],
+    *,
+    cache: WarcHashCache | None = None,
+    refresh: bool = False,
+    workers: int | None = None,
+) -> tuple[dict[Path, str], dict[Path, OSError]]:
+    """
+    SHA256 many files in a thread pool (hashlib releases the GIL).
+
+    Files whose (dev, inode, size, mtime) is in ``cache`` are not read unless
+    ``refresh`` is set; fresh hashes are always stored back into ``cache``.
+
+    Returns:
+        (hashes, errors) keyed by the given paths.
+    """
+    hashes: dict[Path, str] = {}
+    errors: dict[Path, OSError] = {}
+    todo: dict[tuple[int, int], list[Path]] = {}
+    stats: dict[tuple[int, int], os.stat_result] = {}
+
+    for path in dict.fromkeys(paths):
+        try:
+            st = path.stat()
+        except OSError as exc:
+            errors[path] = exc
+            continue
+        cached = cache.get(st) if cache is not None and not refresh else None
+        if cached:
+            hashes[path] = cached
+            continue
+        # Hash each inode once even if several paths link to it.
+        inode = (st.st_dev, st.st_ino)
+        todo.setdefault(inode, []).append(path)
+        stats[inode] = st
+
+    def _hash_one(inode: tuple[int, int]) -> tuple[tuple[int, int], str | OSError]:
+        try:
+            return inode, _compute_sha256(todo[inode][0])
+        except OSError as exc:
+            return inode, exc
+
+    if todo:
+        n_workers = min(workers or _hash_workers(), len(todo))
+        with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="ha-sha256") as pool:
+            for inode, result in pool.map(_hash_one, list(todo)):
+                for path in todo[inode]:
+                    if isinstance(result, OSError):
+                        errors[path] = result
+                    else:
+                        hashes[path] = result
+                if cache is not None and not isinstance(result, OSError):
+                    cache.put(stats[inode], result)
+
+    return hashes, errors
+
+
 def _next_warc_index(existing_names: Iterable[str]) -> int:
     max_idx = 0
     for name in existing_names:
@@ -217,6 +392,7 @@ def consolidate_warcs(
     created = 0
     reused = 0
     stable_paths: list[Path] = []
+    pending_hashes: dict[str, Path] = {}
 
     if not dry_run:
         warcs_dir.mkdir(parents=True, exist_ok=True)
@@ -259,7 +435,9 @@ def consolidate_warcs(
                 dest,
                 allow_copy_fallback=allow_copy_fallback,
             )
-            sha256_hash = _compute_sha256(dest)
+            # Filled in below once all new links are hashed in parallel.
+            sha256_hash = ""
+            pending_hashes[source_key] = dest
 
         created += 1
         stable_paths.append(dest.resolve())
@@ -272,6 +450,17 @@ def consolidate_warcs(
             "sha256": sha256_hash,
         }
 
+    if pending_hashes:
+        hash_cache = WarcHashCache(get_job_warc_hash_cache_path(output_dir))
+        hashes, hash_errors = hash_files(pending_hashes.values(), cache=hash_cache)
+        hash_cache.prune(_iter_stable_warc_paths(warcs_dir))
+        hash_cache.save()
+        if hash_errors:
+            path, exc = next(iter(hash_errors.items()))
+            raise OSError(exc.errno, f"Failed to hash stable WARC {path}: {exc.strerror or exc}")
+        for source_key, dest in pending_hashes.items():
+            by_source[source_key]["sha256"] = hashes[dest]
+
     def _entry_sort_key(entry: dict) -> tuple[int, int, str]:
         stable = str(entry.get("stable_name") or "")
         match = _WARC_NAME_RE.match(stable)
@@ -492,6 +681,7 @@ def verify_warc_manifest(
     *,
     check_size: bool = True,
     check_hash: bool = False,
+    use_hash_cache: bool = False,
 ) -> ManifestVerificationResult:
     """
     Verify the WARC consolidation manifest against actual files on disk.
@@ -506,7 +696,12 @@ def verify_warc_manifest(
     Args:
         output_dir: Job output directory containing warcs/manifest.json
         check_size: Whether to verify file sizes match manifest
-        check_hash: Whether to verify SHA256 hashes match manifest (slow)
+        check_hash: Whether to verify SHA256 hashes match manifest (slow;
+            files are hashed in parallel)
+        use_hash_cache: Trust cached hashes of files whose (dev, inode, size,
+            mtime) is unchanged since they were last hashed instead of
+            re-reading them. Off by default: a hash check is meant to catch
+            silent on-disk corruption, which leaves that tuple unchanged.
 
     Returns:
         ManifestVerificationResult with verification details
@@ -554,6 +749,7 @@ def verify_warc_manifest(
     entries_total = len(entries)
     entries_verified = 0
     manifest_stable_names: set[str] = set()
+    to_hash: list[tuple[str, str, Path]] = []
 
     for entry in entries:
         stable_name = entry.get("stable_name")
@@ -586,29 +782,41 @@ def verify_warc_manifest(
                     errors.append(f"OSError stating {stable_name}: {exc}")
                     continue
 
-        # Check hash
-        if check_hash:
-            expected_hash = entry.get("sha256")
-            if expected_hash:
-                try:
-                    actual_hash = _compute_sha256(warc_path)
-                    if actual_hash != expected_hash:
-                        hash_mismatches.append((stable_name, expected_hash, actual_hash))
-                        continue
-                except OSError as exc:
-                    errors.append(f"OSError hashing {stable_name}: {exc}")
-                    continue
+        # Hashes are checked below, in parallel.
+        if check_hash and entry.get("sha256"):
+            to_hash.append((stable_name, str(entry["sha256"]), warc_path))
+            continue
 
         entries_verified += 1
 
+    hash_cache: WarcHashCache | None = None
+    if to_hash:
+        hash_cache = WarcHashCache(get_job_warc_hash_cache_path(output_dir))
+        hashes, hash_errors = hash_files(
+            (p for _, _, p in to_hash), cache=hash_cache, refresh=not use_hash_cache
+        )
+        for stable_name, expected_hash, warc_path in to_hash:
+            if warc_path in hash_errors:
+                errors.append(f"OSError hashing {stable_name}: {hash_errors[warc_path]}")
+                continue
+            actual_hash = hashes[warc_path]
+            if actual_hash != expected_hash:
+                hash_mismatches.append((stable_name, expected_hash, actual_hash))
+                continue
+            entries_verified += 1
+
     # Check for orphaned files
     try:
         actual_warcs = _iter_stable_warc_paths(warcs_dir)
         for warc_path in actual_warcs:
             if warc_path.name not in manifest_stable_names:
                 orphaned.append(warc_path.name)
+        if hash_cache is not None:
+            hash_cache.prune(actual_warcs)
     except OSError as exc:
         errors.append(f"OSError scanning warcs directory: {exc}")
+    if hash_cache is not None:
+        hash_cache.save()
 
     valid = (
         len(missing) == 0
@@ -9,9 +9,11 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ha_backend.config import get_change_tracking_enabled
+from ha_backend.derived_text_store import DerivedText, get_derived_text_store
 from ha_backend.diffing import (
     DIFF_VERSION,
     NORMALIZATION_VERSION,
+    DiffDocument,
     compute_diff,
     normalize_html_for_diff,
 )
@@ -61,6 +63,20 @@ def _load_snapshot_html(snapshot: Snapshot) -> str:
         raise ValueError(f"Failed to decode HTML: {exc}") from exc
 
 
+def _load_diff_document(snapshot: Snapshot) -> DiffDocument:
+    """
+    Return the diff-normalized document, from the derived text store when possible.
+    """
+    store = get_derived_text_store()
+    if store is None or not snapshot.content_hash:
+        return normalize_html_for_diff(_load_snapshot_html(snapshot))
+    derived = store.get(snapshot.content_hash)
+    if derived is None:
+        derived = DerivedText.from_html(_load_snapshot_html(snapshot))
+        store.put(snapshot.content_hash, derived)
+    return derived.diff_document()
+
+
 def _summarize_change(
     *,
     change_type: str,
@@ -210,10 +226,8 @@ def compute_change_for_snapshot_pair(
         )
 
     try:
-        html_a = _load_snapshot_html(from_snapshot)
-        html_b = _load_snapshot_html(to_snapshot)
-        doc_a = normalize_html_for_diff(html_a)
-        doc_b = normalize_html_for_diff(html_b)
+        doc_a = _load_diff_document(from_snapshot)
+        doc_b = _load_diff_document(to_snapshot)
         diff = compute_diff(doc_a, doc_b)
 
         section_map_a = {title: text for title, text in doc_a.sections}
@@ -17,6 +17,11 @@ Provides the 'ha-backend' command with subcommands for:
 
 Usage: ha-backend <command> [options]
 
+Startup cost matters (systemd timers and ops scripts call this often), so the
+module only imports config/logging at top level; each cmd_* imports SQLAlchemy,
+models, indexing, jobs, etc. itself. tests/test_cli_import_budget.py enforces
+this for `ha-backend --help`.
+
 See also:
     - docs/reference/cli-commands.md for command documentation
     - docs/development/live-testing.md for local testing flows
@@ -30,10 +35,6 @@ import sys
 from pathlib import Path
 from typing import Any, ContextManager, Sequence, cast
 
-from sqlalchemy import func, text
-from sqlalchemy.engine.url import make_url
-
-from .changes import compute_changes_backfill, compute_changes_since
 from .config import (
     REPO_ROOT,
     get_archive_tool_config,
@@ -41,13 +42,7 @@ from .config import (
     get_replay_base_url,
     get_replay_preview_dir,
 )
-from .db import get_engine, get_session
-from .indexing import index_job
-from .job_registry import create_job_for_source, reconcile_scope_passthrough_args
-from .jobs import create_job, run_persistent_job
 from .logging_config import configure_logging
-from .seeds import seed_sources
-from .worker import run_worker_loop
 
 # === Constants ===
 
@@ -104,6 +99,11 @@ def cmd_check_db(args: argparse.Namespace) -> None:
     """
     Simple connectivity check for the configured database.
     """
+    from sqlalchemy import text
+    from sqlalchemy.engine.url import make_url
+
+    from .db import get_engine, get_session
+
     db_cfg = get_database_config()
     print("HealthArchive Backend – Database Check")
     print("--------------------------------------")
@@ -132,8 +132,12 @@ def cmd_status(args: argparse.Namespace) -> None:
     import os
     import subprocess
 
+    from sqlalchemy import func
+
     from ha_backend.models import ArchiveJob
 
+    from .db import get_session
+
     print("HealthArchive Backend – Status Overview")
     print("=" * 50)
 
@@ -278,6 +282,8 @@ def cmd_watchdog_status(args: argparse.Namespace) -> None:
 
     from ha_backend.models import ArchiveJob
 
+    from .db import get_session
+
     def _load_json(path: Path) -> dict:
         """Load JSON file, return empty dict on error."""
         try:
@@ -505,6 +511,8 @@ def cmd_run_job(args: argparse.Namespace) -> None:
           --cleanup --overwrite \\
           -- --workers 4 --some-zimit-arg foo
     """
+    from .jobs import create_job
+
     if not args.seeds:
         print("ERROR: At least one --seeds URL is required.", file=sys.stderr)
         sys.exit(1)
@@ -533,6 +541,9 @@ def cmd_create_job(args: argparse.Namespace) -> None:
     """
     Create a persistent ArchiveJob for a given source using the job registry.
     """
+    from .db import get_session
+    from .job_registry import create_job_for_source
+
     source_code = args.source
 
     from .models import ArchiveJob as ORMArchiveJob  # local import to avoid cycles
@@ -572,7 +583,7 @@ def cmd_run_db_job(args: argparse.Namespace) -> None:
     """
     Run a database-backed ArchiveJob by ID.
     """
-    from .jobs import JobAlreadyRunningError
+    from .jobs import JobAlreadyRunningError, run_persistent_job
 
     job_id = args.id
     try:
@@ -592,6 +603,8 @@ def cmd_index_job(args: argparse.Namespace) -> None:
     """
     Index a completed ArchiveJob into Snapshot rows.
     """
+    from .indexing import index_job
+
     job_id = args.id
     try:
         rc = index_job(job_id)
@@ -611,7 +624,10 @@ def cmd_create_canary_job(args: argparse.Namespace) -> None:
     pywb health vs storage tiering health. Idempotent: skips if
     a canary job is already indexed.
     """
-    from .jobs import JobAlreadyRunningError
+    from .db import get_session
+    from .indexing import index_job
+    from .job_registry import create_job_for_source
+    from .jobs import JobAlreadyRunningError, run_persistent_job
     from .models import ArchiveJob as ORMArchiveJob
 
     # Check if canary job already exists and is indexed
@@ -672,6 +688,9 @@ def cmd_seed_sources(args: argparse.Namespace) -> None:
     """
     Insert initial Source rows (hc, phac, cihr) if they are missing.
     """
+    from .db import get_session
+    from .seeds import seed_sources
+
     created_count = 0
     with get_session() as session:
         created_count = seed_sources(session)
@@ -683,6 +702,9 @@ def cmd_compute_changes(args: argparse.Namespace) -> None:
     """
     Compute change events (diffs) between adjacent snapshot captures.
     """
+    from .changes import compute_changes_backfill, compute_changes_since
+    from .db import get_session
+
     max_events = args.max_events
     source_code = args.source
     dry_run = args.dry_run
@@ -726,6 +748,7 @@ def cmd_schedule_annual(args: argparse.Namespace) -> None:
     """
     from datetime import datetime, timedelta, timezone
 
+    from .db import get_session
     from .job_registry import (
         build_job_config,
         build_output_dir_for_job,
@@ -1015,6 +1038,7 @@ def cmd_annual_status(args: argparse.Namespace) -> None:
     """
     from datetime import datetime, timezone
 
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Source
 
@@ -1265,7 +1289,8 @@ def cmd_reconcile_annual_tool_options(args: argparse.Namespace) -> None:
     jobs that predate per-source tuning.
     """
     from .archive_contract import ArchiveJobConfig, validate_tool_options
-    from .job_registry import SOURCE_JOB_CONFIGS
+    from .db import get_session
+    from .job_registry import SOURCE_JOB_CONFIGS, reconcile_scope_passthrough_args
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Source
 
@@ -1501,17 +1526,22 @@ def cmd_backfill_search_vector(args: argparse.Namespace) -> None:
     Backfill Snapshot.search_vector for Postgres FTS.
 
     This is safe to run multiple times. By default it only fills rows where
-    search_vector is NULL.
+    search_vector is NULL or was built by older rules (search_vector_version
+    below SEARCH_VECTOR_VERSION, e.g. 'simple' vectors from before
+    language-aware FTS).
     """
-    from sqlalchemy import update
+    from sqlalchemy import func, update
 
+    from .db import get_session
     from .models import Snapshot
-    from .search import build_search_vector
+    from .search import SEARCH_VECTOR_VERSION, build_search_vector, language_partitions
 
     batch_size: int = args.batch_size
     start_id: int = args.start_id
     job_id: int | None = args.job_id
     force: bool = args.force
+    # Rows without a vector have no version either.
+    stale_filter = func.coalesce(Snapshot.search_vector_version, 0) < SEARCH_VECTOR_VERSION
 
     with get_session() as session:
         dialect_name = session.get_bind().dialect.name
@@ -1527,7 +1557,7 @@ def cmd_backfill_search_vector(args: argparse.Namespace) -> None:
             if job_id is not None:
                 batch_filters.append(Snapshot.job_id == job_id)
             if not force:
-                batch_filters.append(Snapshot.search_vector.is_(None))
+                batch_filters.append(stale_filter)
 
             ids = (
                 session.query(Snapshot.id)
@@ -1545,21 +1575,26 @@ def cmd_backfill_search_vector(args: argparse.Namespace) -> None:
             if job_id is not None:
                 update_filters.append(Snapshot.job_id == job_id)
             if not force:
-                update_filters.append(Snapshot.search_vector.is_(None))
-
-            stmt = (
-                update(Snapshot)
-                .where(*update_filters)
-                .values(
-                    search_vector=build_search_vector(
-                        Snapshot.title, Snapshot.snippet, Snapshot.url
+                update_filters.append(stale_filter)
+
+            # One UPDATE per language so each uses a constant FTS config
+            # (english/french stemming, 'simple' otherwise).
+            batch_updated = 0
+            for language, _config, language_filter in language_partitions(Snapshot.language):
+                stmt = (
+                    update(Snapshot)
+                    .where(*update_filters, language_filter)
+                    .values(
+                        search_vector=build_search_vector(
+                            Snapshot.title, Snapshot.snippet, Snapshot.url, language=language
+                        ),
+                        search_vector_version=SEARCH_VECTOR_VERSION,
                     )
                 )
-            )
-            exec_result = cast(Any, session.execute(stmt))
+                exec_result = cast(Any, session.execute(stmt))
+                batch_updated += int(exec_result.rowcount or 0)
             session.commit()
 
-            batch_updated = int(exec_result.rowcount or 0)
             total_updated += batch_updated
             print(
                 f"Backfilled search_vector for ids ({last_id}, {max_id}] "
@@ -1579,6 +1614,7 @@ def cmd_backfill_normalized_url_groups(args: argparse.Namespace) -> None:
     """
     from sqlalchemy import or_
 
+    from .db import get_session
     from .models import Snapshot, Source
     from .url_normalization import normalize_url_for_grouping
 
@@ -1639,6 +1675,7 @@ def cmd_rebuild_pages(args: argparse.Namespace) -> None:
 
     This is metadata-only: it never reads or mutates WARC content.
     """
+    from .db import get_session
     from .models import ArchiveJob, Page, Source
     from .pages import discover_job_page_groups, rebuild_pages
 
@@ -1731,16 +1768,42 @@ def cmd_rebuild_pages(args: argparse.Namespace) -> None:
             )
 
 
+def cmd_rebuild_search_vocabulary(args: argparse.Namespace) -> None:
+    """
+    Rebuild the search vocabulary ("did you mean" terms) from snapshot titles.
+    """
+    from .db import get_session
+    from .search_vocabulary import rebuild_search_vocabulary
+
+    dry_run: bool = args.dry_run
+
+    with get_session() as session:
+        result = rebuild_search_vocabulary(session)
+        if dry_run:
+            session.rollback()
+            print(f"DRY RUN: would store {result.terms} vocabulary term(s).")
+        else:
+            session.commit()
+            print(f"UPDATED: search vocabulary now contains {result.terms} term(s).")
+
+
 def cmd_refresh_snapshot_metadata(args: argparse.Namespace) -> None:
     """
     Refresh title/snippet/language for snapshots of a job by re-reading WARCs.
 
-    This updates rows in place (snapshot IDs remain stable).
+    This updates rows in place (snapshot IDs remain stable). Extraction runs
+    again by default and replaces any derived text store entries. With
+    ``--from-derived-store``, snapshots whose body is in the store are refreshed
+    from it without reading their WARC; they keep their indexed language,
+    which may come from the Content-Language header.
     """
     from pathlib import Path
 
     from sqlalchemy import update
 
+    from .db import get_session
+    from .derived_text_store import DerivedText, get_derived_text_store
+    from .indexing.mapping import compute_content_hash
     from .indexing.text_extraction import (
         detect_language,
         extract_text,
@@ -1750,12 +1813,13 @@ def cmd_refresh_snapshot_metadata(args: argparse.Namespace) -> None:
     from .indexing.warc_reader import iter_html_records
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Snapshot
-    from .search import build_search_vector
+    from .search import SEARCH_VECTOR_VERSION, build_search_vector
 
     job_id: int = args.job_id
     batch_size: int = args.batch_size
     dry_run: bool = args.dry_run
     limit: int | None = args.limit
+    from_derived_store: bool = getattr(args, "from_derived_store", False)
 
     with get_session() as session:
         job = session.get(ORMArchiveJob, job_id)
@@ -1772,6 +1836,7 @@ def cmd_refresh_snapshot_metadata(args: argparse.Namespace) -> None:
                 Snapshot.warc_path,
                 Snapshot.warc_record_id,
                 Snapshot.url,
+                Snapshot.content_hash,
             )
             .filter(Snapshot.job_id == job_id)
             .order_by(Snapshot.id)
@@ -1781,21 +1846,41 @@ def cmd_refresh_snapshot_metadata(args: argparse.Namespace) -> None:
             print(f"No snapshots found for job {job_id}.")
             return
 
+        updates: list[dict[str, object]] = []
+        updated_count = 0
+        processed_records = 0
+
+        derived_store = get_derived_text_store()
         by_record_id: dict[tuple[str, str], int] = {}
         by_url: dict[tuple[str, str], list[int]] = {}
         warc_paths: set[str] = set()
 
-        for snap_id, warc_path, warc_record_id, url in rows:
+        for snap_id, warc_path, warc_record_id, url, content_hash in rows:
+            derived = (
+                derived_store.get(content_hash)
+                if derived_store is not None and from_derived_store
+                else None
+            )
+            if derived is not None:
+                processed_records += 1
+                if limit is not None and processed_records > limit:
+                    break
+                updates.append(
+                    {"id": snap_id, "title": derived.title, "snippet": make_snippet(derived.text)}
+                )
+                if len(updates) >= batch_size:
+                    session.bulk_update_mappings(Snapshot.__mapper__, updates)
+                    if not dry_run:
+                        session.commit()
+                    updated_count += len(updates)
+                    updates.clear()
+                continue
             warc_paths.add(warc_path)
             if warc_record_id:
                 by_record_id[(warc_path, warc_record_id)] = snap_id
             else:
                 by_url.setdefault((warc_path, url), []).append(snap_id)
 
-        updates: list[dict[str, object]] = []
-        updated_count = 0
-        processed_records = 0
-
         warc_paths_sorted = sorted(warc_paths)
         print(f"Refreshing snapshot metadata for job {job_id} ({len(warc_paths_sorted)} WARC(s))…")
 
@@ -1824,8 +1909,19 @@ def cmd_refresh_snapshot_metadata(args: argparse.Namespace) -> None:
                     continue
 
                 html = rec.body_bytes.decode("utf-8", errors="replace")
-                title = extract_title(html)
-                text = extract_text(html)
+                if derived_store is not None:
+                    derived = DerivedText.from_html(html)
+                    if not dry_run:
+                        derived_store.put(
+                            compute_content_hash(rec.body_bytes),
+                            derived,
+                            replace=not from_derived_store,
+                        )
+                    title = derived.title
+                    text = derived.text
+                else:
+                    title = extract_title(html)
+                    text = extract_text(html)
                 snippet = make_snippet(text)
                 language = detect_language(text, rec.headers)
 
@@ -1862,12 +1958,18 @@ def cmd_refresh_snapshot_metadata(args: argparse.Namespace) -> None:
                 .where(Snapshot.job_id == job_id)
                 .values(
                     search_vector=build_search_vector(
-                        Snapshot.title, Snapshot.snippet, Snapshot.url
-                    )
+                        Snapshot.title,
+                        Snapshot.snippet,
+                        Snapshot.url,
+                        language=Snapshot.language,
+                    ),
+                    search_vector_version=SEARCH_VECTOR_VERSION,
                 )
             )
             session.commit()
 
+        if derived_store is not None:
+            print(f"Derived text store: {derived_store.summary()}.")
         if dry_run:
             session.rollback()
             print("Dry run complete (rolled back changes).")
@@ -1880,15 +1982,19 @@ def cmd_backfill_outlinks(args: argparse.Namespace) -> None:
     Backfill SnapshotOutlink rows for snapshots by re-reading WARCs.
 
     This is intended for production backfills after deploying the authority
-    schema, and can also be used locally for debugging.
+    schema, and can also be used locally for debugging. Snapshots whose body
+    is in the derived text store are resolved from its stored link targets
+    without reading their WARC.
     """
     from pathlib import Path
 
     from sqlalchemy import inspect
 
     from .authority import recompute_page_signals
-    from .indexing.mapping import normalize_url_for_grouping
-    from .indexing.text_extraction import extract_outlink_groups
+    from .db import get_session
+    from .derived_text_store import DerivedText, get_derived_text_store
+    from .indexing.mapping import compute_content_hash, normalize_url_for_grouping
+    from .indexing.text_extraction import extract_outlink_groups, outlink_groups_from_hrefs
     from .indexing.warc_reader import iter_html_records
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Snapshot, SnapshotOutlink
@@ -1928,6 +2034,8 @@ def cmd_backfill_outlinks(args: argparse.Namespace) -> None:
                 Snapshot.warc_path,
                 Snapshot.warc_record_id,
                 Snapshot.url,
+                Snapshot.content_hash,
+                Snapshot.status_code,
             )
             .filter(Snapshot.job_id == job_id)
             .order_by(Snapshot.id)
@@ -1956,11 +2064,44 @@ def cmd_backfill_outlinks(args: argparse.Namespace) -> None:
         if deleted:
             print(f"Deleted {int(deleted)} existing outlink row(s) for job {job_id}.")
 
+        pending: list[dict[str, object]] = []
+        inserted_rows = 0
+        processed_records = 0
+
+        derived_store = get_derived_text_store()
         by_record_id: dict[tuple[str, str], list[int]] = {}
         by_url: dict[tuple[str, str], list[int]] = {}
         warc_paths: set[str] = set()
 
-        for snap_id, warc_path, warc_record_id, url in rows:
+        for snap_id, warc_path, warc_record_id, url, content_hash, status_code in rows:
+            derived = derived_store.get(content_hash) if derived_store is not None else None
+            if derived is not None:
+                processed_records += 1
+                if limit is not None and processed_records > limit:
+                    break
+                if status_code is None or not (200 <= status_code < 300):
+                    continue
+                from_group = normalize_url_for_grouping(url)
+                if from_group is not None:
+                    impacted_groups.add(from_group)
+                outlink_groups = outlink_groups_from_hrefs(
+                    derived.hrefs,
+                    base_url=url,
+                    from_group=from_group,
+                    max_links=max_links_per_snapshot,
+                )
+                impacted_groups.update(outlink_groups)
+                pending.extend(
+                    {"snapshot_id": snap_id, "to_normalized_url_group": group}
+                    for group in outlink_groups
+                )
+                if len(pending) >= batch_size:
+                    session.bulk_insert_mappings(SnapshotOutlink.__mapper__, pending)
+                    if not dry_run:
+                        session.flush()
+                    inserted_rows += len(pending)
+                    pending.clear()
+                continue
             warc_paths.add(warc_path)
             if warc_record_id:
                 by_record_id.setdefault((warc_path, warc_record_id), []).append(snap_id)
@@ -1972,10 +2113,6 @@ def cmd_backfill_outlinks(args: argparse.Namespace) -> None:
             f"Backfilling outlinks for job {job_id} ({len(rows)} snapshot(s), {len(warc_paths_sorted)} WARC(s))…"
         )
 
-        pending: list[dict[str, object]] = []
-        inserted_rows = 0
-        processed_records = 0
-
         for warc_path_str in warc_paths_sorted:
             warc_path = Path(warc_path_str)
             if not warc_path.is_file():
@@ -2002,12 +2139,23 @@ def cmd_backfill_outlinks(args: argparse.Namespace) -> None:
                 from_group = normalize_url_for_grouping(rec.url)
                 if from_group is not None:
                     impacted_groups.add(from_group)
-                outlink_groups = extract_outlink_groups(
-                    html,
-                    base_url=rec.url,
-                    from_group=from_group,
-                    max_links=max_links_per_snapshot,
-                )
+                if derived_store is not None:
+                    derived = DerivedText.from_html(html)
+                    if not dry_run:
+                        derived_store.put(compute_content_hash(rec.body_bytes), derived)
+                    outlink_groups = outlink_groups_from_hrefs(
+                        derived.hrefs,
+                        base_url=rec.url,
+                        from_group=from_group,
+                        max_links=max_links_per_snapshot,
+                    )
+                else:
+                    outlink_groups = extract_outlink_groups(
+                        html,
+                        base_url=rec.url,
+                        from_group=from_group,
+                        max_links=max_links_per_snapshot,
+                    )
                 if not outlink_groups:
                     continue
 
@@ -2040,6 +2188,8 @@ def cmd_backfill_outlinks(args: argparse.Namespace) -> None:
             pending.clear()
 
         print(f"Inserted {inserted_rows} outlink row(s) for job {job_id}.")
+        if derived_store is not None:
+            print(f"Derived text store: {derived_store.summary()}.")
 
         if update_signals and impacted_groups:
             recompute_page_signals(session, groups=tuple(impacted_groups))
@@ -2049,6 +2199,33 @@ def cmd_backfill_outlinks(args: argparse.Namespace) -> None:
             print("Dry run complete (rolled back changes).")
 
 
+def cmd_train_derived_text_dict(args: argparse.Namespace) -> None:
+    """
+    Train a zstd dictionary on the derived text store's current entries.
+
+    Point HEALTHARCHIVE_DERIVED_TEXT_ZSTD_DICT at the output to use it for
+    new entries; entries written with another dictionary are rewritten as
+    they are read.
+    """
+    from .derived_text_store import get_derived_text_store
+
+    out: Path = args.out
+    store = get_derived_text_store()
+    if store is None:
+        print("ERROR: HEALTHARCHIVE_DERIVED_TEXT_DIR is not set.", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        dictionary = store.train_dictionary(dict_size=args.dict_size, max_samples=args.max_samples)
+    except (RuntimeError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(dictionary)
+    print(f"Wrote {len(dictionary)}-byte zstd dictionary to {out}.")
+
+
 def cmd_recompute_page_signals(args: argparse.Namespace) -> None:
     """
     Rebuild PageSignal rows from SnapshotOutlink edges.
@@ -2056,6 +2233,7 @@ def cmd_recompute_page_signals(args: argparse.Namespace) -> None:
     from sqlalchemy import inspect
 
     from .authority import recompute_page_signals
+    from .db import get_session
 
     dry_run: bool = args.dry_run
 
@@ -2082,6 +2260,7 @@ def cmd_dedupe_snapshots(args: argparse.Namespace) -> None:
 
     Default: dry-run (only shows what would be deduped). Use --apply to execute.
     """
+    from .db import get_session
     from .indexing.deduplication import deduplicate_snapshots, find_same_day_duplicates
 
     apply = bool(getattr(args, "apply", False))
@@ -2130,6 +2309,7 @@ def cmd_restore_deduped_snapshots(args: argparse.Namespace) -> None:
     """
     Restore previously deduplicated snapshots.
     """
+    from .db import get_session
     from .indexing.deduplication import restore_deduped_snapshots
 
     job_id = getattr(args, "id", None)
@@ -2143,6 +2323,7 @@ def cmd_list_jobs(args: argparse.Namespace) -> None:
     """
     List recent ArchiveJob rows with optional filters.
     """
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Source
 
@@ -2205,6 +2386,7 @@ def cmd_list_warcs(args: argparse.Namespace) -> None:
     """
     import json
 
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
 
     with get_session() as session:
@@ -2255,6 +2437,7 @@ def cmd_show_job(args: argparse.Namespace) -> None:
     """
     Show detailed information about a single job.
     """
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
 
     discovered_warc_count: int | None = None
@@ -2362,6 +2545,7 @@ def cmd_retry_job(args: argparse.Namespace) -> None:
     """
     Mark a failed job as retryable for crawl or re-indexing as appropriate.
     """
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
 
     with get_session() as session:
@@ -2394,6 +2578,7 @@ def cmd_reset_retry_count(args: argparse.Namespace) -> None:
 
     from sqlalchemy.orm import joinedload
 
+    from .db import get_session
     from .jobs import JobAlreadyRunningError, _job_lock
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Source
@@ -2565,14 +2750,19 @@ def cmd_recover_stale_jobs(args: argparse.Namespace) -> None:
     """
     Recover jobs that appear stuck in status='running'.
 
+    A running job is stale when it started before the cutoff, or when the
+    worker that claimed it stopped renewing its lease (see ha_backend.job_claims).
+
     This is safe-by-default: it prints a recovery plan unless --apply is passed.
     """
     from datetime import datetime, timedelta, timezone
     from pathlib import Path
 
-    from sqlalchemy import or_
+    from sqlalchemy import and_, or_
 
-    from .crawl_stats import parse_crawl_log_progress
+    from .crawl_stats import read_crawl_log_progress
+    from .db import get_session
+    from .job_claims import clear_job_claim, expired_lease_filter, unclaimed_filter
     from .jobs import JobAlreadyRunningError, _job_lock
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Source
@@ -2640,16 +2830,22 @@ def cmd_recover_stale_jobs(args: argparse.Namespace) -> None:
     with get_session() as session:
         query = session.query(ORMArchiveJob).filter(ORMArchiveJob.status == "running")
         if include_missing_started_at:
-            query = query.filter(
-                or_(
-                    ORMArchiveJob.started_at.is_(None),
-                    ORMArchiveJob.started_at < cutoff,
-                )
+            age_filter = or_(
+                ORMArchiveJob.started_at.is_(None),
+                ORMArchiveJob.started_at < cutoff,
             )
         else:
-            query = query.filter(ORMArchiveJob.started_at.is_not(None)).filter(
-                ORMArchiveJob.started_at < cutoff
+            age_filter = and_(
+                ORMArchiveJob.started_at.is_not(None),
+                ORMArchiveJob.started_at < cutoff,
             )
+        # Old jobs only qualify without a live lease: the job lock probe below
+        # cannot see a crawl another host is still running (and renewing).
+        # A worker that stopped renewing its claim lease (crashed host/process)
+        # leaves the job stale regardless of how recently it started.
+        query = query.filter(
+            or_(and_(age_filter, unclaimed_filter(now)), expired_lease_filter(now))
+        )
 
         if source_filter:
             query = query.join(Source).filter(Source.code == source_filter)
@@ -2690,7 +2886,7 @@ def cmd_recover_stale_jobs(args: argparse.Namespace) -> None:
                 log_path = _find_log_for_job(job)
                 progress_age = None
                 if log_path is not None:
-                    progress = parse_crawl_log_progress(log_path)
+                    progress = read_crawl_log_progress(log_path)
                     if progress is not None:
                         progress_age = int(progress.last_progress_age_seconds(now_utc=now))
                 if progress_age is None:
@@ -2760,13 +2956,24 @@ def cmd_recover_stale_jobs(args: argparse.Namespace) -> None:
             progress_age_str = "-"
             log_path = _find_log_for_job(job)
             if log_path is not None:
-                progress = parse_crawl_log_progress(log_path)
+                progress = read_crawl_log_progress(log_path)
                 if progress is not None:
                     progress_age_str = str(int(progress.last_progress_age_seconds(now_utc=now)))
+            lease_str = ""
+            if job.claimed_by:
+                lease_expires_at = job.lease_expires_at
+                if lease_expires_at is not None and lease_expires_at.tzinfo is None:
+                    lease_expires_at = lease_expires_at.replace(tzinfo=timezone.utc)
+                lease_state = (
+                    "expired"
+                    if lease_expires_at is not None and lease_expires_at <= now
+                    else "active"
+                )
+                lease_str = f" claimed_by={job.claimed_by} lease={lease_state}"
             print(
                 f"job_id={job.id} source={source_code} status={job.status} "
                 f"started_at={started_str} age_min={age_min} "
-                f"last_progress_age_seconds={progress_age_str} name={job.name}"
+                f"last_progress_age_seconds={progress_age_str} name={job.name}{lease_str}"
             )
 
         if not apply_mode:
@@ -2777,6 +2984,7 @@ def cmd_recover_stale_jobs(args: argparse.Namespace) -> None:
         for job in jobs:
             job.status = "retryable"
             job.crawler_stage = "recovered_stale_running"
+            clear_job_claim(job)
 
         print("")
         print(f"Recovered {len(jobs)} job(s) (set status=retryable).")
@@ -2793,6 +3001,7 @@ def cmd_validate_job_config(args: argparse.Namespace) -> None:
     from pathlib import Path
 
     from .archive_contract import ArchiveJobConfig
+    from .db import get_session
     from .jobs import RuntimeArchiveJob, _build_tool_extra_args
     from .models import ArchiveJob as ORMArchiveJob
 
@@ -2901,6 +3110,7 @@ def cmd_patch_job_config(args: argparse.Namespace) -> None:
     from dataclasses import fields as dataclass_fields
 
     from .archive_contract import ArchiveJobConfig, ArchiveToolOptions, validate_tool_options
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
 
     job_id = args.id
@@ -3036,6 +3246,7 @@ def cmd_cleanup_job(args: argparse.Namespace) -> None:
         snapshot_crawl_configs,
         snapshot_state_file,
     )
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Snapshot
 
@@ -3268,6 +3479,7 @@ def cmd_consolidate_warcs(args: argparse.Namespace) -> None:
     from archive_tool.utils import find_all_warc_files
 
     from .archive_storage import build_warc_path_mapping, consolidate_warcs
+    from .db import get_session
     from .indexing.warc_discovery import discover_temp_warcs_for_job
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Snapshot
@@ -3358,6 +3570,7 @@ def cmd_job_storage_report(args: argparse.Namespace) -> None:
     from pathlib import Path
 
     from .archive_storage import compute_job_storage_stats
+    from .db import get_session
     from .indexing.warc_discovery import discover_warcs_for_job
     from .models import ArchiveJob as ORMArchiveJob
 
@@ -3452,6 +3665,8 @@ def cmd_verify_warcs(args: argparse.Namespace) -> None:
     from ha_backend.models import ArchiveJob as ORMArchiveJob
     from ha_backend.models import Snapshot
 
+    from .db import get_session
+
     job_id = int(getattr(args, "job_id", None) or 0)
     if job_id <= 0:
         print("ERROR: --job-id is required.", file=sys.stderr)
@@ -3729,6 +3944,7 @@ def cmd_verify_warc_manifest(args: argparse.Namespace) -> None:
     from pathlib import Path
 
     from .archive_storage import verify_warc_manifest
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob
 
     job_id = args.id
@@ -3747,7 +3963,12 @@ def cmd_verify_warc_manifest(args: argparse.Namespace) -> None:
         source_code = job.source.code if job.source else "?"
         output_dir = Path(job.output_dir).resolve()
 
-    result = verify_warc_manifest(output_dir, check_size=check_size, check_hash=check_hash)
+    result = verify_warc_manifest(
+        output_dir,
+        check_size=check_size,
+        check_hash=check_hash,
+        use_hash_cache=getattr(args, "trust_hash_cache", False),
+    )
 
     if json_output:
         # JSON output mode
@@ -3837,7 +4058,10 @@ def cmd_replay_index_job(args: argparse.Namespace) -> None:
     This command:
     - discovers WARCs for the job using the same discovery logic as indexing
     - creates stable symlinks under the pywb collection's archive directory
-    - runs `wb-manager reindex` inside the configured replay container
+    - merges the job's per-WARC CDXJ shards (see `build-cdxj`) into
+      `indexes/index.cdxj`, reading only WARCs that do not have a shard yet
+    - falls back to `wb-manager reindex` inside the configured replay container
+      if shards cannot be built (or when --wb-manager-reindex is passed)
 
     It is designed for the production deployment described in
     `docs/deployment/replay-service-pywb.md`.
@@ -3847,11 +4071,14 @@ def cmd_replay_index_job(args: argparse.Namespace) -> None:
     from datetime import datetime, timezone
     from pathlib import Path
 
+    from .db import get_session
+    from .indexing.cdxj import ensure_job_cdxj_shards, merge_cdxj_shards
     from .indexing.warc_discovery import discover_warcs_for_job
     from .models import ArchiveJob as ORMArchiveJob
 
     job_id = args.id
     dry_run = args.dry_run
+    native_cdxj = not getattr(args, "wb_manager_reindex", False)
 
     container_name = args.container
     collection_name = args.collection or f"job-{job_id}"
@@ -3978,9 +4205,11 @@ def cmd_replay_index_job(args: argparse.Namespace) -> None:
 
     print(f"Linking {len(warc_paths)} WARC(s) into {archive_dir}")
     rel_paths_for_hash: list[str] = []
+    link_names: list[str] = []
     for idx, host_warc_path in enumerate(warc_paths, start=1):
         suffix = "".join(host_warc_path.suffixes) or host_warc_path.suffix
         link_name = f"warc-{idx:06d}{suffix}"
+        link_names.append(link_name)
 
         resolved_warc = host_warc_path.resolve()
         try:
@@ -4017,11 +4246,41 @@ def cmd_replay_index_job(args: argparse.Namespace) -> None:
 
     if dry_run:
         print("")
-        print(f"Would run: docker exec {container_name} wb-manager reindex {collection_name}")
+        if native_cdxj:
+            print(
+                f"Would build missing CDXJ shards under {output_dir / 'cdxj'} and merge them "
+                f"into {indexes_dir / 'index.cdxj'} (falling back to wb-manager reindex)."
+            )
+        else:
+            print(f"Would run: docker exec {container_name} wb-manager reindex {collection_name}")
         return
 
-    print("Rebuilding pywb CDX index (wb-manager reindex)...")
-    run_docker(["docker", "exec", container_name, "wb-manager", "reindex", collection_name])
+    cdxj_mode = "wb-manager"
+    if native_cdxj:
+        shards = ensure_job_cdxj_shards(output_dir, warc_paths, prune=limit_warcs is None)
+        if shards.failed:
+            print(
+                f"WARNING: Could not build CDXJ shards for {len(shards.failed)} WARC(s) "
+                f"(first: {shards.failed[0][0]}: {shards.failed[0][1]}); "
+                "falling back to wb-manager reindex.",
+                file=sys.stderr,
+            )
+        else:
+            index_path = indexes_dir / "index.cdxj"
+            print(
+                f"Merging {len(shards.shards)} CDXJ shard(s) into {index_path} "
+                f"(built={shards.built} reused={shards.reused})..."
+            )
+            n_lines = merge_cdxj_shards(
+                [(shard, link_names[i]) for i, (_warc, shard) in enumerate(shards.shards)],
+                index_path,
+            )
+            print(f"Wrote {n_lines} CDXJ line(s).")
+            cdxj_mode = "native"
+
+    if cdxj_mode == "wb-manager":
+        print("Rebuilding pywb CDX index (wb-manager reindex)...")
+        run_docker(["docker", "exec", container_name, "wb-manager", "reindex", collection_name])
     warc_list_hash = hashlib.sha256(
         "\n".join(sorted(rel_paths_for_hash)).encode("utf-8")
     ).hexdigest()
@@ -4035,6 +4294,7 @@ def cmd_replay_index_job(args: argparse.Namespace) -> None:
         "warcListHash": warc_list_hash,
         "warcsHostRoot": str(host_root_resolved),
         "warcsContainerRoot": warcs_container_root,
+        "cdxjMode": cdxj_mode,
     }
     try:
         tmp_path = marker_path.with_suffix(".tmp")
@@ -4052,6 +4312,46 @@ def cmd_replay_index_job(args: argparse.Namespace) -> None:
     print("Replay indexing complete.")
 
 
+def cmd_build_cdxj(args: argparse.Namespace) -> None:
+    """
+    Write per-WARC CDXJ shards for an ArchiveJob.
+
+    `index-job` already writes shards during its WARC pass; this command backfills
+    jobs indexed before that (or rebuilds shards with --force). Only WARCs
+    without a current shard are read.
+    """
+    from pathlib import Path
+
+    from .db import get_session
+    from .indexing.cdxj import ensure_job_cdxj_shards, get_job_cdxj_dir
+    from .indexing.warc_discovery import discover_warcs_for_job
+    from .models import ArchiveJob as ORMArchiveJob
+
+    job_id = args.id
+    with get_session() as session:
+        job = session.get(ORMArchiveJob, job_id)
+        if job is None:
+            print(f"ERROR: Job {job_id} not found.", file=sys.stderr)
+            sys.exit(1)
+        output_dir = Path(job.output_dir).resolve()
+        warc_paths = discover_warcs_for_job(job)
+
+    if not warc_paths:
+        print(f"ERROR: No WARCs discovered for job {job_id}.", file=sys.stderr)
+        sys.exit(1)
+
+    result = ensure_job_cdxj_shards(output_dir, warc_paths, force=bool(args.force))
+    print(f"CDXJ shards for job {job_id} in {get_job_cdxj_dir(output_dir)}")
+    print(f"  WARCs:   {len(warc_paths)}")
+    print(f"  built:   {result.built}")
+    print(f"  reused:  {result.reused}")
+    print(f"  failed:  {len(result.failed)}")
+    for warc_path, error in result.failed:
+        print(f"  FAILED {warc_path}: {error}", file=sys.stderr)
+    if result.failed:
+        sys.exit(1)
+
+
 def cmd_replay_generate_previews(args: argparse.Namespace) -> None:
     """
     Generate cached replay preview images for source entry pages.
@@ -4064,11 +4364,23 @@ def cmd_replay_generate_previews(args: argparse.Namespace) -> None:
     This command uses a Playwright Docker image to render each source's
     `entryBrowseUrl` and take a small screenshot (JPEG by default). The URL is
     loaded with `#ha_nobanner=1` so the pywb banner is not captured.
+
+    By default a single renderer container is started and fed a JSONL batch
+    manifest on stdin; it renders --concurrency pages at once and reports a
+    per-preview timing. --per-preview-containers restores the old
+    one-`docker run`-per-preview behaviour.
     """
     import shlex
+    import time
     from urllib.parse import urlsplit, urlunsplit
 
     from .api.routes_public import list_sources
+    from .db import get_session
+
+    concurrency = int(getattr(args, "concurrency", 4))
+    if concurrency < 1:
+        print("ERROR: --concurrency must be >= 1.", file=sys.stderr)
+        sys.exit(1)
 
     preview_dir = get_replay_preview_dir()
     if preview_dir is None:
@@ -4179,6 +4491,8 @@ def cmd_replay_generate_previews(args: argparse.Namespace) -> None:
         host = (parts.hostname or "").lower()
         return host in {"127.0.0.1", "localhost"}
 
+    batch_mode = not getattr(args, "per_preview_containers", False)
+
     failures: list[str] = []
     generated = 0
     skipped = 0
@@ -4191,10 +4505,16 @@ def cmd_replay_generate_previews(args: argparse.Namespace) -> None:
     print(f"Timeout:          {timeout_ms}ms")
     print(f"Format:           {format_normalized}")
     print(f"Playwright npm:   {playwright_npm_version} (cached under {node_cache_dir.name}/)")
+    if batch_mode:
+        print(f"Renderer:         one container, {concurrency} concurrent page(s)")
+    else:
+        print("Renderer:         one container per preview")
     print("")
 
     supported_exts = (".webp", ".jpg", ".jpeg", ".png")
 
+    # (source_code, filename, screenshot_url)
+    planned: list[tuple[str, str, str]] = []
     for source in sources:
         browse_url = source.entryBrowseUrl
         if not browse_url:
@@ -4233,32 +4553,15 @@ def cmd_replay_generate_previews(args: argparse.Namespace) -> None:
         screenshot_url = urlunsplit(
             (parts.scheme, parts.netloc, parts.path, parts.query, "ha_nobanner=1")
         )
+        planned.append((source.sourceCode, filename, screenshot_url))
 
+    def docker_cmd_for(node_args: list[str], *, host_network: bool, stdin: bool) -> list[str]:
         docker_cmd = ["docker", "run", "--rm"]
-        if should_use_host_network(screenshot_url):
+        if stdin:
+            docker_cmd.append("-i")
+        if host_network:
             docker_cmd.extend(["--network", "host"])
 
-        node_args = [
-            "node",
-            "/ha-scripts/generate_replay_preview.js",
-            "--url",
-            screenshot_url,
-            "--out",
-            f"/out/{filename}",
-            "--format",
-            format_normalized,
-            "--quality",
-            str(jpeg_quality),
-            "--width",
-            str(width),
-            "--height",
-            str(height),
-            "--timeout-ms",
-            str(timeout_ms),
-            "--settle-ms",
-            str(settle_ms),
-        ]
-
         node_cmd = " ".join(shlex.quote(part) for part in node_args)
         install_cmd = (
             "set -euo pipefail; "
@@ -4288,31 +4591,136 @@ def cmd_replay_generate_previews(args: argparse.Namespace) -> None:
                 install_cmd,
             ]
         )
+        return docker_cmd
 
-        if args.dry_run:
+    if args.dry_run:
+        for source_code, filename, _url in planned:
             generated += 1
-            print(f"- {source.sourceCode}: would generate {filename}")
-            continue
-
-        print(f"- {source.sourceCode}: generating {filename}...")
+            print(f"- {source_code}: would generate {filename}")
+    elif batch_mode and planned:
+        manifest = "".join(
+            json.dumps(
+                {
+                    "id": source_code,
+                    "url": screenshot_url,
+                    "out": f"/out/{filename}",
+                    "format": format_normalized,
+                    "quality": jpeg_quality,
+                    "width": width,
+                    "height": height,
+                    "timeoutMs": timeout_ms,
+                    "settleMs": settle_ms,
+                }
+            )
+            + "\n"
+            for source_code, filename, screenshot_url in planned
+        )
+        docker_cmd = docker_cmd_for(
+            [
+                "node",
+                "/ha-scripts/generate_replay_preview.js",
+                "--batch",
+                "--concurrency",
+                str(concurrency),
+            ],
+            host_network=any(should_use_host_network(url) for _c, _f, url in planned),
+            stdin=True,
+        )
+        print(f"Rendering {len(planned)} preview(s) in one renderer container...")
+        batch_started = time.monotonic()
         result = subprocess.run(  # nosec: B603 - operator-controlled docker invocation
             docker_cmd,
+            input=manifest,
             text=True,
             capture_output=True,
         )
-        if result.returncode != 0:
-            failures.append(source.sourceCode)
-            print(
-                f"  ERROR: preview generation failed for {source.sourceCode} (exit {result.returncode})",
-                file=sys.stderr,
+        batch_seconds = time.monotonic() - batch_started
+
+        outcomes: dict[str, dict] = {}
+        for line in (result.stdout or "").splitlines():
+            line = line.strip()
+            if not line.startswith("{"):
+                if line:
+                    print(f"  {line}")
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"  {line}")
+                continue
+            if isinstance(payload, dict) and "id" in payload:
+                outcomes[str(payload["id"])] = payload
+
+        for source_code, filename, _url in planned:
+            outcome = outcomes.get(source_code)
+            if outcome is None:
+                failures.append(source_code)
+                print(f"- {source_code}: FAILED (no result from renderer)", file=sys.stderr)
+            elif outcome.get("ok"):
+                generated += 1
+                print(f"- {source_code}: generated {filename} in {int(outcome.get('ms') or 0)}ms")
+            else:
+                failures.append(source_code)
+                print(
+                    f"- {source_code}: FAILED after {int(outcome.get('ms') or 0)}ms: "
+                    f"{outcome.get('error') or 'unknown error'}",
+                    file=sys.stderr,
+                )
+
+        if len(outcomes) < len(planned) and result.stderr:
+            print(result.stderr, file=sys.stderr)
+        print(
+            f"Renderer finished in {batch_seconds:.1f}s (exit {result.returncode}) "
+            f"for {len(planned)} preview(s)."
+        )
+    else:
+        for source_code, filename, screenshot_url in planned:
+            docker_cmd = docker_cmd_for(
+                [
+                    "node",
+                    "/ha-scripts/generate_replay_preview.js",
+                    "--url",
+                    screenshot_url,
+                    "--out",
+                    f"/out/{filename}",
+                    "--format",
+                    format_normalized,
+                    "--quality",
+                    str(jpeg_quality),
+                    "--width",
+                    str(width),
+                    "--height",
+                    str(height),
+                    "--timeout-ms",
+                    str(timeout_ms),
+                    "--settle-ms",
+                    str(settle_ms),
+                ],
+                host_network=should_use_host_network(screenshot_url),
+                stdin=False,
             )
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-            continue
 
-        generated += 1
+            print(f"- {source_code}: generating {filename}...")
+            started = time.monotonic()
+            result = subprocess.run(  # nosec: B603 - operator-controlled docker invocation
+                docker_cmd,
+                text=True,
+                capture_output=True,
+            )
+            if result.returncode != 0:
+                failures.append(source_code)
+                print(
+                    f"  ERROR: preview generation failed for {source_code} (exit {result.returncode})",
+                    file=sys.stderr,
+                )
+                if result.stdout:
+                    print(result.stdout)
+                if result.stderr:
+                    print(result.stderr, file=sys.stderr)
+                continue
+
+            generated += 1
+            print(f"  done in {int((time.monotonic() - started) * 1000)}ms")
 
     print("")
     print(f"Generated: {generated}")
@@ -4340,6 +4748,7 @@ def cmd_replay_reconcile(args: argparse.Namespace) -> None:
     from pathlib import Path
 
     from .api.routes_public import _find_replay_preview_file, list_sources
+    from .db import get_session
     from .indexing.warc_discovery import discover_warcs_for_job
     from .models import ArchiveJob as ORMArchiveJob
     from .models import Source
@@ -4714,6 +5123,7 @@ def cmd_replay_reconcile(args: argparse.Namespace) -> None:
                         warcs_container_root=warcs_container_root,
                         limit_warcs=None,
                         dry_run=False,
+                        wb_manager_reindex=False,
                     )
                     try:
                         cmd_replay_index_job(ns)
@@ -4818,6 +5228,8 @@ def cmd_replay_reconcile(args: argparse.Namespace) -> None:
                 height=540,
                 timeout_ms=45000,
                 settle_ms=1200,
+                concurrency=4,
+                per_preview_containers=False,
                 dry_run=False,
             )
             try:
@@ -4841,6 +5253,7 @@ def cmd_register_job_dir(args: argparse.Namespace) -> None:
     from datetime import datetime, timezone
     from pathlib import Path
 
+    from .db import get_session
     from .models import ArchiveJob as ORMArchiveJob  # local import to avoid cycles
     from .models import Source
 
@@ -4892,7 +5305,62 @@ def cmd_start_worker(args: argparse.Namespace) -> None:
     """
     Start the background worker loop.
     """
-    run_worker_loop(poll_interval=args.poll_interval, run_once=args.once)
+    from .db import set_engine_role
+    from .worker import run_worker_loop
+
+    set_engine_role("worker")
+    run_worker_loop(
+        poll_interval=args.poll_interval,
+        run_once=args.once,
+        crawl_concurrency=args.crawl_concurrency,
+        index_concurrency=args.index_concurrency,
+        wakeups=not args.no_wakeups,
+    )
+
+
+def cmd_ops_collector(args: argparse.Namespace) -> None:
+    """
+    Run the VPS ops collectors (metrics textfiles, auto-recover) in one process.
+    """
+    import signal
+    import threading
+
+    from .db import set_engine_role
+    from .ops_collector import OpsCollector, run_ops_collector, select_collectors
+
+    set_engine_role("metrics")
+    try:
+        specs = select_collectors(args.collector)
+    except ValueError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    collector = OpsCollector(specs=specs, out_dir=Path(args.out_dir))
+    stop = threading.Event()
+
+    def _handle_shutdown(signum, frame) -> None:  # pragma: no cover - signal wiring
+        stop.set()
+        signal.signal(signum, signal.SIG_DFL)
+
+    previous_handlers = {}
+    if not args.once and threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous_handlers[signum] = signal.signal(signum, _handle_shutdown)
+    try:
+        run_ops_collector(collector, run_once=args.once, stop=stop)
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+    if args.once:
+        for state in collector.states:
+            if not state.enabled:
+                status = "disabled"
+            else:
+                status = f"exit={state.last_exit_code} {state.last_duration_seconds or 0.0:.2f}s"
+            print(f"{state.spec.name}: {status}")
+        if any(s.enabled and s.last_exit_code for s in collector.states):
+            sys.exit(1)
 
 
 # === Argument parser wiring ===
@@ -5206,7 +5674,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--force",
         action="store_true",
         default=False,
-        help="Recompute vectors even when search_vector is already populated.",
+        help=(
+            "Recompute every vector, not only missing ones and ones built by older "
+            "rules (search_vector_version below the current version)."
+        ),
     )
     p_backfill_search.set_defaults(func=cmd_backfill_search_vector)
 
@@ -5271,6 +5742,19 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_rebuild_pages.set_defaults(func=cmd_rebuild_pages)
 
+    # rebuild-search-vocabulary
+    p_rebuild_vocab = subparsers.add_parser(
+        "rebuild-search-vocabulary",
+        help="Rebuild the search vocabulary used for 'did you mean' corrections.",
+    )
+    p_rebuild_vocab.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=False,
+        help="Compute the vocabulary but roll back at the end (no DB changes).",
+    )
+    p_rebuild_vocab.set_defaults(func=cmd_rebuild_search_vocabulary)
+
     # refresh-snapshot-metadata
     p_refresh = subparsers.add_parser(
         "refresh-snapshot-metadata",
@@ -5293,6 +5777,15 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Optional maximum number of WARC records to process (debugging).",
     )
+    p_refresh.add_argument(
+        "--from-derived-store",
+        action="store_true",
+        default=False,
+        help=(
+            "Reuse derived text store entries instead of re-extracting from WARCs "
+            "(only correct when extraction has not changed since they were written)."
+        ),
+    )
     p_refresh.add_argument(
         "--dry-run",
         action="store_true",
@@ -5343,6 +5836,31 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_backfill_outlinks.set_defaults(func=cmd_backfill_outlinks)
 
+    # train-derived-text-dict
+    p_train_dict = subparsers.add_parser(
+        "train-derived-text-dict",
+        help="Train a zstd dictionary on the derived text store (needs zstandard).",
+    )
+    p_train_dict.add_argument(
+        "--out",
+        type=Path,
+        required=True,
+        help="Where to write the dictionary (set HEALTHARCHIVE_DERIVED_TEXT_ZSTD_DICT to it).",
+    )
+    p_train_dict.add_argument(
+        "--dict-size",
+        type=int,
+        default=112_640,
+        help="Target dictionary size in bytes.",
+    )
+    p_train_dict.add_argument(
+        "--max-samples",
+        type=int,
+        default=20_000,
+        help="Maximum number of stored entries to sample.",
+    )
+    p_train_dict.set_defaults(func=cmd_train_derived_text_dict)
+
     # recompute-page-signals
     p_signals = subparsers.add_parser(
         "recompute-page-signals",
@@ -5520,7 +6038,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--older-than-minutes",
         type=int,
         required=True,
-        help="Mark jobs as stale if started more than this many minutes ago.",
+        help=(
+            "Mark jobs as stale if started more than this many minutes ago. "
+            "Jobs whose worker claim lease has expired are always considered stale."
+        ),
     )
     p_recover.add_argument(
         "--require-no-progress-seconds",
@@ -5782,6 +6303,16 @@ def build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Output JSON instead of human-readable text.",
     )
+    p_verify_manifest.add_argument(
+        "--trust-hash-cache",
+        action="store_true",
+        default=False,
+        help=(
+            "With --level hash, reuse hashes of WARCs unchanged (same dev/inode/size/mtime) "
+            "since they were last hashed instead of re-reading every file. Faster, but "
+            "does not detect silent on-disk corruption."
+        ),
+    )
     p_verify_manifest.set_defaults(func=cmd_verify_warc_manifest)
 
     # replay-index-job
@@ -5830,8 +6361,33 @@ def build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Print actions without changing the filesystem or running docker.",
     )
+    p_replay_index.add_argument(
+        "--wb-manager-reindex",
+        action="store_true",
+        default=False,
+        help="Skip native CDXJ shards and rebuild the index with `wb-manager reindex`.",
+    )
     p_replay_index.set_defaults(func=cmd_replay_index_job)
 
+    # build-cdxj
+    p_build_cdxj = subparsers.add_parser(
+        "build-cdxj",
+        help="Write per-WARC CDXJ shards for a job (used by replay-index-job).",
+    )
+    p_build_cdxj.add_argument(
+        "--id",
+        type=int,
+        required=True,
+        help="ArchiveJob ID whose WARCs should be indexed.",
+    )
+    p_build_cdxj.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Rebuild shards even when a current shard already exists.",
+    )
+    p_build_cdxj.set_defaults(func=cmd_build_cdxj)
+
     # replay-generate-previews
     p_replay_previews = subparsers.add_parser(
         "replay-generate-previews",
@@ -5895,6 +6451,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=1200,
         help="Additional delay after load (milliseconds) before taking a screenshot.",
     )
+    p_replay_previews.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Pages rendered concurrently by the batch renderer (default: 4).",
+    )
+    p_replay_previews.add_argument(
+        "--per-preview-containers",
+        action="store_true",
+        default=False,
+        help="Legacy mode: start a fresh renderer container for every preview.",
+    )
     p_replay_previews.add_argument(
         "--dry-run",
         action="store_true",
@@ -5982,8 +6550,11 @@ def build_parser() -> argparse.ArgumentParser:
     p_replay_reconcile.add_argument(
         "--max-previews",
         type=int,
-        default=1,
-        help="Max previews to generate per invocation when --previews is enabled (default: 1).",
+        default=10,
+        help=(
+            "Max previews to generate per invocation when --previews is enabled "
+            "(default: 10; all are rendered by one batch renderer container)."
+        ),
     )
     p_replay_reconcile.set_defaults(func=cmd_replay_reconcile)
 
@@ -5996,7 +6567,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--poll-interval",
         type=int,
         default=30,
-        help="Seconds between polls when no work is found.",
+        help=(
+            "Seconds between polls when no work is found (with wake-ups active, "
+            "polling only runs every 300s as a safety net)."
+        ),
     )
     p_worker.add_argument(
         "--once",
@@ -6004,8 +6578,60 @@ def build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Run a single iteration and exit.",
     )
+    p_worker.add_argument(
+        "--crawl-concurrency",
+        type=int,
+        default=1,
+        help="Maximum concurrent archive_tool crawls (crawl lane size).",
+    )
+    p_worker.add_argument(
+        "--index-concurrency",
+        type=int,
+        default=1,
+        help="Maximum concurrent index_job processes (index lane size; 0 disables indexing).",
+    )
+    p_worker.add_argument(
+        "--no-wakeups",
+        action="store_true",
+        default=False,
+        help=(
+            "Disable job wake-ups (Postgres LISTEN/NOTIFY or the local wake FIFO) and rely "
+            "on --poll-interval only."
+        ),
+    )
     p_worker.set_defaults(func=cmd_start_worker)
 
+    # ops-collector
+    p_ops_collector = subparsers.add_parser(
+        "ops-collector",
+        help=(
+            "Run the VPS ops collectors (crawl/tiering metrics, auto-recover) on a schedule "
+            "in one long-running process."
+        ),
+    )
+    p_ops_collector.add_argument(
+        "--once",
+        action="store_true",
+        default=False,
+        help="Run every selected collector once and exit (non-zero if any failed).",
+    )
+    p_ops_collector.add_argument(
+        "--collector",
+        action="append",
+        default=None,
+        metavar="NAME",
+        help=(
+            "Only run this collector (repeatable): crawl-metrics, tiering-metrics, "
+            "storage-hotpath-auto-recover, crawl-auto-recover."
+        ),
+    )
+    p_ops_collector.add_argument(
+        "--out-dir",
+        default="/var/lib/node_exporter/textfile_collector",
+        help="Directory for the collector duration metrics textfile.",
+    )
+    p_ops_collector.set_defaults(func=cmd_ops_collector)
+
     # register-job-dir
     p_register = subparsers.add_parser(
         "register-job-dir",
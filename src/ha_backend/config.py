@@ -122,6 +122,26 @@ DEFAULT_REPLAY_BASE_URL = ""
 #   HEALTHARCHIVE_REPLAY_PREVIEW_DIR=/srv/healtharchive/replay/previews
 DEFAULT_REPLAY_PREVIEW_DIR = ""
 
+# Directory for the on-disk cache of rendered raw snapshot pages (WARC body
+# plus banner). Unset disables the cache.
+#
+# Example (prod):
+#   HEALTHARCHIVE_RAW_RENDER_CACHE_DIR=/srv/healtharchive/cache/raw
+DEFAULT_RAW_RENDER_CACHE_DIR = ""
+DEFAULT_RAW_RENDER_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Content-addressed store of text derived from archived HTML bodies (extracted
+# text, link targets, diff-normalized lines), keyed by Snapshot.content_hash.
+# Written at index time and read by backfills and change tracking instead of
+# re-reading WARCs. Unset disables the store.
+#
+# Example (prod):
+#   HEALTHARCHIVE_DERIVED_TEXT_DIR=/srv/healtharchive/derived-text
+DEFAULT_DERIVED_TEXT_DIR = ""
+# Optional zstd dictionary for derived text entries (see
+# `ha-backend train-derived-text-dict`). Ignored unless `zstandard` is installed.
+DEFAULT_DERIVED_TEXT_ZSTD_DICT = ""
+
 # === Search/browse behavior toggles ===
 
 # When enabled, /api/search with view=pages and no query/date-range can use the
@@ -150,6 +170,10 @@ DEFAULT_COMPARE_LIVE_MAX_BYTES = 2_000_000
 DEFAULT_COMPARE_LIVE_MAX_ARCHIVE_BYTES = 2_000_000
 DEFAULT_COMPARE_LIVE_MAX_RENDER_LINES = 5000
 DEFAULT_COMPARE_LIVE_MAX_CONCURRENCY = 4
+DEFAULT_COMPARE_LIVE_CACHE_TTL_SECONDS = 60
+DEFAULT_COMPARE_LIVE_CACHE_MAX_ENTRIES = 64
+# Summed body size of cached live fetches (one process holds up to this much).
+DEFAULT_COMPARE_LIVE_CACHE_MAX_BYTES = 16_000_000
 DEFAULT_COMPARE_LIVE_USER_AGENT = "HealthArchiveCompareLive/1.0 (+https://healtharchive.ca)"
 
 # === Research exports ===
@@ -201,6 +225,17 @@ def get_archive_tool_config() -> ArchiveToolConfig:
 # repository root. This can be overridden via HEALTHARCHIVE_DATABASE_URL.
 DEFAULT_DATABASE_URL = f"sqlite:///{REPO_ROOT / 'healtharchive.db'}"
 
+# Engine roles: each process type gets its own pool sizing and Postgres
+# statement_timeout (0 = no limit). Override per role via
+# HEALTHARCHIVE_DB_<ROLE>_{POOL_SIZE,MAX_OVERFLOW,STATEMENT_TIMEOUT_MS}.
+DB_ROLES = ("api", "worker", "cli", "metrics")
+DEFAULT_DB_ROLE = "cli"
+DEFAULT_DB_POOL_TIMEOUT_SECONDS = 10.0
+DEFAULT_DB_POOL_RECYCLE_SECONDS = 1800
+# Per-route statement timeouts for the public API (Postgres only).
+DEFAULT_DB_SEARCH_STATEMENT_TIMEOUT_MS = 15_000
+DEFAULT_DB_EXPORT_STATEMENT_TIMEOUT_MS = 300_000
+
 # === CORS / frontend integration ===
 
 # Default origins for the public API. This covers local dev and the
@@ -245,6 +280,8 @@ class DatabaseConfig:
     """
 
     database_url: str = DEFAULT_DATABASE_URL
+    # Optional read replica for read-only public endpoints.
+    replica_url: str | None = None
 
 
 def get_database_config() -> DatabaseConfig:
@@ -252,7 +289,109 @@ def get_database_config() -> DatabaseConfig:
     Return the current database configuration, honouring environment overrides.
     """
     url = os.environ.get("HEALTHARCHIVE_DATABASE_URL", DEFAULT_DATABASE_URL)
-    return DatabaseConfig(database_url=url)
+    replica = os.environ.get("HEALTHARCHIVE_DATABASE_REPLICA_URL", "").strip() or None
+    return DatabaseConfig(database_url=url, replica_url=replica)
+
+
+@dataclass(frozen=True)
+class DatabasePoolProfile:
+    """
+    Connection pool settings for one engine role (see ``DB_ROLES``).
+    """
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout_seconds: float
+    pool_recycle_seconds: int
+    pool_pre_ping: bool
+    statement_timeout_ms: int
+
+
+# (pool_size, max_overflow, statement_timeout_ms) per role. The API serves
+# concurrent requests; the worker and CLI run long indexing/maintenance
+# statements, so they get no statement timeout by default.
+_DB_ROLE_DEFAULTS: dict[str, tuple[int, int, int]] = {
+    "api": (10, 10, 30_000),
+    "worker": (3, 2, 0),
+    "cli": (2, 2, 0),
+    "metrics": (1, 1, 60_000),
+}
+
+
+def _env_int(name: str, default: int, *, minimum: int, maximum: int) -> int:
+    raw = os.environ.get(name, str(default)).strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        value = default
+    return max(minimum, min(value, maximum))
+
+
+def get_database_role() -> str:
+    """
+    Return the engine role from HEALTHARCHIVE_DB_ROLE (unknown values fall back to cli).
+    """
+    role = os.environ.get("HEALTHARCHIVE_DB_ROLE", DEFAULT_DB_ROLE).strip().lower()
+    return role if role in DB_ROLES else DEFAULT_DB_ROLE
+
+
+def get_database_pool_profile(role: str) -> DatabasePoolProfile:
+    """
+    Return pool sizing and statement timeout for ``role``, honouring env overrides.
+    """
+    if role not in _DB_ROLE_DEFAULTS:
+        role = DEFAULT_DB_ROLE
+    pool_size, max_overflow, statement_timeout_ms = _DB_ROLE_DEFAULTS[role]
+    prefix = f"HEALTHARCHIVE_DB_{role.upper()}_"
+
+    raw_timeout = os.environ.get(
+        "HEALTHARCHIVE_DB_POOL_TIMEOUT_SECONDS", str(DEFAULT_DB_POOL_TIMEOUT_SECONDS)
+    ).strip()
+    try:
+        pool_timeout = float(raw_timeout)
+    except ValueError:
+        pool_timeout = DEFAULT_DB_POOL_TIMEOUT_SECONDS
+
+    pre_ping = os.environ.get("HEALTHARCHIVE_DB_POOL_PRE_PING", "1").strip().lower()
+    return DatabasePoolProfile(
+        pool_size=_env_int(f"{prefix}POOL_SIZE", pool_size, minimum=1, maximum=100),
+        max_overflow=_env_int(f"{prefix}MAX_OVERFLOW", max_overflow, minimum=0, maximum=100),
+        pool_timeout_seconds=max(0.1, min(pool_timeout, 300.0)),
+        pool_recycle_seconds=_env_int(
+            "HEALTHARCHIVE_DB_POOL_RECYCLE_SECONDS",
+            DEFAULT_DB_POOL_RECYCLE_SECONDS,
+            minimum=-1,
+            maximum=86_400,
+        ),
+        pool_pre_ping=pre_ping not in {"0", "false", "no", "off"},
+        statement_timeout_ms=_env_int(
+            f"{prefix}STATEMENT_TIMEOUT_MS", statement_timeout_ms, minimum=0, maximum=86_400_000
+        ),
+    )
+
+
+def get_search_statement_timeout_ms() -> int:
+    """
+    Return the Postgres statement_timeout for /api/search (0 = role default).
+    """
+    return _env_int(
+        "HEALTHARCHIVE_DB_SEARCH_STATEMENT_TIMEOUT_MS",
+        DEFAULT_DB_SEARCH_STATEMENT_TIMEOUT_MS,
+        minimum=0,
+        maximum=86_400_000,
+    )
+
+
+def get_export_statement_timeout_ms() -> int:
+    """
+    Return the Postgres statement_timeout for /api/exports/* (0 = role default).
+    """
+    return _env_int(
+        "HEALTHARCHIVE_DB_EXPORT_STATEMENT_TIMEOUT_MS",
+        DEFAULT_DB_EXPORT_STATEMENT_TIMEOUT_MS,
+        minimum=0,
+        maximum=86_400_000,
+    )
 
 
 def get_cors_origins() -> List[str]:
@@ -311,6 +450,54 @@ def get_replay_preview_dir() -> Path | None:
     return Path(raw)
 
 
+def get_raw_render_cache_dir() -> Path | None:
+    """
+    Return the directory for cached rendered raw snapshots, or None if disabled.
+    """
+    raw = os.environ.get("HEALTHARCHIVE_RAW_RENDER_CACHE_DIR", DEFAULT_RAW_RENDER_CACHE_DIR)
+    raw = raw.strip()
+    if not raw:
+        return None
+    return Path(raw)
+
+
+def get_raw_render_cache_max_bytes() -> int:
+    """
+    Return the size budget of the rendered raw snapshot cache.
+    """
+    raw = os.environ.get(
+        "HEALTHARCHIVE_RAW_RENDER_CACHE_MAX_BYTES",
+        str(DEFAULT_RAW_RENDER_CACHE_MAX_BYTES),
+    ).strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        value = DEFAULT_RAW_RENDER_CACHE_MAX_BYTES
+    return max(1_000_000, value)
+
+
+def get_derived_text_dir() -> Path | None:
+    """
+    Return the root of the derived text store, or None if disabled.
+    """
+    raw = os.environ.get("HEALTHARCHIVE_DERIVED_TEXT_DIR", DEFAULT_DERIVED_TEXT_DIR).strip()
+    if not raw:
+        return None
+    return Path(raw)
+
+
+def get_derived_text_zstd_dict_path() -> Path | None:
+    """
+    Return the zstd dictionary used for derived text entries, if configured.
+    """
+    raw = os.environ.get(
+        "HEALTHARCHIVE_DERIVED_TEXT_ZSTD_DICT", DEFAULT_DERIVED_TEXT_ZSTD_DICT
+    ).strip()
+    if not raw:
+        return None
+    return Path(raw)
+
+
 def get_pages_fastpath_enabled() -> bool:
     """
     Return whether the API should use the pages-table fast path for browse.
@@ -503,6 +690,51 @@ def get_compare_live_max_concurrency() -> int:
     return max(1, min(value, 50))
 
 
+def get_compare_live_cache_ttl_seconds() -> float:
+    """
+    Return how long a live fetch is reused before revalidation (0 disables).
+    """
+    raw = os.environ.get(
+        "HEALTHARCHIVE_COMPARE_LIVE_CACHE_TTL_SECONDS",
+        str(DEFAULT_COMPARE_LIVE_CACHE_TTL_SECONDS),
+    ).strip()
+    try:
+        value = float(raw)
+    except ValueError:
+        value = float(DEFAULT_COMPARE_LIVE_CACHE_TTL_SECONDS)
+    return max(0.0, min(value, 600.0))
+
+
+def get_compare_live_cache_max_entries() -> int:
+    """
+    Return the per-process number of cached live fetches (0 disables).
+    """
+    raw = os.environ.get(
+        "HEALTHARCHIVE_COMPARE_LIVE_CACHE_MAX_ENTRIES",
+        str(DEFAULT_COMPARE_LIVE_CACHE_MAX_ENTRIES),
+    ).strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        value = DEFAULT_COMPARE_LIVE_CACHE_MAX_ENTRIES
+    return max(0, min(value, 1024))
+
+
+def get_compare_live_cache_max_bytes() -> int:
+    """
+    Return the per-process byte budget for cached live fetches (0 disables).
+    """
+    raw = os.environ.get(
+        "HEALTHARCHIVE_COMPARE_LIVE_CACHE_MAX_BYTES",
+        str(DEFAULT_COMPARE_LIVE_CACHE_MAX_BYTES),
+    ).strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        value = DEFAULT_COMPARE_LIVE_CACHE_MAX_BYTES
+    return max(0, min(value, 256_000_000))
+
+
 def get_compare_live_user_agent() -> str:
     """
     Return the User-Agent used for compare-live fetches.
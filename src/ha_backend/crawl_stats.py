@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import base64
+import hashlib
 import json
 import logging
+import os
 import stat
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -85,40 +88,46 @@ def parse_crawl_status_events_from_log_tail(
 
     events: List[CrawlStatusEvent] = []
     for line in tail.splitlines():
-        if CrawlStatusLogContext not in line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if payload.get("context") != CrawlStatusLogContext:
-            continue
-        if payload.get("message") != CrawlStatusLogMessage:
-            continue
-        details = payload.get("details")
-        if not isinstance(details, dict):
-            continue
+        event = _parse_crawl_status_line(line)
+        if event is not None:
+            events.append(event)
 
-        crawled = details.get("crawled")
-        total = details.get("total")
-        if crawled is None or total is None:
-            continue
+    return events
 
-        ts = _parse_utc_timestamp(payload.get("timestamp"))
-        if ts is None:
-            continue
 
-        events.append(
-            CrawlStatusEvent(
-                timestamp_utc=ts,
-                crawled=int(crawled),
-                total=int(total),
-                pending=int(details["pending"]) if details.get("pending") is not None else None,
-                failed=int(details["failed"]) if details.get("failed") is not None else None,
-            )
-        )
+def _parse_crawl_status_line(line: str) -> CrawlStatusEvent | None:
+    if CrawlStatusLogContext not in line:
+        return None
+    try:
+        payload = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("context") != CrawlStatusLogContext:
+        return None
+    if payload.get("message") != CrawlStatusLogMessage:
+        return None
+    details = payload.get("details")
+    if not isinstance(details, dict):
+        return None
 
-    return events
+    crawled = details.get("crawled")
+    total = details.get("total")
+    if crawled is None or total is None:
+        return None
+
+    ts = _parse_utc_timestamp(payload.get("timestamp"))
+    if ts is None:
+        return None
+
+    return CrawlStatusEvent(
+        timestamp_utc=ts,
+        crawled=int(crawled),
+        total=int(total),
+        pending=int(details["pending"]) if details.get("pending") is not None else None,
+        failed=int(details["failed"]) if details.get("failed") is not None else None,
+    )
 
 
 def parse_crawl_log_progress(
@@ -136,6 +145,12 @@ def parse_crawl_log_progress(
     instead of incorrectly treating failed-page churn as fresh progress.
     """
     events = parse_crawl_status_events_from_log_tail(log_path, max_bytes=max_bytes)
+    return _progress_from_events(log_path, events)
+
+
+def _progress_from_events(
+    log_path: Path, events: List[CrawlStatusEvent]
+) -> CrawlLogProgress | None:
     if not events:
         return None
 
@@ -235,6 +250,351 @@ def count_resume_crawl_events_from_log_tail(
     return count
 
 
+# --- Incremental log cursors -------------------------------------------------
+#
+# Monitoring timers (metrics textfile, auto-recover, content report, status
+# CLI) all ask "what is this crawl doing?" several times per minute. Instead of
+# re-reading the last megabyte of every log each time, a LogCursor remembers
+# how far it has parsed each log in a small JSON state file and only reads the
+# bytes appended since. Parsed events are kept with their byte offsets so the
+# results match a fresh tail parse over the same window.
+
+LOG_CURSOR_DIR_ENV = "HEALTHARCHIVE_LOG_CURSOR_DIR"
+DEFAULT_LOG_WINDOW_BYTES = 1024 * 1024
+_LOG_CURSOR_STATE_VERSION = 1
+# Longest partial line carried between reads; longer lines are skipped.
+_LOG_CURSOR_MAX_PARTIAL_BYTES = 256 * 1024
+# Upper bound on retained crawlStatus events (keeps state files small).
+_LOG_CURSOR_MAX_EVENTS = 5000
+# Bytes just before the offset that are fingerprinted to detect in-place rewrites.
+_LOG_CURSOR_ANCHOR_BYTES = 64
+
+
+def get_log_cursor_dir() -> Path:
+    raw = os.environ.get(LOG_CURSOR_DIR_ENV, "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    from .jobs import _get_job_lock_dir
+
+    return _get_job_lock_dir() / "log-cursors"
+
+
+def _event_to_state(offset: int, event: CrawlStatusEvent) -> list[Any]:
+    return [
+        offset,
+        event.timestamp_utc.isoformat(),
+        event.crawled,
+        event.total,
+        event.pending,
+        event.failed,
+    ]
+
+
+def _event_from_state(raw: list[Any]) -> tuple[int, CrawlStatusEvent]:
+    offset, ts, crawled, total, pending, failed = raw
+    return int(offset), CrawlStatusEvent(
+        timestamp_utc=datetime.fromisoformat(ts),
+        crawled=int(crawled),
+        total=int(total),
+        pending=int(pending) if pending is not None else None,
+        failed=int(failed) if failed is not None else None,
+    )
+
+
+class LogCursor:
+    """
+    Incrementally parsed view of one archive_tool combined log.
+
+    The cursor tracks (device, inode, offset, partial trailing line) plus the
+    crawlStatus events and stage markers seen within the last
+    ``window_bytes`` of the log. ``update()`` reads only newly appended bytes;
+    if the log was rotated (new inode) or truncated (size < offset) the cursor
+    starts over from the tail.
+
+    Usage::
+
+        cursor = LogCursor.load(log_path)
+        cursor.update()
+        progress = cursor.progress()
+        cursor.save()
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        *,
+        window_bytes: int = DEFAULT_LOG_WINDOW_BYTES,
+        state_dir: Path | None = None,
+    ) -> None:
+        self.log_path = Path(log_path)
+        self.window_bytes = max(1, int(window_bytes))
+        self.state_dir = state_dir
+        self._reset(dev=None, inode=None)
+
+    def _reset(self, *, dev: int | None, inode: int | None) -> None:
+        self.dev = dev
+        self.inode = inode
+        self.offset = 0
+        # Fingerprint of the bytes just before ``offset``.
+        self.anchor: str | None = None
+        # Offset from which lines have been parsed without gaps.
+        self.covered_from = 0
+        # Bytes of an unterminated trailing line; None while skipping to the
+        # next newline (after a seek into the middle of the file).
+        self._partial: bytes | None = b""
+        self._events: list[tuple[int, CrawlStatusEvent]] = []
+        self._new_crawl_phase_offsets: list[int] = []
+        self._resume_crawl_offsets: list[int] = []
+
+    def _restart(self, st: os.stat_result, offset: int) -> None:
+        self._reset(dev=st.st_dev, inode=st.st_ino)
+        self.offset = self.covered_from = offset
+        self._partial = b"" if offset == 0 else None
+
+    # -- persistence ----------------------------------------------------------
+
+    @property
+    def state_path(self) -> Path:
+        try:
+            key_source = str(self.log_path.resolve())
+        except OSError:
+            key_source = str(self.log_path)
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()[:24]
+        return (self.state_dir or get_log_cursor_dir()) / f"{key}.json"
+
+    @classmethod
+    def load(
+        cls,
+        log_path: Path,
+        *,
+        window_bytes: int = DEFAULT_LOG_WINDOW_BYTES,
+        state_dir: Path | None = None,
+    ) -> "LogCursor":
+        """
+        Restore a cursor from its state file (or start fresh if there is none).
+        """
+        cursor = cls(log_path, window_bytes=window_bytes, state_dir=state_dir)
+        try:
+            data = json.loads(cursor.state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cursor
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable log cursor %s: %s", cursor.state_path, exc)
+            return cursor
+        try:
+            if data.get("version") != _LOG_CURSOR_STATE_VERSION:
+                return cursor
+            cursor.dev = data["dev"]
+            cursor.inode = data["inode"]
+            cursor.offset = int(data["offset"])
+            cursor.anchor = data.get("anchor")
+            cursor.covered_from = int(data["covered_from"])
+            partial = data.get("partial")
+            cursor._partial = None if partial is None else base64.b64decode(partial)
+            cursor._events = [_event_from_state(raw) for raw in data.get("events", [])]
+            cursor._new_crawl_phase_offsets = [int(o) for o in data.get("new_crawl_phase", [])]
+            cursor._resume_crawl_offsets = [int(o) for o in data.get("resume_crawl", [])]
+            # A consumer with a larger window keeps the stored state wide enough
+            # for everyone sharing it.
+            cursor.window_bytes = max(cursor.window_bytes, int(data.get("window_bytes", 0)))
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.debug("Ignoring malformed log cursor %s: %s", cursor.state_path, exc)
+            cursor._reset(dev=None, inode=None)
+        return cursor
+
+    def save(self) -> bool:
+        """
+        Persist the cursor atomically. Returns False if the state dir is not writable.
+        """
+        path = self.state_path
+        data = {
+            "version": _LOG_CURSOR_STATE_VERSION,
+            "log_path": str(self.log_path),
+            "dev": self.dev,
+            "inode": self.inode,
+            "offset": self.offset,
+            "anchor": self.anchor,
+            "covered_from": self.covered_from,
+            "window_bytes": self.window_bytes,
+            "partial": None
+            if self._partial is None
+            else base64.b64encode(self._partial).decode("ascii"),
+            "events": [_event_to_state(o, e) for o, e in self._events],
+            "new_crawl_phase": self._new_crawl_phase_offsets,
+            "resume_crawl": self._resume_crawl_offsets,
+        }
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("Could not save log cursor %s: %s", path, exc)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+        return True
+
+    # -- parsing --------------------------------------------------------------
+
+    def update(self) -> bool:
+        """
+        Parse bytes appended to the log since the last update.
+
+        Returns:
+            False if the log could not be read (missing or unreadable).
+        """
+        try:
+            with open(self.log_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if not stat.S_ISREG(st.st_mode):
+                    return False
+                size = st.st_size
+                window_start = max(0, size - self.window_bytes)
+                if (
+                    # New file, rotated log, or truncation.
+                    (st.st_dev, st.st_ino) != (self.dev, self.inode)
+                    or size < self.offset
+                    # Rewritten in place (same inode, different content).
+                    or self._read_anchor(f, self.offset) != self.anchor
+                    # Stored window narrower than this consumer needs.
+                    or self.covered_from > window_start
+                    # Idle for so long that the unread bytes overrun the window.
+                    or self.offset < window_start
+                ):
+                    self._restart(st, window_start)
+
+                read_from = self.offset
+                if self._partial is None and read_from > 0:
+                    # Mid-line unless the previous byte ends a line.
+                    f.seek(read_from - 1)
+                    if f.read(1) == b"\n":
+                        self._partial = b""
+                f.seek(read_from)
+                chunk = f.read(size - read_from)
+                anchor = self._read_anchor(f, read_from + len(chunk))
+        except OSError as exc:
+            logger.debug("Failed to read crawl log %s: %s", self.log_path, exc)
+            return False
+
+        self._consume(read_from, chunk)
+        self._prune(read_from + len(chunk))
+        self.anchor = anchor
+        return True
+
+    @staticmethod
+    def _read_anchor(f: Any, offset: int) -> str | None:
+        if offset <= 0:
+            return None
+        f.seek(max(0, offset - _LOG_CURSOR_ANCHOR_BYTES))
+        data = f.read(min(offset, _LOG_CURSOR_ANCHOR_BYTES))
+        return hashlib.sha256(data).hexdigest()[:16]
+
+    def _consume(self, start: int, chunk: bytes) -> None:
+        pos = 0
+        line_start = start
+        if self._partial is None:
+            newline = chunk.find(b"\n")
+            if newline < 0:
+                self.offset = start + len(chunk)
+                return
+            pos = newline + 1
+            line_start = start + pos
+            self._partial = b""
+        else:
+            line_start = start - len(self._partial)
+
+        while True:
+            newline = chunk.find(b"\n", pos)
+            if newline < 0:
+                break
+            raw = chunk[pos:newline]
+            if self._partial:
+                raw = self._partial + raw
+                self._partial = b""
+            self._consume_line(line_start, raw.decode("utf-8", errors="replace"))
+            pos = newline + 1
+            line_start = start + pos
+
+        tail = chunk[pos:]
+        if self._partial is not None:
+            tail = self._partial + tail
+        self._partial = tail if len(tail) <= _LOG_CURSOR_MAX_PARTIAL_BYTES else None
+        self.offset = start + len(chunk)
+
+    def _consume_line(self, offset: int, line: str) -> None:
+        if NewCrawlPhaseStageToken in line:
+            self._new_crawl_phase_offsets.append(offset)
+        elif ResumeCrawlStageToken in line:
+            self._resume_crawl_offsets.append(offset)
+        event = _parse_crawl_status_line(line)
+        if event is not None:
+            self._events.append((offset, event))
+
+    def _prune(self, end: int) -> None:
+        cutoff = end - self.window_bytes
+        self._events = [(o, e) for o, e in self._events if o >= cutoff][-_LOG_CURSOR_MAX_EVENTS:]
+        self._new_crawl_phase_offsets = [o for o in self._new_crawl_phase_offsets if o >= cutoff]
+        self._resume_crawl_offsets = [o for o in self._resume_crawl_offsets if o >= cutoff]
+
+    # -- views ------------------------------------------------------------------
+
+    def _cutoff(self, max_bytes: int | None) -> int:
+        return self.offset - int(max_bytes if max_bytes is not None else self.window_bytes)
+
+    def events(self, *, max_bytes: int | None = None) -> List[CrawlStatusEvent]:
+        cutoff = self._cutoff(max_bytes)
+        return [e for o, e in self._events if o >= cutoff]
+
+    def progress(self, *, max_bytes: int | None = None) -> CrawlLogProgress | None:
+        return _progress_from_events(self.log_path, self.events(max_bytes=max_bytes))
+
+    def new_crawl_phase_count(self, *, max_bytes: int | None = None) -> int:
+        cutoff = self._cutoff(max_bytes)
+        return sum(1 for o in self._new_crawl_phase_offsets if o >= cutoff)
+
+    def resume_crawl_count(self, *, max_bytes: int | None = None) -> int:
+        cutoff = self._cutoff(max_bytes)
+        return sum(1 for o in self._resume_crawl_offsets if o >= cutoff)
+
+
+def open_log_cursor(
+    log_path: Path,
+    *,
+    max_bytes: int = DEFAULT_LOG_WINDOW_BYTES,
+    state_dir: Path | None = None,
+) -> LogCursor | None:
+    """
+    Load, advance and persist the shared cursor for ``log_path``.
+
+    Returns None when the log cannot be read. Failing to persist the cursor
+    (e.g. a read-only state dir) is not an error; the next call simply
+    re-reads from the last saved offset.
+    """
+    cursor = LogCursor.load(log_path, window_bytes=max_bytes, state_dir=state_dir)
+    if not cursor.update():
+        return None
+    cursor.save()
+    return cursor
+
+
+def read_crawl_log_progress(
+    log_path: Path,
+    *,
+    max_bytes: int = DEFAULT_LOG_WINDOW_BYTES,
+    state_dir: Path | None = None,
+) -> CrawlLogProgress | None:
+    """
+    Incremental equivalent of ``parse_crawl_log_progress`` backed by a LogCursor.
+    """
+    cursor = open_log_cursor(log_path, max_bytes=max_bytes, state_dir=state_dir)
+    if cursor is None:
+        return None
+    return cursor.progress(max_bytes=max_bytes)
+
+
 def _find_latest_combined_log(output_dir: Path) -> Optional[Path]:
     """
     Locate the most recent archive_*.combined.log file under a job's output
@@ -304,7 +664,18 @@ def update_job_stats_from_logs(job: ArchiveJob) -> None:
             logger.debug("No combined log found for job %s; skipping stats sync.", job.id)
             return
 
-        stats: Optional[Dict[str, Any]] = parse_last_stats_from_log(log_path)
+        stats: Optional[Dict[str, Any]] = None
+        cursor = open_log_cursor(log_path)
+        last_event = cursor.events()[-1] if cursor is not None and cursor.events() else None
+        if last_event is not None:
+            stats = {
+                "crawled": last_event.crawled,
+                "total": last_event.total,
+                "pending": last_event.pending,
+                "failed": last_event.failed,
+            }
+        else:
+            stats = parse_last_stats_from_log(log_path)
         if not stats:
             logger.debug("parse_last_stats_from_log returned no stats for %s; skipping.", log_path)
             return
@@ -333,8 +704,12 @@ def update_job_stats_from_logs(job: ArchiveJob) -> None:
 __all__ = [
     "CrawlLogProgress",
     "CrawlStatusEvent",
+    "LogCursor",
     "count_new_crawl_phase_events_from_log_tail",
+    "count_resume_crawl_events_from_log_tail",
+    "open_log_cursor",
     "parse_crawl_log_progress",
     "parse_crawl_status_events_from_log_tail",
+    "read_crawl_log_progress",
     "update_job_stats_from_logs",
 ]
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import time
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, exc, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import Pool, QueuePool, StaticPool
 
-from .config import get_database_config
+from .config import DB_ROLES, get_database_config, get_database_pool_profile, get_database_role
 
 
 class Base(DeclarativeBase):
@@ -21,58 +22,214 @@ class Base(DeclarativeBase):
 _engine = None
 _SessionLocal: sessionmaker[Session] | None = None
 
+# Optional read replica (HEALTHARCHIVE_DATABASE_REPLICA_URL), keyed by URL so
+# a changed setting builds a fresh engine.
+_read_engine = None
+_read_engine_url: str | None = None
+_ReadSessionLocal: sessionmaker[Session] | None = None
+
+# Explicit role set by an entrypoint (API, worker, ...); falls back to
+# HEALTHARCHIVE_DB_ROLE.
+_role: str | None = None
+
+_STATEMENT_TIMEOUT_KEY = "statement_timeout_ms"
+
+
+class _TimedQueuePool(QueuePool):
+    """
+    QueuePool that reports how long each checkout waited (see runtime_metrics).
+    """
+
+    def connect(self) -> Any:
+        from .runtime_metrics import observe_db_pool_checkout
+
+        started = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            observe_db_pool_checkout(
+                self.logging_name or "primary", time.perf_counter() - started, timed_out=True
+            )
+            raise
+        observe_db_pool_checkout(self.logging_name or "primary", time.perf_counter() - started)
+        return conn
+
+
+def set_engine_role(role: str) -> None:
+    """
+    Select the pool profile for this process (``api``, ``worker``, ``cli``, ``metrics``).
+
+    Entry points call this before their first query; engines that were
+    already built keep the settings they were created with.
+    """
+    global _role
+    if role not in DB_ROLES:
+        raise ValueError(f"Unknown database role {role!r} (expected one of {', '.join(DB_ROLES)})")
+    _role = role
+
+
+def get_engine_role() -> str:
+    return _role or get_database_role()
+
+
+def _build_engine(url: str, *, pool_name: str):
+    if url.startswith("sqlite://"):
+        connect_args = {"check_same_thread": False}
+        # Special-case in-memory SQLite so multiple sessions share a single
+        # connection (handy for tests and local dev).
+        if url in {"sqlite://", "sqlite:///:memory:"}:
+            engine = create_engine(
+                url,
+                connect_args=connect_args,
+                poolclass=StaticPool,
+                future=True,
+            )
+        else:
+            engine = create_engine(
+                url,
+                connect_args=connect_args,
+                poolclass=_TimedQueuePool,
+                pool_logging_name=pool_name,
+                future=True,
+            )
+    else:
+        role = get_engine_role()
+        profile = get_database_pool_profile(role)
+        pg_connect_args: dict[str, Any] = {"application_name": f"healtharchive-{role}"}
+        if profile.statement_timeout_ms > 0:
+            pg_connect_args["options"] = f"-c statement_timeout={profile.statement_timeout_ms}"
+        engine = create_engine(
+            url,
+            connect_args=pg_connect_args,
+            poolclass=_TimedQueuePool,
+            pool_logging_name=pool_name,
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout_seconds,
+            pool_recycle=profile.pool_recycle_seconds,
+            pool_pre_ping=profile.pool_pre_ping,
+            future=True,
+        )
+
+    # Compiled-cache hit/miss counters for search statements (/metrics).
+    from .runtime_metrics import install_sql_compile_cache_metrics
+
+    install_sql_compile_cache_metrics(engine)
+    return engine
+
 
 def get_engine():
     """
     Lazily construct and cache the SQLAlchemy engine.
+
+    Postgres engines are sized from the process role's pool profile
+    (``set_engine_role`` / HEALTHARCHIVE_DB_ROLE).
     """
     global _engine
     if _engine is None:
-        db_cfg = get_database_config()
-        # echo can be toggled via environment later if desired.
-        url = db_cfg.database_url
-        if url.startswith("sqlite://"):
-            connect_args = {"check_same_thread": False}
-            # Special-case in-memory SQLite so multiple sessions share a single
-            # connection (handy for tests and local dev).
-            if url in {"sqlite://", "sqlite:///:memory:"}:
-                _engine = create_engine(
-                    url,
-                    connect_args=connect_args,
-                    poolclass=StaticPool,
-                    future=True,
-                )
-            else:
-                _engine = create_engine(url, connect_args=connect_args, future=True)
-        else:
-            _engine = create_engine(url, future=True)
+        _engine = _build_engine(get_database_config().database_url, pool_name="primary")
     return _engine
 
 
+def get_read_engine():
+    """
+    Return the read-replica engine when configured, else the primary engine.
+    """
+    global _read_engine, _read_engine_url
+    replica_url = get_database_config().replica_url
+    if not replica_url:
+        return get_engine()
+    if _read_engine is None or _read_engine_url != replica_url:
+        if _read_engine is not None:
+            _read_engine.dispose()
+        _read_engine = _build_engine(replica_url, pool_name="replica")
+        _read_engine_url = replica_url
+    return _read_engine
+
+
+def get_engine_pools() -> dict[str, Pool]:
+    """
+    Return the pools of engines built so far, keyed by ``primary`` / ``replica``.
+    """
+    pools: dict[str, Pool] = {}
+    if _engine is not None:
+        pools["primary"] = _engine.pool
+    if _read_engine is not None:
+        pools["replica"] = _read_engine.pool
+    return pools
+
+
+def _apply_statement_timeout(session: Session, transaction: Any, connection: Any) -> None:
+    timeout_ms = session.info.get(_STATEMENT_TIMEOUT_KEY)
+    if timeout_ms and connection.dialect.name == "postgresql":
+        connection.execute(text(f"SET LOCAL statement_timeout = {int(timeout_ms)}"))
+
+
+def _make_session_factory(engine: Any) -> sessionmaker[Session]:
+    factory = sessionmaker(
+        bind=engine,
+        autoflush=False,
+        autocommit=False,
+        future=True,
+    )
+    # Per-session statement_timeout (see set_statement_timeout).
+    event.listen(factory, "after_begin", _apply_statement_timeout)
+    return factory
+
+
 def get_session_factory() -> sessionmaker[Session]:
     """
     Return a cached sessionmaker bound to the engine.
     """
     global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(
-            bind=get_engine(),
-            autoflush=False,
-            autocommit=False,
-            future=True,
-        )
+        _SessionLocal = _make_session_factory(get_engine())
+        # Job status changes wake the worker (LISTEN/NOTIFY or local FIFO).
+        from .job_events import install_job_event_hooks
+
+        install_job_event_hooks(_SessionLocal)
     return _SessionLocal
 
 
-@contextmanager
-def get_session() -> Iterator[Session]:
+def get_read_session_factory() -> sessionmaker[Session]:
     """
-    Context manager yielding a database session.
+    Return a sessionmaker for read-only work (replica when configured).
 
-    Commits on success, rolls back on exception, and always closes.
+    Sessions it creates carry ``info["read_only"] = True`` so writers such as
+    usage metrics can route to the primary instead.
+    """
+    global _ReadSessionLocal
+    engine = get_read_engine()
+    if engine is get_engine():
+        return get_session_factory()
+    if _ReadSessionLocal is None or _ReadSessionLocal.kw.get("bind") is not engine:
+        _ReadSessionLocal = _make_session_factory(engine)
+        _ReadSessionLocal.configure(info={"read_only": True})
+    return _ReadSessionLocal
+
+
+def set_statement_timeout(session: Session, timeout_ms: int | None) -> None:
     """
-    session_factory = get_session_factory()
+    Apply a Postgres ``statement_timeout`` to every transaction ``session`` runs.
+
+    Uses ``SET LOCAL`` so the setting never leaks into pooled connections.
+    ``None``/0 keeps the role default. No-op on SQLite.
+    """
+    if not timeout_ms:
+        session.info.pop(_STATEMENT_TIMEOUT_KEY, None)
+        return
+    session.info[_STATEMENT_TIMEOUT_KEY] = int(timeout_ms)
+    if session.in_transaction():
+        _apply_statement_timeout(session, None, session.connection())
+
+
+@contextmanager
+def _session_scope(
+    session_factory: sessionmaker[Session], statement_timeout_ms: int | None
+) -> Iterator[Session]:
     session = session_factory()
+    if statement_timeout_ms:
+        set_statement_timeout(session, statement_timeout_ms)
     try:
         yield session
         session.commit()
@@ -83,4 +240,36 @@ def get_session() -> Iterator[Session]:
         session.close()
 
 
-__all__ = ["Base", "get_engine", "get_session", "get_session_factory"]
+@contextmanager
+def get_session(*, statement_timeout_ms: int | None = None) -> Iterator[Session]:
+    """
+    Context manager yielding a database session.
+
+    Commits on success, rolls back on exception, and always closes.
+    """
+    with _session_scope(get_session_factory(), statement_timeout_ms) as session:
+        yield session
+
+
+@contextmanager
+def get_read_session(*, statement_timeout_ms: int | None = None) -> Iterator[Session]:
+    """
+    Like ``get_session`` but bound to the read replica when one is configured.
+    """
+    with _session_scope(get_read_session_factory(), statement_timeout_ms) as session:
+        yield session
+
+
+__all__ = [
+    "Base",
+    "get_engine",
+    "get_engine_pools",
+    "get_engine_role",
+    "get_read_engine",
+    "get_read_session",
+    "get_read_session_factory",
+    "get_session",
+    "get_session_factory",
+    "set_engine_role",
+    "set_statement_timeout",
+]
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+"""
+Content-addressed store of text derived from archived HTML bodies.
+
+Indexing, ``refresh-snapshot-metadata``, ``backfill-outlinks`` and
+``compute-changes`` all derive the same artifacts from a response body:
+extracted text (title, snippet, FTS content), main-content link targets and
+diff-normalized lines. Only title and snippet live in the database, so every
+refresh used to go back to the WARCs.
+
+Entries are keyed by ``Snapshot.content_hash``, so identical bodies across
+editions share one file. They are written once (at index time, or by the
+first backfill that misses) and named with ``DERIVED_TEXT_VERSION`` so an
+extraction change simply misses and overwrites.
+
+Payloads are compressed with zstd when ``zstandard`` is installed (optionally
+with a dictionary trained on stored entries, see ``train_dictionary``) and
+with zlib otherwise. The codec is recorded per entry; anything that cannot
+be decoded is treated as a miss.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator, Optional
+
+from ha_backend.config import get_derived_text_dir, get_derived_text_zstd_dict_path
+from ha_backend.diffing import NORMALIZATION_VERSION, DiffDocument, normalize_html_for_diff
+from ha_backend.indexing.text_extraction import (
+    extract_outlink_hrefs,
+    extract_text,
+    extract_title,
+)
+
+# Optional zstd codec; zlib keeps the store usable without the extra.
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on installed extras
+    zstandard = None
+
+logger = logging.getLogger("healtharchive.derived_text_store")
+
+# Bump the "x" part when text_extraction output changes; the "d" part follows
+# the diff normalization version.
+DERIVED_TEXT_VERSION = f"x1.d{NORMALIZATION_VERSION}"
+
+_KEY_RE = re.compile(r"[0-9a-f]{16,128}")
+_CODEC_ZSTD = b"zstd\n"
+_CODEC_ZLIB = b"zlib\n"
+_ZSTD_LEVEL = 9
+_ZLIB_LEVEL = 6
+
+
+@dataclass
+class DerivedText:
+    """
+    Body-only artifacts of one HTML capture (nothing that depends on its URL).
+    """
+
+    title: Optional[str]
+    text: str
+    hrefs: list[str]
+    diff_lines: list[str]
+    diff_sections: list[tuple[str, str]]
+
+    @classmethod
+    def from_html(cls, html: str) -> DerivedText:
+        doc = normalize_html_for_diff(html)
+        return cls(
+            title=extract_title(html),
+            text=extract_text(html),
+            hrefs=extract_outlink_hrefs(html),
+            diff_lines=doc.lines,
+            diff_sections=doc.sections,
+        )
+
+    def diff_document(self) -> DiffDocument:
+        return DiffDocument(
+            text=" ".join(self.diff_lines),
+            lines=list(self.diff_lines),
+            sections=list(self.diff_sections),
+        )
+
+    def to_bytes(self) -> bytes:
+        payload = {
+            "title": self.title,
+            "text": self.text,
+            "hrefs": self.hrefs,
+            "diff_lines": self.diff_lines,
+            "diff_sections": self.diff_sections,
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> DerivedText:
+        payload: dict[str, Any] = json.loads(data)
+        return cls(
+            title=payload["title"],
+            text=payload["text"],
+            hrefs=list(payload["hrefs"]),
+            diff_lines=list(payload["diff_lines"]),
+            diff_sections=[(title, text) for title, text in payload["diff_sections"]],
+        )
+
+
+class DerivedTextStore:
+    def __init__(
+        self,
+        root: Path,
+        *,
+        zstd_dict: Optional[bytes] = None,
+        use_zstd: Optional[bool] = None,
+        version: str = DERIVED_TEXT_VERSION,
+    ) -> None:
+        self.root = root
+        self.version = version
+        self.use_zstd = zstandard is not None if use_zstd is None else use_zstd
+        if self.use_zstd and zstandard is None:
+            raise RuntimeError("zstandard is not installed; cannot write zstd entries.")
+        self._zstd_dict = (
+            zstandard.ZstdCompressionDict(zstd_dict)
+            if zstd_dict is not None and zstandard is not None
+            else None
+        )
+        # Approximate counters for CLI/log summaries.
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.{self.version}"
+
+    def _encode(self, data: bytes) -> bytes:
+        if self.use_zstd:
+            cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, dict_data=self._zstd_dict)
+            return _CODEC_ZSTD + cctx.compress(data)
+        return _CODEC_ZLIB + zlib.compress(data, _ZLIB_LEVEL)
+
+    def _decode(self, blob: bytes) -> bytes:
+        if blob.startswith(_CODEC_ZLIB):
+            return zlib.decompress(blob[len(_CODEC_ZLIB) :])
+        if blob.startswith(_CODEC_ZSTD):
+            if zstandard is None:
+                raise ValueError("zstd entry but zstandard is not installed")
+            dctx = zstandard.ZstdDecompressor(dict_data=self._zstd_dict)
+            return dctx.decompress(blob[len(_CODEC_ZSTD) :])
+        raise ValueError("unknown derived text codec")
+
+    def get(self, key: Optional[str]) -> Optional[DerivedText]:
+        """
+        Return the entry for ``key`` (a content hash), or None on a miss.
+        """
+        if not key or not _KEY_RE.fullmatch(key):
+            return None
+        path = self._path(key)
+        try:
+            blob = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            derived = DerivedText.from_bytes(self._decode(blob))
+        except Exception as exc:
+            # Undecodable (e.g. written with another zstd dictionary): drop it so
+            # the next put rewrites it.
+            logger.debug("Dropping unreadable derived text entry %s: %s", key, exc)
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            self.misses += 1
+            return None
+        self.hits += 1
+        return derived
+
+    def put(self, key: Optional[str], derived: DerivedText, *, replace: bool = False) -> bool:
+        """
+        Store ``derived`` unless an entry for this version already exists.
+
+        ``replace`` overwrites it instead (a re-extraction that must win over an
+        entry written by older code under the same version). Best-effort:
+        failures are logged and reported as False.
+        """
+        if not key or not _KEY_RE.fullmatch(key):
+            return False
+        path = self._path(key)
+        if path.exists() and not replace:
+            return False
+        bucket = path.parent
+        try:
+            bucket.mkdir(parents=True, exist_ok=True)
+            blob = self._encode(derived.to_bytes())
+            fd, tmp_name = tempfile.mkstemp(dir=bucket, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_name, path)
+            # Entries from older extraction versions are never read again.
+            for stale in bucket.glob(f"{key}.*"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Failed to store derived text for %s: %s", key, exc)
+            return False
+        self.writes += 1
+        return True
+
+    def get_or_derive(self, key: Optional[str], html: str) -> DerivedText:
+        """
+        Return the stored entry for ``key`` or derive it from ``html`` and store it.
+        """
+        derived = self.get(key)
+        if derived is None:
+            derived = DerivedText.from_html(html)
+            self.put(key, derived)
+        return derived
+
+    def iter_payloads(self, *, limit: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yield decoded payloads of current-version entries (for dictionary training).
+        """
+        n = 0
+        for path in self.root.glob(f"*/*.{self.version}"):
+            if limit is not None and n >= limit:
+                return
+            try:
+                data = self._decode(path.read_bytes())
+            except Exception as exc:
+                logger.debug("Skipping %s: %s", path, exc)
+                continue
+            n += 1
+            yield data
+
+    def train_dictionary(self, *, dict_size: int = 112_640, max_samples: int = 20_000) -> bytes:
+        """
+        Train a zstd dictionary on stored entries.
+
+        Canada.ca pages share most of their chrome and boilerplate, which a
+        dictionary captures once instead of per entry. Entries written with a
+        different dictionary stop decoding after a switch and are rewritten
+        as they are read.
+        """
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed; cannot train a dictionary.")
+        samples = list(self.iter_payloads(limit=max_samples))
+        if not samples:
+            raise ValueError(f"No derived text entries under {self.root} to train on.")
+        return zstandard.train_dictionary(dict_size, samples).as_bytes()
+
+    def summary(self) -> str:
+        return f"{self.hits} hit(s), {self.misses} miss(es), {self.writes} write(s)"
+
+
+_STORE: Optional[DerivedTextStore] = None
+_STORE_KEY: Optional[tuple[Path, Optional[Path]]] = None
+_STORE_LOCK = Lock()
+
+
+def get_derived_text_store() -> Optional[DerivedTextStore]:
+    """
+    Return the configured store, or None when HEALTHARCHIVE_DERIVED_TEXT_DIR is unset.
+    """
+    global _STORE, _STORE_KEY
+    root = get_derived_text_dir()
+    if root is None:
+        return None
+    dict_path = get_derived_text_zstd_dict_path()
+    with _STORE_LOCK:
+        if _STORE is None or _STORE_KEY != (root, dict_path):
+            zstd_dict: Optional[bytes] = None
+            if dict_path is not None:
+                if zstandard is None:
+                    logger.warning(
+                        "HEALTHARCHIVE_DERIVED_TEXT_ZSTD_DICT is set but zstandard is not "
+                        "installed; using zlib."
+                    )
+                else:
+                    try:
+                        zstd_dict = dict_path.read_bytes()
+                    except OSError as exc:
+                        logger.warning("Cannot read zstd dictionary %s: %s", dict_path, exc)
+            _STORE = DerivedTextStore(root, zstd_dict=zstd_dict)
+            _STORE_KEY = (root, dict_path)
+        return _STORE
+
+
+__all__ = [
+    "DERIVED_TEXT_VERSION",
+    "DerivedText",
+    "DerivedTextStore",
+    "get_derived_text_store",
+]
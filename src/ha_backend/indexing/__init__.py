@@ -1,5 +1,20 @@
 from __future__ import annotations
 
-from .pipeline import index_job
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pipeline import index_job
+
+
+def __getattr__(name: str) -> Any:
+    # Import the pipeline (BeautifulSoup, warcio, authority) only when asked:
+    # ``ha_backend.indexing.viewer`` and friends are used by the API and CLI
+    # without needing the indexing pipeline.
+    if name == "index_job":
+        from .pipeline import index_job
+
+        return index_job
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["index_job"]
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+"""
+ha_backend.indexing.cdxj - Native CDXJ generation for pywb replay
+
+Builds pywb-compatible CDXJ index lines from our own WARC pass so a replay
+collection can be made ready without `wb-manager reindex` re-reading every
+WARC:
+
+    - one sorted shard per WARC under ``<output_dir>/cdxj/``, written during
+      ``index_job`` (or by ``ha-backend build-cdxj``)
+    - shard names encode the WARC's resolved path, size and mtime, so a shard
+      is reused until its WARC changes and only new WARCs are ever read
+    - ``merge_cdxj_shards`` k-way merges shards into a collection's
+      ``indexes/index.cdxj``, rewriting ``filename`` to the collection's
+      stable ``warc-NNNNNN`` link names
+
+Line format (as written by pywb's own indexer)::
+
+    com,example)/path 20250101120000 {"url": ..., "mime": ..., "status": ...,
+        "digest": ..., "length": ..., "offset": ..., "filename": ...}
+
+See also:
+    - docs/deployment/replay-service-pywb.md
+    - ha_backend.cli.cmd_replay_index_job for collection assembly
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+from urllib.parse import urlsplit
+
+from warcio.archiveiterator import ArchiveIterator
+
+from .warc_reader import _parse_warc_datetime
+
+logger = logging.getLogger("healtharchive.indexing")
+
+CDXJ_SHARDS_DIRNAME = "cdxj"
+CDXJ_SHARD_SUFFIX = ".cdxj"
+
+# Record types pywb serves from the index; request/metadata/warcinfo records
+# are not replayable on their own.
+CDXJ_RECORD_TYPES = frozenset({"response", "revisit", "resource"})
+
+_WWW_PREFIX_RE = re.compile(r"^www\d*\.")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def surt_key(url: str) -> str | None:
+    """
+    Return the SURT sort key pywb uses for ``url`` (scheme dropped).
+
+    Follows the ``surt`` package defaults: lowercase, strip ``www*.`` and
+    userinfo, drop default ports and the fragment, strip a trailing slash
+    unless the path is ``/``, and sort query arguments. Session-id stripping
+    is not applied. Returns None for non-HTTP(S) URLs.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        return None
+
+    host = (parts.hostname or "").strip(".").lower()
+    if not host:
+        return None
+    host = _WWW_PREFIX_RE.sub("", host, count=1)
+    key = ",".join(reversed(host.split(".")))
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        key = f"{key}:{port}"
+
+    path = (parts.path or "/").lower()
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+    key = f"{key}){path}"
+
+    query = parts.query.lower()
+    if query:
+        args = sorted(a for a in query.split("&") if a)
+        if args:
+            key = f"{key}?{'&'.join(args)}"
+    return key
+
+
+def get_job_cdxj_dir(output_dir: Path) -> Path:
+    return output_dir / CDXJ_SHARDS_DIRNAME
+
+
+def cdxj_shard_path(shards_dir: Path, warc_path: Path) -> Path:
+    """
+    Return the shard path for ``warc_path`` in its current on-disk state.
+    """
+    resolved = warc_path.resolve()
+    st = resolved.stat()
+    fingerprint = hashlib.sha256(
+        f"{resolved}\0{st.st_size}\0{st.st_mtime_ns}".encode("utf-8")
+    ).hexdigest()[:24]
+    return shards_dir / f"{fingerprint}{CDXJ_SHARD_SUFFIX}"
+
+
+def _record_mime_and_status(record: Any) -> tuple[str | None, str | None]:
+    if record.rec_type == "revisit":
+        mime = "warc/revisit"
+    elif record.rec_type == "resource":
+        content_type = record.rec_headers.get_header("Content-Type") or ""
+        return (content_type.split(";", 1)[0].strip().lower() or None), "200"
+    else:
+        mime = None
+
+    http_headers = getattr(record, "http_headers", None)
+    status: str | None = None
+    if http_headers is not None:
+        status = http_headers.get_statuscode() or None
+        if mime is None:
+            content_type = http_headers.get_header("Content-Type") or ""
+            mime = content_type.split(";", 1)[0].strip().lower() or None
+    return mime, status
+
+
+def cdxj_line_for_record(record: Any, offset: int, length: int) -> str | None:
+    """
+    Render one CDXJ line (without ``filename``) for a warcio record.
+
+    Returns None for records pywb does not index.
+    """
+    if record.rec_type not in CDXJ_RECORD_TYPES:
+        return None
+    url = record.rec_headers.get_header("WARC-Target-URI")
+    if not url:
+        return None
+    key = surt_key(url)
+    if key is None:
+        return None
+
+    timestamp = _parse_warc_datetime(record.rec_headers.get_header("WARC-Date")).strftime(
+        "%Y%m%d%H%M%S"
+    )
+    mime, status = _record_mime_and_status(record)
+
+    fields: dict[str, Any] = {"url": url}
+    if mime:
+        fields["mime"] = mime
+    if status:
+        fields["status"] = status
+    digest = record.rec_headers.get_header("WARC-Payload-Digest")
+    if digest:
+        fields["digest"] = digest.split(":", 1)[1] if digest.startswith("sha1:") else digest
+    fields["length"] = str(length)
+    fields["offset"] = str(offset)
+    return f"{key} {timestamp} {json.dumps(fields)}"
+
+
+@dataclass
+class CdxjShardBuilder:
+    """
+    Collect CDXJ lines for one WARC while another pass iterates it.
+
+    ``add`` has the ``record_observer`` signature used by
+    ``warc_reader.iter_html_records`` and never raises.
+    """
+
+    lines: list[str] = field(default_factory=list)
+    errors: int = 0
+
+    def add(self, record: Any, offset: int, length: int) -> None:
+        try:
+            line = cdxj_line_for_record(record, offset, length)
+        except Exception:
+            self.errors += 1
+            return
+        if line is not None:
+            self.lines.append(line)
+
+    def write(self, shard_path: Path) -> int:
+        """
+        Sort and atomically write the collected lines; returns the line count.
+        """
+        self.lines.sort()
+        shard_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = shard_path.with_name(f".{shard_path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for line in self.lines:
+                f.write(line)
+                f.write("\n")
+        os.replace(tmp_path, shard_path)
+        return len(self.lines)
+
+
+def build_warc_cdxj_shard(warc_path: Path, shard_path: Path) -> int:
+    """
+    Read ``warc_path`` once and write its sorted CDXJ shard.
+    """
+    builder = CdxjShardBuilder()
+    with warc_path.open("rb") as f:
+        it = ArchiveIterator(f)
+        for record in it:
+            if record.rec_type not in CDXJ_RECORD_TYPES:
+                continue
+            builder.add(record, it.get_record_offset(), it.get_record_length())
+    return builder.write(shard_path)
+
+
+@dataclass
+class CdxjShardsResult:
+    shards: list[tuple[Path, Path]]  # (warc_path, shard_path), in WARC order
+    built: int = 0
+    reused: int = 0
+    failed: list[tuple[Path, str]] = field(default_factory=list)
+
+
+def ensure_job_cdxj_shards(
+    output_dir: Path,
+    warc_paths: Sequence[Path],
+    *,
+    force: bool = False,
+    prune: bool = True,
+) -> CdxjShardsResult:
+    """
+    Make sure every WARC has a current shard, reading only WARCs that lack one.
+
+    Shards for WARCs that are no longer present (or have changed) are pruned.
+    """
+    shards_dir = get_job_cdxj_dir(output_dir)
+    result = CdxjShardsResult(shards=[])
+    for warc_path in warc_paths:
+        try:
+            shard_path = cdxj_shard_path(shards_dir, warc_path)
+            if shard_path.is_file() and not force:
+                result.reused += 1
+            else:
+                build_warc_cdxj_shard(warc_path, shard_path)
+                result.built += 1
+        except Exception as exc:
+            logger.warning("Failed to build CDXJ shard for %s: %s", warc_path, exc)
+            result.failed.append((warc_path, str(exc)))
+            continue
+        result.shards.append((warc_path, shard_path))
+
+    if prune and not result.failed and shards_dir.is_dir():
+        keep = {shard for _, shard in result.shards}
+        for path in shards_dir.glob(f"*{CDXJ_SHARD_SUFFIX}"):
+            if path not in keep:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    return result
+
+
+def _iter_shard_lines(shard_path: Path, filename: str) -> Iterator[str]:
+    suffix = f", {json.dumps({'filename': filename})[1:]}"
+    with shard_path.open("r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.rstrip("\n")
+            if line.endswith("}"):
+                yield line[:-1] + suffix
+
+
+def merge_cdxj_shards(shards: Iterable[tuple[Path, str]], out_path: Path) -> int:
+    """
+    K-way merge sorted shards into ``out_path`` (written atomically).
+
+    ``shards`` pairs each shard with the WARC filename pywb should resolve
+    (e.g. ``warc-000001.warc.gz``). Returns the number of lines written.
+    """
+    streams = [_iter_shard_lines(shard, filename) for shard, filename in shards]
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.tmp")
+    count = 0
+    with tmp_path.open("w", encoding="utf-8") as out:
+        for line in heapq.merge(*streams):
+            out.write(line)
+            out.write("\n")
+            count += 1
+    os.replace(tmp_path, out_path)
+    return count
+
+
+__all__ = [
+    "CDXJ_SHARDS_DIRNAME",
+    "CdxjShardBuilder",
+    "CdxjShardsResult",
+    "build_warc_cdxj_shard",
+    "cdxj_line_for_record",
+    "cdxj_shard_path",
+    "ensure_job_cdxj_shards",
+    "get_job_cdxj_dir",
+    "merge_cdxj_shards",
+    "surt_key",
+]
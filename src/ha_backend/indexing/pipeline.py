@@ -9,6 +9,7 @@ Transforms completed crawl jobs into searchable Snapshot records:
     3. Extracts title, text, snippet, language from HTML
     4. Creates/updates Snapshot rows in database
     5. Computes storage statistics and page signals
+    6. Writes per-WARC CDXJ shards for pywb replay from the same WARC pass
 
 Key functions:
     - index_job(job_id): Main entry point for indexing a job
@@ -35,7 +36,9 @@ from ha_backend.archive_storage import (
 )
 from ha_backend.authority import recompute_page_signals
 from ha_backend.db import get_session
-from ha_backend.indexing.mapping import record_to_snapshot
+from ha_backend.derived_text_store import get_derived_text_store
+from ha_backend.indexing.cdxj import CdxjShardBuilder, cdxj_shard_path, get_job_cdxj_dir
+from ha_backend.indexing.mapping import compute_content_hash, record_to_snapshot
 from ha_backend.indexing.text_extraction import (
     detect_is_archived,
     detect_language,
@@ -44,6 +47,8 @@ from ha_backend.indexing.text_extraction import (
     extract_text,
     extract_title,
     make_snippet,
+    outlink_groups_from_hrefs,
+    truncate_content_text,
 )
 from ha_backend.indexing.warc_discovery import discover_temp_warcs_for_job, discover_warcs_for_job
 from ha_backend.indexing.warc_reader import iter_html_records
@@ -111,6 +116,45 @@ def _ensure_stable_warcs_available(job_id: int, job: "ArchiveJob", output_dir: P
     _attempt_temp_warc_consolidation(job_id, job, output_dir)
 
 
+# --- Helper functions for CDXJ shards ---
+
+
+def _cdxj_shards_enabled() -> bool:
+    raw = os.environ.get("HEALTHARCHIVE_INDEX_BUILD_CDXJ", "1").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def _pages_incremental_enabled() -> bool:
+    raw = os.environ.get("HEALTHARCHIVE_PAGES_INCREMENTAL", "1").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def _start_cdxj_shard(output_dir: Path, warc_path: Path) -> tuple[CdxjShardBuilder, Path] | None:
+    """Return a builder for this WARC's shard, or None if a current shard exists."""
+    try:
+        shard_path = cdxj_shard_path(get_job_cdxj_dir(output_dir), warc_path)
+    except OSError as exc:
+        logger.warning("Skipping CDXJ shard for %s: %s", warc_path, exc)
+        return None
+    if shard_path.is_file():
+        return None
+    return CdxjShardBuilder(), shard_path
+
+
+def _finish_cdxj_shard(pending: tuple[CdxjShardBuilder, Path], warc_path: Path) -> None:
+    builder, shard_path = pending
+    try:
+        n_lines = builder.write(shard_path)
+    except OSError as exc:
+        logger.warning("Failed to write CDXJ shard for %s: %s", warc_path, exc)
+        return
+    if builder.errors:
+        logger.warning(
+            "CDXJ shard for %s skipped %d unparseable record(s).", warc_path, builder.errors
+        )
+    logger.debug("Wrote %d CDXJ line(s) for %s to %s", n_lines, warc_path, shard_path)
+
+
 def _load_job(session: Session, job_id: int) -> ArchiveJob:
     job = session.get(ArchiveJob, job_id)
     if job is None:
@@ -134,6 +178,7 @@ def index_job(job_id: int) -> int:
         has_page_signals = inspector.has_table("page_signals")
         use_authority = has_outlinks and has_page_signals
         has_pages = inspector.has_table("pages")
+        has_search_vocabulary = inspector.has_table("search_vocabulary")
 
         if job.source is None:
             raise ValueError(f"ArchiveJob {job_id} has no associated Source; cannot index.")
@@ -244,10 +289,14 @@ def index_job(job_id: int) -> int:
 
             impacted_groups: set[str] = set()
             impacted_page_groups: set[str] = set()
+            # Groups that lose this job's previous snapshots need a full
+            # recompute; everything else can be folded in incrementally.
+            reindexed_page_groups: set[str] = set()
             if has_pages:
                 from ha_backend.pages import discover_job_page_groups
 
-                impacted_page_groups.update(discover_job_page_groups(session, job_id=job.id))
+                reindexed_page_groups.update(discover_job_page_groups(session, job_id=job.id))
+                impacted_page_groups.update(reindexed_page_groups)
 
             if has_outlinks:
                 # Capture the set of groups affected by removing the old outlinks,
@@ -266,21 +315,37 @@ def index_job(job_id: int) -> int:
                     SnapshotOutlink.snapshot_id.in_(snapshot_ids_subq)
                 ).delete(synchronize_session=False)
 
-            session.query(Snapshot).filter(Snapshot.job_id == job.id).delete(
-                synchronize_session=False
+            replaced_snapshots = (
+                session.query(Snapshot)
+                .filter(Snapshot.job_id == job.id)
+                .delete(synchronize_session=False)
             )
             job.indexed_page_count = 0
             job.status = "indexing"
 
             n_snapshots = 0
+            build_cdxj = _cdxj_shards_enabled()
+            # Optional content-addressed text store: duplicate bodies skip
+            # extraction, and later backfills/diffs skip the WARCs.
+            derived_store = get_derived_text_store()
 
             for warc_path in warc_paths:
-                for rec in iter_html_records(warc_path):
+                pending_cdxj = _start_cdxj_shard(output_dir, warc_path) if build_cdxj else None
+                observer = pending_cdxj[0].add if pending_cdxj is not None else None
+                for rec in iter_html_records(warc_path, record_observer=observer):
                     try:
                         # Decode bytes to text; prefer UTF-8 with replacement for robustness.
                         html = rec.body_bytes.decode("utf-8", errors="replace")
-                        title = extract_title(html)
-                        text = extract_text(html)
+                        derived = None
+                        if derived_store is not None:
+                            derived = derived_store.get_or_derive(
+                                compute_content_hash(rec.body_bytes), html
+                            )
+                            title = derived.title
+                            text = derived.text
+                        else:
+                            title = extract_title(html)
+                            text = extract_text(html)
                         snippet = make_snippet(text)
                         language = detect_language(text, rec.headers)
 
@@ -305,27 +370,43 @@ def index_job(job_id: int) -> int:
                                 impacted_page_groups.add(group_key)
 
                         if use_postgres_fts:
-                            from ha_backend.search import build_search_vector
+                            from ha_backend.search import (
+                                SEARCH_VECTOR_VERSION,
+                                build_search_vector,
+                            )
 
                             # Use extended content text (4KB) for better FTS recall.
-                            content_text = extract_content_text(html)
+                            content_text = (
+                                truncate_content_text(text)
+                                if derived is not None
+                                else extract_content_text(html)
+                            )
                             snapshot.search_vector = build_search_vector(
                                 title,
                                 snippet,
                                 rec.url,
                                 content_text=content_text,
+                                language=language,
                             )
+                            snapshot.search_vector_version = SEARCH_VECTOR_VERSION
 
                         if (
                             has_outlinks
                             and rec.status_code is not None
                             and 200 <= rec.status_code < 300
                         ):
-                            outlink_groups = extract_outlink_groups(
-                                html,
-                                base_url=rec.url,
-                                from_group=snapshot.normalized_url_group,
-                            )
+                            if derived is not None:
+                                outlink_groups = outlink_groups_from_hrefs(
+                                    derived.hrefs,
+                                    base_url=rec.url,
+                                    from_group=snapshot.normalized_url_group,
+                                )
+                            else:
+                                outlink_groups = extract_outlink_groups(
+                                    html,
+                                    base_url=rec.url,
+                                    from_group=snapshot.normalized_url_group,
+                                )
                             if snapshot.normalized_url_group:
                                 impacted_groups.add(snapshot.normalized_url_group)
                             for group in outlink_groups:
@@ -347,11 +428,36 @@ def index_job(job_id: int) -> int:
                             rec_exc,
                         )
                         continue
+                if pending_cdxj is not None:
+                    _finish_cdxj_shard(pending_cdxj, warc_path)
 
             job.indexed_page_count = n_snapshots
             job.status = "indexed"
 
-            if has_pages and impacted_page_groups:
+            if has_pages and impacted_page_groups and _pages_incremental_enabled():
+                from ha_backend.pages import merge_job_pages, rebuild_pages
+
+                session.flush()
+                merged = merge_job_pages(session, job_id=job.id, source_id=job.source_id)
+                rebuilt_groups = deleted_groups = 0
+                if reindexed_page_groups:
+                    # Overwrites the merged rows for these groups with exact values.
+                    pages_result = rebuild_pages(
+                        session,
+                        source_id=job.source_id,
+                        groups=tuple(sorted(reindexed_page_groups)),
+                        delete_missing=True,
+                    )
+                    rebuilt_groups = pages_result.upserted_groups
+                    deleted_groups = pages_result.deleted_groups
+                logger.info(
+                    "Merged %d page group(s), rebuilt %d (deleted %d) for job %s.",
+                    merged.upserted_groups,
+                    rebuilt_groups,
+                    deleted_groups,
+                    job_id,
+                )
+            elif has_pages and impacted_page_groups:
                 from ha_backend.pages import rebuild_pages
 
                 session.flush()
@@ -372,6 +478,29 @@ def index_job(job_id: int) -> int:
                 session.flush()
                 recompute_page_signals(session, groups=tuple(impacted_groups))
 
+            if has_search_vocabulary and (n_snapshots or replaced_snapshots):
+                from ha_backend.search_vocabulary import (
+                    merge_job_search_vocabulary,
+                    rebuild_search_vocabulary,
+                )
+
+                session.flush()
+                if replaced_snapshots:
+                    # The replaced titles' terms cannot be subtracted; recount.
+                    vocab_result = rebuild_search_vocabulary(session)
+                    logger.info(
+                        "Rebuilt search vocabulary (%d term(s)) for job %s.",
+                        vocab_result.terms,
+                        job_id,
+                    )
+                else:
+                    vocab_result = merge_job_search_vocabulary(session, job.id)
+                    logger.info(
+                        "Merged %d search vocabulary term(s) for job %s.",
+                        vocab_result.terms,
+                        job_id,
+                    )
+
             # Best-effort storage accounting (metadata-only; no content reads).
             try:
                 temp_dirs = sorted([p for p in output_dir.glob(".tmp*") if p.is_dir()])
@@ -406,6 +535,13 @@ def index_job(job_id: int) -> int:
                         "Auto-deduplication failed for job %s (non-fatal): %s", job_id, exc
                     )
 
+            if derived_store is not None:
+                logger.info(
+                    "Derived text store totals after job %s: %s.",
+                    job_id,
+                    derived_store.summary(),
+                )
+
             logger.info(
                 "Indexing for job %s completed successfully with %d snapshot(s).",
                 job_id,
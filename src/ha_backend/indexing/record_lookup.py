@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+"""
+ha_backend.indexing.record_lookup - O(log n) WARC record lookup via CDXJ shards
+
+Resolves (WARC, URL, timestamp) to a record offset by binary-searching the
+per-WARC CDXJ shard written at index time (see ``ha_backend.indexing.cdxj``)
+instead of scanning the WARC from the start:
+
+    - shards are memory-mapped and kept open in an LRU; each open mmap holds
+      one file descriptor, so the LRU is bounded by an fd budget
+      (``HEALTHARCHIVE_CDXJ_LOOKUP_MAX_OPEN``)
+    - the shard for a WARC is found from the WARC path alone (no DB round
+      trip): ``<output_dir>/cdxj/`` is looked up among the WARC's ancestors
+
+Callers (viewer, changes, live compare) go through
+``viewer.find_record_for_snapshot``, which falls back to a WARC scan whenever
+no shard or matching line exists.
+"""
+
+import json
+import logging
+import mmap
+import os
+import resource
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .cdxj import CDXJ_SHARDS_DIRNAME, cdxj_shard_path, surt_key
+from .warc_reader import ArchiveRecord, read_record_at
+
+logger = logging.getLogger("healtharchive.indexing")
+
+MAX_OPEN_ENV = "HEALTHARCHIVE_CDXJ_LOOKUP_MAX_OPEN"
+DEFAULT_MAX_OPEN = 64
+
+# WARCs live at <output_dir>/warcs/<file> (stable) or
+# <output_dir>/.tmp*/collections/crawl-*/archive/<file> (legacy).
+_MAX_SHARD_DIR_DEPTH = 5
+
+
+@dataclass(frozen=True)
+class CdxjCapture:
+    url: str
+    timestamp: str
+    offset: int
+    length: int
+    mime: Optional[str]
+    status: Optional[str]
+
+
+def _default_max_open() -> int:
+    raw = os.environ.get(MAX_OPEN_ENV, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning("Invalid %s=%r; using default.", MAX_OPEN_ENV, raw)
+    try:
+        soft, _hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (OSError, ValueError):
+        return DEFAULT_MAX_OPEN
+    if soft == resource.RLIM_INFINITY or soft <= 0:
+        return DEFAULT_MAX_OPEN
+    # Leave most descriptors to sockets, DB connections and WARC reads.
+    return max(1, min(DEFAULT_MAX_OPEN, soft // 8))
+
+
+def _search_prefix(mm: mmap.mmap, prefix: bytes) -> list[bytes]:
+    """
+    Return every line starting with ``prefix`` in a sorted, newline-separated map.
+    """
+    size = len(mm)
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = mm.rfind(b"\n", 0, mid) + 1
+        end = mm.find(b"\n", start)
+        if end < 0:
+            end = size
+        if mm[start:end] < prefix:
+            lo = end + 1
+        else:
+            hi = start
+
+    matches: list[bytes] = []
+    pos = lo
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end < 0:
+            end = size
+        line = mm[pos:end]
+        if not line.startswith(prefix):
+            break
+        matches.append(line)
+        pos = end + 1
+    return matches
+
+
+class CdxjMmapCache:
+    """
+    LRU of memory-mapped CDXJ shards, bounded by an open-file budget.
+
+    Thread-safe: searches run under the cache lock so an mmap is never closed
+    while in use.
+    """
+
+    def __init__(self, max_open: int | None = None) -> None:
+        self.max_open = max_open if max_open is not None else _default_max_open()
+        self._maps: OrderedDict[Path, tuple[tuple[int, int], mmap.mmap]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def open_count(self) -> int:
+        return len(self._maps)
+
+    def _get(self, shard_path: Path) -> mmap.mmap | None:
+        try:
+            st = shard_path.stat()
+        except OSError:
+            self._evict(shard_path)
+            return None
+        ident = (st.st_ino, st.st_mtime_ns)
+        cached = self._maps.get(shard_path)
+        if cached is not None and cached[0] == ident:
+            self._maps.move_to_end(shard_path)
+            return cached[1]
+        self._evict(shard_path)
+        if st.st_size == 0:
+            return None
+
+        while len(self._maps) >= self.max_open:
+            _path, (_ident, oldest) = self._maps.popitem(last=False)
+            oldest.close()
+        with shard_path.open("rb") as f:
+            # mmap dups the descriptor, so the map keeps exactly one fd open.
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[shard_path] = (ident, mm)
+        return mm
+
+    def _evict(self, shard_path: Path) -> None:
+        cached = self._maps.pop(shard_path, None)
+        if cached is not None:
+            cached[1].close()
+
+    def search(self, shard_path: Path, prefix: bytes) -> list[bytes]:
+        with self._lock:
+            mm = self._get(shard_path)
+            if mm is None:
+                return []
+            return _search_prefix(mm, prefix)
+
+    def close(self) -> None:
+        with self._lock:
+            for _ident, mm in self._maps.values():
+                mm.close()
+            self._maps.clear()
+
+
+_cache: CdxjMmapCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cdxj_mmap_cache() -> CdxjMmapCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CdxjMmapCache()
+        return _cache
+
+
+def find_shard_for_warc(warc_path: Path) -> Path | None:
+    """
+    Return the current CDXJ shard for ``warc_path``, if one has been written.
+    """
+    try:
+        resolved = warc_path.resolve()
+    except OSError:
+        return None
+    for parent in list(resolved.parents)[:_MAX_SHARD_DIR_DEPTH]:
+        shards_dir = parent / CDXJ_SHARDS_DIRNAME
+        if not shards_dir.is_dir():
+            continue
+        try:
+            shard = cdxj_shard_path(shards_dir, resolved)
+        except OSError:
+            return None
+        return shard if shard.is_file() else None
+    return None
+
+
+def _parse_line(line: bytes) -> CdxjCapture | None:
+    try:
+        _key, timestamp, payload = line.decode("utf-8").split(" ", 2)
+        fields = json.loads(payload)
+        return CdxjCapture(
+            url=str(fields["url"]),
+            timestamp=timestamp,
+            offset=int(fields["offset"]),
+            length=int(fields["length"]),
+            mime=fields.get("mime"),
+            status=fields.get("status"),
+        )
+    except (ValueError, KeyError):
+        return None
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def lookup_capture(
+    warc_path: Path,
+    url: str,
+    timestamp: datetime | None = None,
+    *,
+    cache: CdxjMmapCache | None = None,
+) -> CdxjCapture | None:
+    """
+    Find the capture of ``url`` in ``warc_path`` closest to ``timestamp``.
+
+    Exact URL matches win over SURT-equivalent variants; revisit records are
+    skipped since they carry no payload. Returns None without a shard.
+    """
+    key = surt_key(url)
+    if key is None:
+        return None
+    shard = find_shard_for_warc(warc_path)
+    if shard is None:
+        return None
+
+    lines = (cache or get_cdxj_mmap_cache()).search(shard, f"{key} ".encode("utf-8"))
+    captures = [c for c in map(_parse_line, lines) if c is not None and c.mime != "warc/revisit"]
+    if not captures:
+        return None
+
+    target = _naive_utc(timestamp) if timestamp is not None else None
+
+    def _rank(c: CdxjCapture) -> tuple[int, float]:
+        distance = 0.0
+        if target is not None:
+            try:
+                captured = datetime.strptime(c.timestamp, "%Y%m%d%H%M%S")
+                distance = abs((captured - target).total_seconds())
+            except ValueError:
+                distance = float("inf")
+        return (0 if c.url == url else 1, distance)
+
+    return min(captures, key=_rank)
+
+
+def read_capture(
+    warc_path: Path,
+    url: str,
+    timestamp: datetime | None = None,
+    *,
+    cache: CdxjMmapCache | None = None,
+) -> ArchiveRecord | None:
+    """
+    ``lookup_capture`` + a single seek-and-read of the matching record.
+    """
+    capture = lookup_capture(warc_path, url, timestamp, cache=cache)
+    if capture is None:
+        return None
+    return read_record_at(warc_path, capture.offset)
+
+
+__all__ = [
+    "CdxjCapture",
+    "CdxjMmapCache",
+    "find_shard_for_warc",
+    "get_cdxj_mmap_cache",
+    "lookup_capture",
+    "read_capture",
+]
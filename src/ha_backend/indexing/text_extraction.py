@@ -244,7 +244,15 @@ def extract_content_text(html: str, max_chars: int = 4096) -> str:
     This is used for Postgres FTS vectors (4KB default) while the UI snippet
     remains short (~280 chars).
     """
-    text = extract_text(html)
+    return truncate_content_text(extract_text(html), max_chars=max_chars)
+
+
+def truncate_content_text(text: str, max_chars: int = 4096) -> str:
+    """
+    Normalize whitespace in already extracted text and cap it at max_chars.
+
+    ``extract_content_text(html)`` equals ``truncate_content_text(extract_text(html))``.
+    """
     text = " ".join(text.split())  # Normalize whitespace.
 
     if len(text) <= max_chars:
@@ -405,11 +413,26 @@ def extract_outlink_groups(
     This is used to derive simple authority signals (e.g., inlink counts) without
     introducing a separate crawler or search service.
     """
+    return outlink_groups_from_hrefs(
+        extract_outlink_hrefs(html),
+        base_url=base_url,
+        from_group=from_group,
+        max_links=max_links,
+    )
+
+
+def extract_outlink_hrefs(html: str) -> list[str]:
+    """
+    Return the raw (unresolved) link targets in main content, in document order.
+
+    Depends only on the body, so it can be stored per content hash and
+    resolved against each capture's URL later.
+    """
     soup = BeautifulSoup(html, "html.parser")
     _clean_soup_for_extraction(soup)
 
     root = _find_content_root(soup)
-    groups: set[str] = set()
+    hrefs: list[str] = []
 
     for a in root.find_all("a", href=True):
         if not isinstance(a, Tag):
@@ -424,7 +447,24 @@ def extract_outlink_groups(
         href_lower = href.lower()
         if href_lower.startswith(("mailto:", "tel:", "javascript:", "data:")):
             continue
+        hrefs.append(href)
+
+    return hrefs
+
+
+def outlink_groups_from_hrefs(
+    hrefs: list[str],
+    *,
+    base_url: str,
+    from_group: str | None = None,
+    max_links: int = 200,
+) -> set[str]:
+    """
+    Resolve hrefs from ``extract_outlink_hrefs`` into normalized_url_group strings.
+    """
+    groups: set[str] = set()
 
+    for href in hrefs:
         abs_url = urljoin(base_url, href)
         parts = urlsplit(abs_url)
         if parts.scheme not in ("http", "https") or not parts.netloc:
@@ -451,8 +491,11 @@ __all__ = [
     "extract_title",
     "extract_text",
     "extract_content_text",
+    "truncate_content_text",
     "make_snippet",
     "detect_language",
     "detect_is_archived",
     "extract_outlink_groups",
+    "extract_outlink_hrefs",
+    "outlink_groups_from_hrefs",
 ]
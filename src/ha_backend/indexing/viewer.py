@@ -1,26 +1,39 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import Optional
 
+from ha_backend.indexing.record_lookup import read_capture
 from ha_backend.indexing.warc_reader import ArchiveRecord, iter_html_records
 from ha_backend.models import Snapshot
 
+logger = logging.getLogger("healtharchive.indexing")
+
 
 def find_record_for_snapshot(snapshot: Snapshot) -> Optional[ArchiveRecord]:
     """
     Locate the WARC response record corresponding to a Snapshot.
 
-    For now we primarily rely on the stored warc_record_id. If that is not
-    available, we fall back to the first HTML response in the WARC that matches
+    When the WARC has a CDXJ shard, the record is found by binary search and
+    read with a single seek. Otherwise we scan the WARC, preferring the stored
+    warc_record_id and falling back to the first HTML response that matches
     the snapshot URL.
     """
     warc_path = Path(snapshot.warc_path)
     if not warc_path.is_file():
         return None
 
-    # Prefer exact record ID match when we have one.
     target_id = snapshot.warc_record_id
+    try:
+        indexed = read_capture(warc_path, snapshot.url, snapshot.capture_timestamp)
+    except Exception as exc:
+        logger.warning("CDXJ lookup failed for %s in %s: %s", snapshot.url, warc_path, exc)
+        indexed = None
+    if indexed is not None and (not target_id or indexed.warc_record_id == target_id):
+        return indexed
+
+    # Prefer exact record ID match when we have one.
     if target_id:
         for rec in iter_html_records(warc_path):
             if rec.warc_record_id == target_id:
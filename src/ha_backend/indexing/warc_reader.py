@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from warcio.archiveiterator import ArchiveIterator
 
@@ -47,15 +47,56 @@ def _parse_warc_datetime(warc_date: Optional[str]) -> datetime:
         return datetime.now(timezone.utc)
 
 
-def iter_html_records(warc_path: Path) -> Iterator[ArchiveRecord]:
+def _http_response_fields(record: Any) -> tuple[Optional[int], Optional[str], Dict[str, str]]:
+    """
+    Return (status_code, mime_type, lowercased headers) for a response record.
+    """
+    http_headers = getattr(record, "http_headers", None)
+    status_code: Optional[int] = None
+    mime_type: Optional[str] = None
+    headers: Dict[str, str] = {}
+
+    if http_headers is not None:
+        try:
+            sc = http_headers.get_statuscode()
+            status_code = int(sc) if sc is not None else None
+        except Exception:
+            status_code = None
+
+        for name, value in http_headers.headers:
+            headers[name.lower()] = value
+
+        ct = headers.get("content-type")
+        if ct:
+            mime_type = ct.split(";", 1)[0].strip().lower()
+
+    return status_code, mime_type, headers
+
+
+def iter_html_records(
+    warc_path: Path,
+    *,
+    record_observer: Optional[Callable[[Any, int, int], None]] = None,
+) -> Iterator[ArchiveRecord]:
     """
     Yield ArchiveRecord objects for HTML-like HTTP responses in a WARC file.
+
+    If given, ``record_observer(record, offset, length)`` is called for every
+    record (HTML or not) once its body has been consumed, so callers can build
+    side indexes (e.g. CDXJ) from the same pass.
     """
     warc_path = warc_path.resolve()
     with warc_path.open("rb") as f:
-        for record in ArchiveIterator(f):
+        it = ArchiveIterator(f)
+
+        def _observe(record: Any) -> None:
+            if record_observer is not None:
+                record_observer(record, it.get_record_offset(), it.get_record_length())
+
+        for record in it:
             try:
                 if record.rec_type != "response":
+                    _observe(record)
                     continue
 
                 url = record.rec_headers.get_header("WARC-Target-URI")
@@ -65,31 +106,16 @@ def iter_html_records(warc_path: Path) -> Iterator[ArchiveRecord]:
                 warc_date = record.rec_headers.get_header("WARC-Date")
                 capture_ts = _parse_warc_datetime(warc_date)
 
-                http_headers = getattr(record, "http_headers", None)
-                status_code: Optional[int] = None
-                mime_type: Optional[str] = None
-                headers: Dict[str, str] = {}
-
-                if http_headers is not None:
-                    try:
-                        sc = http_headers.get_statuscode()
-                        status_code = int(sc) if sc is not None else None
-                    except Exception:
-                        status_code = None
-
-                    for name, value in http_headers.headers:
-                        headers[name.lower()] = value
-
-                    ct = headers.get("content-type")
-                    if ct:
-                        mime_type = ct.split(";", 1)[0].strip().lower()
+                status_code, mime_type, headers = _http_response_fields(record)
 
                 # Only keep HTML-like responses. If mime_type is missing but the
                 # URL looks like HTML, we still accept it.
                 if mime_type and "html" not in mime_type:
+                    _observe(record)
                     continue
 
                 body = record.content_stream().read()
+                _observe(record)
                 warc_record_id = record.rec_headers.get_header("WARC-Record-ID")
 
                 yield ArchiveRecord(
@@ -107,4 +133,34 @@ def iter_html_records(warc_path: Path) -> Iterator[ArchiveRecord]:
                 continue
 
 
-__all__ = ["ArchiveRecord", "iter_html_records"]
+def read_record_at(warc_path: Path, offset: int) -> Optional[ArchiveRecord]:
+    """
+    Read the response record starting at byte ``offset`` of a WARC.
+
+    Used with CDXJ offsets to fetch one record without scanning the file.
+    Returns None if the record there is not a response.
+    """
+    warc_path = warc_path.resolve()
+    with warc_path.open("rb") as f:
+        f.seek(offset)
+        for record in ArchiveIterator(f):
+            if record.rec_type != "response":
+                return None
+            url = record.rec_headers.get_header("WARC-Target-URI")
+            if not url:
+                return None
+            status_code, mime_type, headers = _http_response_fields(record)
+            return ArchiveRecord(
+                url=url,
+                capture_timestamp=_parse_warc_datetime(record.rec_headers.get_header("WARC-Date")),
+                status_code=status_code,
+                mime_type=mime_type,
+                headers=headers,
+                body_bytes=record.content_stream().read(),
+                warc_record_id=record.rec_headers.get_header("WARC-Record-ID"),
+                warc_path=warc_path,
+            )
+    return None
+
+
+__all__ = ["ArchiveRecord", "iter_html_records", "read_record_at"]
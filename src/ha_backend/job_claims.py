@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+"""
+ha_backend.job_claims - Multi-worker safe job claiming with leases
+
+The per-job ``fcntl`` lock in ``jobs._job_lock`` only protects a single host.
+To run workers on several hosts (or several process pools), a worker first
+*claims* a job row in the database:
+
+    - Postgres: ``SELECT ... FOR UPDATE SKIP LOCKED`` picks the first unclaimed
+      candidate without blocking on rows other workers are claiming.
+    - SQLite (and other dialects): a conditional ``UPDATE ... WHERE status IN
+      (...) AND <unclaimed>`` compare-and-set; a rowcount of 1 means we won.
+
+A claim records ``claimed_by`` and ``lease_expires_at`` on ``ArchiveJob``.
+While a phase runs, ``LeaseHeartbeat`` renews the lease; if the worker dies the
+lease expires and the job becomes claimable again (or, for crawls left in
+status=running, is picked up by ``ha-backend recover-stale-jobs``).
+
+See also:
+    - ha_backend.worker.main for the claim → run → release lifecycle
+    - docs/architecture.md (worker loop) for operational details
+"""
+
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence, cast
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from .db import get_session
+from .models import ArchiveJob
+
+logger = logging.getLogger("healtharchive.job_claims")
+
+# Lease length for a claimed job. The heartbeat renews it every third of this.
+DEFAULT_LEASE_SECONDS = 300
+
+# Optional stable worker identity (defaults to "<hostname>:<pid>").
+WORKER_ID_ENV = "HEALTHARCHIVE_WORKER_ID"
+
+# How many candidates the compare-and-set path tries before giving up.
+CLAIM_CANDIDATE_BATCH = 5
+
+
+def get_worker_id() -> str:
+    """
+    Return the identity recorded in ``ArchiveJob.claimed_by`` for this process.
+    """
+    raw = os.environ.get(WORKER_ID_ENV, "").strip()
+    if raw:
+        return raw[:255]
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def unclaimed_filter(now_utc: datetime) -> ColumnElement[bool]:
+    """
+    SQL predicate matching jobs with no claim or with an expired lease.
+    """
+    return or_(
+        ArchiveJob.claimed_by.is_(None),
+        ArchiveJob.lease_expires_at.is_(None),
+        ArchiveJob.lease_expires_at <= now_utc,
+    )
+
+
+def expired_lease_filter(now_utc: datetime) -> ColumnElement[bool]:
+    """
+    SQL predicate matching jobs whose owner stopped renewing its lease.
+    """
+    return and_(
+        ArchiveJob.claimed_by.is_not(None),
+        ArchiveJob.lease_expires_at.is_not(None),
+        ArchiveJob.lease_expires_at <= now_utc,
+    )
+
+
+def claim_next_job(
+    session: Session,
+    candidates: Query[ArchiveJob],
+    *,
+    statuses: Sequence[str],
+    worker_id: str,
+    now_utc: datetime,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+) -> Optional[ArchiveJob]:
+    """
+    Atomically claim the first job from ``candidates``.
+
+    ``candidates`` is an ordered ArchiveJob query (already filtered by status);
+    ``statuses`` repeats that status filter for the compare-and-set update.
+    The claim is flushed but not committed; callers own the transaction.
+    """
+    expires_at = now_utc + timedelta(seconds=int(lease_seconds))
+    candidates = candidates.filter(unclaimed_filter(now_utc))
+
+    if session.get_bind().dialect.name == "postgresql":
+        job = candidates.with_for_update(skip_locked=True, of=ArchiveJob).first()
+        if job is None:
+            return None
+        job.claimed_by = worker_id
+        job.claimed_at = now_utc
+        job.lease_expires_at = expires_at
+        session.flush()
+        return job
+
+    candidate_ids = [
+        int(job_id)
+        for (job_id,) in candidates.with_entities(ArchiveJob.id).limit(CLAIM_CANDIDATE_BATCH)
+    ]
+    for job_id in candidate_ids:
+        stmt = (
+            update(ArchiveJob)
+            .where(
+                ArchiveJob.id == job_id,
+                ArchiveJob.status.in_(list(statuses)),
+                unclaimed_filter(now_utc),
+            )
+            .values(claimed_by=worker_id, claimed_at=now_utc, lease_expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(Any, session.execute(stmt))
+        if result.rowcount == 1:
+            return (
+                session.query(ArchiveJob).filter(ArchiveJob.id == job_id).populate_existing().one()
+            )
+    return None
+
+
+def renew_job_lease(
+    job_id: int,
+    *,
+    worker_id: str,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+) -> bool:
+    """
+    Extend the lease on a job we still own.
+
+    Returns:
+        False if the claim was lost (released, or taken over after expiry).
+    """
+    now = datetime.now(timezone.utc)
+    with get_session() as session:
+        stmt = (
+            update(ArchiveJob)
+            .where(ArchiveJob.id == int(job_id), ArchiveJob.claimed_by == worker_id)
+            .values(lease_expires_at=now + timedelta(seconds=int(lease_seconds)))
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(Any, session.execute(stmt))
+        return result.rowcount == 1
+
+
+def release_job_claim(job_id: int, *, worker_id: str) -> bool:
+    """
+    Drop our claim on a job (no-op if another worker owns it now).
+    """
+    with get_session() as session:
+        stmt = (
+            update(ArchiveJob)
+            .where(ArchiveJob.id == int(job_id), ArchiveJob.claimed_by == worker_id)
+            .values(claimed_by=None, claimed_at=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(Any, session.execute(stmt))
+        return result.rowcount == 1
+
+
+def clear_job_claim(job: ArchiveJob) -> None:
+    """
+    Forget a job's claim unconditionally (operator recovery paths).
+    """
+    job.claimed_by = None
+    job.claimed_at = None
+    job.lease_expires_at = None
+
+
+class LeaseHeartbeat:
+    """
+    Background thread that renews a job lease while a phase runs.
+
+    Usage::
+
+        with LeaseHeartbeat(job_id, worker_id=worker_id):
+            run_persistent_job(job_id)
+    """
+
+    def __init__(
+        self,
+        job_id: int,
+        *,
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        interval_seconds: float | None = None,
+    ) -> None:
+        self.job_id = int(job_id)
+        self.worker_id = worker_id
+        self.lease_seconds = int(lease_seconds)
+        self.interval_seconds = (
+            float(interval_seconds)
+            if interval_seconds is not None
+            else max(1.0, self.lease_seconds / 3.0)
+        )
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                renewed = renew_job_lease(
+                    self.job_id, worker_id=self.worker_id, lease_seconds=self.lease_seconds
+                )
+            except Exception as exc:
+                logger.warning("Lease renewal for job %s failed: %s", self.job_id, exc)
+                continue
+            if not renewed and not self.lost:
+                self.lost = True
+                logger.error(
+                    "Lost lease on job %s (worker %s); another worker or recovery may take it over.",
+                    self.job_id,
+                    self.worker_id,
+                )
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        self._thread = threading.Thread(
+            target=self._run, name=f"ha-lease-{self.job_id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds + 5)
+
+
+__all__ = [
+    "DEFAULT_LEASE_SECONDS",
+    "LeaseHeartbeat",
+    "claim_next_job",
+    "clear_job_claim",
+    "expired_lease_filter",
+    "get_worker_id",
+    "release_job_claim",
+    "renew_job_lease",
+    "unclaimed_filter",
+]
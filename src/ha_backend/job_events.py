@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+"""
+ha_backend.job_events - Wake-up channel for job status changes
+
+Lets the worker react to freshly queued work instead of waiting out a fixed
+poll interval:
+
+    - Postgres: ``NOTIFY healtharchive_jobs`` is emitted inside the same
+      transaction that moves a job to queued/retryable/completed, so listeners
+      only hear about committed changes.
+    - SQLite (single-host dev): after commit, a byte is written to a local FIFO
+      (``HEALTHARCHIVE_WORKER_WAKE_FIFO``, default ``<job lock dir>/worker-wake.fifo``).
+
+Events are collected by a session hook installed on the shared sessionmaker
+(``db.get_session_factory``), so every code path that changes ``ArchiveJob.status``
+through the ORM (create-job, schedule-annual, retry-job, crawl completion)
+wakes the worker without extra calls. Polling remains as a safety net.
+
+See also:
+    - ha_backend.worker.main for how wake-ups feed the lane scheduler
+"""
+
+import errno
+import json
+import logging
+import os
+import select
+import stat
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import event, func
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm import Session, sessionmaker
+
+from .models import ArchiveJob
+
+logger = logging.getLogger("healtharchive.job_events")
+
+JOB_EVENTS_CHANNEL = "healtharchive_jobs"
+WAKE_FIFO_ENV = "HEALTHARCHIVE_WORKER_WAKE_FIFO"
+WAKE_FIFO_NAME = "worker-wake.fifo"
+
+# Statuses that mean "there may be new work for a worker lane".
+WAKE_STATUSES = frozenset({"queued", "retryable", "completed"})
+
+_SESSION_INFO_KEY = "healtharchive_job_events"
+_LISTENER_RECONNECT_SECONDS = 5.0
+_LISTENER_TICK_SECONDS = 1.0
+
+_HOOKED_FACTORIES: "weakref.WeakSet[sessionmaker[Session]]" = weakref.WeakSet()
+
+
+def get_wake_fifo_path() -> Path:
+    raw = os.environ.get(WAKE_FIFO_ENV, "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    from .jobs import _get_job_lock_dir
+
+    return _get_job_lock_dir() / WAKE_FIFO_NAME
+
+
+def poke_local_wake(path: Path | None = None) -> bool:
+    """
+    Wake a local worker blocked on the FIFO.
+
+    Returns:
+        True if a byte was written; False if no worker is listening.
+    """
+    fifo = path or get_wake_fifo_path()
+    try:
+        fd = os.open(str(fifo), os.O_WRONLY | os.O_NONBLOCK)
+    except OSError as exc:
+        # ENOENT: no FIFO yet; ENXIO: no reader attached.
+        if exc.errno not in (errno.ENOENT, errno.ENXIO):
+            logger.debug("Could not open worker wake FIFO %s: %s", fifo, exc)
+        return False
+    try:
+        if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+            return False
+        os.write(fd, b"1")
+        return True
+    except BlockingIOError:
+        # The FIFO is already full of pending wake-ups.
+        return True
+    except OSError as exc:
+        logger.debug("Could not write worker wake FIFO %s: %s", fifo, exc)
+        return False
+    finally:
+        os.close(fd)
+
+
+def _added_status(job: ArchiveJob) -> str | None:
+    history = sa_inspect(job).attrs.status.history
+    if not history.added:
+        return None
+    return str(history.added[-1])
+
+
+def _status_wake_events(session: Session) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for obj in session.new:
+        if isinstance(obj, ArchiveJob) and obj.id is not None:
+            new_status = obj.status or "queued"
+            if new_status in WAKE_STATUSES:
+                events.append({"job_id": int(obj.id), "status": new_status})
+    for obj in session.dirty:
+        if isinstance(obj, ArchiveJob) and obj.id is not None:
+            changed_status = _added_status(obj)
+            if changed_status in WAKE_STATUSES:
+                events.append({"job_id": int(obj.id), "status": changed_status})
+    return events
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    events = _status_wake_events(session)
+    if not events:
+        return
+    if session.get_bind().dialect.name == "postgresql":
+        conn = session.connection()
+        for payload in events:
+            conn.execute(
+                sa_select(
+                    func.pg_notify(JOB_EVENTS_CHANNEL, json.dumps(payload, separators=(",", ":")))
+                )
+            )
+        return
+    session.info.setdefault(_SESSION_INFO_KEY, []).extend(events)
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop(_SESSION_INFO_KEY, None):
+        poke_local_wake()
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_SESSION_INFO_KEY, None)
+
+
+def install_job_event_hooks(factory: sessionmaker[Session]) -> None:
+    """
+    Emit job wake-ups for sessions created by ``factory`` (idempotent).
+    """
+    # Tracked here rather than via event.contains(): SQLAlchemy keys its
+    # listener registry by id(), which a garbage-collected factory can hand
+    # down to a new one.
+    if factory in _HOOKED_FACTORIES:
+        return
+    _HOOKED_FACTORIES.add(factory)
+    event.listen(factory, "after_flush", _after_flush)
+    event.listen(factory, "after_commit", _after_commit)
+    event.listen(factory, "after_rollback", _after_rollback)
+
+
+def _drain_pg_notifications(dbapi_conn: Any) -> int:
+    """
+    Consume pending notifications from a psycopg (3) or psycopg2 connection.
+    """
+    notifies = getattr(dbapi_conn, "notifies", None)
+    if callable(notifies):
+        # psycopg 3
+        return sum(1 for _ in notifies(timeout=0))
+    # psycopg2
+    dbapi_conn.poll()
+    count = len(dbapi_conn.notifies)
+    del dbapi_conn.notifies[:]
+    return count
+
+
+class JobEventListener:
+    """
+    Background listener that calls ``on_event`` whenever a job wake-up arrives.
+
+    Uses ``LISTEN healtharchive_jobs`` on Postgres and the local wake FIFO
+    otherwise.
+    """
+
+    def __init__(self, on_event: Callable[[], None]) -> None:
+        self._on_event = on_event
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.channel: str | None = None
+
+    def start(self) -> bool:
+        """
+        Start listening; returns False if no wake channel could be set up.
+        """
+        from .db import get_engine
+
+        engine = get_engine()
+        if engine.dialect.name == "postgresql":
+            self.channel = f"postgres:{JOB_EVENTS_CHANNEL}"
+            target: Callable[[], None] = lambda: self._run_postgres(engine)  # noqa: E731
+        else:
+            fd = self._open_fifo()
+            if fd is None:
+                return False
+            self.channel = f"fifo:{get_wake_fifo_path()}"
+            target = lambda: self._run_fifo(fd)  # noqa: E731
+
+        self._thread = threading.Thread(target=target, name="ha-job-events", daemon=True)
+        self._thread.start()
+        logger.info("Listening for job wake-ups on %s.", self.channel)
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=_LISTENER_TICK_SECONDS + 5)
+
+    def _open_fifo(self) -> int | None:
+        fifo = get_wake_fifo_path()
+        try:
+            fifo.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.mkfifo(str(fifo), 0o666)
+            except FileExistsError:
+                pass
+            try:
+                os.chmod(str(fifo), 0o666)
+            except OSError:
+                pass
+            # O_RDWR keeps a writer attached so select() blocks instead of
+            # reporting EOF between pokes.
+            fd = os.open(str(fifo), os.O_RDWR | os.O_NONBLOCK)
+        except OSError as exc:
+            logger.warning("Could not set up worker wake FIFO %s: %s", fifo, exc)
+            return None
+        if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+            os.close(fd)
+            logger.warning("Worker wake path %s exists but is not a FIFO.", fifo)
+            return None
+        return fd
+
+    def _run_fifo(self, fd: int) -> None:
+        try:
+            while not self._stop.is_set():
+                readable, _, _ = select.select([fd], [], [], _LISTENER_TICK_SECONDS)
+                if not readable:
+                    continue
+                try:
+                    data = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                if data:
+                    self._on_event()
+        finally:
+            os.close(fd)
+
+    def _run_postgres(self, engine: Any) -> None:
+        while not self._stop.is_set():
+            raw = None
+            try:
+                raw = engine.raw_connection()
+                dbapi_conn = raw.driver_connection
+                dbapi_conn.autocommit = True
+                cursor = dbapi_conn.cursor()
+                cursor.execute(f"LISTEN {JOB_EVENTS_CHANNEL}")
+                cursor.close()
+                while not self._stop.is_set():
+                    readable, _, _ = select.select(
+                        [dbapi_conn.fileno()], [], [], _LISTENER_TICK_SECONDS
+                    )
+                    if readable and _drain_pg_notifications(dbapi_conn):
+                        self._on_event()
+            except Exception as exc:
+                logger.warning(
+                    "Job wake-up listener failed (%s); reconnecting in %.0fs.",
+                    exc,
+                    _LISTENER_RECONNECT_SECONDS,
+                )
+                self._stop.wait(_LISTENER_RECONNECT_SECONDS)
+            finally:
+                if raw is not None:
+                    try:
+                        raw.invalidate()
+                    except Exception:
+                        pass
+
+
+__all__ = [
+    "JOB_EVENTS_CHANNEL",
+    "JobEventListener",
+    "WAKE_STATUSES",
+    "get_wake_fifo_path",
+    "install_job_event_hooks",
+    "poke_local_wake",
+]
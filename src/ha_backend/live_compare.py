@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import difflib
 import ipaddress
 import socket
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Optional
+from threading import Lock
+from typing import Callable, Optional
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
 import httpx
 
+from ha_backend.config import (
+    get_compare_live_cache_max_bytes,
+    get_compare_live_cache_max_entries,
+    get_compare_live_cache_ttl_seconds,
+    get_compare_live_max_concurrency,
+)
 from ha_backend.diffing import (
     DIFF_VERSION,
     NORMALIZATION_VERSION,
@@ -201,88 +211,288 @@ def load_snapshot_html(snapshot: Snapshot, *, max_bytes: Optional[int] = None) -
         raise LiveCompareError("Failed to decode archived HTML.") from exc
 
 
-def fetch_live_html(
+def _live_request_headers(user_agent: str) -> dict[str, str]:
+    return {
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "identity",
+        "Cache-Control": "no-cache",
+        "Pragma": "no-cache",
+    }
+
+
+def _redirect_target(response: httpx.Response, current_url: str) -> Optional[str]:
+    if response.status_code not in {301, 302, 303, 307, 308}:
+        return None
+    location = response.headers.get("location")
+    if not location:
+        raise LiveFetchError("Live fetch redirect missing Location header.")
+    return urljoin(current_url, location)
+
+
+def _check_live_response(response: httpx.Response, *, max_bytes: int) -> Optional[str]:
+    """
+    Validate status, content type and advertised length; return the content type.
+    """
+    if response.status_code < 200 or response.status_code >= 300:
+        raise LiveFetchError(f"Live fetch failed with status {response.status_code}.")
+
+    content_type = response.headers.get("content-type")
+    if not is_html_mime_type(content_type):
+        raise LiveFetchNotHtml("Live URL is not HTML.")
+
+    content_length = response.headers.get("content-length")
+    if content_length:
+        try:
+            advertised = int(content_length)
+        except ValueError:
+            advertised = None
+        if advertised is not None and advertised > max_bytes:
+            raise LiveFetchTooLarge("Live HTML is too large to compare safely.")
+    return content_type
+
+
+def _decode_live_body(body: bytes, encoding: Optional[str]) -> str:
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+@dataclass
+class _CachedLiveFetch:
+    result: LiveFetchResult
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class LiveFetchCache:
+    """
+    Small in-process TTL cache of live fetches, keyed by final URL.
+
+    Requested URLs are aliased to the final URL they redirected to. Fresh
+    entries are served without any outbound request; stale entries with an
+    ``ETag``/``Last-Modified`` are revalidated with a conditional GET.
+
+    Least recently used entries are evicted once either ``max_entries`` or
+    ``max_bytes`` (summed body sizes) is exceeded.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int, max_bytes: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, _CachedLiveFetch] = OrderedDict()
+        self._aliases: dict[str, str] = {}
+        self._lock = Lock()
+
+    def lookup(self, requested_url: str) -> Optional[_CachedLiveFetch]:
+        with self._lock:
+            key = self._aliases.get(requested_url, requested_url)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            if not self.is_fresh(entry) and not (entry.etag or entry.last_modified):
+                # Nothing to revalidate with; treat as a miss.
+                return None
+            return entry
+
+    def is_fresh(self, entry: _CachedLiveFetch) -> bool:
+        return time.monotonic() - entry.stored_at < self.ttl_seconds
+
+    def store(
+        self,
+        result: LiveFetchResult,
+        *,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        entry = _CachedLiveFetch(
+            result=result,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=time.monotonic(),
+        )
+        if result.bytes_read > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(result.final_url, None)
+            if previous is not None:
+                self.total_bytes -= previous.result.bytes_read
+            self._entries[result.final_url] = entry
+            self.total_bytes += result.bytes_read
+            self._aliases[result.requested_url] = result.final_url
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                evicted, evicted_entry = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_entry.result.bytes_read
+                for alias in [a for a, target in self._aliases.items() if target == evicted]:
+                    del self._aliases[alias]
+
+    def revalidated(self, entry: _CachedLiveFetch) -> LiveFetchResult:
+        """
+        Mark ``entry`` fresh again after a 304 and return its refreshed result.
+        """
+        with self._lock:
+            entry.stored_at = time.monotonic()
+            entry.result = replace(entry.result, fetched_at=datetime.now(timezone.utc))
+            return entry.result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self.total_bytes = 0
+
+
+_LIVE_FETCH_CACHE: Optional[LiveFetchCache] = None
+_LIVE_FETCH_CACHE_LOCK = Lock()
+
+
+def get_live_fetch_cache() -> Optional[LiveFetchCache]:
+    """
+    Return the process-wide live fetch cache, or None when disabled by config.
+    """
+    global _LIVE_FETCH_CACHE
+    ttl_seconds = get_compare_live_cache_ttl_seconds()
+    max_entries = get_compare_live_cache_max_entries()
+    max_bytes = get_compare_live_cache_max_bytes()
+    if ttl_seconds <= 0 or max_entries <= 0 or max_bytes <= 0:
+        return None
+    with _LIVE_FETCH_CACHE_LOCK:
+        if _LIVE_FETCH_CACHE is None:
+            _LIVE_FETCH_CACHE = LiveFetchCache(
+                ttl_seconds=ttl_seconds, max_entries=max_entries, max_bytes=max_bytes
+            )
+        return _LIVE_FETCH_CACHE
+
+
+def clear_live_fetch_cache() -> None:
+    global _LIVE_FETCH_CACHE
+    with _LIVE_FETCH_CACHE_LOCK:
+        _LIVE_FETCH_CACHE = None
+
+
+_ASYNC_CLIENT: Optional[tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+
+
+def get_live_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient (one connection pool per event loop).
+    """
+    global _ASYNC_CLIENT
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT[0] is not loop or _ASYNC_CLIENT[1].is_closed:
+        max_connections = get_compare_live_max_concurrency() * 2
+        client = httpx.AsyncClient(
+            follow_redirects=False,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        _ASYNC_CLIENT = (loop, client)
+    return _ASYNC_CLIENT[1]
+
+
+async def aclose_live_async_client() -> None:
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is not None:
+        _loop, client = _ASYNC_CLIENT
+        _ASYNC_CLIENT = None
+        await client.aclose()
+
+
+async def fetch_live_html_async(
     url: str,
     *,
     timeout_seconds: float,
     max_redirects: int,
     max_bytes: int,
     user_agent: str,
+    client: Optional[httpx.AsyncClient] = None,
+    cache: Optional[LiveFetchCache] = None,
+    validate_url: Callable[[str], str] = _normalize_url,
 ) -> LiveFetchResult:
-    requested_url = _normalize_url(url)
-    current_url = requested_url
+    """
+    Fetch a live HTML page on a shared connection pool, with optional caching.
 
-    timeout = httpx.Timeout(timeout_seconds)
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml",
-        "Accept-Encoding": "identity",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-    }
+    Redirects are followed manually (each hop is re-validated against private
+    and non-public addresses) and the body is capped at ``max_bytes``.
 
-    with httpx.Client(timeout=timeout, headers=headers, follow_redirects=False) as client:
-        for _ in range(max_redirects + 1):
-            current_url = _normalize_url(current_url)
-            try:
-                with client.stream("GET", current_url) as response:
-                    if response.status_code in {301, 302, 303, 307, 308}:
-                        location = response.headers.get("location")
-                        if not location:
-                            raise LiveFetchError("Live fetch redirect missing Location header.")
-                        current_url = urljoin(current_url, location)
-                        continue
-
-                    if response.status_code < 200 or response.status_code >= 300:
-                        raise LiveFetchError(
-                            f"Live fetch failed with status {response.status_code}."
-                        )
-
-                    content_type = response.headers.get("content-type")
-                    if not is_html_mime_type(content_type):
-                        raise LiveFetchNotHtml("Live URL is not HTML.")
-
-                    content_length = response.headers.get("content-length")
-                    if content_length:
-                        try:
-                            advertised = int(content_length)
-                        except ValueError:
-                            advertised = None
-                        if advertised is not None and advertised > max_bytes:
-                            raise LiveFetchTooLarge("Live HTML is too large to compare safely.")
+    URL validation (which resolves DNS) runs in a worker thread. ``validate_url``
+    exists so tests can point the fetcher at a local stub server.
+    """
+    requested_url = await asyncio.to_thread(validate_url, url)
+    if client is None:
+        client = get_live_async_client()
+
+    cached = cache.lookup(requested_url) if cache is not None else None
+    if cached is not None and cache is not None and cache.is_fresh(cached):
+        return replace(cached.result, requested_url=requested_url)
 
-                    bytes_read = 0
-                    chunks: list[bytes] = []
-                    try:
-                        for chunk in response.iter_bytes():
-                            bytes_read += len(chunk)
-                            if bytes_read > max_bytes:
-                                raise LiveFetchTooLarge("Live HTML is too large to compare safely.")
-                            chunks.append(chunk)
-                    except httpx.HTTPError as exc:
-                        raise LiveFetchError("Live fetch failed while reading HTML.") from exc
-
-                    body = b"".join(chunks)
-                    encoding = response.encoding or "utf-8"
-                    try:
-                        html = body.decode(encoding, errors="replace")
-                    except LookupError:
-                        html = body.decode("utf-8", errors="replace")
-                    fetched_at = datetime.now(timezone.utc)
-
-                    return LiveFetchResult(
-                        requested_url=requested_url,
-                        final_url=current_url,
-                        status_code=response.status_code,
-                        content_type=content_type,
-                        bytes_read=bytes_read,
-                        fetched_at=fetched_at,
-                        html=html,
+    timeout = httpx.Timeout(timeout_seconds)
+    headers = _live_request_headers(user_agent)
+    current_url = requested_url
+    if cached is not None:
+        # Stale: revalidate the final URL directly instead of replaying redirects.
+        current_url = cached.result.final_url
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    for _ in range(max_redirects + 1):
+        current_url = await asyncio.to_thread(validate_url, current_url)
+        try:
+            async with client.stream(
+                "GET", current_url, headers=headers, timeout=timeout
+            ) as response:
+                if response.status_code == 304 and cached is not None and cache is not None:
+                    return replace(cache.revalidated(cached), requested_url=requested_url)
+                headers.pop("If-None-Match", None)
+                headers.pop("If-Modified-Since", None)
+
+                next_url = _redirect_target(response, current_url)
+                if next_url is not None:
+                    current_url = next_url
+                    continue
+
+                content_type = _check_live_response(response, max_bytes=max_bytes)
+
+                bytes_read = 0
+                chunks: list[bytes] = []
+                try:
+                    async for chunk in response.aiter_bytes():
+                        bytes_read += len(chunk)
+                        if bytes_read > max_bytes:
+                            raise LiveFetchTooLarge("Live HTML is too large to compare safely.")
+                        chunks.append(chunk)
+                except httpx.HTTPError as exc:
+                    raise LiveFetchError("Live fetch failed while reading HTML.") from exc
+
+                result = LiveFetchResult(
+                    requested_url=requested_url,
+                    final_url=current_url,
+                    status_code=response.status_code,
+                    content_type=content_type,
+                    bytes_read=bytes_read,
+                    fetched_at=datetime.now(timezone.utc),
+                    html=_decode_live_body(b"".join(chunks), response.encoding),
+                )
+                if cache is not None:
+                    cache.store(
+                        result,
+                        etag=response.headers.get("etag"),
+                        last_modified=response.headers.get("last-modified"),
                     )
-            except httpx.TimeoutException as exc:
-                raise LiveFetchError("Live fetch timed out.") from exc
-            except httpx.RequestError as exc:
-                raise LiveFetchError("Live fetch failed.") from exc
+                return result
+        except httpx.TimeoutException as exc:
+            raise LiveFetchError("Live fetch timed out.") from exc
+        except httpx.RequestError as exc:
+            raise LiveFetchError("Live fetch failed.") from exc
 
     raise LiveFetchError("Live fetch exceeded redirect limit.")
 
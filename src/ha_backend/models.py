@@ -30,6 +30,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -42,6 +43,18 @@ from sqlalchemy.sql import func
 
 from .db import Base
 
+# Content types treated as HTML captures (prefix match, like the former
+# ``mime_type ILIKE 'text/html%'`` filters).
+HTML_MIME_PREFIXES = ("text/html", "application/xhtml+xml")
+
+
+def mime_type_is_html(mime_type: Optional[str]) -> bool:
+    return bool(mime_type) and str(mime_type).strip().lower().startswith(HTML_MIME_PREFIXES)
+
+
+def _default_is_html(context: Any) -> bool:
+    return mime_type_is_html(context.get_current_parameters().get("mime_type"))
+
 
 class TimestampMixin:
     """
@@ -202,6 +215,16 @@ class ArchiveJob(TimestampMixin, Base):
     combined_log_path: Mapped[Optional[str]] = mapped_column(String(1000))
     state_file_path: Mapped[Optional[str]] = mapped_column(String(1000))
 
+    # Multi-worker claim + lease (see ha_backend.job_claims).
+    # - claimed_by: worker identity currently owning a crawl/index phase
+    # - lease_expires_at: claim is considered abandoned after this time
+    claimed_by: Mapped[Optional[str]] = mapped_column(String(255))
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        index=True,
+    )
+
     source: Mapped[Optional[Source]] = relationship(back_populates="jobs")
     snapshots: Mapped[List["Snapshot"]] = relationship(back_populates="job")
 
@@ -238,6 +261,14 @@ class Snapshot(TimestampMixin, Base):
     )
 
     mime_type: Mapped[Optional[str]] = mapped_column(String(255))
+    # Derived from mime_type on insert so HTML-only lookups can use equality
+    # instead of ILIKE patterns.
+    is_html: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=_default_is_html,
+        server_default=text("0"),
+    )
     status_code: Mapped[Optional[int]] = mapped_column(Integer)
 
     title: Mapped[Optional[str]] = mapped_column(Text)
@@ -250,6 +281,10 @@ class Snapshot(TimestampMixin, Base):
             Text().with_variant(postgresql.TSVECTOR(), "postgresql"),
         )
     )
+    # Rules search_vector was built with (ha_backend.search.SEARCH_VECTOR_VERSION).
+    # - NULL = no vector
+    # - 1 = legacy 'simple' vector, matched with 'simple' queries until backfilled
+    search_vector_version: Mapped[Optional[int]] = mapped_column(Integer)
 
     warc_path: Mapped[str] = mapped_column(Text, nullable=False)
     warc_record_id: Mapped[Optional[str]] = mapped_column(String(255))
@@ -276,6 +311,20 @@ class Snapshot(TimestampMixin, Base):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Page-group timelines: ordered captures per group. Only small columns
+        # are INCLUDEd on Postgres; title/url are unbounded and could exceed the
+        # btree tuple size limit (INCLUDE columns are ignored elsewhere).
+        Index(
+            "ix_snapshots_timeline",
+            "source_id",
+            "normalized_url_group",
+            "capture_timestamp",
+            "id",
+            postgresql_include=["status_code", "job_id"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Snapshot id={self.id!r} url={self.url!r}>"
 
@@ -516,6 +565,15 @@ class Page(TimestampMixin, Base):
         ForeignKey("snapshots.id", ondelete="SET NULL"),
         nullable=True,
     )
+    # - latest_html_snapshot_id: latest HTML capture (Snapshot.is_html), with
+    #   its capture time so incremental merges can compare without a join.
+    latest_html_snapshot_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("snapshots.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    latest_html_capture_timestamp: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
 
     source: Mapped[Source] = relationship()
 
@@ -594,7 +652,33 @@ class PageSignal(Base):
     )
 
 
+class SearchVocabularyTerm(Base):
+    """
+    Distinct lowercased title terms with their document frequency.
+
+    Derived from Snapshot titles (see ``ha_backend.search_vocabulary``) and used
+    to correct misspelled search tokens via a trigram index on ``term``.
+    """
+
+    __tablename__ = "search_vocabulary"
+
+    term: Mapped[str] = mapped_column(Text, primary_key=True)
+    doc_freq: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
 __all__ = [
+    "HTML_MIME_PREFIXES",
+    "mime_type_is_html",
     "Source",
     "ArchiveJob",
     "Snapshot",
@@ -604,4 +688,5 @@ __all__ = [
     "Page",
     "SnapshotOutlink",
     "PageSignal",
+    "SearchVocabularyTerm",
 ]
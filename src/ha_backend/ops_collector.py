@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+"""
+Long-running host for the VPS ops collectors (``ha-backend ops-collector``).
+
+The ``scripts/vps-*.py`` collectors are one-shot programs: each systemd timer
+starts a fresh interpreter, re-imports SQLAlchemy/ha_backend, opens a new DB
+connection and re-runs the same ``systemctl``/``ps``/``findmnt`` probes as its
+neighbours. The daemon loads each script once and calls its
+``main(argv, runner=...)`` on a schedule, so collectors share the process-wide
+DB pool, and read-only subprocess probes are run at most once per tick (see
+``TickRunner``). Scripts opt in with ``hosted_main`` and issue commands through
+``hosted_subprocess_run``.
+
+The scripts remain the canonical implementation and keep working unchanged
+for one-shot runs; each collector's argv and enable flag are read from its
+unit in ``docs/deployment/systemd/`` (see ``collector_from_unit``). Per-collector duration/exit metrics go to their own
+textfile (``healtharchive_ops_collector.prom``), written atomically like the
+collectors' own outputs.
+"""
+
+import functools
+import importlib.util
+import logging
+import os
+import shlex
+import subprocess
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Sequence
+
+from .config import REPO_ROOT
+
+logger = logging.getLogger("healtharchive.ops_collector")
+
+DEFAULT_TEXTFILE_OUT_DIR = Path("/var/lib/node_exporter/textfile_collector")
+DEFAULT_METRICS_FILE = "healtharchive_ops_collector.prom"
+DEFAULT_TICK_SECONDS = 5.0
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+SYSTEMD_UNITS_DIR = REPO_ROOT / "docs" / "deployment" / "systemd"
+
+# Read-only probes that are safe to share within one tick. ``mount`` is only
+# read-only without arguments.
+_CACHEABLE_COMMANDS = {"findmnt", "mountpoint", "ps"}
+_CACHEABLE_SYSTEMCTL_VERBS = {"cat", "is-active", "is-enabled", "is-failed", "show", "status"}
+# Keyword arguments that change what a probe returns (``check``/``timeout`` do not).
+_OUTPUT_KWARGS = ("capture_output", "text", "universal_newlines", "encoding", "stdout", "stderr")
+
+# Runner of the hosted ``main()`` call in progress (None outside the daemon).
+_HOSTED_RUNNER: ContextVar[Callable[..., Any] | None] = ContextVar(
+    "ops_collector_runner", default=None
+)
+
+
+def hosted_subprocess_run(*args: Any, **kwargs: Any) -> Any:
+    """
+    ``subprocess.run`` for collector scripts: the daemon's tick runner while
+    hosted, plain ``subprocess.run`` for one-shot runs.
+    """
+    return (_HOSTED_RUNNER.get() or subprocess.run)(*args, **kwargs)
+
+
+def hosted_main(func: Callable[[list[str] | None], int]) -> Callable[..., int]:
+    """
+    Decorate a collector script's ``main(argv)`` so the daemon can call
+    ``main(argv, runner=...)``; the runner applies to that call only.
+    """
+
+    @functools.wraps(func)
+    def main(argv: list[str] | None = None, *, runner: Callable[..., Any] | None = None) -> int:
+        token = _HOSTED_RUNNER.set(runner)
+        try:
+            return func(argv)
+        finally:
+            _HOSTED_RUNNER.reset(token)
+
+    return main
+
+
+@dataclass(frozen=True)
+class CollectorSpec:
+    """
+    One scheduled collector: ``scripts/<script>`` called with ``argv`` every
+    ``interval_seconds``. When ``enabled_flag`` is set, the collector only runs
+    while that file exists (mirrors the units' ``ConditionPathExists=``).
+    """
+
+    name: str
+    script: str
+    interval_seconds: float
+    argv: tuple[str, ...] = ()
+    enabled_flag: Path | None = None
+
+
+# Unit name (``healtharchive-<name>.service``) and timer interval of the
+# minutely/5-minutely collectors. Daily jobs (coverage guardrails, replay smoke)
+# stay on their timers.
+_HOSTED_UNITS: tuple[tuple[str, float], ...] = (
+    ("crawl-metrics", 60),
+    ("tiering-metrics", 60),
+    ("storage-hotpath-auto-recover", 60),
+    ("crawl-auto-recover", 300),
+)
+
+
+def collector_from_unit(
+    name: str, interval_seconds: float, *, units_dir: Path = SYSTEMD_UNITS_DIR
+) -> CollectorSpec:
+    """
+    Build the spec for ``healtharchive-<name>.service`` from its ``ExecStart=``
+    (script and argv) and its ``ConditionPathExists=/...-enabled`` flag, so the
+    daemon and the one-shot units cannot drift apart.
+    """
+    path = units_dir / f"healtharchive-{name}.service"
+    exec_start: str | None = None
+    enabled_flag: Path | None = None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        key, _, value = line.partition("=")
+        value = value.strip()
+        if key.strip() == "ExecStart":
+            exec_start = value
+        elif key.strip() == "ConditionPathExists" and value.endswith("-enabled"):
+            enabled_flag = Path(value)
+    words = shlex.split(exec_start or "")
+    script_index = next((i for i, word in enumerate(words) if word.endswith(".py")), None)
+    if script_index is None:
+        raise ValueError(f"{path} has no ExecStart= running a scripts/*.py collector")
+    return CollectorSpec(
+        name,
+        os.path.basename(words[script_index]),
+        interval_seconds,
+        tuple(words[script_index + 1 :]),
+        enabled_flag,
+    )
+
+
+def default_collectors() -> list[CollectorSpec]:
+    """
+    Return the hosted collectors, as configured by their systemd units.
+    """
+    return [collector_from_unit(name, interval) for name, interval in _HOSTED_UNITS]
+
+
+def _is_cacheable(cmd: Sequence[str]) -> bool:
+    if not cmd:
+        return False
+    prog = os.path.basename(str(cmd[0]))
+    if prog in _CACHEABLE_COMMANDS:
+        return True
+    if prog == "mount":
+        return len(cmd) == 1
+    if prog == "systemctl":
+        verbs = [str(arg) for arg in cmd[1:] if not str(arg).startswith("-")]
+        return bool(verbs) and verbs[0] in _CACHEABLE_SYSTEMCTL_VERBS
+    return False
+
+
+class TickRunner:
+    """
+    ``subprocess.run`` replacement passed to hosted collectors' ``main()``.
+
+    Results of read-only probes (process table, mount table, unit
+    state) are memoized for the lifetime of the tick. Any other command runs
+    normally and drops the memo, since it may have changed what the probes
+    would report (e.g. an auto-recover restart).
+    """
+
+    def __init__(self, runner: Callable[..., Any] = subprocess.run) -> None:
+        self._runner = runner
+        self._cache: dict[tuple[Any, ...], subprocess.CompletedProcess[Any]] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hits = 0
+
+    def __call__(self, args: Any, *posargs: Any, **kwargs: Any) -> Any:
+        if posargs or isinstance(args, (str, bytes)) or not _is_cacheable(args):
+            with self._lock:
+                self._cache.clear()
+            return self._runner(args, *posargs, **kwargs)
+
+        key = (tuple(str(a) for a in args),) + tuple(
+            (k, kwargs[k]) for k in _OUTPUT_KWARGS if k in kwargs
+        )
+        with self._lock:
+            self.calls += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.hits += 1
+        if cached is None:
+            cached = self._runner(args, **{**kwargs, "check": False})
+            with self._lock:
+                self._cache[key] = cached
+        if kwargs.get("check"):
+            cached.check_returncode()
+        return cached
+
+
+@dataclass
+class CollectorState:
+    spec: CollectorSpec
+    module: ModuleType | None = None
+    next_due: float = 0.0
+    runs: int = 0
+    failures: int = 0
+    enabled: bool = True
+    last_exit_code: int | None = None
+    last_duration_seconds: float | None = None
+    last_run_timestamp: float | None = None
+    last_success_timestamp: float | None = None
+
+
+@dataclass
+class OpsCollector:
+    """
+    Scheduler for hosted collectors. ``run_due()`` runs everything that is due
+    (sequentially, sharing one ``TickRunner``) and rewrites the metrics file.
+    """
+
+    specs: Sequence[CollectorSpec] = field(default_factory=default_collectors)
+    out_dir: Path = DEFAULT_TEXTFILE_OUT_DIR
+    metrics_file: str = DEFAULT_METRICS_FILE
+    scripts_dir: Path = SCRIPTS_DIR
+    runner: Callable[..., Any] = subprocess.run
+    clock: Callable[[], float] = time.time
+    states: list[CollectorState] = field(init=False)
+    subprocess_calls: int = field(default=0, init=False)
+    subprocess_cache_hits: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.states = [CollectorState(spec) for spec in self.specs]
+
+    def _load(self, state: CollectorState) -> ModuleType:
+        if state.module is None:
+            path = self.scripts_dir / state.spec.script
+            module_name = "ha_ops_collector_" + state.spec.name.replace("-", "_")
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load collector script {path}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            state.module = module
+        return state.module
+
+    def _run_one(self, state: CollectorState, tick: TickRunner) -> None:
+        spec = state.spec
+        started = time.monotonic()
+        state.last_run_timestamp = self.clock()
+        try:
+            module = self._load(state)
+            rc = int(module.main(list(spec.argv), runner=tick) or 0)
+        except SystemExit as exc:
+            rc = exc.code if isinstance(exc.code, int) else 1
+        except Exception:
+            logger.exception("Collector %s failed.", spec.name)
+            rc = 1
+        state.last_duration_seconds = time.monotonic() - started
+        state.last_exit_code = rc
+        state.runs += 1
+        if rc == 0:
+            state.last_success_timestamp = self.clock()
+        else:
+            state.failures += 1
+            logger.warning("Collector %s exited with %s.", spec.name, rc)
+
+    def run_due(self, now: float | None = None) -> list[str]:
+        """
+        Run every collector whose interval has elapsed; return their names.
+        """
+        now = self.clock() if now is None else now
+        tick = TickRunner(self.runner)
+        ran: list[str] = []
+        for state in self.states:
+            if now < state.next_due:
+                continue
+            state.next_due = now + state.spec.interval_seconds
+            flag = state.spec.enabled_flag
+            state.enabled = flag is None or flag.exists()
+            if not state.enabled:
+                continue
+            self._run_one(state, tick)
+            ran.append(state.spec.name)
+        self.subprocess_calls += tick.calls
+        self.subprocess_cache_hits += tick.hits
+        if ran:
+            self.write_metrics()
+        return ran
+
+    def seconds_until_due(self, now: float | None = None) -> float:
+        now = self.clock() if now is None else now
+        return max(0.0, min((s.next_due for s in self.states), default=now) - now)
+
+    def render_metrics(self) -> str:
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str, attr: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for state in self.states:
+                value = getattr(state, attr)
+                if value is None:
+                    continue
+                if isinstance(value, bool):
+                    value = int(value)
+                lines.append(f'{name}{{collector="{state.spec.name}"}} {value:g}')
+
+        prefix = "healtharchive_ops_collector"
+        family(
+            f"{prefix}_enabled",
+            "gauge",
+            "1 when the collector's enable flag exists (or it has none).",
+            "enabled",
+        )
+        family(
+            f"{prefix}_run_duration_seconds",
+            "gauge",
+            "Wall time of the collector's most recent run.",
+            "last_duration_seconds",
+        )
+        family(
+            f"{prefix}_last_exit_code",
+            "gauge",
+            "Exit code of the collector's most recent run.",
+            "last_exit_code",
+        )
+        family(
+            f"{prefix}_last_run_timestamp_seconds",
+            "gauge",
+            "UNIX timestamp of the collector's most recent run.",
+            "last_run_timestamp",
+        )
+        family(
+            f"{prefix}_last_success_timestamp_seconds",
+            "gauge",
+            "UNIX timestamp of the collector's most recent successful run.",
+            "last_success_timestamp",
+        )
+        family(f"{prefix}_runs_total", "counter", "Collector runs since start.", "runs")
+        family(
+            f"{prefix}_failures_total",
+            "counter",
+            "Collector runs that failed since start.",
+            "failures",
+        )
+        lines.append(
+            f"# HELP {prefix}_subprocess_probes_total Read-only subprocess probes requested by collectors."
+        )
+        lines.append(f"# TYPE {prefix}_subprocess_probes_total counter")
+        lines.append(f"{prefix}_subprocess_probes_total {self.subprocess_calls}")
+        lines.append(
+            f"# HELP {prefix}_subprocess_probe_cache_hits_total Probes answered from the per-tick cache."
+        )
+        lines.append(f"# TYPE {prefix}_subprocess_probe_cache_hits_total counter")
+        lines.append(f"{prefix}_subprocess_probe_cache_hits_total {self.subprocess_cache_hits}")
+        lines.append(
+            f"# HELP {prefix}_metrics_timestamp_seconds UNIX timestamp when these metrics were generated."
+        )
+        lines.append(f"# TYPE {prefix}_metrics_timestamp_seconds gauge")
+        lines.append(f"{prefix}_metrics_timestamp_seconds {int(self.clock())}")
+        return "\n".join(lines) + "\n"
+
+    def write_metrics(self) -> Path:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        out_file = self.out_dir / self.metrics_file
+        tmp = out_file.with_suffix(out_file.suffix + f".{os.getpid()}.tmp")
+        tmp.write_text(self.render_metrics(), encoding="utf-8")
+        tmp.chmod(0o644)
+        tmp.replace(out_file)
+        return out_file
+
+
+def select_collectors(names: Sequence[str] | None) -> list[CollectorSpec]:
+    """
+    Return the default collectors, optionally restricted to ``names``.
+    """
+    specs = default_collectors()
+    if not names:
+        return specs
+    by_name = {spec.name: spec for spec in specs}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(
+            f"Unknown collector(s): {', '.join(unknown)} (known: {', '.join(sorted(by_name))})"
+        )
+    return [by_name[name] for name in names]
+
+
+def run_ops_collector(
+    collector: OpsCollector,
+    *,
+    run_once: bool = False,
+    stop: threading.Event | None = None,
+    tick_seconds: float = DEFAULT_TICK_SECONDS,
+) -> None:
+    """
+    Run ``collector`` until ``stop`` is set (or one pass with ``run_once``).
+    """
+    stop = stop or threading.Event()
+    logger.info(
+        "Ops collector starting (%s).",
+        ", ".join(f"{s.spec.name}/{s.spec.interval_seconds:g}s" for s in collector.states),
+    )
+    while not stop.is_set():
+        collector.run_due()
+        if run_once:
+            break
+        stop.wait(min(tick_seconds, max(0.5, collector.seconds_until_due())))
+    logger.info("Ops collector stopped.")
+
+
+__all__ = [
+    "CollectorSpec",
+    "OpsCollector",
+    "TickRunner",
+    "collector_from_unit",
+    "default_collectors",
+    "hosted_main",
+    "hosted_subprocess_run",
+    "run_ops_collector",
+    "select_collectors",
+]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Iterable, Sequence, cast
 
-from sqlalchemy import and_, case, func, or_
+from sqlalchemy import and_, case, func, literal_column, or_, select
 from sqlalchemy.orm import Session
 
 from ha_backend.models import Page, Snapshot
@@ -61,6 +61,120 @@ def _dialect_insert(session: Session):
     return generic_insert
 
 
+def _latest_per_group_subquery(
+    session: Session,
+    filters: list[Any],
+    group_key: Any,
+    name: str,
+):
+    """
+    Newest Snapshot (capture_timestamp, then id) per group among ``filters``.
+
+    Columns: source_id, group_key, ``<name>_snapshot_id``,
+    ``<name>_capture_timestamp``.
+    """
+    rn = (
+        func.row_number()
+        .over(
+            partition_by=(Snapshot.source_id, group_key),
+            order_by=(Snapshot.capture_timestamp.desc(), Snapshot.id.desc()),
+        )
+        .label("rn")
+    )
+    ranked = (
+        session.query(
+            Snapshot.source_id.label("source_id"),
+            group_key.label("group_key"),
+            Snapshot.id.label("snapshot_id"),
+            Snapshot.capture_timestamp.label("capture_timestamp"),
+            rn,
+        )
+        .filter(*filters)
+        .subquery()
+    )
+    return (
+        session.query(
+            ranked.c.source_id.label("source_id"),
+            ranked.c.group_key.label("group_key"),
+            ranked.c.snapshot_id.label(f"{name}_snapshot_id"),
+            ranked.c.capture_timestamp.label(f"{name}_capture_timestamp"),
+        )
+        .filter(ranked.c.rn == 1)
+        .subquery()
+    )
+
+
+def _page_aggregate_select(session: Session, filters: list[Any], group_key: Any):
+    """
+    Per-group Page columns aggregated over the Snapshot rows matching ``filters``.
+
+    Returns ``(select_query, agg_subquery)``.
+    """
+    ok_filter = or_(
+        Snapshot.status_code.is_(None),
+        and_(Snapshot.status_code >= 200, Snapshot.status_code < 300),
+    )
+
+    agg_subq = (
+        session.query(
+            Snapshot.source_id.label("source_id"),
+            group_key.label("group_key"),
+            func.min(Snapshot.capture_timestamp).label("first_capture_timestamp"),
+            func.max(Snapshot.capture_timestamp).label("last_capture_timestamp"),
+            func.count(Snapshot.id).label("snapshot_count"),
+        )
+        .filter(*filters)
+        .group_by(Snapshot.source_id, group_key)
+        .subquery()
+    )
+
+    latest_one_subq = _latest_per_group_subquery(session, filters, group_key, "latest")
+    latest_ok_one_subq = _latest_per_group_subquery(
+        session, [*filters, ok_filter], group_key, "latest_ok"
+    )
+    latest_html_one_subq = _latest_per_group_subquery(
+        session, [*filters, Snapshot.is_html.is_(True)], group_key, "latest_html"
+    )
+
+    def _same_group(subq: Any) -> Any:
+        return and_(
+            subq.c.source_id == agg_subq.c.source_id,
+            subq.c.group_key == agg_subq.c.group_key,
+        )
+
+    select_stmt = (
+        session.query(
+            agg_subq.c.source_id.label("source_id"),
+            agg_subq.c.group_key.label("normalized_url_group"),
+            agg_subq.c.first_capture_timestamp,
+            agg_subq.c.last_capture_timestamp,
+            agg_subq.c.snapshot_count,
+            latest_one_subq.c.latest_snapshot_id,
+            latest_ok_one_subq.c.latest_ok_snapshot_id,
+            latest_html_one_subq.c.latest_html_snapshot_id,
+            latest_html_one_subq.c.latest_html_capture_timestamp,
+        )
+        .join(latest_one_subq, _same_group(latest_one_subq))
+        .outerjoin(latest_ok_one_subq, _same_group(latest_ok_one_subq))
+        .outerjoin(latest_html_one_subq, _same_group(latest_html_one_subq))
+    )
+
+    return select_stmt, agg_subq
+
+
+_PAGE_INSERT_COLS = [
+    "source_id",
+    "normalized_url_group",
+    "first_capture_timestamp",
+    "last_capture_timestamp",
+    "snapshot_count",
+    "latest_snapshot_id",
+    "latest_ok_snapshot_id",
+    "latest_html_snapshot_id",
+    "latest_html_capture_timestamp",
+]
+
+
 def rebuild_pages(
     session: Session,
     *,
@@ -120,119 +234,10 @@ def rebuild_pages(
     if groups_list is not None:
         filters.append(group_key.in_(groups_list))
 
-    ok_filter = or_(
-        Snapshot.status_code.is_(None),
-        and_(Snapshot.status_code >= 200, Snapshot.status_code < 300),
-    )
-
-    agg_subq = (
-        session.query(
-            Snapshot.source_id.label("source_id"),
-            group_key.label("group_key"),
-            func.min(Snapshot.capture_timestamp).label("first_capture_timestamp"),
-            func.max(Snapshot.capture_timestamp).label("last_capture_timestamp"),
-            func.count(Snapshot.id).label("snapshot_count"),
-        )
-        .filter(*filters)
-        .group_by(Snapshot.source_id, group_key)
-        .subquery()
-    )
-
-    latest_rn = (
-        func.row_number()
-        .over(
-            partition_by=(Snapshot.source_id, group_key),
-            order_by=(Snapshot.capture_timestamp.desc(), Snapshot.id.desc()),
-        )
-        .label("rn")
-    )
-    latest_subq = (
-        session.query(
-            Snapshot.source_id.label("source_id"),
-            group_key.label("group_key"),
-            Snapshot.id.label("snapshot_id"),
-            latest_rn,
-        )
-        .filter(*filters)
-        .subquery()
-    )
-    latest_one_subq = (
-        session.query(
-            latest_subq.c.source_id.label("source_id"),
-            latest_subq.c.group_key.label("group_key"),
-            latest_subq.c.snapshot_id.label("latest_snapshot_id"),
-        )
-        .filter(latest_subq.c.rn == 1)
-        .subquery()
-    )
-
-    latest_ok_rn = (
-        func.row_number()
-        .over(
-            partition_by=(Snapshot.source_id, group_key),
-            order_by=(Snapshot.capture_timestamp.desc(), Snapshot.id.desc()),
-        )
-        .label("rn")
-    )
-    latest_ok_subq = (
-        session.query(
-            Snapshot.source_id.label("source_id"),
-            group_key.label("group_key"),
-            Snapshot.id.label("snapshot_id"),
-            latest_ok_rn,
-        )
-        .filter(*filters)
-        .filter(ok_filter)
-        .subquery()
-    )
-    latest_ok_one_subq = (
-        session.query(
-            latest_ok_subq.c.source_id.label("source_id"),
-            latest_ok_subq.c.group_key.label("group_key"),
-            latest_ok_subq.c.snapshot_id.label("latest_ok_snapshot_id"),
-        )
-        .filter(latest_ok_subq.c.rn == 1)
-        .subquery()
-    )
-
-    select_stmt = (
-        session.query(
-            agg_subq.c.source_id.label("source_id"),
-            agg_subq.c.group_key.label("normalized_url_group"),
-            agg_subq.c.first_capture_timestamp,
-            agg_subq.c.last_capture_timestamp,
-            agg_subq.c.snapshot_count,
-            latest_one_subq.c.latest_snapshot_id,
-            latest_ok_one_subq.c.latest_ok_snapshot_id,
-        )
-        .join(
-            latest_one_subq,
-            and_(
-                latest_one_subq.c.source_id == agg_subq.c.source_id,
-                latest_one_subq.c.group_key == agg_subq.c.group_key,
-            ),
-        )
-        .outerjoin(
-            latest_ok_one_subq,
-            and_(
-                latest_ok_one_subq.c.source_id == agg_subq.c.source_id,
-                latest_ok_one_subq.c.group_key == agg_subq.c.group_key,
-            ),
-        )
-    )
-
-    insert_cols = [
-        "source_id",
-        "normalized_url_group",
-        "first_capture_timestamp",
-        "last_capture_timestamp",
-        "snapshot_count",
-        "latest_snapshot_id",
-        "latest_ok_snapshot_id",
-    ]
+    select_stmt, agg_subq = _page_aggregate_select(session, filters, group_key)
 
     dialect_insert = _dialect_insert(session)
-    insert_stmt = dialect_insert(Page.__table__).from_select(insert_cols, select_stmt)
+    insert_stmt = dialect_insert(Page.__table__).from_select(_PAGE_INSERT_COLS, select_stmt)
 
     # ON CONFLICT works for Postgres and SQLite. For other dialects (unsupported
     # in prod), we fall back to best-effort inserts.
@@ -246,6 +251,10 @@ def rebuild_pages(
                 "snapshot_count": insert_stmt.excluded.snapshot_count,
                 "latest_snapshot_id": insert_stmt.excluded.latest_snapshot_id,
                 "latest_ok_snapshot_id": insert_stmt.excluded.latest_ok_snapshot_id,
+                "latest_html_snapshot_id": insert_stmt.excluded.latest_html_snapshot_id,
+                "latest_html_capture_timestamp": (
+                    insert_stmt.excluded.latest_html_capture_timestamp
+                ),
                 "updated_at": func.now(),
             },
         )
@@ -275,6 +284,129 @@ def rebuild_pages(
     )
 
 
+def merge_job_pages(
+    session: Session,
+    *,
+    job_id: int,
+    source_id: int | None = None,
+) -> PagesRebuildResult:
+    """
+    Fold one job's snapshots into existing Page rows with a single upsert.
+
+    Aggregates are computed only from the job's snapshots and combined with
+    the stored row (min/max timestamps, summed count, newer latest pointers),
+    so the cost scales with the job rather than with every capture of the
+    touched groups. This is only correct for snapshots not yet counted in
+    ``pages``; groups that lost snapshots (deletes, re-index) still need
+    ``rebuild_pages``.
+    """
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name not in {"postgresql", "sqlite"}:
+        groups = discover_job_page_groups(session, job_id=job_id)
+        return rebuild_pages(session, source_id=source_id, groups=groups)
+
+    group_key = build_snapshot_page_group_key(dialect_name=dialect_name)
+    filters: list[Any] = [Snapshot.source_id.isnot(None), Snapshot.job_id == job_id]
+    if source_id is not None:
+        filters.append(Snapshot.source_id == source_id)
+    select_stmt, _ = _page_aggregate_select(session, filters, group_key)
+
+    insert_stmt = _dialect_insert(session)(Page.__table__).from_select(
+        _PAGE_INSERT_COLS, select_stmt
+    )
+    new = insert_stmt.excluded
+    pages = Page.__table__.c
+
+    def _capture_ts(snapshot_id_ref: str) -> Any:
+        # Textual reference: the compiler would otherwise add ``pages`` /
+        # ``excluded`` to the subquery's FROM instead of correlating.
+        return (
+            select(Snapshot.capture_timestamp)
+            .where(Snapshot.id == literal_column(snapshot_id_ref))
+            .scalar_subquery()
+        )
+
+    # Same ordering as rebuild_pages: newest capture_timestamp, then highest id.
+    new_is_latest = or_(
+        pages.latest_snapshot_id.is_(None),
+        pages.last_capture_timestamp.is_(None),
+        new.last_capture_timestamp > pages.last_capture_timestamp,
+        and_(
+            new.last_capture_timestamp == pages.last_capture_timestamp,
+            new.latest_snapshot_id > pages.latest_snapshot_id,
+        ),
+    )
+    stored_ok_ts = _capture_ts("pages.latest_ok_snapshot_id")
+    new_ok_ts = _capture_ts("excluded.latest_ok_snapshot_id")
+    new_is_latest_ok = and_(
+        new.latest_ok_snapshot_id.isnot(None),
+        or_(
+            pages.latest_ok_snapshot_id.is_(None),
+            new_ok_ts > stored_ok_ts,
+            and_(
+                new_ok_ts == stored_ok_ts,
+                new.latest_ok_snapshot_id > pages.latest_ok_snapshot_id,
+            ),
+        ),
+    )
+
+    new_is_latest_html = and_(
+        new.latest_html_snapshot_id.isnot(None),
+        or_(
+            pages.latest_html_snapshot_id.is_(None),
+            pages.latest_html_capture_timestamp.is_(None),
+            new.latest_html_capture_timestamp > pages.latest_html_capture_timestamp,
+            and_(
+                new.latest_html_capture_timestamp == pages.latest_html_capture_timestamp,
+                new.latest_html_snapshot_id > pages.latest_html_snapshot_id,
+            ),
+        ),
+    )
+
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=["source_id", "normalized_url_group"],
+        set_={
+            "first_capture_timestamp": case(
+                (
+                    or_(
+                        pages.first_capture_timestamp.is_(None),
+                        new.first_capture_timestamp < pages.first_capture_timestamp,
+                    ),
+                    new.first_capture_timestamp,
+                ),
+                else_=pages.first_capture_timestamp,
+            ),
+            "last_capture_timestamp": case(
+                (new_is_latest, new.last_capture_timestamp),
+                else_=pages.last_capture_timestamp,
+            ),
+            "snapshot_count": pages.snapshot_count + new.snapshot_count,
+            "latest_snapshot_id": case(
+                (new_is_latest, new.latest_snapshot_id),
+                else_=pages.latest_snapshot_id,
+            ),
+            "latest_ok_snapshot_id": case(
+                (new_is_latest_ok, new.latest_ok_snapshot_id),
+                else_=pages.latest_ok_snapshot_id,
+            ),
+            "latest_html_snapshot_id": case(
+                (new_is_latest_html, new.latest_html_snapshot_id),
+                else_=pages.latest_html_snapshot_id,
+            ),
+            "latest_html_capture_timestamp": case(
+                (new_is_latest_html, new.latest_html_capture_timestamp),
+                else_=pages.latest_html_capture_timestamp,
+            ),
+            "updated_at": func.now(),
+        },
+    )
+    exec_result = cast(Any, session.execute(upsert_stmt))
+    return PagesRebuildResult(
+        upserted_groups=int(exec_result.rowcount or 0),
+        deleted_groups=0,
+    )
+
+
 def discover_job_page_groups(session: Session, *, job_id: int) -> list[str]:
     """
     Return distinct page group keys for snapshots belonging to a given job.
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+"""
+Bounded on-disk cache of rendered raw snapshot pages.
+
+``/api/snapshots/raw/{id}`` otherwise re-reads the WARC record and splices the
+banner into the body on every request. Rendered bytes are stored per snapshot
+id, tagged with the response ETag, so a banner/template change or a new
+capture (which changes the "View diff" target) simply misses and overwrites.
+
+Eviction is oldest-mtime-first once the directory exceeds its byte budget;
+hits touch the file so frequently viewed pages stay.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from ha_backend.config import get_raw_render_cache_dir, get_raw_render_cache_max_bytes
+
+logger = logging.getLogger("healtharchive.raw_render_cache")
+
+# Prune down to this fraction of max_bytes so we don't rescan on every write.
+_PRUNE_TARGET_RATIO = 0.8
+
+
+class RawRenderCache:
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._approx_bytes: Optional[int] = None
+
+    def _bucket(self, snapshot_id: int) -> Path:
+        return self.root / f"{snapshot_id % 256:02x}"
+
+    def _path(self, snapshot_id: int, tag: str) -> Path:
+        return self._bucket(snapshot_id) / f"{snapshot_id}-{tag}.html"
+
+    def get(self, snapshot_id: int, tag: str) -> Optional[bytes]:
+        path = self._path(snapshot_id, tag)
+        try:
+            body = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return body
+
+    def put(self, snapshot_id: int, tag: str, body: bytes) -> None:
+        """
+        Store ``body`` (best-effort; failures are logged and ignored).
+        """
+        if len(body) > self.max_bytes:
+            return
+        bucket = self._bucket(snapshot_id)
+        try:
+            bucket.mkdir(parents=True, exist_ok=True)
+            # Drop renders of this snapshot made under an older tag.
+            for stale in bucket.glob(f"{snapshot_id}-*.html"):
+                stale.unlink(missing_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=bucket, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(tmp_name, self._path(snapshot_id, tag))
+        except OSError as exc:
+            logger.warning("Failed to cache rendered snapshot %s: %s", snapshot_id, exc)
+            return
+
+        with self._lock:
+            if self._approx_bytes is None:
+                self._approx_bytes = self._scan_bytes()
+            else:
+                self._approx_bytes += len(body)
+            if self._approx_bytes > self.max_bytes:
+                self._approx_bytes = self._prune()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*.html"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _scan_bytes(self) -> int:
+        return sum(size for _mtime, size, _path in self._entries())
+
+    def _prune(self) -> int:
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, size, _path in entries)
+        target = int(self.max_bytes * _PRUNE_TARGET_RATIO)
+        for _mtime, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        return total
+
+
+_CACHE: Optional[RawRenderCache] = None
+_CACHE_LOCK = Lock()
+
+
+def get_raw_render_cache() -> Optional[RawRenderCache]:
+    """
+    Return the configured cache, or None when HEALTHARCHIVE_RAW_RENDER_CACHE_DIR is unset.
+    """
+    global _CACHE
+    root = get_raw_render_cache_dir()
+    if root is None:
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE.root != root:
+            _CACHE = RawRenderCache(root, max_bytes=get_raw_render_cache_max_bytes())
+        return _CACHE
+
+
+__all__ = ["RawRenderCache", "get_raw_render_cache"]
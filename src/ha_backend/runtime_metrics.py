@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from threading import Lock
+from typing import Any, Iterator, Mapping
 
 
 @dataclass
@@ -32,6 +35,7 @@ class _SearchMetrics:
     relevance_fts: int = 0
     relevance_fallback: int = 0
     relevance_fuzzy: int = 0
+    relevance_corrected: int = 0
     boolean: int = 0
     url: int = 0
     pages_fastpath: int = 0
@@ -41,6 +45,179 @@ class _SearchMetrics:
 SEARCH_METRICS = _SearchMetrics()
 
 
+@dataclass
+class _SqlCompileCacheMetrics:
+    lock: Lock = field(default_factory=Lock)
+
+    # Statements executed while serving /api/search, by compiled-cache outcome.
+    hit: int = 0
+    miss: int = 0
+    uncached: int = 0
+
+
+SQL_COMPILE_CACHE_METRICS = _SqlCompileCacheMetrics()
+
+# Upper bounds (seconds) for the pool checkout wait histogram.
+_POOL_WAIT_BUCKETS = (0.001, 0.01, 0.1, 1.0, 5.0)
+
+
+@dataclass
+class _PoolCheckoutStats:
+    count: int = 0
+    timeouts: int = 0
+    wait_seconds_sum: float = 0.0
+    wait_seconds_max: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(_POOL_WAIT_BUCKETS))
+
+
+@dataclass
+class _DbPoolMetrics:
+    lock: Lock = field(default_factory=Lock)
+    pools: dict[str, _PoolCheckoutStats] = field(default_factory=dict)
+
+
+DB_POOL_METRICS = _DbPoolMetrics()
+
+
+def observe_db_pool_checkout(pool: str, wait_seconds: float, *, timed_out: bool = False) -> None:
+    """
+    Record how long a connection checkout from ``pool`` (primary/replica) waited.
+    """
+    m = DB_POOL_METRICS
+    with m.lock:
+        stats = m.pools.setdefault(pool, _PoolCheckoutStats())
+        stats.count += 1
+        if timed_out:
+            stats.timeouts += 1
+        stats.wait_seconds_sum += float(wait_seconds)
+        stats.wait_seconds_max = max(stats.wait_seconds_max, float(wait_seconds))
+        for i, upper in enumerate(_POOL_WAIT_BUCKETS):
+            if wait_seconds <= upper:
+                stats.buckets[i] += 1
+
+
+def render_db_pool_metrics_prometheus(pools: Mapping[str, Any]) -> list[str]:
+    """
+    Render connection pool utilization and checkout waits for ``pools``.
+
+    ``pools`` maps a label (primary/replica) to a SQLAlchemy pool; see
+    ``ha_backend.db.get_engine_pools``.
+    """
+    lines: list[str] = []
+    sized = {name: pool for name, pool in pools.items() if hasattr(pool, "size")}
+
+    lines.append("# HELP healtharchive_db_pool_size Configured connection pool size")
+    lines.append("# TYPE healtharchive_db_pool_size gauge")
+    for name, pool in sized.items():
+        lines.append(f'healtharchive_db_pool_size{{pool="{name}"}} {pool.size()}')
+
+    lines.append("# HELP healtharchive_db_pool_checked_out Connections currently checked out")
+    lines.append("# TYPE healtharchive_db_pool_checked_out gauge")
+    for name, pool in sized.items():
+        lines.append(f'healtharchive_db_pool_checked_out{{pool="{name}"}} {pool.checkedout()}')
+
+    lines.append(
+        "# HELP healtharchive_db_pool_overflow Connections open beyond pool_size (negative when the pool is not yet full)"
+    )
+    lines.append("# TYPE healtharchive_db_pool_overflow gauge")
+    for name, pool in sized.items():
+        lines.append(f'healtharchive_db_pool_overflow{{pool="{name}"}} {pool.overflow()}')
+
+    lines.append(
+        "# HELP healtharchive_db_pool_utilization_ratio Checked-out connections divided by pool_size"
+    )
+    lines.append("# TYPE healtharchive_db_pool_utilization_ratio gauge")
+    for name, pool in sized.items():
+        size = pool.size() or 1
+        lines.append(
+            f'healtharchive_db_pool_utilization_ratio{{pool="{name}"}} {pool.checkedout() / size}'
+        )
+
+    m = DB_POOL_METRICS
+    with m.lock:
+        lines.append(
+            "# HELP healtharchive_db_pool_checkout_wait_seconds Time to obtain a pooled connection (per-process)"
+        )
+        lines.append("# TYPE healtharchive_db_pool_checkout_wait_seconds histogram")
+        for name, stats in sorted(m.pools.items()):
+            for upper, bucket in zip(_POOL_WAIT_BUCKETS, stats.buckets):
+                lines.append(
+                    f'healtharchive_db_pool_checkout_wait_seconds_bucket{{pool="{name}",le="{upper:g}"}} {bucket}'
+                )
+            lines.append(
+                f'healtharchive_db_pool_checkout_wait_seconds_bucket{{pool="{name}",le="+Inf"}} {stats.count}'
+            )
+            lines.append(
+                f'healtharchive_db_pool_checkout_wait_seconds_sum{{pool="{name}"}} {stats.wait_seconds_sum}'
+            )
+            lines.append(
+                f'healtharchive_db_pool_checkout_wait_seconds_count{{pool="{name}"}} {stats.count}'
+            )
+
+        lines.append(
+            "# HELP healtharchive_db_pool_checkout_wait_seconds_max Max observed checkout wait (seconds)"
+        )
+        lines.append("# TYPE healtharchive_db_pool_checkout_wait_seconds_max gauge")
+        for name, stats in sorted(m.pools.items()):
+            lines.append(
+                f'healtharchive_db_pool_checkout_wait_seconds_max{{pool="{name}"}} {stats.wait_seconds_max}'
+            )
+
+        lines.append(
+            "# HELP healtharchive_db_pool_checkout_timeouts_total Checkouts that gave up after pool_timeout"
+        )
+        lines.append("# TYPE healtharchive_db_pool_checkout_timeouts_total counter")
+        for name, stats in sorted(m.pools.items()):
+            lines.append(
+                f'healtharchive_db_pool_checkout_timeouts_total{{pool="{name}"}} {stats.timeouts}'
+            )
+
+    return lines
+
+
+_IN_SEARCH_SQL_SCOPE: ContextVar[bool] = ContextVar("ha_in_search_sql_scope", default=False)
+
+
+@contextmanager
+def search_sql_scope() -> Iterator[None]:
+    """
+    Attribute statements executed inside this block to /api/search.
+    """
+    token = _IN_SEARCH_SQL_SCOPE.set(True)
+    try:
+        yield
+    finally:
+        _IN_SEARCH_SQL_SCOPE.reset(token)
+
+
+def _observe_sql_compile_cache(
+    conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if not _IN_SEARCH_SQL_SCOPE.get() or context is None:
+        return
+    from sqlalchemy.engine.interfaces import CacheStats
+
+    outcome = getattr(context, "cache_hit", None)
+    m = SQL_COMPILE_CACHE_METRICS
+    with m.lock:
+        if outcome == CacheStats.CACHE_HIT:
+            m.hit += 1
+        elif outcome == CacheStats.CACHE_MISS:
+            m.miss += 1
+        else:
+            m.uncached += 1
+
+
+def install_sql_compile_cache_metrics(engine: Any) -> None:
+    """
+    Count SQLAlchemy compiled-cache hits/misses for search statements on ``engine``.
+    """
+    from sqlalchemy import event
+
+    if not event.contains(engine, "after_cursor_execute", _observe_sql_compile_cache):
+        event.listen(engine, "after_cursor_execute", _observe_sql_compile_cache)
+
+
 def observe_search_request(
     *, duration_seconds: float, mode: str, ok: bool, error_type: str | None = None
 ) -> None:
@@ -97,6 +274,8 @@ def observe_search_request(
             m.relevance_fallback += 1
         elif mode.startswith("relevance_fuzzy"):
             m.relevance_fuzzy += 1
+        elif mode.startswith("relevance_corrected"):
+            m.relevance_corrected += 1
         elif mode == "boolean":
             m.boolean += 1
         elif mode == "url":
@@ -158,6 +337,9 @@ def render_search_metrics_prometheus() -> list[str]:
         lines.append(
             f'healtharchive_search_mode_total{{mode="relevance_fuzzy"}} {m.relevance_fuzzy}'
         )
+        lines.append(
+            f'healtharchive_search_mode_total{{mode="relevance_corrected"}} {m.relevance_corrected}'
+        )
         lines.append(f'healtharchive_search_mode_total{{mode="boolean"}} {m.boolean}')
         lines.append(f'healtharchive_search_mode_total{{mode="url"}} {m.url}')
         lines.append(f'healtharchive_search_mode_total{{mode="pages_fastpath"}} {m.pages_fastpath}')
@@ -169,7 +351,34 @@ def render_search_metrics_prometheus() -> list[str]:
         lines.append("# TYPE healtharchive_search_duration_seconds_max gauge")
         lines.append(f"healtharchive_search_duration_seconds_max {m.duration_seconds_max}")
 
-        return lines
+    c = SQL_COMPILE_CACHE_METRICS
+    with c.lock:
+        lines.append(
+            "# HELP healtharchive_search_sql_compile_cache_total /api/search statements by SQLAlchemy compiled-cache outcome (per-process)"
+        )
+        lines.append("# TYPE healtharchive_search_sql_compile_cache_total counter")
+        lines.append(f'healtharchive_search_sql_compile_cache_total{{result="hit"}} {c.hit}')
+        lines.append(f'healtharchive_search_sql_compile_cache_total{{result="miss"}} {c.miss}')
+        lines.append(
+            f'healtharchive_search_sql_compile_cache_total{{result="uncached"}} {c.uncached}'
+        )
+        cacheable = c.hit + c.miss
+        lines.append(
+            "# HELP healtharchive_search_sql_compile_cache_hit_ratio Share of cacheable /api/search statements served from the compiled cache"
+        )
+        lines.append("# TYPE healtharchive_search_sql_compile_cache_hit_ratio gauge")
+        lines.append(
+            f"healtharchive_search_sql_compile_cache_hit_ratio {c.hit / cacheable if cacheable else 0.0}"
+        )
+
+    return lines
 
 
-__all__ = ["observe_search_request", "render_search_metrics_prometheus"]
+__all__ = [
+    "install_sql_compile_cache_metrics",
+    "observe_db_pool_checkout",
+    "observe_search_request",
+    "render_db_pool_metrics_prometheus",
+    "render_search_metrics_prometheus",
+    "search_sql_scope",
+]
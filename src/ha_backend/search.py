@@ -1,18 +1,159 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
-from sqlalchemy import func, literal_column
+from sqlalchemy import and_, case, cast, func, literal, literal_column, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.sql.elements import ColumnElement
 
-# For now we use the 'simple' text search config to avoid incorrect stemming for
-# bilingual content. We can later switch based on Snapshot.language ('english'
-# vs 'french') once we have a robust approach.
+# 'simple' (no stemming) is used for URLs and for content whose language we
+# could not identify. English/French content is stemmed with the matching
+# Postgres config (Snapshot.language carries 'en', 'fr-ca', 'und', ...).
 TS_CONFIG: ColumnElement[str] = literal_column("'simple'")
 WEIGHT_A: ColumnElement[str] = literal_column("'A'")
 WEIGHT_B: ColumnElement[str] = literal_column("'B'")
 WEIGHT_C: ColumnElement[str] = literal_column("'C'")
 
+LANGUAGE_TS_CONFIGS: dict[str, str] = {"en": "english", "fr": "french"}
+DEFAULT_TS_CONFIG_NAME = "simple"
+
+# Stored in Snapshot.search_vector_version next to every vector built by
+# build_search_vector. Version 1 vectors predate language-aware FTS ('simple'
+# for every field) and are matched with a 'simple' query until
+# `ha-backend backfill-search-vector` rebuilds them.
+SEARCH_VECTOR_VERSION = 2
+
+
+def ts_config_for_language(language: str | None) -> str:
+    """
+    Map a Snapshot.language value ('en', 'fr-CA', 'und', None) to a Postgres FTS config name.
+    """
+    primary = (language or "").strip().lower()[:2]
+    return LANGUAGE_TS_CONFIGS.get(primary, DEFAULT_TS_CONFIG_NAME)
+
+
+def _language_prefix(language_col: Any) -> ColumnElement[str]:
+    return func.lower(func.substr(func.coalesce(language_col, ""), 1, 2))
+
+
+def language_predicate(language_col: Any, code: str) -> ColumnElement[bool]:
+    """
+    Rows whose language has the primary subtag ``code`` ('en' matches 'en-CA').
+    """
+    return _language_prefix(language_col) == code.strip().lower()[:2]
+
+
+def language_partitions(
+    language_col: Any,
+) -> list[tuple[str | None, str, ColumnElement[bool]]]:
+    """
+    Split rows by FTS config: (language code, config name, row predicate) per
+    stemmed language, plus (None, 'simple', ...) for everything else.
+
+    The predicates are disjoint and cover every row (NULL languages fall into 'simple').
+    """
+    prefix = _language_prefix(language_col)
+    partitions: list[tuple[str | None, str, ColumnElement[bool]]] = [
+        (code, config, prefix == code) for code, config in LANGUAGE_TS_CONFIGS.items()
+    ]
+    partitions.append((None, DEFAULT_TS_CONFIG_NAME, prefix.notin_(list(LANGUAGE_TS_CONFIGS))))
+    return partitions
+
+
+def _query_partitions(
+    language_col: Any,
+    version_col: Any = None,
+    *,
+    languages: list[str] | None = None,
+) -> list[tuple[str, ColumnElement[bool]]]:
+    """
+    Split rows by the config a query must be parsed with to match their stored
+    vector: (config name, row predicate), with the 'simple' partition last.
+
+    Rows whose ``version_col`` is older than SEARCH_VECTOR_VERSION hold
+    'simple' vectors whatever their language. A NULL version (no stored
+    vector; callers compute one with the current rules) counts as current.
+    """
+    partitions: list[tuple[str, ColumnElement[bool]]] = []
+    simple_guards: list[ColumnElement[bool]] = []
+    for code, config, guard in language_partitions(language_col):
+        if languages is not None and code not in languages:
+            continue
+        if code is None:
+            simple_guards.append(guard)
+        elif version_col is None:
+            partitions.append((config, guard))
+        else:
+            version = func.coalesce(version_col, SEARCH_VECTOR_VERSION)
+            partitions.append((config, and_(guard, version == SEARCH_VECTOR_VERSION)))
+            simple_guards.append(and_(guard, version != SEARCH_VECTOR_VERSION))
+    if simple_guards:
+        partitions.append((DEFAULT_TS_CONFIG_NAME, or_(*simple_guards)))
+    return partitions
+
+
+def ts_config_expr(language: Any) -> ColumnElement[Any]:
+    """
+    Return the regconfig for ``language``: a literal for Python values, or a
+    per-row CASE when ``language`` is a SQL expression (e.g. Snapshot.language).
+    """
+    if language is None or isinstance(language, str):
+        return literal_column(f"'{ts_config_for_language(language)}'")
+    prefix = _language_prefix(language)
+    return cast(
+        case(
+            *((prefix == code, literal(config)) for code, config in LANGUAGE_TS_CONFIGS.items()),
+            else_=literal(DEFAULT_TS_CONFIG_NAME),
+        ),
+        REGCONFIG,
+    )
+
+
+def build_language_tsquery(
+    make_tsquery: Callable[[ColumnElement[Any]], ColumnElement[Any]],
+    language_col: Any,
+    *,
+    version_col: Any = None,
+) -> ColumnElement[Any]:
+    """
+    Per-row tsquery parsed with the row's own config, for ts_rank_cd().
+
+    ``version_col`` (Snapshot.search_vector_version) sends rows with legacy
+    vectors to the 'simple' query. Not index-friendly; filter with
+    ``build_language_fts_filter`` instead.
+    """
+    stemmed = _query_partitions(language_col, version_col)[:-1]
+    return case(
+        *((guard, make_tsquery(literal_column(f"'{config}'"))) for config, guard in stemmed),
+        else_=make_tsquery(TS_CONFIG),
+    )
+
+
+def build_language_fts_filter(
+    vector: Any,
+    make_tsquery: Callable[[ColumnElement[Any]], ColumnElement[Any]],
+    language_col: Any,
+    *,
+    version_col: Any = None,
+    languages: list[str] | None = None,
+) -> ColumnElement[bool]:
+    """
+    Match ``vector`` against a query parsed with each row's language config.
+
+    Emits one ``vector @@ <constant tsquery>`` per language partition (each can
+    use the GIN index) guarded by the row's language, so stemming on both sides
+    always agrees and negations keep their meaning. With ``version_col``, rows
+    whose vector predates language-aware FTS are matched by the 'simple'
+    branch instead. ``languages`` (e.g. ``["fr"]``) restricts matching to
+    those languages.
+    """
+    return or_(
+        *(
+            and_(guard, vector.op("@@")(make_tsquery(literal_column(f"'{config}'"))))
+            for config, guard in _query_partitions(language_col, version_col, languages=languages)
+        )
+    )
+
 
 def build_search_vector(
     title: Any,
@@ -20,6 +161,7 @@ def build_search_vector(
     url: Any,
     *,
     content_text: Any = None,
+    language: Any = None,
 ) -> ColumnElement[Any]:
     """
     Return a weighted Postgres tsvector expression suitable for Snapshot.search_vector.
@@ -33,19 +175,27 @@ def build_search_vector(
         url: Page URL (weight C - lowest).
         content_text: Optional extended content text (~4KB) for FTS (weight B).
                       If provided, this is used instead of snippet for better recall.
+        language: Snapshot.language value or column; selects the stemming config
+                  for title and body. URLs always use 'simple'.
+
+    Store SEARCH_VECTOR_VERSION in Snapshot.search_vector_version alongside it.
     """
+    text_config = ts_config_expr(language)
     vector_title = func.setweight(
-        func.to_tsvector(TS_CONFIG, func.coalesce(title, "")),
+        func.to_tsvector(text_config, func.coalesce(title, "")),
         WEIGHT_A,
     )
 
     # Use content_text for FTS if provided (v3), otherwise fall back to snippet.
     body_text = content_text if content_text is not None else snippet
     vector_body = func.setweight(
-        func.to_tsvector(TS_CONFIG, func.coalesce(body_text, "")),
+        func.to_tsvector(text_config, func.coalesce(body_text, "")),
         WEIGHT_B,
     )
 
+    # The default parser emits url/host/url_path tokens for URLs, which the
+    # english and french configs also map to the 'simple' dictionary, so a
+    # query parsed with the row's config still matches these lexemes.
     vector_url = func.setweight(
         func.to_tsvector(TS_CONFIG, func.coalesce(url, "")),
         WEIGHT_C,
@@ -53,4 +203,15 @@ def build_search_vector(
     return vector_title.op("||")(vector_body.op("||")(vector_url))
 
 
-__all__ = ["TS_CONFIG", "build_search_vector"]
+__all__ = [
+    "LANGUAGE_TS_CONFIGS",
+    "SEARCH_VECTOR_VERSION",
+    "TS_CONFIG",
+    "build_language_fts_filter",
+    "build_language_tsquery",
+    "build_search_vector",
+    "language_partitions",
+    "language_predicate",
+    "ts_config_expr",
+    "ts_config_for_language",
+]
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from sqlalchemy import and_, func, not_, or_, true
+from sqlalchemy.sql.elements import ColumnElement
+
+from ha_backend.models import Snapshot
+from ha_backend.search import build_language_fts_filter, build_language_tsquery
+from ha_backend.search_query import And, Not, Or, QueryNode, Term
+
+# Field prefixes map onto the setweight() labels used by build_search_vector:
+# title is weight A, body text (content_text/snippet) is weight B. Unprefixed
+# terms match any weight (plus a URL substring, see _compile_fts); url: terms
+# never go through the tsvector.
+_FIELD_WEIGHTS = {"title": "A", "snippet": "B"}
+
+_LEXEME_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """
+    SQL plan for a parsed boolean/field query.
+
+    ``filter`` is the WHERE predicate. ``rank_tsquery`` is the positive text
+    portion (negations and url: terms dropped) for ts_rank_cd, or None when
+    the query has no rankable text.
+    """
+
+    filter: ColumnElement[bool]
+    rank_tsquery: ColumnElement[Any] | None
+
+
+def _escape_like(value: str) -> str:
+    """
+    Escape LIKE wildcards so user input is treated as a literal substring.
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def term_to_tsquery_text(term: Term) -> str | None:
+    """
+    Render a non-url Term as to_tsquery() source text.
+
+    Words are prefix-matched (``'vaccin':*``) to stay close to the substring
+    semantics users get on other backends; phrases and multi-word terms such
+    as ``covid-19`` become ``<->`` adjacency. Returns None when the term has
+    no indexable characters.
+    """
+    words = [w.lower() for w in _LEXEME_RE.findall(term.text)]
+    if not words:
+        return None
+    weight = _FIELD_WEIGHTS.get(term.field or "", "")
+    prefix = "" if term.is_phrase else "*"
+    lexemes = [f"'{w}':{prefix}{weight}" if (prefix or weight) else f"'{w}'" for w in words]
+    if len(lexemes) == 1:
+        return lexemes[0]
+    return "(" + " <-> ".join(lexemes) + ")"
+
+
+def _like_pattern(term: Term) -> str:
+    return f"%{_escape_like(term.text.strip())}%"
+
+
+def _ilike_raw(column: Any, pattern: str) -> ColumnElement[bool]:
+    # Raw column (no coalesce) so its gin_trgm_ops index can serve the ILIKE;
+    # the IS NOT NULL guard keeps NOT ... two-valued for NULL values.
+    return and_(column.isnot(None), column.ilike(pattern, escape="\\"))
+
+
+def _ilike_coalesced(column: Any, pattern: str) -> ColumnElement[bool]:
+    return func.coalesce(column, "").ilike(pattern, escape="\\")
+
+
+def _url_term_expr(term: Term) -> ColumnElement[bool]:
+    pattern = _like_pattern(term)
+    return or_(
+        Snapshot.url.ilike(pattern, escape="\\"),
+        _ilike_raw(Snapshot.normalized_url_group, pattern),
+    )
+
+
+def _make_tsquery(tsquery_text: str) -> Callable[[ColumnElement[Any]], ColumnElement[Any]]:
+    def make(config: ColumnElement[Any]) -> ColumnElement[Any]:
+        return func.to_tsquery(config, tsquery_text)
+
+    return make
+
+
+def _vector_match(tsquery_text: str) -> ColumnElement[bool]:
+    # One GIN-indexable `@@` per language partition; to_tsquery() stems the
+    # quoted lexemes with each partition's config.
+    return build_language_fts_filter(
+        Snapshot.search_vector,
+        _make_tsquery(tsquery_text),
+        Snapshot.language,
+        version_col=Snapshot.search_vector_version,
+    )
+
+
+# Intermediate result of compiling a subtree: either to_tsquery() source text
+# (the subtree only touches the tsvector) or a SQL predicate. None means the
+# subtree matches everything (e.g. a term made only of punctuation).
+_Part = str | ColumnElement[bool] | None
+
+
+def _as_predicate(part: _Part) -> ColumnElement[bool]:
+    if part is None:
+        return true()
+    if isinstance(part, str):
+        return _vector_match(part)
+    return part
+
+
+def _combine(parts: list[_Part], *, op: str) -> _Part:
+    if op == "|" and any(p is None for p in parts):
+        return None
+    present = [p for p in parts if p is not None]
+    if not present:
+        return None
+    ts_parts = [p for p in present if isinstance(p, str)]
+    sql_parts = [p for p in present if not isinstance(p, str)]
+
+    ts_joined: str | None = None
+    if ts_parts:
+        ts_joined = ts_parts[0] if len(ts_parts) == 1 else "(" + f" {op} ".join(ts_parts) + ")"
+    if not sql_parts:
+        return ts_joined
+    if ts_joined is not None:
+        sql_parts.insert(0, _vector_match(ts_joined))
+    return and_(*sql_parts) if op == "&" else or_(*sql_parts)
+
+
+def _compile_fts(node: QueryNode) -> _Part:
+    if isinstance(node, Term):
+        if node.field == "url":
+            if not node.text.strip():
+                return None
+            return _url_term_expr(node)
+        tsquery_text = term_to_tsquery_text(node)
+        if node.field is None and tsquery_text is not None:
+            # URL lexemes in the vector are whole URL/host/path tokens, so an
+            # unprefixed word keeps matching anywhere in the URL as before.
+            return or_(
+                _vector_match(tsquery_text),
+                Snapshot.url.ilike(_like_pattern(node), escape="\\"),
+            )
+        return tsquery_text
+    if isinstance(node, Not):
+        child = _compile_fts(node.child)
+        if child is None:
+            return None
+        if isinstance(child, str):
+            return f"!{child}"
+        return not_(child)
+    if isinstance(node, And):
+        return _combine([_compile_fts(c) for c in node.children], op="&")
+    if isinstance(node, Or):
+        return _combine([_compile_fts(c) for c in node.children], op="|")
+    return None
+
+
+def _rank_text(node: QueryNode) -> str | None:
+    if isinstance(node, Term):
+        return None if node.field == "url" else term_to_tsquery_text(node)
+    if isinstance(node, Not):
+        return None
+    if isinstance(node, (And, Or)):
+        op = " & " if isinstance(node, And) else " | "
+        parts = [p for p in (_rank_text(c) for c in node.children) if p]
+        if not parts:
+            return None
+        return parts[0] if len(parts) == 1 else "(" + op.join(parts) + ")"
+    return None
+
+
+_Matcher = Callable[[Any, str], ColumnElement[bool]]
+
+
+def _compile_substring(node: QueryNode, match: _Matcher = _ilike_coalesced) -> ColumnElement[bool]:
+    if isinstance(node, Term):
+        if not node.text.strip():
+            return true()
+        pattern = _like_pattern(node)
+        if node.field == "title":
+            return match(Snapshot.title, pattern)
+        if node.field == "snippet":
+            return match(Snapshot.snippet, pattern)
+        url_match = Snapshot.url.ilike(pattern, escape="\\")
+        if node.field == "url":
+            return or_(url_match, match(Snapshot.normalized_url_group, pattern))
+        return or_(match(Snapshot.title, pattern), match(Snapshot.snippet, pattern), url_match)
+    if isinstance(node, Not):
+        return not_(_compile_substring(node.child, match))
+    if isinstance(node, And):
+        return and_(*(_compile_substring(c, match) for c in node.children))
+    if isinstance(node, Or):
+        return or_(*(_compile_substring(c, match) for c in node.children))
+    return true()
+
+
+def compile_query(node: QueryNode, *, dialect_name: str) -> CompiledQuery:
+    """
+    Compile a parsed query into an index-friendly predicate for ``dialect_name``.
+
+    On Postgres, text terms are matched per language partition as
+    ``search_vector @@ to_tsquery(<config>, ...)`` (served by
+    ``ix_snapshots_search_vector``); title:/snippet: subtrees collapse into a
+    single tsquery text. Unprefixed terms also match a substring of the URL,
+    and url: terms become ILIKE on the raw, trigram-indexed URL columns. Rows
+    whose ``search_vector`` has not been backfilled fall back to substring
+    matching on the raw (trigram-indexed) title, snippet and URL columns.
+
+    Other dialects (SQLite in dev/tests) keep case-insensitive substring
+    matching across title, snippet and URL.
+    """
+    if dialect_name != "postgresql":
+        return CompiledQuery(filter=_compile_substring(node), rank_tsquery=None)
+
+    rank_text = _rank_text(node)
+    return CompiledQuery(
+        filter=or_(
+            _as_predicate(_compile_fts(node)),
+            and_(Snapshot.search_vector.is_(None), _compile_substring(node, _ilike_raw)),
+        ),
+        rank_tsquery=(
+            build_language_tsquery(
+                _make_tsquery(rank_text),
+                Snapshot.language,
+                version_col=Snapshot.search_vector_version,
+            )
+            if rank_text
+            else None
+        ),
+    )
+
+
+__all__ = ["CompiledQuery", "compile_query", "term_to_tsquery_text"]
@@ -25,7 +25,8 @@ import os
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, Sequence, TypeVar
 
 from sqlalchemy import and_, case, func, literal, or_
 from sqlalchemy.sql.elements import ColumnElement
@@ -45,6 +46,8 @@ class QueryMode(str, Enum):
 
 _TOKEN_RE = re.compile(r"[a-z0-9]+", re.IGNORECASE)
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class RankingConfig:
@@ -103,6 +106,24 @@ def tokenize_query(q_clean: str) -> list[str]:
     return [t.lower() for t in _TOKEN_RE.findall(q_clean)]
 
 
+def pad_terms_to_bucket(terms: Sequence[_T]) -> list[_T]:
+    """
+    Repeat the last term until the list length is a power of two.
+
+    SQLAlchemy's compiled cache keys on statement shape, not bound values, so
+    one ILIKE per token would compile a new statement for every token count.
+    AND/OR over a repeated term is unchanged, so padding keeps results
+    identical while bounding the shapes per ranking plan to a handful.
+    """
+    padded = list(terms)
+    if not padded:
+        return padded
+    size = 1
+    while size < len(padded):
+        size *= 2
+    return padded + [padded[-1]] * (size - len(padded))
+
+
 def classify_query_mode(q_clean: str) -> QueryMode:
     """
     Classify the query into a coarse intent mode.
@@ -129,6 +150,7 @@ def classify_query_mode(q_clean: str) -> QueryMode:
     return QueryMode.specific
 
 
+@lru_cache(maxsize=None)
 def get_ranking_config(
     *, mode: QueryMode, version: RankingVersion = RankingVersion.v2
 ) -> RankingConfig:
@@ -136,6 +158,7 @@ def get_ranking_config(
     Get ranking coefficients based on query mode and ranking version.
 
     v3 uses stronger archived penalties and slightly tuned authority blending.
+    Configs are immutable, so one instance per (mode, version) is shared.
     """
     if version == RankingVersion.v3:
         return _get_ranking_config_v3(mode)
@@ -236,7 +259,7 @@ def build_title_token_match_expr(
     title_expr: ColumnElement,
     tokens: Iterable[str],
 ) -> tuple[ColumnElement[bool], ColumnElement[bool]]:
-    tokens_list = [t for t in tokens if t]
+    tokens_list = pad_terms_to_bucket([t for t in tokens if t])
     if not tokens_list:
         return (literal_false(), literal_false())
 
@@ -450,6 +473,7 @@ __all__ = [
     "RankingConfig",
     "get_ranking_version",
     "tokenize_query",
+    "pad_terms_to_bucket",
     "classify_query_mode",
     "get_ranking_config",
     "build_title_boost_expr",
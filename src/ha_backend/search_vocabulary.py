@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+"""
+Precomputed search vocabulary for "did you mean" query corrections.
+
+``search_vocabulary`` holds every distinct lowercased title term with its
+document frequency. When a plain-text search matches nothing, misspelled
+tokens are corrected against this small, trigram-indexed table and the
+corrected query is run through the normal (index-backed) search path, instead
+of scanning snapshot titles with ``word_similarity``.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from ha_backend.models import SearchVocabularyTerm, Snapshot
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+MIN_TERM_LENGTH = 3
+MAX_TERM_LENGTH = 64
+# Minimum trigram similarity (pg_trgm semantics) for a vocabulary term to be
+# offered as a correction. pg_trgm's default `%` threshold (0.3) is used as the
+# index-served candidate filter; this is the stricter acceptance bar.
+MIN_CORRECTION_SIMILARITY = 0.45
+MAX_CORRECTED_TOKENS = 6
+
+_CACHE_TTL_SECONDS = 600.0
+_CACHE_MAX_ENTRIES = 4096
+_CORRECTION_CACHE: dict[tuple[int, str], tuple[float, str | None]] = {}
+_CORRECTION_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class VocabularyRebuildResult:
+    terms: int
+
+
+def _is_vocabulary_term(word: str) -> bool:
+    return MIN_TERM_LENGTH <= len(word) <= MAX_TERM_LENGTH and not word.isdigit()
+
+
+def extract_title_terms(title: str | None) -> set[str]:
+    """
+    Return the distinct vocabulary terms of a title (lowercased words).
+    """
+    if not title:
+        return set()
+    return {w for w in (m.lower() for m in _WORD_RE.findall(title)) if _is_vocabulary_term(w)}
+
+
+def _trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """
+    pg_trgm ``similarity()`` for single words, used off-Postgres.
+    """
+    ta, tb = _trigrams(a.lower()), _trigrams(b.lower())
+    if not ta or not tb:
+        return 0.0
+    shared = len(ta & tb)
+    return shared / float(len(ta) + len(tb) - shared)
+
+
+def clear_correction_cache() -> None:
+    with _CORRECTION_CACHE_LOCK:
+        _CORRECTION_CACHE.clear()
+
+
+def rebuild_search_vocabulary(session: Session) -> VocabularyRebuildResult:
+    """
+    Replace ``search_vocabulary`` with the terms of all snapshot titles.
+
+    On Postgres this is a single ``ts_stat`` pass (simple config, so terms are
+    unstemmed words); elsewhere titles are tokenized in Python.
+    """
+    dialect_name = session.get_bind().dialect.name
+    session.query(SearchVocabularyTerm).delete(synchronize_session=False)
+
+    if dialect_name == "postgresql":
+        session.execute(
+            text(
+                """
+                INSERT INTO search_vocabulary (term, doc_freq)
+                SELECT word, ndoc
+                FROM ts_stat(
+                    'SELECT to_tsvector(''simple'', coalesce(title, '''')) FROM snapshots'
+                )
+                WHERE length(word) BETWEEN :min_len AND :max_len
+                  AND word !~ '^[0-9]+$'
+                """
+            ),
+            {"min_len": MIN_TERM_LENGTH, "max_len": MAX_TERM_LENGTH},
+        )
+        terms = int(session.query(func.count(SearchVocabularyTerm.term)).scalar() or 0)
+    else:
+        counts: Counter[str] = Counter()
+        for (title,) in session.query(Snapshot.title).yield_per(2000):
+            counts.update(extract_title_terms(title))
+        if counts:
+            session.bulk_insert_mappings(
+                SearchVocabularyTerm.__mapper__,
+                [{"term": term, "doc_freq": n} for term, n in counts.items()],
+            )
+        terms = len(counts)
+
+    clear_correction_cache()
+    return VocabularyRebuildResult(terms=terms)
+
+
+def merge_job_search_vocabulary(session: Session, job_id: int) -> VocabularyRebuildResult:
+    """
+    Add the title terms of one job's snapshots to ``search_vocabulary``.
+
+    Counts are added to the stored ``doc_freq`` rather than recomputed, so this
+    only suits a job indexed for the first time. When a job's old snapshots
+    were replaced (re-index) or removed, use ``rebuild_search_vocabulary``.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        exec_result = session.execute(
+            text(
+                """
+                INSERT INTO search_vocabulary (term, doc_freq)
+                SELECT word, ndoc
+                FROM ts_stat(:stat_query)
+                WHERE length(word) BETWEEN :min_len AND :max_len
+                  AND word !~ '^[0-9]+$'
+                ON CONFLICT (term) DO UPDATE
+                SET doc_freq = search_vocabulary.doc_freq + EXCLUDED.doc_freq,
+                    updated_at = now()
+                """
+            ),
+            {
+                "stat_query": (
+                    "SELECT to_tsvector('simple', coalesce(title, '')) "
+                    f"FROM snapshots WHERE job_id = {int(job_id)}"
+                ),
+                "min_len": MIN_TERM_LENGTH,
+                "max_len": MAX_TERM_LENGTH,
+            },
+        )
+        terms = int(getattr(exec_result, "rowcount", 0) or 0)
+    else:
+        counts: Counter[str] = Counter()
+        for (title,) in (
+            session.query(Snapshot.title).filter(Snapshot.job_id == job_id).yield_per(2000)
+        ):
+            counts.update(extract_title_terms(title))
+        items = list(counts.items())
+        # Chunked to stay under SQLite's bound-parameter limit.
+        for start in range(0, len(items), 500):
+            insert_stmt = sqlite_insert(SearchVocabularyTerm).values(
+                [{"term": term, "doc_freq": n} for term, n in items[start : start + 500]]
+            )
+            session.execute(
+                insert_stmt.on_conflict_do_update(
+                    index_elements=["term"],
+                    set_={
+                        "doc_freq": SearchVocabularyTerm.doc_freq + insert_stmt.excluded.doc_freq,
+                        "updated_at": func.now(),
+                    },
+                )
+            )
+        terms = len(counts)
+
+    clear_correction_cache()
+    return VocabularyRebuildResult(terms=terms)
+
+
+def _lookup_correction(session: Session, token: str) -> str | None:
+    """
+    Return the best vocabulary term for ``token`` (``token`` itself when known).
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        row = session.execute(
+            text(
+                """
+                SELECT term, similarity(term, :token) AS sim
+                FROM search_vocabulary
+                WHERE term % :token
+                ORDER BY sim DESC, doc_freq DESC, term
+                LIMIT 1
+                """
+            ),
+            {"token": token},
+        ).first()
+        if row is None or float(row.sim) < MIN_CORRECTION_SIMILARITY:
+            return None
+        return str(row.term)
+
+    candidates = (
+        session.query(SearchVocabularyTerm.term, SearchVocabularyTerm.doc_freq)
+        .filter(func.length(SearchVocabularyTerm.term).between(len(token) - 3, len(token) + 3))
+        .order_by(SearchVocabularyTerm.term)
+        .all()
+    )
+    best: tuple[float, int, str] | None = None
+    for term, doc_freq in candidates:
+        sim = trigram_similarity(term, token)
+        if sim < MIN_CORRECTION_SIMILARITY:
+            continue
+        key = (sim, int(doc_freq or 0), term)
+        if best is None or (key[0], key[1]) > (best[0], best[1]):
+            best = key
+    return best[2] if best is not None else None
+
+
+def correct_token(session: Session, token: str) -> str | None:
+    """
+    Cached vocabulary lookup for one lowercased token.
+    """
+    cache_key = (id(session.get_bind()), token)
+    now = time.monotonic()
+    with _CORRECTION_CACHE_LOCK:
+        cached = _CORRECTION_CACHE.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    correction = _lookup_correction(session, token)
+    with _CORRECTION_CACHE_LOCK:
+        if len(_CORRECTION_CACHE) >= _CACHE_MAX_ENTRIES:
+            _CORRECTION_CACHE.clear()
+        _CORRECTION_CACHE[cache_key] = (now + _CACHE_TTL_SECONDS, correction)
+    return correction
+
+
+def suggest_query(session: Session, q: str) -> str | None:
+    """
+    Return ``q`` with misspelled words replaced by vocabulary terms.
+
+    Words already in the vocabulary (or with no close match) are kept as typed.
+    Returns None when nothing would change.
+    """
+    pieces: list[str] = []
+    last_end = 0
+    changed = False
+    for i, match in enumerate(_WORD_RE.finditer(q)):
+        word = match.group(0).lower()
+        if i >= MAX_CORRECTED_TOKENS or not _is_vocabulary_term(word):
+            continue
+        correction = correct_token(session, word)
+        if correction is None or correction == word:
+            continue
+        pieces.append(q[last_end : match.start()])
+        pieces.append(correction)
+        last_end = match.end()
+        changed = True
+    if not changed:
+        return None
+    pieces.append(q[last_end:])
+    return "".join(pieces)
+
+
+__all__ = [
+    "VocabularyRebuildResult",
+    "clear_correction_cache",
+    "correct_token",
+    "extract_title_terms",
+    "merge_job_search_vocabulary",
+    "rebuild_search_vocabulary",
+    "suggest_query",
+    "trigram_similarity",
+]
@@ -12,6 +12,7 @@ from ha_backend.config import (
     get_usage_metrics_enabled,
     get_usage_metrics_window_days,
 )
+from ha_backend.db import get_session
 from ha_backend.models import UsageMetric
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,15 @@ def record_usage_event(db: Session, event: str) -> None:
     if event not in EVENTS:
         return
 
+    if db.info.get("read_only"):
+        # Request sessions on the read replica cannot write; count on the primary.
+        try:
+            with get_session() as primary:
+                record_usage_event(primary, event)
+        except Exception:
+            logger.warning("Failed to record usage metric", exc_info=True)
+        return
+
     metric_date = _today_utc()
 
     try:
@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from .main import run_worker_loop
+from .main import WorkerLanes, run_worker_loop
 
-__all__ = ["run_worker_loop"]
+__all__ = ["WorkerLanes", "run_worker_loop"]
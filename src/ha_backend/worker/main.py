@@ -1,19 +1,36 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import os
+import signal
 import subprocess
+import threading
 import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Collection, Optional
 
 from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from ha_backend.db import get_session
 from ha_backend.indexing import index_job
-from ha_backend.jobs import JobAlreadyRunningError, run_persistent_job
+from ha_backend.job_claims import (
+    LeaseHeartbeat,
+    claim_next_job,
+    get_worker_id,
+    release_job_claim,
+    unclaimed_filter,
+)
+from ha_backend.job_events import JobEventListener
+from ha_backend.jobs import JobAlreadyRunningError, _job_lock, run_persistent_job
 from ha_backend.models import ArchiveJob, Source
 
 """
@@ -23,10 +40,16 @@ Picks queued/retryable jobs, runs archive_tool crawls, and triggers indexing.
 Implements retry logic with cooldowns for infrastructure errors and disk
 pressure protection.
 
+The long-running loop schedules work on two independent lanes (see
+``WorkerLanes``): a crawl lane for queued/retryable jobs and an index lane for
+jobs whose crawl completed, so a large indexing run no longer blocks the next
+crawl (and vice versa).
+
 Key thresholds defined here:
     - DISK_HEADROOM_THRESHOLD_PERCENT (85%): Skip crawls if disk usage exceeds
     - INFRA_ERROR_RETRY_COOLDOWN_MINUTES (10): Cooldown after infra errors
     - MAX_CRAWL_RETRIES (2): Maximum retry attempts per job
+    - DEFAULT_CRAWL_CONCURRENCY / DEFAULT_INDEX_CONCURRENCY (1 / 1): Lane sizes
 
 See also:
     - docs/operations/thresholds-and-tuning.md for operational guidance
@@ -38,8 +61,22 @@ logger = logging.getLogger("healtharchive.worker")
 # Worker retry and threshold constants
 MAX_CRAWL_RETRIES = 2
 DEFAULT_POLL_INTERVAL = 30
+# With a job wake-up channel active, polling is only a safety net for missed
+# notifications (listener reconnects, status changes made outside the ORM).
+WAKEUP_SAFETY_POLL_SECONDS = 300
 INFRA_ERROR_RETRY_COOLDOWN_MINUTES = 10
 
+# An index lane that finds a job's lock held elsewhere (e.g. an operator's
+# ``index-job``) leaves that job alone for this long before re-claiming it.
+LOCKED_JOB_RETRY_COOLDOWN_SECONDS = 60
+# Return code of _run_index_phase when the job lock is held (EX_TEMPFAIL).
+INDEX_PHASE_LOCK_HELD_RC = 75
+
+# Lane sizes for the long-running loop: concurrent archive_tool runs and
+# concurrent index_job processes.
+DEFAULT_CRAWL_CONCURRENCY = 1
+DEFAULT_INDEX_CONCURRENCY = 1
+
 # Disk headroom threshold: skip crawl if disk usage exceeds this percentage
 DISK_HEADROOM_THRESHOLD_PERCENT = 85
 DISK_HEADROOM_CHECK_PATH = "/srv/healtharchive/jobs"
@@ -215,61 +252,129 @@ def _tier_annual_job_if_needed(job: ArchiveJob) -> None:
         raise
 
 
-def _select_next_crawl_job(session: Session, *, now_utc: datetime) -> Optional[ArchiveJob]:
+CRAWL_CLAIM_STATUSES = ("queued", "retryable")
+INDEX_CLAIM_STATUSES = ("completed",)
+
+
+def _crawl_candidates(
+    session: Session,
+    *,
+    now_utc: datetime,
+    exclude_ids: Collection[int] = (),
+) -> Query[ArchiveJob]:
     """
-    Select the next job that needs a crawl phase.
+    Ordered query of jobs that need a crawl phase.
 
     To avoid alert storms and tight retry loops when infrastructure is unhealthy
     (e.g. Errno 107 stale SSHFS mountpoints), we temporarily skip jobs that most
     recently ended in crawler_status=infra_error.
+
+    ``exclude_ids`` lets the lane scheduler skip jobs it has already handed to a
+    crawl slot but whose status has not flipped to ``running`` yet.
     """
     infra_error_cutoff = now_utc - timedelta(minutes=INFRA_ERROR_RETRY_COOLDOWN_MINUTES)
-    return (
+    query = (
         session.query(ArchiveJob)
         .join(Source)
         .filter(
-            ArchiveJob.status.in_(["queued", "retryable"]),
+            ArchiveJob.status.in_(CRAWL_CLAIM_STATUSES),
             or_(
                 ArchiveJob.crawler_status.is_(None),
                 ArchiveJob.crawler_status != "infra_error",
                 ArchiveJob.updated_at <= infra_error_cutoff,
             ),
         )
-        .order_by(ArchiveJob.queued_at.asc().nullsfirst(), ArchiveJob.created_at.asc())
-        .first()
     )
+    if exclude_ids:
+        query = query.filter(ArchiveJob.id.notin_(list(exclude_ids)))
+    return query.order_by(ArchiveJob.queued_at.asc().nullsfirst(), ArchiveJob.created_at.asc())
 
 
-def _process_single_job() -> bool:
+def _index_candidates(session: Session, *, exclude_ids: Collection[int] = ()) -> Query[ArchiveJob]:
     """
-    Attempt to process a single job.
+    Ordered query of jobs whose crawl completed and which still need indexing.
 
-    Returns:
-        True if a job was processed (crawl and/or index), False if no work was found.
+    Jobs are indexed in the order their crawls finished.
     """
-    job_id: Optional[int] = None
+    query = (
+        session.query(ArchiveJob).join(Source).filter(ArchiveJob.status.in_(INDEX_CLAIM_STATUSES))
+    )
+    if exclude_ids:
+        query = query.filter(ArchiveJob.id.notin_(list(exclude_ids)))
+    return query.order_by(ArchiveJob.finished_at.asc().nullsfirst(), ArchiveJob.id.asc())
 
-    # Pre-flight: check disk headroom before selecting a job.
-    # This prevents starting crawls when disk is already under pressure.
-    has_headroom, disk_percent = _check_disk_headroom()
-    if not has_headroom:
-        logger.warning(
-            "Disk usage at %d%% exceeds threshold (%d%%); skipping crawl to prevent disk-full failures.",
-            disk_percent,
-            DISK_HEADROOM_THRESHOLD_PERCENT,
-        )
-        return False
 
-    # Select a job that needs crawling.
+def _select_next_crawl_job(
+    session: Session,
+    *,
+    now_utc: datetime,
+    exclude_ids: Collection[int] = (),
+) -> Optional[ArchiveJob]:
+    """
+    Return the next job that needs a crawl phase (without claiming it).
+    """
+    return (
+        _crawl_candidates(session, now_utc=now_utc, exclude_ids=exclude_ids)
+        .filter(unclaimed_filter(now_utc))
+        .first()
+    )
+
+
+def _select_next_index_job(
+    session: Session,
+    *,
+    exclude_ids: Collection[int] = (),
+) -> Optional[ArchiveJob]:
+    """
+    Return the next job waiting for indexing (without claiming it).
+    """
+    now_utc = datetime.now(timezone.utc)
+    return (
+        _index_candidates(session, exclude_ids=exclude_ids)
+        .filter(unclaimed_filter(now_utc))
+        .first()
+    )
+
+
+def _log_disk_headroom_skip(disk_percent: int) -> None:
+    logger.warning(
+        "Disk usage at %d%% exceeds threshold (%d%%); skipping crawl to prevent disk-full failures.",
+        disk_percent,
+        DISK_HEADROOM_THRESHOLD_PERCENT,
+    )
+
+
+def _claim_crawl_job(
+    *,
+    disk_percent: int,
+    exclude_ids: Collection[int] = (),
+    worker_id: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Claim the next crawlable job and prepare it (auto-tiering) for a crawl slot.
+
+    Returns:
+        The job id, or None if no job needs crawling.
+    """
+    worker_id = worker_id or get_worker_id()
     now_utc = datetime.now(timezone.utc)
     with get_session() as session:
-        job = _select_next_crawl_job(session, now_utc=now_utc)
+        job = claim_next_job(
+            session,
+            _crawl_candidates(session, now_utc=now_utc, exclude_ids=exclude_ids),
+            statuses=CRAWL_CLAIM_STATUSES,
+            worker_id=worker_id,
+            now_utc=now_utc,
+        )
         if job is None:
-            return False
+            return None
+        # Publish the claim before the (possibly slow) tiering step.
+        session.commit()
         job_id = job.id
         source = job.source
         logger.info(
-            "Worker picked job %s for source %s (%s) with status %s and retry_count %s (disk: %d%%)",
+            "Worker %s claimed job %s for source %s (%s) with status %s and retry_count %s (disk: %d%%)",
+            worker_id,
             job_id,
             source.code if source else "unknown",
             source.name if source else "unknown",
@@ -279,8 +384,73 @@ def _process_single_job() -> bool:
         )
 
         # Auto-tier annual jobs to storagebox before crawl starts (prevents disk pressure)
-        _tier_annual_job_if_needed(job)
+        try:
+            _tier_annual_job_if_needed(job)
+        except Exception:
+            session.rollback()
+            release_job_claim(job_id, worker_id=worker_id)
+            raise
+
+    return job_id
+
+
+def _claim_index_job(
+    *,
+    exclude_ids: Collection[int] = (),
+    worker_id: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Claim the next job waiting for indexing.
 
+    Returns:
+        The job id, or None if no job is waiting.
+    """
+    worker_id = worker_id or get_worker_id()
+    now_utc = datetime.now(timezone.utc)
+    with get_session() as session:
+        job = claim_next_job(
+            session,
+            _index_candidates(session, exclude_ids=exclude_ids),
+            statuses=INDEX_CLAIM_STATUSES,
+            worker_id=worker_id,
+            now_utc=now_utc,
+        )
+        if job is None:
+            return None
+        logger.info(
+            "Worker %s claimed job %s for indexing (source %s).",
+            worker_id,
+            job.id,
+            job.source.code if job.source else "unknown",
+        )
+        return job.id
+
+
+def _run_crawl_phase(
+    job_id: int, worker_id: Optional[str] = None, *, keep_claim: bool = False
+) -> bool:
+    """
+    Run the crawl phase for a claimed job and apply the worker's retry semantics.
+
+    The job's lease is renewed while the crawl runs and released afterwards,
+    unless ``keep_claim`` is set and the crawl succeeded: the caller then
+    indexes the job under the same claim (see ``_run_index_phase``).
+
+    Returns:
+        True if the crawl succeeded and the job is ready for indexing.
+    """
+    worker_id = worker_id or get_worker_id()
+    crawled = False
+    try:
+        with LeaseHeartbeat(job_id, worker_id=worker_id):
+            crawled = _crawl_and_apply_retry_semantics(job_id)
+        return crawled
+    finally:
+        if not (keep_claim and crawled):
+            release_job_claim(job_id, worker_id=worker_id)
+
+
+def _crawl_and_apply_retry_semantics(job_id: int) -> bool:
     # Run the crawl phase using the existing helper, which manages its own sessions.
     try:
         crawl_rc = run_persistent_job(job_id)
@@ -297,14 +467,14 @@ def _process_single_job() -> bool:
                 if job.started_at is None:
                     job.started_at = datetime.now(timezone.utc)
                 job.finished_at = None
-        return True
+        return False
 
     # Post-crawl handling: update retry semantics.
     with get_session() as session:
         job = session.get(ArchiveJob, job_id)
         if job is None:
             logger.error("Job %s vanished from database after crawl.", job_id)
-            return True
+            return False
 
         if job.crawler_status == "infra_error":
             if job.status != "retryable":
@@ -315,7 +485,7 @@ def _process_single_job() -> bool:
                 crawl_rc,
                 job.retry_count,
             )
-            return True
+            return False
 
         if job.crawler_status == "infra_error_config":
             logger.error(
@@ -324,7 +494,7 @@ def _process_single_job() -> bool:
                 crawl_rc,
                 job.status,
             )
-            return True
+            return False
 
         if crawl_rc != 0 or job.status == "failed":
             # Crawl failed; decide whether to mark as retryable.
@@ -344,44 +514,338 @@ def _process_single_job() -> bool:
                     crawl_rc,
                     job.status,
                 )
-            return True
+            return False
 
         # If we reach here, crawl succeeded and job.status should be 'completed'.
-        logger.info("Crawl for job %s completed successfully; starting indexing.", job_id)
+        logger.info("Crawl for job %s completed successfully; ready for indexing.", job_id)
+    return True
+
+
+def _run_index_phase(job_id: int, worker_id: Optional[str] = None) -> int:
+    """
+    Index a claimed job while holding its per-job lock and renewing its lease.
 
-    # Run indexing phase.
-    index_rc = index_job(job_id)
+    The lock keeps a second worker lane (or an operator running ``run-db-job``)
+    on this host from touching the same job; the lease does the same across hosts.
+    """
+    worker_id = worker_id or get_worker_id()
+    try:
+        with _job_lock(job_id), LeaseHeartbeat(job_id, worker_id=worker_id):
+            index_rc = index_job(job_id)
+    except JobAlreadyRunningError as exc:
+        logger.warning(
+            "Job %s lock is held at %s; skipping indexing for now.", job_id, exc.lock_path
+        )
+        return INDEX_PHASE_LOCK_HELD_RC
+    finally:
+        release_job_claim(job_id, worker_id=worker_id)
     if index_rc != 0:
         logger.error("Indexing for job %s failed with RC=%s.", job_id, index_rc)
     else:
         logger.info("Indexing for job %s completed successfully.", job_id)
+    return index_rc
+
+
+def _process_single_job() -> bool:
+    """
+    Attempt to process a single job inline (crawl, then index).
+
+    Used by ``run_worker_loop(run_once=True)``; the long-running loop schedules
+    the same phases through :class:`WorkerLanes` instead.
+
+    Returns:
+        True if a job was processed (crawl and/or index), False if no work was found.
+    """
+    # Pre-flight: check disk headroom before selecting a job.
+    # This prevents starting crawls when disk is already under pressure.
+    has_headroom, disk_percent = _check_disk_headroom()
+    if not has_headroom:
+        _log_disk_headroom_skip(disk_percent)
+        return False
 
+    job_id = _claim_crawl_job(disk_percent=disk_percent)
+    if job_id is None:
+        return False
+
+    # Keep the claim from the crawl through indexing so no other worker's
+    # index lane can pick the freshly completed job in between.
+    if _run_crawl_phase(job_id, keep_claim=True):
+        _run_index_phase(job_id)
     return True
 
 
-def run_worker_loop(poll_interval: int = DEFAULT_POLL_INTERVAL, run_once: bool = False) -> None:
+def _index_process_initializer() -> None:
+    """
+    Prepare an index-lane subprocess.
+
+    Shutdown signals are handled by the parent worker, which drains in-flight
+    indexing instead of letting SIGTERM/SIGINT kill a half-written job.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    from ha_backend.logging_config import configure_logging
+
+    configure_logging()
+
+
+class WorkerLanes:
+    """
+    Schedule crawl and index phases on independent, bounded lanes.
+
+    - The crawl lane runs up to ``crawl_concurrency`` archive_tool runs (threads
+      that wait on the crawler subprocess) for queued/retryable jobs.
+    - The index lane runs up to ``index_concurrency`` ``index_job`` calls for
+      jobs in status ``completed``; by default each one runs in its own process
+      so HTML parsing does not compete with the scheduler for the GIL.
+
+    Both lanes use the same disk-headroom gate before admitting work. Jobs are
+    claimed atomically in the database (``ha_backend.job_claims``) so several
+    workers can share one queue, and every phase also holds the job's ``fcntl``
+    lock from ``jobs._job_lock``.
+    """
+
+    def __init__(
+        self,
+        *,
+        crawl_concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+        index_concurrency: int = DEFAULT_INDEX_CONCURRENCY,
+        index_in_subprocess: bool = True,
+    ) -> None:
+        if crawl_concurrency < 0 or index_concurrency < 0:
+            raise ValueError("Lane concurrency must be >= 0.")
+        if crawl_concurrency == 0 and index_concurrency == 0:
+            raise ValueError("At least one worker lane must be enabled.")
+        self.crawl_concurrency = int(crawl_concurrency)
+        self.index_concurrency = int(index_concurrency)
+        self.worker_id = get_worker_id()
+
+        self._stop = threading.Event()
+        # Set by finished phases, stop requests and job wake-ups (see notify()).
+        self._wake = threading.Event()
+        self._crawl_inflight: dict[Future, int] = {}
+        self._index_inflight: dict[Future, int] = {}
+        # Index jobs whose lock was held elsewhere -> monotonic time to retry.
+        self._index_cooldown: dict[int, float] = {}
+
+        self._crawl_pool: Executor | None = None
+        if self.crawl_concurrency:
+            self._crawl_pool = ThreadPoolExecutor(
+                max_workers=self.crawl_concurrency, thread_name_prefix="ha-crawl"
+            )
+        self._index_pool: Executor | None = None
+        if self.index_concurrency:
+            if index_in_subprocess:
+                self._index_pool = ProcessPoolExecutor(
+                    max_workers=self.index_concurrency,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_index_process_initializer,
+                )
+            else:
+                self._index_pool = ThreadPoolExecutor(
+                    max_workers=self.index_concurrency, thread_name_prefix="ha-index"
+                )
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop.is_set()
+
+    def request_stop(self) -> None:
+        """
+        Stop admitting new work; in-flight phases keep running until drained.
+        """
+        if not self._stop.is_set():
+            logger.info(
+                "Worker shutdown requested; draining %d crawl(s) and %d index run(s).",
+                len(self._crawl_inflight),
+                len(self._index_inflight),
+            )
+        self._stop.set()
+        self._wake.set()
+
+    def notify(self) -> None:
+        """
+        Wake the scheduler early (e.g. a job was queued or finished crawling).
+        """
+        self._wake.set()
+
+    def inflight(self) -> dict[str, list[int]]:
+        return {
+            "crawl": sorted(self._crawl_inflight.values()),
+            "index": sorted(self._index_inflight.values()),
+        }
+
+    def _reap(self) -> int:
+        finished = 0
+        for lane, inflight in (("crawl", self._crawl_inflight), ("index", self._index_inflight)):
+            for fut in [f for f in inflight if f.done()]:
+                job_id = inflight.pop(fut)
+                finished += 1
+                exc = fut.exception()
+                if exc is not None:
+                    logger.error("Worker %s lane failed for job %s: %s", lane, job_id, exc)
+                elif lane == "index" and fut.result() == INDEX_PHASE_LOCK_HELD_RC:
+                    self._index_cooldown[job_id] = (
+                        time.monotonic() + LOCKED_JOB_RETRY_COOLDOWN_SECONDS
+                    )
+        return finished
+
+    def fill(self) -> int:
+        """
+        Reap finished phases and admit new work into lanes with free slots.
+
+        Returns:
+            Number of phases submitted.
+        """
+        self._reap()
+        if self._stop.is_set():
+            return 0
+        crawl_free = self.crawl_concurrency - len(self._crawl_inflight)
+        index_free = self.index_concurrency - len(self._index_inflight)
+        if crawl_free <= 0 and index_free <= 0:
+            return 0
+
+        has_headroom, disk_percent = _check_disk_headroom()
+        if not has_headroom:
+            _log_disk_headroom_skip(disk_percent)
+            return 0
+
+        now = time.monotonic()
+        for locked_id, retry_at in list(self._index_cooldown.items()):
+            if retry_at <= now:
+                del self._index_cooldown[locked_id]
+
+        submitted = 0
+        while self._index_pool is not None and index_free > 0:
+            job_id = _claim_index_job(
+                exclude_ids=set(self._index_inflight.values()) | set(self._index_cooldown),
+                worker_id=self.worker_id,
+            )
+            if job_id is None:
+                break
+            fut = self._index_pool.submit(_run_index_phase, job_id, self.worker_id)
+            self._index_inflight[fut] = job_id
+            fut.add_done_callback(self._on_phase_done)
+            index_free -= 1
+            submitted += 1
+
+        while self._crawl_pool is not None and crawl_free > 0:
+            exclude = set(self._crawl_inflight.values()) | set(self._index_inflight.values())
+            job_id = _claim_crawl_job(
+                disk_percent=disk_percent, exclude_ids=exclude, worker_id=self.worker_id
+            )
+            if job_id is None:
+                break
+            fut = self._crawl_pool.submit(_run_crawl_phase, job_id, self.worker_id)
+            self._crawl_inflight[fut] = job_id
+            fut.add_done_callback(self._on_phase_done)
+            crawl_free -= 1
+            submitted += 1
+
+        return submitted
+
+    def _on_phase_done(self, fut: Future) -> None:
+        self._wake.set()
+
+    def wait(self, timeout: float) -> None:
+        """
+        Block until a phase finishes, a wake-up arrives, stop is requested, or timeout.
+        """
+        if self._stop.is_set():
+            return
+        self._wake.wait(max(0.0, timeout))
+        self._wake.clear()
+
+    def run(self, *, poll_interval: float) -> None:
+        """
+        Run the scheduler until :meth:`request_stop` is called, then drain.
+        """
+        try:
+            while not self._stop.is_set():
+                submitted = 0
+                try:
+                    submitted = self.fill()
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.error("Unexpected error in worker iteration: %s", exc)
+                if submitted == 0 and not (self._crawl_inflight or self._index_inflight):
+                    logger.info("No queued jobs found; sleeping for %s seconds.", poll_interval)
+                self.wait(poll_interval if submitted == 0 else 0)
+        finally:
+            self.drain()
+
+    def drain(self) -> None:
+        """
+        Wait for in-flight crawl and index phases, then release the lane pools.
+        """
+        self._stop.set()
+        for pool in (self._crawl_pool, self._index_pool):
+            if pool is not None:
+                pool.shutdown(wait=True)
+        self._reap()
+
+
+def run_worker_loop(
+    poll_interval: int = DEFAULT_POLL_INTERVAL,
+    run_once: bool = False,
+    *,
+    crawl_concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+    index_concurrency: int = DEFAULT_INDEX_CONCURRENCY,
+    wakeups: bool = True,
+) -> None:
     """
     Main worker loop.
 
     Args:
         poll_interval: Seconds to sleep between polls when no work is found.
-        run_once: If True, perform a single iteration and return.
+        run_once: If True, process a single job inline (crawl, then index) and return.
+        crawl_concurrency: Maximum concurrent archive_tool runs.
+        index_concurrency: Maximum concurrent ``index_job`` processes.
+        wakeups: Listen for job status changes (``ha_backend.job_events``) and
+            fall back to polling only every ``WAKEUP_SAFETY_POLL_SECONDS``.
     """
-    logger.info("Worker starting (poll_interval=%s, run_once=%s).", poll_interval, run_once)
+    logger.info(
+        "Worker starting (poll_interval=%s, run_once=%s, crawl_concurrency=%s, index_concurrency=%s).",
+        poll_interval,
+        run_once,
+        crawl_concurrency,
+        index_concurrency,
+    )
 
-    try:
-        while True:
-            processed = False
-            try:
-                processed = _process_single_job()
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.error("Unexpected error in worker iteration: %s", exc)
-
-            if run_once:
-                break
+    if run_once:
+        try:
+            _process_single_job()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error("Unexpected error in worker iteration: %s", exc)
+        return
+
+    lanes = WorkerLanes(crawl_concurrency=crawl_concurrency, index_concurrency=index_concurrency)
+
+    listener: JobEventListener | None = None
+    idle_interval: float = poll_interval
+    if wakeups:
+        listener = JobEventListener(lanes.notify)
+        if listener.start():
+            idle_interval = max(poll_interval, WAKEUP_SAFETY_POLL_SECONDS)
+        else:
+            listener = None
+            logger.warning("Job wake-ups unavailable; polling every %s seconds.", poll_interval)
 
-            if not processed:
-                logger.info("No queued jobs found; sleeping for %s seconds.", poll_interval)
-                time.sleep(poll_interval)
+    def _handle_shutdown(signum, frame) -> None:  # pragma: no cover - signal wiring
+        lanes.request_stop()
+        # A second signal falls through to the default handler (hard stop).
+        signal.signal(signum, signal.SIG_DFL)
+
+    previous_handlers = {}
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous_handlers[signum] = signal.signal(signum, _handle_shutdown)
+
+    try:
+        lanes.run(poll_interval=idle_interval)
     except KeyboardInterrupt:  # pragma: no cover - manual interruption
         logger.info("Worker interrupted by user; shutting down.")
+    finally:
+        if listener is not None:
+            listener.stop()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+    logger.info("Worker stopped.")
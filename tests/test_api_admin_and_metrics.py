@@ -213,6 +213,9 @@ def test_metrics_content_includes_basic_counters(tmp_path, monkeypatch) -> None:
     assert "healtharchive_jobs_pages_failed_total" in body
     assert "healtharchive_jobs_warc_bytes_total" in body
     assert "healtharchive_jobs_storage_scanned_total" in body
+    assert 'healtharchive_db_pool_size{pool="primary"}' in body
+    assert 'healtharchive_db_pool_utilization_ratio{pool="primary"}' in body
+    assert 'healtharchive_db_pool_checkout_wait_seconds_count{pool="primary"}' in body
 
 
 def test_metrics_include_cleanup_status_labels(tmp_path, monkeypatch) -> None:
@@ -7,7 +7,7 @@ from fastapi.testclient import TestClient
 
 from ha_backend import db as db_module
 from ha_backend.db import Base, get_engine, get_session
-from ha_backend.models import ArchiveJob, Snapshot, SnapshotChange, Source
+from ha_backend.models import ArchiveJob, Page, Snapshot, SnapshotChange, Source
 
 
 def _init_test_app(tmp_path: Path, monkeypatch) -> TestClient:
@@ -151,6 +151,117 @@ def test_changes_feed_and_compare(tmp_path, monkeypatch) -> None:
     assert timeline_body["snapshots"][1]["compareFromSnapshotId"] == ids["snap_a"]
 
 
+def test_timeline_pages_with_cursor_and_refreshes_on_new_capture(tmp_path, monkeypatch) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    ids = _seed_change_data()
+
+    first = client.get(f"/api/snapshots/{ids['snap_a']}/timeline?limit=1")
+    assert first.status_code == 200
+    first_body = first.json()
+    assert [s["snapshotId"] for s in first_body["snapshots"]] == [ids["snap_a"]]
+    assert first_body["snapshots"][0]["jobName"] == "hc-20250101"
+    assert first_body["nextCursor"]
+
+    second = client.get(
+        f"/api/snapshots/{ids['snap_a']}/timeline",
+        params={"limit": 1, "cursor": first_body["nextCursor"]},
+    )
+    assert second.status_code == 200
+    second_body = second.json()
+    assert [s["snapshotId"] for s in second_body["snapshots"]] == [ids["snap_b"]]
+    assert second_body["snapshots"][0]["compareFromSnapshotId"] == ids["snap_a"]
+    assert second_body["nextCursor"] is None
+
+    bad = client.get(f"/api/snapshots/{ids['snap_a']}/timeline", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 422
+
+    assert len(client.get(f"/api/snapshots/{ids['snap_a']}/timeline").json()["snapshots"]) == 2
+    with get_session() as session:
+        session.add(
+            Snapshot(
+                job_id=ids["job_id"],
+                source_id=ids["source_id"],
+                url="https://www.canada.ca/en/health-canada/covid19.html",
+                normalized_url_group="https://www.canada.ca/en/health-canada/covid19.html",
+                capture_timestamp=datetime(2025, 7, 1, 12, 0, tzinfo=timezone.utc),
+                mime_type="text/html",
+                status_code=200,
+                title="COVID-19 guidance (summer)",
+                warc_path="/warcs/hc-covid-c.warc.gz",
+                warc_record_id="hc-covid-c",
+            )
+        )
+    # The cached timeline is keyed on the group's data version.
+    refreshed = client.get(f"/api/snapshots/{ids['snap_a']}/timeline").json()
+    assert [s["title"] for s in refreshed["snapshots"]][-1] == "COVID-19 guidance (summer)"
+
+
+def test_timeline_cache_is_keyed_on_the_pages_row_and_group_changes(tmp_path, monkeypatch) -> None:
+    from ha_backend.pages import rebuild_pages
+
+    client = _init_test_app(tmp_path, monkeypatch)
+    ids = _seed_change_data()
+    with get_session() as session:
+        rebuild_pages(session)
+    url = f"/api/snapshots/{ids['snap_a']}/timeline"
+
+    def _titles() -> list[str]:
+        return [s["title"] for s in client.get(url).json()["snapshots"]]
+
+    def _set_title(title: str) -> None:
+        with get_session() as session:
+            session.query(Snapshot).filter(Snapshot.id == ids["snap_b"]).update({"title": title})
+
+    assert _titles() == ["COVID-19 guidance", "COVID-19 guidance (updated)"]
+    paged = client.get(url, params={"limit": 1}).json()
+    assert [s["snapshotId"] for s in paged["snapshots"]] == [ids["snap_a"]]
+
+    # Hit: nothing the version tracks changed, so the cached response is served.
+    _set_title("Renamed in place")
+    assert _titles()[-1] == "COVID-19 guidance (updated)"
+
+    # Miss only for change events in the group, not for other groups' events.
+    def _add_new_page_event(snapshot_id: int, group: str) -> None:
+        with get_session() as session:
+            session.add(
+                SnapshotChange(
+                    source_id=ids["source_id"],
+                    normalized_url_group=group,
+                    to_snapshot_id=snapshot_id,
+                    to_job_id=ids["job_id"],
+                    to_capture_timestamp=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+                    change_type="new_page",
+                    computed_by="test",
+                )
+            )
+
+    with get_session() as session:
+        other = Snapshot(
+            job_id=ids["job_id"],
+            source_id=ids["source_id"],
+            url="https://www.canada.ca/en/other.html",
+            normalized_url_group="https://www.canada.ca/en/other.html",
+            capture_timestamp=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+            mime_type="text/html",
+            warc_path="/warcs/other.warc.gz",
+            warc_record_id="other",
+        )
+        session.add(other)
+        session.flush()
+        other_id = other.id
+    _add_new_page_event(other_id, "https://www.canada.ca/en/other.html")
+    assert _titles()[-1] == "COVID-19 guidance (updated)"
+    _add_new_page_event(ids["snap_a"], "https://www.canada.ca/en/health-canada/covid19.html")
+    assert _titles()[-1] == "Renamed in place"
+
+    # Miss: rebuilding the group's pages row bumps the version.
+    _set_title("Renamed again")
+    assert _titles()[-1] == "Renamed in place"
+    with get_session() as session:
+        session.query(Page).one().snapshot_count += 1
+    assert _titles()[-1] == "Renamed again"
+
+
 def test_changes_rss_escapes_xml(tmp_path, monkeypatch) -> None:
     monkeypatch.setenv("HEALTHARCHIVE_CHANGE_TRACKING_ENABLED", "1")
     client = _init_test_app(tmp_path, monkeypatch)
@@ -127,7 +127,7 @@ def test_compare_live_success(tmp_path, monkeypatch) -> None:
         mime_type="text/html; charset=utf-8",
     )
 
-    def _fake_fetch_live_html(*_args, **_kwargs):
+    async def _fake_fetch_live_html(*_args, **_kwargs):
         return LiveFetchResult(
             requested_url="https://example.org/page",
             final_url="https://example.org/page",
@@ -138,7 +138,7 @@ def test_compare_live_success(tmp_path, monkeypatch) -> None:
             html="<html><main><h1>Title</h1><p>New text</p></main></html>",
         )
 
-    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html", _fake_fetch_live_html)
+    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html_async", _fake_fetch_live_html)
 
     resp = client.get(f"/api/snapshots/{snapshot_id}/compare-live")
     assert resp.status_code == 200
@@ -172,7 +172,7 @@ def test_compare_live_full_mode_includes_page_chrome(tmp_path, monkeypatch) -> N
         mime_type="text/html; charset=utf-8",
     )
 
-    def _fake_fetch_live_html(*_args, **_kwargs):
+    async def _fake_fetch_live_html(*_args, **_kwargs):
         return LiveFetchResult(
             requested_url="https://example.org/page",
             final_url="https://example.org/page",
@@ -183,7 +183,7 @@ def test_compare_live_full_mode_includes_page_chrome(tmp_path, monkeypatch) -> N
             html="<html><body><header>Banner</header><main><h1>Title</h1><p>New text</p></main></body></html>",
         )
 
-    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html", _fake_fetch_live_html)
+    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html_async", _fake_fetch_live_html)
 
     resp = client.get(f"/api/snapshots/{snapshot_id}/compare-live", params={"mode": "full"})
     assert resp.status_code == 200
@@ -206,7 +206,7 @@ def test_compare_live_falls_back_to_full_page_when_main_is_empty(tmp_path, monke
         mime_type="text/html; charset=utf-8",
     )
 
-    def _fake_fetch_live_html(*_args, **_kwargs):
+    async def _fake_fetch_live_html(*_args, **_kwargs):
         return LiveFetchResult(
             requested_url="https://example.org/page",
             final_url="https://example.org/page",
@@ -217,7 +217,7 @@ def test_compare_live_falls_back_to_full_page_when_main_is_empty(tmp_path, monke
             html="<html><body><header><h1>Title</h1><p>New text</p></header></body></html>",
         )
 
-    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html", _fake_fetch_live_html)
+    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html_async", _fake_fetch_live_html)
 
     resp = client.get(f"/api/snapshots/{snapshot_id}/compare-live")
     assert resp.status_code == 200
@@ -240,10 +240,10 @@ def test_compare_live_live_not_html_maps_to_422(tmp_path, monkeypatch) -> None:
         html="<html><body>Old</body></html>",
     )
 
-    def _fake_fetch_live_html(*_args, **_kwargs):
+    async def _fake_fetch_live_html(*_args, **_kwargs):
         raise LiveFetchNotHtml("Live URL is not HTML.")
 
-    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html", _fake_fetch_live_html)
+    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html_async", _fake_fetch_live_html)
 
     resp = client.get(f"/api/snapshots/{snapshot_id}/compare-live")
     assert resp.status_code == 422
@@ -259,10 +259,10 @@ def test_compare_live_blocked_maps_to_400(tmp_path, monkeypatch) -> None:
         html="<html><body>Old</body></html>",
     )
 
-    def _fake_fetch_live_html(*_args, **_kwargs):
+    async def _fake_fetch_live_html(*_args, **_kwargs):
         raise LiveFetchBlocked("Live fetch blocked by safety rules.")
 
-    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html", _fake_fetch_live_html)
+    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html_async", _fake_fetch_live_html)
 
     resp = client.get(f"/api/snapshots/{snapshot_id}/compare-live")
     assert resp.status_code == 400
@@ -273,12 +273,14 @@ def test_compare_live_archived_too_large_maps_to_413(tmp_path, monkeypatch) -> N
     monkeypatch.setenv("HEALTHARCHIVE_COMPARE_LIVE_MAX_ARCHIVE_BYTES", "100000")
     client = _init_test_app(tmp_path, monkeypatch)
 
-    def _should_not_fetch_live(*_args, **_kwargs):
+    async def _should_not_fetch_live(*_args, **_kwargs):
         raise AssertionError(
-            "fetch_live_html should not be called when archived HTML exceeds limit"
+            "fetch_live_html_async should not be called when archived HTML exceeds limit"
         )
 
-    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html", _should_not_fetch_live)
+    monkeypatch.setattr(
+        "ha_backend.api.routes_public.fetch_live_html_async", _should_not_fetch_live
+    )
 
     snapshot_id = _seed_snapshot_with_warc(
         tmp_path,
@@ -288,3 +290,34 @@ def test_compare_live_archived_too_large_maps_to_413(tmp_path, monkeypatch) -> N
 
     resp = client.get(f"/api/snapshots/{snapshot_id}/compare-live")
     assert resp.status_code == 413
+
+
+def test_compare_live_releases_db_connection_during_fetch(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HEALTHARCHIVE_COMPARE_LIVE_ENABLED", "1")
+    client = _init_test_app(tmp_path, monkeypatch)
+
+    snapshot_id = _seed_snapshot_with_warc(
+        tmp_path,
+        url="https://example.org/page",
+        html="<html><main><h1>Title</h1><p>Old text</p></main></html>",
+    )
+    checked_out: list[int] = []
+
+    async def _fake_fetch_live_html(*_args, **_kwargs):
+        checked_out.append(get_engine().pool.checkedout())
+        return LiveFetchResult(
+            requested_url="https://example.org/page",
+            final_url="https://example.org/page",
+            status_code=200,
+            content_type="text/html",
+            bytes_read=10,
+            fetched_at=datetime(2025, 12, 25, 12, 0, tzinfo=timezone.utc),
+            html="<html><main><h1>Title</h1><p>New text</p></main></html>",
+        )
+
+    monkeypatch.setattr("ha_backend.api.routes_public.fetch_live_html_async", _fake_fetch_live_html)
+
+    resp = client.get(f"/api/snapshots/{snapshot_id}/compare-live")
+    assert resp.status_code == 200
+    assert resp.json()["archivedSnapshot"]["title"] == "Test Page"
+    assert checked_out == [0]
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ha_backend import db as db_module
+from ha_backend.api.cursors import (
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_order_by,
+)
+from ha_backend.db import Base, get_engine, get_session
+from ha_backend.models import ArchiveJob, Snapshot, SnapshotChange, Source
+
+
+def _init_test_app(tmp_path: Path, monkeypatch) -> TestClient:
+    db_path = tmp_path / "api_cursor.db"
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{db_path}")
+
+    db_module._engine = None
+    db_module._SessionLocal = None
+
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    from ha_backend.api import app
+
+    return TestClient(app)
+
+
+def _seed(n: int = 23) -> int:
+    """
+    Seed ``n`` snapshots (with timestamp ties and mixed statuses) plus changes.
+    """
+    with get_session() as session:
+        hc = Source(code="hc", name="Health Canada", enabled=True)
+        session.add(hc)
+        session.flush()
+        job = ArchiveJob(source_id=hc.id, name="hc-1", output_dir="/tmp/hc-1", status="indexed")
+        session.add(job)
+        session.flush()
+
+        base = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        snaps = []
+        for i in range(n):
+            snap = Snapshot(
+                job_id=job.id,
+                source_id=hc.id,
+                url=f"https://www.canada.ca/en/page-{i % 9}.html?v={i}",
+                normalized_url_group=f"https://www.canada.ca/en/page-{i % 9}.html",
+                # Every three snapshots share a timestamp so the id tie-break matters.
+                capture_timestamp=base + timedelta(days=i // 3),
+                mime_type="text/html",
+                status_code=(404 if i % 7 == 0 else 301 if i % 5 == 0 else 200),
+                title=("COVID-19 guidance" if i % 2 else f"Covid page {i}"),
+                snippet="covid text" if i % 3 else "other text",
+                language="en",
+                warc_path="/warcs/x.warc.gz",
+            )
+            snaps.append(snap)
+        session.add_all(snaps)
+        session.flush()
+
+        for i, snap in enumerate(snaps[:7]):
+            session.add(
+                SnapshotChange(
+                    source_id=hc.id,
+                    normalized_url_group=snap.normalized_url_group,
+                    to_snapshot_id=snap.id,
+                    to_job_id=job.id,
+                    to_capture_timestamp=None if i == 3 else snap.capture_timestamp,
+                    change_type="updated",
+                    computed_by="test",
+                )
+            )
+        return job.id
+
+
+def _walk(client: TestClient, path: str, params: dict, key: str = "results") -> list[dict]:
+    seen: list[dict] = []
+    cursor = None
+    for _ in range(50):
+        resp = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        seen.extend(body[key])
+        cursor = body["nextCursor"]
+        if cursor is None:
+            return seen
+    raise AssertionError("cursor walk did not terminate")
+
+
+def _offset_all(client: TestClient, path: str, params: dict) -> list[dict]:
+    resp = client.get(path, params={**params, "page": 1, "pageSize": 100})
+    assert resp.status_code == 200, resp.text
+    return resp.json()["results"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"includeNon2xx": "true"},
+        {"q": "covid", "includeNon2xx": "true"},
+        {"q": "covid", "view": "pages"},
+        {"view": "pages", "includeNon2xx": "true"},
+        {"q": "guidance OR url:page-3", "includeDuplicates": "true"},
+    ],
+)
+def test_search_cursor_walk_matches_offset_order(tmp_path, monkeypatch, params) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    _seed()
+
+    expected = [r["id"] for r in _offset_all(client, "/api/search", params)]
+    walked = [r["id"] for r in _walk(client, "/api/search", {**params, "pageSize": 4})]
+
+    assert expected
+    assert walked == expected
+
+
+def test_search_offset_pages_also_return_next_cursor(tmp_path, monkeypatch) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    _seed()
+
+    first = client.get("/api/search", params={"pageSize": 3, "page": 2}).json()
+    assert first["nextCursor"]
+    following = client.get(
+        "/api/search", params={"pageSize": 3, "cursor": first["nextCursor"]}
+    ).json()
+    third_page = client.get("/api/search", params={"pageSize": 3, "page": 3}).json()
+    assert [r["id"] for r in following["results"]] == [r["id"] for r in third_page["results"]]
+
+    last = client.get("/api/search", params={"pageSize": 100}).json()
+    assert last["nextCursor"] is None
+
+
+def test_search_rejects_foreign_or_garbled_cursor(tmp_path, monkeypatch) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    _seed()
+
+    token = client.get("/api/search", params={"q": "covid", "pageSize": 2}).json()["nextCursor"]
+    assert token
+
+    resp = client.get("/api/search", params={"q": "flu", "pageSize": 2, "cursor": token})
+    assert resp.status_code == 422
+    resp = client.get("/api/search", params={"q": "covid", "cursor": "not-a-cursor"})
+    assert resp.status_code == 422
+
+
+def test_changes_cursor_walk_covers_null_timestamps(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HEALTHARCHIVE_CHANGE_TRACKING_ENABLED", "1")
+    client = _init_test_app(tmp_path, monkeypatch)
+    job_id = _seed()
+
+    walked = _walk(client, "/api/changes", {"jobId": job_id, "pageSize": 2})
+
+    assert len(walked) == 7
+    assert len({r["changeId"] for r in walked}) == 7
+    # SQLite sorts NULLs low, so under DESC they come after every dated change.
+    assert walked[-1]["toCaptureTimestamp"] is None
+    offset_rows = client.get("/api/changes", params={"jobId": job_id, "pageSize": 50}).json()
+    assert [r["changeId"] for r in walked] == [r["changeId"] for r in offset_rows["results"]]
+
+
+@pytest.mark.parametrize("nulls_high", [True, False])
+def test_nullable_key_follows_the_dialect_null_placement(tmp_path, monkeypatch, nulls_high) -> None:
+    monkeypatch.setenv("HEALTHARCHIVE_CHANGE_TRACKING_ENABLED", "1")
+    _init_test_app(tmp_path, monkeypatch)
+    job_id = _seed()
+    keys = [SortKey(SnapshotChange.to_capture_timestamp, nullable=True), SortKey(SnapshotChange.id)]
+    # The ORDER BY stays plain; emulate the dialect's NULL placement explicitly.
+    assert "NULLS" not in str(keyset_order_by(keys)[0].compile()).upper()
+    ts_order = SnapshotChange.to_capture_timestamp.desc()
+    order: list[Any] = [
+        ts_order.nulls_first() if nulls_high else ts_order.nulls_last(),
+        SnapshotChange.id.desc(),
+    ]
+
+    with get_session() as session:
+        base = session.query(SnapshotChange).filter(SnapshotChange.to_job_id == job_id)
+        expected = [c.id for c in base.order_by(*order).all()]
+        walked: list[int] = []
+        values = None
+        while True:
+            query = base
+            if values is not None:
+                query = query.filter(keyset_filter(keys, values, nulls_high=nulls_high))
+            rows = query.order_by(*order).limit(1).all()
+            if not rows:
+                break
+            walked.extend(r.id for r in rows)
+            values = [rows[-1].to_capture_timestamp, rows[-1].id]
+
+    assert walked == expected
+
+
+def test_admin_job_snapshots_next_cursor_header(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("HEALTHARCHIVE_ADMIN_TOKEN", raising=False)
+    client = _init_test_app(tmp_path, monkeypatch)
+    job_id = _seed()
+
+    ids: list[int] = []
+    params: dict = {"limit": 5}
+    while True:
+        resp = client.get(f"/api/admin/jobs/{job_id}/snapshots", params=params)
+        assert resp.status_code == 200
+        ids.extend(r["id"] for r in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 5, "cursor": cursor}
+
+    all_rows = client.get(f"/api/admin/jobs/{job_id}/snapshots", params={"limit": 500}).json()
+    assert ids == [r["id"] for r in all_rows]
+    assert len(ids) == 23
+
+
+def test_keyset_filter_round_trips_datetimes() -> None:
+    ts = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    token = encode_cursor("scope", [ts, 7, 0.25, None])
+    assert decode_cursor(token, "scope") == [ts, 7, 0.25, None]
+
+    keys = [SortKey(Snapshot.capture_timestamp), SortKey(Snapshot.id, descending=False)]
+    sql = str(keyset_filter(keys, [ts, 7]).compile())
+    assert "snapshots.capture_timestamp < " in sql
+    assert "snapshots.capture_timestamp = " in sql
+    assert "snapshots.id > " in sql
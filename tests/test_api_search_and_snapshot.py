@@ -875,6 +875,38 @@ def test_search_invalid_date_range_returns_422(tmp_path, monkeypatch) -> None:
     assert resp.json()["detail"] == "Invalid date range: 'from' must be <= 'to'."
 
 
+def test_search_lang_filters_by_snapshot_language(tmp_path, monkeypatch) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    _seed_search_data()
+    with get_session() as session:
+        hc = session.query(Source).filter(Source.code == "hc").one()
+        session.add(
+            Snapshot(
+                job_id=None,
+                source_id=hc.id,
+                url="https://www.canada.ca/fr/sante-canada/covid19.html",
+                normalized_url_group="https://www.canada.ca/fr/sante-canada/covid19.html",
+                capture_timestamp=datetime(2025, 1, 2, 12, 0, tzinfo=timezone.utc),
+                mime_type="text/html",
+                status_code=200,
+                title="COVID-19 : conseils",
+                snippet="Conseils de Santé Canada sur la COVID-19.",
+                language="fr-CA",
+                warc_path="/warcs/hc-covid-fr.warc.gz",
+                warc_record_id="hc-covid-fr",
+            )
+        )
+
+    resp = client.get("/api/search", params={"q": "covid", "lang": "fr"})
+    assert resp.status_code == 200
+    assert [r["title"] for r in resp.json()["results"]] == ["COVID-19 : conseils"]
+
+    resp = client.get("/api/search", params={"q": "covid", "lang": "en"})
+    assert [r["title"] for r in resp.json()["results"]] == ["COVID-19 guidance"]
+
+    assert client.get("/api/search", params={"lang": "de"}).status_code == 422
+
+
 def test_search_view_pages_ranking_v2_scores_best_snapshot_for_group(tmp_path, monkeypatch) -> None:
     client = _init_test_app(tmp_path, monkeypatch)
     _seed_pages_view_best_match_ranking_data()
@@ -1260,3 +1292,36 @@ def test_search_invalid_query_params(tmp_path, monkeypatch) -> None:
     # source must match slug regex.
     resp_bad_source = client.get("/api/search", params={"source": "HC!"})
     assert resp_bad_source.status_code == 422
+
+
+def test_search_statements_reuse_compiled_sql_across_queries(tmp_path, monkeypatch) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    _seed_search_data()
+
+    from ha_backend.runtime_metrics import (
+        SQL_COMPILE_CACHE_METRICS,
+        render_search_metrics_prometheus,
+    )
+
+    params = {"view": "snapshots", "ranking": "v2", "includeDuplicates": "true"}
+    resp = client.get("/api/search", params={**params, "q": "covid guidance health"})
+    assert resp.status_code == 200
+
+    with SQL_COMPILE_CACHE_METRICS.lock:
+        baseline_hit = SQL_COMPILE_CACHE_METRICS.hit
+        baseline_miss = SQL_COMPILE_CACHE_METRICS.miss
+
+    # Different terms and token count (3 -> 4) in the same ranking plan:
+    # every statement is served from the compiled cache.
+    resp = client.get("/api/search", params={**params, "q": "seasonal flu vaccine recommendations"})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [r["title"] for r in data["results"]][:1] == ["Flu recommendations"]
+
+    with SQL_COMPILE_CACHE_METRICS.lock:
+        assert SQL_COMPILE_CACHE_METRICS.miss == baseline_miss
+        assert SQL_COMPILE_CACHE_METRICS.hit > baseline_hit
+
+    metrics = "\n".join(render_search_metrics_prometheus())
+    assert 'healtharchive_search_sql_compile_cache_total{result="hit"}' in metrics
+    assert "healtharchive_search_sql_compile_cache_hit_ratio " in metrics
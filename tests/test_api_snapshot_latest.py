@@ -143,3 +143,48 @@ def test_snapshot_latest_returns_404_for_missing_snapshot(tmp_path, monkeypatch)
 
     resp = client.get("/api/snapshots/999/latest")
     assert resp.status_code == 404
+
+
+def test_snapshot_latest_reads_pointers_from_pages_table(tmp_path, monkeypatch) -> None:
+    from ha_backend.pages import rebuild_pages
+
+    client = _init_test_app(tmp_path, monkeypatch)
+    source_id = _seed_source()
+
+    url = "https://example.org/page"
+    html_id = _seed_snapshot(
+        source_id=source_id,
+        url=url,
+        normalized_url_group=url,
+        capture_timestamp=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+        mime_type="application/XHTML+xml",
+    )
+    pdf_id = _seed_snapshot(
+        source_id=source_id,
+        url=url,
+        normalized_url_group=url,
+        capture_timestamp=datetime(2025, 2, 1, 12, 0, tzinfo=timezone.utc),
+        mime_type="application/pdf",
+    )
+    with get_session() as session:
+        rebuild_pages(session)
+
+    # A capture indexed after the rebuild is not visible through the pages
+    # pointers, which shows the lookup did not scan snapshots.
+    _seed_snapshot(
+        source_id=source_id,
+        url=url,
+        normalized_url_group=url,
+        capture_timestamp=datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc),
+        mime_type="text/html",
+    )
+
+    body = client.get(f"/api/snapshots/{pdf_id}/latest").json()
+    assert body["snapshotId"] == html_id
+    assert body["mimeType"] == "application/XHTML+xml"
+    body = client.get(f"/api/snapshots/{html_id}/latest", params={"requireHtml": "0"}).json()
+    assert body["snapshotId"] == pdf_id
+
+    monkeypatch.setenv("HA_PAGES_FASTPATH", "0")
+    body = client.get(f"/api/snapshots/{pdf_id}/latest").json()
+    assert body["snapshotId"] not in (html_id, pdf_id)
@@ -6,7 +6,7 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 
 from ha_backend import db as db_module
-from ha_backend.db import Base, get_engine, get_session
+from ha_backend.db import Base, get_engine, get_read_engine, get_read_session, get_session
 from ha_backend.models import UsageMetric
 from ha_backend.usage_metrics import (
     EVENT_CHANGES_LIST,
@@ -91,3 +91,31 @@ def test_usage_metrics_records_private_events_without_leaking(tmp_path, monkeypa
     assert body["totals"]["snapshotDetailViews"] == 0
     assert body["totals"]["rawSnapshotViews"] == 0
     assert body["totals"]["reportSubmissions"] == 0
+
+
+def test_usage_events_from_replica_reads_are_written_to_primary(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HEALTHARCHIVE_USAGE_METRICS_ENABLED", "1")
+    client = _init_test_app(tmp_path, monkeypatch)
+
+    replica_path = tmp_path / "api_usage_metrics_replica.db"
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_REPLICA_URL", f"sqlite:///{replica_path}")
+    monkeypatch.setattr(db_module, "_read_engine", None)
+    monkeypatch.setattr(db_module, "_read_engine_url", None)
+    monkeypatch.setattr(db_module, "_ReadSessionLocal", None)
+    replica = get_read_engine()
+    assert replica is not get_engine()
+    Base.metadata.create_all(replica)
+
+    resp = client.get("/api/changes")
+    assert resp.status_code == 200
+
+    today = datetime.now(timezone.utc).date()
+    with get_session() as session:
+        rows = session.query(UsageMetric).filter(UsageMetric.metric_date == today).all()
+        primary_counts = {row.event: int(row.count or 0) for row in rows}
+    with get_read_session() as session:
+        assert session.info.get("read_only") is True
+        replica_count = session.query(UsageMetric).count()
+
+    assert primary_counts == {EVENT_CHANGES_LIST: 1}
+    assert replica_count == 0
@@ -9,12 +9,15 @@ Verifies:
 """
 
 import errno
+import hashlib
 import json
 import os
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from ha_backend import archive_storage as storage
 from ha_backend.archive_storage import (
     PROVENANCE_DIRNAME,
     STABLE_WARCS_DIRNAME,
@@ -334,3 +337,91 @@ def test_storage_stats_handles_missing_directory(tmp_path):
 
     assert stats.tmp_bytes_total == 0
     assert stats.tmp_non_warc_bytes_total == 0
+
+
+def test_hash_files_reuses_cache_and_hashes_hardlinks_once(tmp_path: Path, monkeypatch) -> None:
+    a = tmp_path / "a.warc.gz"
+    a.write_bytes(b"alpha" * 1000)
+    b = tmp_path / "b.warc.gz"
+    b.write_bytes(b"beta")
+    a_link = tmp_path / "a-link.warc.gz"
+    os.link(a, a_link)
+
+    reads: list[Path] = []
+    real_compute = storage._compute_sha256
+
+    def _counting(path: Path) -> str:
+        reads.append(path)
+        return real_compute(path)
+
+    monkeypatch.setattr(storage, "_compute_sha256", _counting)
+
+    cache = storage.WarcHashCache(tmp_path / "cache.json")
+    hashes, errors = storage.hash_files(
+        [a, b, a_link, tmp_path / "missing.warc.gz"], cache=cache, workers=2
+    )
+    cache.save()
+
+    assert hashes[a] == hashes[a_link] == hashlib.sha256(b"alpha" * 1000).hexdigest()
+    assert hashes[b] == hashlib.sha256(b"beta").hexdigest()
+    assert list(errors) == [tmp_path / "missing.warc.gz"]
+    assert len(reads) == 2  # one read per inode
+
+    reads.clear()
+    reloaded = storage.WarcHashCache(tmp_path / "cache.json")
+    again, _ = storage.hash_files([a_link, b], cache=reloaded)
+    assert again == {a_link: hashes[a], b: hashes[b]}
+    assert reads == []
+
+    # A changed file (new size/mtime) is rehashed; refresh forces a re-read.
+    b.write_bytes(b"beta-changed")
+    again, _ = storage.hash_files([b], cache=reloaded)
+    assert again[b] == hashlib.sha256(b"beta-changed").hexdigest()
+    storage.hash_files([a], cache=reloaded, refresh=True)
+    assert reads == [b, a]
+
+
+def test_consolidate_warcs_reuses_cached_hash_for_hardlinks(tmp_path: Path, monkeypatch) -> None:
+    src_dir = tmp_path / "crawl_tmps" / "job_tmp"
+    src_dir.mkdir(parents=True)
+    warc = src_dir / "test.warc.gz"
+    warc.write_bytes(b"warc_data")
+    output_dir = tmp_path / "job_out"
+
+    consolidate_warcs(output_dir=output_dir, source_warc_paths=[warc])
+    assert storage.get_job_warc_hash_cache_path(output_dir).is_file()
+
+    reads: list[Path] = []
+    real_compute = storage._compute_sha256
+
+    def _counting(path: Path) -> str:
+        reads.append(path)
+        return real_compute(path)
+
+    monkeypatch.setattr(storage, "_compute_sha256", _counting)
+    result = storage.verify_warc_manifest(output_dir, check_hash=True, use_hash_cache=True)
+    assert result.valid
+    assert result.entries_verified == 1
+    assert reads == []
+
+    # Without the opt-in, a hash check re-reads every WARC.
+    result = storage.verify_warc_manifest(output_dir, check_hash=True)
+    assert result.valid
+    assert len(reads) == 1
+
+
+def test_warc_hash_cache_prunes_entries_for_removed_files(tmp_path: Path) -> None:
+    kept = tmp_path / "kept.warc.gz"
+    gone = tmp_path / "gone.warc.gz"
+    kept.write_bytes(b"kept")
+    gone.write_bytes(b"gone")
+
+    cache = storage.WarcHashCache(tmp_path / "cache.json")
+    storage.hash_files([kept, gone], cache=cache)
+    gone.unlink()
+    assert cache.prune([kept, gone]) == 1
+    cache.save()
+
+    reloaded = storage.WarcHashCache(tmp_path / "cache.json")
+    assert reloaded.get(kept.stat()) == hashlib.sha256(b"kept").hexdigest()
+    assert reloaded.prune([kept]) == 0
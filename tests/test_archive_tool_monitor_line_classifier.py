@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+from pathlib import Path
+from queue import Queue
+from typing import Any, cast
+
+import pytest
+
+from archive_tool import monitor as monitor_module
+from archive_tool.monitor import CrawlMonitor, classify_error_text
+from archive_tool.state import CrawlState
+
+
+class _FakePopen:
+    def poll(self):
+        return None
+
+
+def _make_monitor(tmp_path: Path) -> CrawlMonitor:
+    args = argparse.Namespace(
+        enable_monitoring=True,
+        monitor_interval_seconds=30,
+        stall_timeout_minutes=30,
+        error_threshold_timeout=10,
+        error_threshold_http=10,
+    )
+    return CrawlMonitor(
+        container_id="deadbeef",
+        process_handle=cast(Any, _FakePopen()),
+        state=CrawlState(tmp_path, initial_workers=1),
+        args=args,
+        output_queue=Queue(),
+        stop_event=threading.Event(),
+    )
+
+
+def _json_line(**payload: Any) -> str:
+    return json.dumps(payload, separators=(",", ":"))
+
+
+@pytest.mark.parametrize(
+    ("texts", "expected"),
+    [
+        (("Navigation timeout of 90000 ms exceeded",), "timeout"),
+        (("navigation TIMEOUT",), "timeout"),
+        (("net::ERR_CONNECTION_RESET",), "http"),
+        (('{"status":503}',), "http"),
+        # An earlier HTTP match must not hide a later timeout match.
+        (("net::ERR_ABORTED then net::ERR_TIMED_OUT",), "timeout"),
+        (("net::ERR_FAILED", "Navigation timeout"), "timeout"),
+        (("all good",), None),
+    ],
+)
+def test_classify_error_text(texts: tuple[str, ...], expected: str | None) -> None:
+    assert classify_error_text(*texts) == expected
+
+
+def test_parse_log_line_classifies_lines(tmp_path: Path) -> None:
+    m = _make_monitor(tmp_path)
+
+    m._parse_log_line(
+        _json_line(
+            logLevel="info",
+            context="crawlStatus",
+            message="Crawl statistics",
+            details={"crawled": 5, "total": 10, "pending": 2, "failed": 0},
+        ),
+        100.0,
+    )
+    assert m.state.last_crawled_count == 5
+
+    m._parse_log_line(
+        _json_line(
+            logLevel="warn",
+            context="pageStatus",
+            message="Page Load Failed: will retry",
+            details={"msg": "net::ERR_TIMED_OUT"},
+        ),
+        101.0,
+    )
+    m._parse_log_line(
+        _json_line(logLevel="error", context="general", message="net::ERR_CONNECTION_REFUSED"),
+        102.0,
+    )
+    m._parse_log_line(_json_line(logLevel="error", context="general", message="boom"), 103.0)
+    m._parse_log_line("plain text: Navigation timeout exceeded", 104.0)
+
+    assert m.state.error_counts == {"timeout": 2, "http": 1, "other": 1}
+
+
+def test_parse_log_line_skips_info_noise_without_decoding(tmp_path: Path, monkeypatch) -> None:
+    m = _make_monitor(tmp_path)
+
+    def _fail(_line: str) -> Any:
+        raise AssertionError("info-level noise should not be decoded")
+
+    monkeypatch.setattr(monitor_module, "_json_loads", _fail)
+    m._parse_log_line(
+        _json_line(logLevel="info", context="general", message="net::ERR_ABORTED ignored"), 1.0
+    )
+    assert m.state.error_counts == {"timeout": 0, "http": 0, "other": 0}
+
+
+def test_report_throughput_persists_to_state_file(tmp_path: Path) -> None:
+    m = _make_monitor(tmp_path)
+    m._lines_since_report = 300
+    m._parse_seconds_since_report = 0.003
+
+    m._report_throughput(10.0)
+
+    data = json.loads((tmp_path / ".archive_state.json").read_text(encoding="utf-8"))
+    assert data["monitor"] == {
+        "lines_total": 300,
+        "lines_per_second": 30.0,
+        "parse_us_per_line": 10.0,
+    }
+    assert m._lines_since_report == 0
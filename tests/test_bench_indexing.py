@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from ha_backend import db as db_module
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_indexing_bench_smoke(tmp_path, monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(REPO_ROOT))
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{tmp_path / 'unused.db'}")
+    monkeypatch.setattr(db_module, "_engine", None)
+    monkeypatch.setattr(db_module, "_SessionLocal", None)
+
+    from bench.compare import compare_reports
+    from bench.indexing import run_benchmark
+    from bench.warcgen import WarcSpec
+
+    report = run_benchmark(
+        database_url=f"sqlite:///{tmp_path / 'bench.db'}",
+        work_dir=tmp_path / "job",
+        spec=WarcSpec(records=16, warcs=2, body_kb_median=2.0, links_per_page=6),
+        components=True,
+    )
+
+    warcs = report["meta"]["warcs"]
+    assert warcs["files"] == 2
+    assert warcs["htmlRecords"] + warcs["nonHtmlRecords"] == 16
+    idx = report["results"]["index_job"]
+    assert idx["records_per_s"] > 0
+    assert {"decompress", "parse", "extract", "db_write", "pages_rebuild", "signals"} <= set(
+        idx["stages"]
+    )
+    total = sum(stage["seconds"] for stage in idx["stages"].values())
+    assert abs(total - idx["seconds"]) < 0.01
+    components = report["results"]["components"]
+    assert components["iter_html_records"]["records"] == warcs["htmlRecords"]
+    assert "extract_text" in components["extract_seconds"]
+
+    lines, regressions = compare_reports(report, report, threshold=0.2, min_ms=1.0)
+    assert lines and not regressions
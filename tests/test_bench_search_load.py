@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from ha_backend import db as db_module
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_search_load_bench_smoke(tmp_path, monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(REPO_ROOT))
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{tmp_path / 'unused.db'}")
+    monkeypatch.setenv("HEALTHARCHIVE_RATE_LIMITING_ENABLED", "0")
+    monkeypatch.setattr(db_module, "_engine", None)
+    monkeypatch.setattr(db_module, "_SessionLocal", None)
+
+    from bench.compare import compare_reports
+    from bench.corpus import CorpusSpec
+    from bench.search_load import run_benchmark
+
+    report = run_benchmark(
+        database_url=f"sqlite:///{tmp_path / 'bench.db'}",
+        spec=CorpusSpec(sources=2, groups_per_source=6, captures_per_group=2),
+        reuse_corpus=False,
+        targets=["inner", "asgi"],
+        iterations=1,
+        concurrency=2,
+        max_queries=6,
+    )
+
+    corpus = report["meta"]["corpus"]
+    assert corpus["snapshots"] == 24
+    assert corpus["pages"] == 12
+    inner = report["results"]["inner"]["latency"]
+    asgi = report["results"]["asgi"]["latency"]
+    assert inner["all"]["count"] == report["meta"]["queryMixSize"]
+    assert set(asgi) == set(inner)
+    assert any(key.endswith("/pages") for key in inner)
+    assert "url/snapshots" in inner
+
+    lines, regressions = compare_reports(report, report, threshold=0.2, min_ms=1.0)
+    assert lines and not regressions
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Modules that only specific subcommands need; none may load for `--help`.
+HEAVY_MODULES = (
+    "sqlalchemy",
+    "bs4",
+    "warcio",
+    "httpx",
+    "fastapi",
+    "ha_backend.models",
+    "ha_backend.changes",
+    "ha_backend.indexing.pipeline",
+    "ha_backend.jobs",
+    "ha_backend.worker",
+)
+# Extra modules `ha-backend --help` may import beyond a bare interpreter.
+HELP_IMPORT_BUDGET = 60
+
+
+def _imported_modules(code: str, *, env: dict[str, str] | None = None) -> list[str]:
+    run_env = {**os.environ, **(env or {})}
+    run_env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(SRC_DIR), run_env.get("PYTHONPATH", "")) if p
+    )
+    result = subprocess.run(  # nosec: B603 - fixed interpreter and code
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=run_env,
+        check=False,
+    )
+    assert result.returncode in (0, 1), result.stderr[-2000:]
+    return [
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and not line.rstrip().endswith("package")
+    ]
+
+
+def test_cli_help_imports_stay_within_budget() -> None:
+    baseline = _imported_modules("pass")
+    modules = _imported_modules(
+        "from ha_backend.cli import main\ntry:\n    main(['--help'])\nexcept SystemExit:\n    pass"
+    )
+
+    assert "ha_backend.cli" in modules
+    assert not [m for m in modules if m.split(".")[0] in HEAVY_MODULES or m in HEAVY_MODULES]
+    assert len(modules) - len(baseline) <= HELP_IMPORT_BUDGET
+
+
+def test_cli_db_command_skips_indexing_and_diffing_imports(tmp_path) -> None:
+    modules = _imported_modules(
+        "from ha_backend.cli import main\nmain(['check-db'])",
+        env={"HEALTHARCHIVE_DATABASE_URL": f"sqlite:///{tmp_path / 'cli.db'}"},
+    )
+
+    assert "sqlalchemy" in modules
+    for heavy in ("bs4", "warcio", "ha_backend.changes", "ha_backend.indexing.pipeline"):
+        assert heavy not in modules
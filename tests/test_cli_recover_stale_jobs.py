@@ -109,3 +109,73 @@ def test_recover_stale_jobs_skips_when_job_lock_held(tmp_path, monkeypatch) -> N
         except OSError:
             pass
         os.close(fd)
+
+
+def test_recover_stale_jobs_includes_expired_lease(tmp_path, monkeypatch) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    monkeypatch.setenv("HEALTHARCHIVE_ARCHIVE_ROOT", str(tmp_path / "jobs"))
+    monkeypatch.setenv("HEALTHARCHIVE_JOB_LOCK_DIR", str(tmp_path / "locks"))
+
+    now = datetime.now(timezone.utc)
+    with get_session() as session:
+        seed_sources(session)
+
+    with get_session() as session:
+        expired = create_job_for_source("hc", session=session)
+        expired.status = "running"
+        expired.started_at = now - timedelta(minutes=5)
+        expired.claimed_by = "other-host:123"
+        expired.lease_expires_at = now - timedelta(minutes=1)
+
+        active = create_job_for_source("phac", session=session)
+        active.status = "running"
+        active.started_at = now - timedelta(minutes=5)
+        active.claimed_by = "other-host:456"
+        active.lease_expires_at = now + timedelta(minutes=4)
+        session.flush()
+        expired_id, active_id = int(expired.id), int(active.id)
+
+    out = _run_cli(["recover-stale-jobs", "--older-than-minutes", "60", "--apply"])
+    assert f"job_id={expired_id}" in out
+    assert "lease=expired" in out
+    assert f"job_id={active_id}" not in out
+
+    with get_session() as session:
+        recovered = session.get(ArchiveJob, expired_id)
+        assert recovered is not None
+        assert recovered.status == "retryable"
+        assert recovered.claimed_by is None
+        assert recovered.lease_expires_at is None
+
+        untouched = session.get(ArchiveJob, active_id)
+        assert untouched is not None
+        assert untouched.status == "running"
+        assert untouched.claimed_by == "other-host:456"
+
+
+def test_recover_stale_jobs_leaves_old_job_with_live_lease(tmp_path, monkeypatch) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    monkeypatch.setenv("HEALTHARCHIVE_ARCHIVE_ROOT", str(tmp_path / "jobs"))
+    monkeypatch.setenv("HEALTHARCHIVE_JOB_LOCK_DIR", str(tmp_path / "locks"))
+
+    now = datetime.now(timezone.utc)
+    with get_session() as session:
+        seed_sources(session)
+
+    with get_session() as session:
+        job = create_job_for_source("hc", session=session)
+        job.status = "running"
+        job.started_at = now - timedelta(hours=10)
+        job.claimed_by = "other-host:123"
+        job.lease_expires_at = now + timedelta(minutes=4)
+        session.flush()
+        job_id = int(job.id)
+
+    out = _run_cli(["recover-stale-jobs", "--older-than-minutes", "60", "--apply"])
+    assert "No stale running jobs found." in out
+
+    with get_session() as session:
+        untouched = session.get(ArchiveJob, job_id)
+        assert untouched is not None
+        assert untouched.status == "running"
+        assert untouched.claimed_by == "other-host:123"
@@ -178,3 +178,66 @@ def test_replay_index_job_dry_run_does_not_modify_files_or_run_docker(
 
     assert calls == []
     assert not (collections_dir / f"job-{job_id}").exists()
+
+
+def test_replay_index_job_merges_native_cdxj_shards(tmp_path, monkeypatch) -> None:
+    from io import BytesIO
+
+    from warcio.warcwriter import WARCWriter
+
+    _init_test_db(tmp_path, monkeypatch)
+    job_id, warcs = _seed_indexed_job_with_warcs(tmp_path)
+    for idx, warc in enumerate(warcs):
+        with warc.open("wb") as f:
+            writer = WARCWriter(f, gzip=True)
+            body = f"<html>{idx}</html>".encode("utf-8")
+            payload = BytesIO(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode("utf-8")
+                + body
+            )
+            writer.write_record(
+                writer.create_warc_record(
+                    uri=f"https://example.org/p{idx}",
+                    record_type="response",
+                    payload=payload,
+                    warc_headers_dict={"WARC-Date": "2025-01-01T00:00:00Z"},
+                )
+            )
+
+    collections_dir = tmp_path / "replay" / "collections"
+    calls: list[list[str]] = []
+
+    def fake_run(args_list: list[str], text: bool = True, capture_output: bool = True):
+        calls.append(list(args_list))
+        return subprocess.CompletedProcess(args_list, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(cli_module.subprocess, "run", fake_run)
+
+    parser = cli_module.build_parser()
+    args = parser.parse_args(
+        [
+            "replay-index-job",
+            "--id",
+            str(job_id),
+            "--collections-dir",
+            str(collections_dir),
+            "--warcs-host-root",
+            str(tmp_path),
+        ]
+    )
+    args.func(args)
+
+    # Only the collection init runs in the container; no full reindex.
+    assert [c[3:] for c in calls] == [["wb-manager", "init", f"job-{job_id}"]]
+
+    collection_root = collections_dir / f"job-{job_id}"
+    lines = (collection_root / "indexes" / "index.cdxj").read_text(encoding="utf-8").splitlines()
+    assert [line.split(" ", 1)[0] for line in lines] == ["org,example)/p0", "org,example)/p1"]
+    assert [json.loads(line.split(" ", 2)[2])["filename"] for line in lines] == [
+        "warc-000001.warc.gz",
+        "warc-000002.warc.gz",
+    ]
+
+    marker = json.loads((collection_root / "replay-index.meta.json").read_text(encoding="utf-8"))
+    assert marker["cdxjMode"] == "native"
@@ -243,3 +243,52 @@ def test_replay_reconcile_previews_apply_calls_generator(tmp_path, monkeypatch)
 
     assert calls == [["hc"]]
     assert "Replay indexing status" in out
+
+
+def test_replay_generate_previews_batches_into_one_renderer(tmp_path, monkeypatch) -> None:
+    import json
+    import subprocess
+
+    _init_test_db(tmp_path, monkeypatch)
+    job_id = _seed_indexed_job_with_warcs(tmp_path, source_code="hc")
+    monkeypatch.setenv("HEALTHARCHIVE_REPLAY_BASE_URL", "https://replay.example")
+    monkeypatch.setenv("HEALTHARCHIVE_REPLAY_PREVIEW_DIR", str(tmp_path / "previews"))
+
+    with get_session() as session:
+        src = session.query(Source).filter_by(code="hc").one()
+        _seed_entry_snapshot(session, job_id=job_id, source=src)
+
+    calls: list[tuple[list[str], str | None]] = []
+
+    def fake_run(args_list: list[str], input=None, text=True, capture_output=True):
+        calls.append((list(args_list), input))
+        stdout = "npm notice\n" + json.dumps({"id": "hc", "ok": True, "ms": 1234}) + "\n"
+        return subprocess.CompletedProcess(args_list, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(cli_module.subprocess, "run", fake_run)
+
+    out = _run_cli(["replay-generate-previews", "--concurrency", "3"])
+
+    assert len(calls) == 1
+    docker_cmd, manifest = calls[0]
+    assert docker_cmd[:4] == ["docker", "run", "--rm", "-i"]
+    assert "--batch --concurrency 3" in docker_cmd[-1]
+    assert manifest is not None
+    jobs = [json.loads(line) for line in manifest.splitlines()]
+    assert [j["id"] for j in jobs] == ["hc"]
+    assert jobs[0]["out"] == f"/out/source-hc-job-{job_id}.jpg"
+    assert jobs[0]["url"].endswith("#ha_nobanner=1")
+    assert (jobs[0]["width"], jobs[0]["height"]) == (1000, 540)
+    assert f"hc: generated source-hc-job-{job_id}.jpg in 1234ms" in out
+    assert "Generated: 1" in out
+
+
+def test_replay_generate_previews_rejects_zero_concurrency(tmp_path, monkeypatch, capsys) -> None:
+    import pytest
+
+    _init_test_db(tmp_path, monkeypatch)
+    monkeypatch.setenv("HEALTHARCHIVE_REPLAY_PREVIEW_DIR", str(tmp_path / "previews"))
+    with pytest.raises(SystemExit) as exc:
+        _run_cli(["replay-generate-previews", "--concurrency", "0"])
+    assert exc.value.code == 1
+    assert "--concurrency must be >= 1" in capsys.readouterr().err
@@ -13,6 +13,8 @@ from ha_backend.config import (
     get_archive_tool_config,
     get_cors_origins,
     get_database_config,
+    get_database_pool_profile,
+    get_database_role,
     get_exports_default_limit,
     get_exports_enabled,
     get_exports_max_limit,
@@ -142,3 +144,30 @@ def test_cors_origins_parses_replay_origin_without_scheme(monkeypatch) -> None:
     monkeypatch.setenv("HEALTHARCHIVE_REPLAY_BASE_URL", "replay.healtharchive.ca")
     origins = get_cors_origins()
     assert "https://replay.healtharchive.ca" in origins
+
+
+def test_database_pool_profile_per_role_overrides(monkeypatch) -> None:
+    monkeypatch.delenv("HEALTHARCHIVE_DB_ROLE", raising=False)
+    assert get_database_role() == "cli"
+    monkeypatch.setenv("HEALTHARCHIVE_DB_ROLE", "bogus")
+    assert get_database_role() == "cli"
+    monkeypatch.setenv("HEALTHARCHIVE_DB_ROLE", "API")
+    assert get_database_role() == "api"
+
+    api = get_database_pool_profile("api")
+    worker = get_database_pool_profile("worker")
+    assert api.pool_size > worker.pool_size
+    assert api.statement_timeout_ms > 0
+    assert worker.statement_timeout_ms == 0
+
+    monkeypatch.setenv("HEALTHARCHIVE_DB_API_POOL_SIZE", "25")
+    monkeypatch.setenv("HEALTHARCHIVE_DB_API_MAX_OVERFLOW", "not-a-number")
+    monkeypatch.setenv("HEALTHARCHIVE_DB_API_STATEMENT_TIMEOUT_MS", "5000")
+    monkeypatch.setenv("HEALTHARCHIVE_DB_POOL_PRE_PING", "0")
+    tuned = get_database_pool_profile("api")
+    assert tuned.pool_size == 25
+    assert tuned.max_overflow == api.max_overflow
+    assert tuned.statement_timeout_ms == 5000
+    assert tuned.pool_pre_ping is False
+    # Per-role settings do not leak into other roles.
+    assert get_database_pool_profile("worker").pool_size == worker.pool_size
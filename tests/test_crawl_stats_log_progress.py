@@ -5,9 +5,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from ha_backend.crawl_stats import (
+    LogCursor,
     count_new_crawl_phase_events_from_log_tail,
     count_resume_crawl_events_from_log_tail,
+    open_log_cursor,
     parse_crawl_log_progress,
+    read_crawl_log_progress,
 )
 
 
@@ -128,3 +131,89 @@ def test_count_new_crawl_phase_events_from_log_tail_returns_none_when_missing(
 ) -> None:
     missing = tmp_path / "missing.combined.log"
     assert count_new_crawl_phase_events_from_log_tail(missing) is None
+
+
+def _status_line(ts: str, crawled: int) -> str:
+    return json.dumps(
+        {
+            "timestamp": ts,
+            "logLevel": "info",
+            "context": "crawlStatus",
+            "message": "Crawl statistics",
+            "details": {"crawled": crawled, "total": 100, "pending": 1, "failed": 0},
+        }
+    )
+
+
+def test_log_cursor_parses_appended_bytes_incrementally(tmp_path: Path) -> None:
+    log_path = tmp_path / "archive_initial_crawl_1.combined.log"
+    state_dir = tmp_path / "cursors"
+    log_path.write_text(_status_line("2026-01-01T00:00:00Z", 10) + "\n", encoding="utf-8")
+
+    progress = read_crawl_log_progress(log_path, state_dir=state_dir)
+    assert progress is not None and progress.last_status.crawled == 10
+
+    # Append a complete line plus half of the next one (writer mid-flush).
+    second = _status_line("2026-01-01T00:01:00Z", 20)
+    third = _status_line("2026-01-01T00:02:00Z", 30)
+    phase = "--- Starting Loop Iteration: Stage 'New Crawl Phase - Attempt 2' ---"
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write(second + "\n" + phase + "\n" + third[:25])
+
+    cursor = open_log_cursor(log_path, state_dir=state_dir)
+    assert cursor is not None
+    assert [e.crawled for e in cursor.events()] == [10, 20]
+    assert cursor.new_crawl_phase_count() == 1
+
+    offset_before = cursor.offset
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write(third[25:] + "\n")
+
+    cursor = LogCursor.load(log_path, state_dir=state_dir)
+    assert cursor.offset == offset_before
+    assert cursor.update()
+    assert [e.crawled for e in cursor.events()] == [10, 20, 30]
+
+    # Same answer as a fresh tail parse of the whole log.
+    assert cursor.progress() == parse_crawl_log_progress(log_path)
+
+
+def test_log_cursor_restarts_after_rotation_and_truncation(tmp_path: Path) -> None:
+    log_path = tmp_path / "archive_resume_crawl_1.combined.log"
+    state_dir = tmp_path / "cursors"
+    log_path.write_text(
+        "\n".join(_status_line(f"2026-01-01T00:0{i}:00Z", i) for i in range(5)) + "\n",
+        encoding="utf-8",
+    )
+    progress = read_crawl_log_progress(log_path, state_dir=state_dir)
+    assert progress is not None and progress.last_status.crawled == 4
+
+    # Rotation: a new file (new inode) at the same path.
+    rotated = tmp_path / "rotated.log"
+    rotated.write_text(_status_line("2026-01-02T00:00:00Z", 50) + "\n", encoding="utf-8")
+    rotated.replace(log_path)
+    cursor = open_log_cursor(log_path, state_dir=state_dir)
+    assert cursor is not None
+    assert [e.crawled for e in cursor.events()] == [50]
+
+    # Truncation / in-place rewrite: same inode, different content.
+    log_path.write_text(_status_line("2026-01-03T00:00:00Z", 7) + "\n", encoding="utf-8")
+    cursor = open_log_cursor(log_path, state_dir=state_dir)
+    assert cursor is not None
+    assert [e.crawled for e in cursor.events()] == [7]
+
+
+def test_log_cursor_window_matches_tail_parse(tmp_path: Path) -> None:
+    log_path = tmp_path / "archive_initial_crawl_2.combined.log"
+    state_dir = tmp_path / "cursors"
+    lines = [_status_line(f"2026-01-01T{h:02d}:00:00Z", h) for h in range(24)]
+    log_path.write_text("\n".join(lines[:12]) + "\n", encoding="utf-8")
+
+    window = 4 * (len(lines[0]) + 1) + 10
+    assert open_log_cursor(log_path, max_bytes=window, state_dir=state_dir) is not None
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write("\n".join(lines[12:]) + "\n")
+
+    expected = parse_crawl_log_progress(log_path, max_bytes=window)
+    assert read_crawl_log_progress(log_path, max_bytes=window, state_dir=state_dir) == expected
+    assert expected is not None and expected.last_status.crawled == 23
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import argparse
+import shutil
+from pathlib import Path
+
+from sqlalchemy import select
+
+from ha_backend import db as db_module
+from ha_backend.db import Base, get_engine, get_session
+from ha_backend.derived_text_store import DerivedText, DerivedTextStore
+from ha_backend.diffing import normalize_html_for_diff
+from ha_backend.indexing.text_extraction import (
+    extract_outlink_groups,
+    extract_outlink_hrefs,
+    extract_text,
+    extract_title,
+    outlink_groups_from_hrefs,
+)
+from ha_backend.models import ArchiveJob, Snapshot, SnapshotOutlink, Source
+
+HTML = (
+    "<html><head><title>Flu vaccine</title></head><body><nav><a href='/en'>Home</a></nav>"
+    "<main><h1>Flu vaccine</h1><h2>Who should get it</h2><p>Everyone over six months.</p>"
+    "<p><a href='/en/flu/risks.html'>Risks</a> <a href='mailto:x@y.ca'>Mail</a>"
+    " <a href='#top'>Top</a> <a href='https://other.example.ca/a?b=1'>Other</a></p></main>"
+    "<footer>Date modified</footer></body></html>"
+)
+KEY = "ab" * 32
+
+
+def test_derived_text_matches_extraction_and_store_is_write_once(tmp_path) -> None:
+    derived = DerivedText.from_html(HTML)
+    assert derived.title == extract_title(HTML)
+    assert derived.text == extract_text(HTML)
+    assert derived.diff_document() == normalize_html_for_diff(HTML)
+    base_url = "https://www.canada.ca/en/flu.html"
+    assert outlink_groups_from_hrefs(
+        extract_outlink_hrefs(HTML), base_url=base_url
+    ) == extract_outlink_groups(HTML, base_url=base_url)
+
+    store = DerivedTextStore(tmp_path, use_zstd=False, version="v1")
+    assert store.get(KEY) is None
+    assert store.put(KEY, derived)
+    assert not store.put(KEY, DerivedText.from_html("<p>other</p>"))
+    assert store.get(KEY) == derived
+    assert store.get("../../etc/passwd") is None and not store.put("../x", derived)
+
+    # A new extraction version misses, then replaces the old entry.
+    newer = DerivedTextStore(tmp_path, use_zstd=False, version="v2")
+    assert newer.get(KEY) is None
+    assert newer.put(KEY, derived)
+    assert [p.name for p in (tmp_path / "ab").iterdir()] == [f"{KEY}.v2"]
+
+    # Undecodable entries are dropped so the next put rewrites them.
+    (tmp_path / "ab" / f"{KEY}.v2").write_bytes(b"zstd\n\x00garbage")
+    assert newer.get(KEY) is None
+    assert newer.put(KEY, derived) and newer.get(KEY) == derived
+    assert (newer.hits, newer.writes) == (1, 2)
+
+
+def _synthetic_job(tmp_path, monkeypatch, records: int = 24) -> tuple[int, Path]:
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1]))
+    from bench.warcgen import WarcSpec, write_synthetic_warcs
+
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{tmp_path / 'derived.db'}")
+    monkeypatch.setattr(db_module, "_engine", None)
+    monkeypatch.setattr(db_module, "_SessionLocal", None)
+    Base.metadata.create_all(get_engine())
+
+    out = tmp_path / "job"
+    write_synthetic_warcs(
+        out / "warcs", WarcSpec(records=records, warcs=1, body_kb_median=1.0, links_per_page=6)
+    )
+    with get_session() as session:
+        source = Source(code="hc", name="Health Canada", enabled=True)
+        session.add(source)
+        session.flush()
+        job = ArchiveJob(source_id=source.id, name="j", output_dir=str(out), status="completed")
+        session.add(job)
+        session.flush()
+        return job.id, out
+
+
+def test_backfills_and_diffs_read_store_instead_of_warcs(tmp_path, monkeypatch) -> None:
+    from ha_backend.changes import compute_change_for_snapshot_pair
+    from ha_backend.cli import cmd_backfill_outlinks, cmd_refresh_snapshot_metadata
+    from ha_backend.indexing.pipeline import index_job
+
+    job_id, out = _synthetic_job(tmp_path, monkeypatch)
+
+    def _state():
+        with get_session() as session:
+            snaps = sorted(
+                (s.url, s.capture_timestamp, s.title, s.snippet, s.content_hash)
+                for s in session.scalars(select(Snapshot)).all()
+            )
+            links = sorted(
+                session.execute(
+                    select(
+                        Snapshot.url,
+                        Snapshot.capture_timestamp,
+                        SnapshotOutlink.to_normalized_url_group,
+                    ).join(SnapshotOutlink, SnapshotOutlink.snapshot_id == Snapshot.id)
+                ).all()
+            )
+            return snaps, links
+
+    def _diff():
+        with get_session() as session:
+            a, b = session.scalars(select(Snapshot).order_by(Snapshot.id).limit(2)).all()
+            change = compute_change_for_snapshot_pair(b, a)
+            return change.change_type, change.diff_html
+
+    assert index_job(job_id) == 0
+    baseline, baseline_diff = _state(), _diff()
+    assert baseline[1] and baseline_diff[0] == "updated"
+
+    # Store enabled: the first index fills it, a re-index is served from it.
+    monkeypatch.setenv("HEALTHARCHIVE_DERIVED_TEXT_DIR", str(tmp_path / "derived"))
+    for _ in range(2):
+        assert index_job(job_id) == 0
+        assert _state() == baseline
+    assert any((tmp_path / "derived").glob("*/*"))
+
+    # Without the WARCs, backfills and diffs still reproduce the indexed values.
+    shutil.rmtree(out / "warcs")
+    with get_session() as session:
+        session.query(SnapshotOutlink).delete()
+        for snap in session.scalars(select(Snapshot)).all():
+            snap.title, snap.snippet = None, ""
+    cmd_refresh_snapshot_metadata(
+        argparse.Namespace(
+            job_id=job_id, batch_size=5, dry_run=False, limit=None, from_derived_store=True
+        )
+    )
+    cmd_backfill_outlinks(
+        argparse.Namespace(
+            job_id=job_id,
+            batch_size=5,
+            max_links_per_snapshot=200,
+            dry_run=False,
+            limit=None,
+            update_signals=False,
+        )
+    )
+    assert _state() == baseline
+    assert _diff() == baseline_diff
+
+
+def test_refresh_rederives_by_default_and_store_hits_honour_limit(tmp_path, monkeypatch) -> None:
+    from ha_backend.cli import cmd_backfill_outlinks, cmd_refresh_snapshot_metadata
+    from ha_backend.derived_text_store import get_derived_text_store
+    from ha_backend.indexing.pipeline import index_job
+
+    job_id, _ = _synthetic_job(tmp_path, monkeypatch, records=6)
+    monkeypatch.setenv("HEALTHARCHIVE_DERIVED_TEXT_DIR", str(tmp_path / "derived"))
+    assert index_job(job_id) == 0
+    store = get_derived_text_store()
+    assert store is not None
+    with get_session() as session:
+        snap = session.scalars(select(Snapshot).order_by(Snapshot.id)).first()
+        assert snap is not None
+        snap_id, content_hash, title = snap.id, snap.content_hash, snap.title
+
+    # An entry left by older extraction code under the same version.
+    stale = DerivedText.from_html("<title>Stale</title><p>old</p>")
+    assert store.put(content_hash, stale, replace=True)
+
+    def _refresh(**kwargs) -> str | None:
+        cmd_refresh_snapshot_metadata(
+            argparse.Namespace(job_id=job_id, batch_size=5, dry_run=False, limit=None, **kwargs)
+        )
+        with get_session() as session:
+            return session.get(Snapshot, snap_id).title  # type: ignore[union-attr]
+
+    assert _refresh(from_derived_store=False) == title
+    assert store.get(content_hash).title == title  # type: ignore[union-attr]
+    store.put(content_hash, stale, replace=True)
+    assert _refresh(from_derived_store=True) == "Stale"
+
+    # --limit counts store hits like WARC records.
+    cmd_backfill_outlinks(
+        argparse.Namespace(
+            job_id=job_id,
+            batch_size=5,
+            max_links_per_snapshot=200,
+            dry_run=False,
+            limit=2,
+            update_signals=False,
+        )
+    )
+    with get_session() as session:
+        linked = session.scalars(select(SnapshotOutlink.snapshot_id).distinct()).all()
+    assert 0 < len(linked) <= 2
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from warcio.archiveiterator import ArchiveIterator
+from warcio.warcwriter import WARCWriter
+
+from ha_backend.indexing.cdxj import (
+    CdxjShardBuilder,
+    build_warc_cdxj_shard,
+    ensure_job_cdxj_shards,
+    get_job_cdxj_dir,
+    merge_cdxj_shards,
+    surt_key,
+)
+from ha_backend.indexing.warc_reader import iter_html_records
+
+
+def _http_payload(body: bytes, content_type: str) -> BytesIO:
+    head = (
+        f"HTTP/1.1 200 OK\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode("utf-8")
+    return BytesIO(head + body)
+
+
+def _write_warc(warc_path: Path, records: list[tuple[str, bytes, str, str]]) -> None:
+    """records: (url, body, content_type, warc_date)"""
+    warc_path.parent.mkdir(parents=True, exist_ok=True)
+    with warc_path.open("wb") as f:
+        writer = WARCWriter(f, gzip=True)
+        for url, body, content_type, warc_date in records:
+            writer.write_record(
+                writer.create_warc_record(
+                    uri=url,
+                    record_type="request",
+                    payload=BytesIO(b"GET / HTTP/1.1\r\n\r\n"),
+                    warc_headers_dict={"WARC-Date": warc_date},
+                )
+            )
+            writer.write_record(
+                writer.create_warc_record(
+                    uri=url,
+                    record_type="response",
+                    payload=_http_payload(body, content_type),
+                    warc_headers_dict={"WARC-Date": warc_date},
+                )
+            )
+
+
+def _parse(line: str) -> tuple[str, str, dict]:
+    key, ts, payload = line.split(" ", 2)
+    return key, ts, json.loads(payload)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www.canada.ca/en/health-canada.html", "ca,canada)/en/health-canada.html"),
+        ("http://Example.COM/", "com,example)/"),
+        ("https://www2.example.com:443/A/B/", "com,example)/a/b"),
+        ("http://example.com:8080/x?b=2&a=1#frag", "com,example:8080)/x?a=1&b=2"),
+        ("https://user:pw@sub.example.org", "org,example,sub)/"),
+        ("dns:example.com", None),
+    ],
+)
+def test_surt_key(url: str, expected: str | None) -> None:
+    assert surt_key(url) == expected
+
+
+def test_build_shard_indexes_all_responses_with_offsets(tmp_path: Path) -> None:
+    warc = tmp_path / "a.warc.gz"
+    _write_warc(
+        warc,
+        [
+            ("https://example.org/z", b"<html>z</html>", "text/html", "2025-01-02T00:00:00Z"),
+            ("https://example.org/logo.png", b"\x89PNG", "image/png", "2025-01-01T00:00:00Z"),
+        ],
+    )
+    shard = tmp_path / "shard.cdxj"
+
+    assert build_warc_cdxj_shard(warc, shard) == 2
+
+    lines = shard.read_text(encoding="utf-8").splitlines()
+    parsed = [_parse(line) for line in lines]
+    assert [(k, ts) for k, ts, _ in parsed] == [
+        ("org,example)/logo.png", "20250101000000"),
+        ("org,example)/z", "20250102000000"),
+    ]
+    fields = parsed[0][2]
+    assert fields["mime"] == "image/png"
+    assert fields["status"] == "200"
+    assert "filename" not in fields
+
+    # Offset/length must point at the gzip member holding the response record.
+    with warc.open("rb") as f:
+        for _, _, fields in parsed:
+            f.seek(int(fields["offset"]))
+            member = BytesIO(f.read(int(fields["length"])))
+            record = next(iter(ArchiveIterator(member)))
+            assert record.rec_type == "response"
+            assert record.rec_headers.get_header("WARC-Target-URI") == fields["url"]
+
+
+def test_iter_html_records_observer_matches_standalone_shard(tmp_path: Path) -> None:
+    warc = tmp_path / "a.warc.gz"
+    _write_warc(
+        warc,
+        [
+            ("https://example.org/a", b"<html>a</html>", "text/html", "2025-01-01T00:00:00Z"),
+            ("https://example.org/s.css", b"body{}", "text/css", "2025-01-01T00:00:01Z"),
+        ],
+    )
+    builder = CdxjShardBuilder()
+    html_urls = [r.url for r in iter_html_records(warc, record_observer=builder.add)]
+    assert html_urls == ["https://example.org/a"]
+
+    observed = tmp_path / "observed.cdxj"
+    standalone = tmp_path / "standalone.cdxj"
+    builder.write(observed)
+    build_warc_cdxj_shard(warc, standalone)
+    assert observed.read_text(encoding="utf-8") == standalone.read_text(encoding="utf-8")
+
+
+def test_ensure_and_merge_shards_incrementally(tmp_path: Path) -> None:
+    output_dir = tmp_path / "job"
+    warc_a = output_dir / "warcs" / "a.warc.gz"
+    warc_b = output_dir / "warcs" / "b.warc.gz"
+    _write_warc(
+        warc_a,
+        [("https://example.org/b", b"<html>b</html>", "text/html", "2025-01-01T00:00:00Z")],
+    )
+
+    first = ensure_job_cdxj_shards(output_dir, [warc_a])
+    assert (first.built, first.reused, first.failed) == (1, 0, [])
+
+    _write_warc(
+        warc_b,
+        [("https://example.org/a", b"<html>a</html>", "text/html", "2025-01-01T00:00:00Z")],
+    )
+    second = ensure_job_cdxj_shards(output_dir, [warc_a, warc_b])
+    assert (second.built, second.reused) == (1, 1)
+
+    index = tmp_path / "indexes" / "index.cdxj"
+    n = merge_cdxj_shards(
+        [(shard, f"warc-{i:06d}.warc.gz") for i, (_, shard) in enumerate(second.shards, start=1)],
+        index,
+    )
+    assert n == 2
+    merged = [_parse(line) for line in index.read_text(encoding="utf-8").splitlines()]
+    assert [(k, f["filename"]) for k, _, f in merged] == [
+        ("org,example)/a", "warc-000002.warc.gz"),
+        ("org,example)/b", "warc-000001.warc.gz"),
+    ]
+
+    # Dropping a WARC prunes its shard.
+    ensure_job_cdxj_shards(output_dir, [warc_b])
+    assert len(list(get_job_cdxj_dir(output_dir).glob("*.cdxj"))) == 1
+
+
+def test_ensure_shards_reports_unreadable_warcs(tmp_path: Path) -> None:
+    bad = tmp_path / "job" / "warcs" / "bad.warc.gz"
+    bad.parent.mkdir(parents=True)
+    bad.write_bytes(b"not-a-warc")
+
+    result = ensure_job_cdxj_shards(tmp_path / "job", [bad])
+
+    assert result.shards == []
+    assert [p for p, _ in result.failed] == [bad]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+from warcio.warcwriter import WARCWriter
+
+from ha_backend.indexing import viewer as viewer_module
+from ha_backend.indexing.cdxj import ensure_job_cdxj_shards
+from ha_backend.indexing.record_lookup import CdxjMmapCache, lookup_capture
+
+
+def _write_warc(warc_path: Path, records: list[tuple[str, str, str]]) -> None:
+    """records: (url, html, warc_date)"""
+    warc_path.parent.mkdir(parents=True, exist_ok=True)
+    with warc_path.open("wb") as f:
+        writer = WARCWriter(f, gzip=True)
+        for url, html, warc_date in records:
+            body = html.encode("utf-8")
+            payload = BytesIO(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode("utf-8")
+                + body
+            )
+            writer.write_record(
+                writer.create_warc_record(
+                    uri=url,
+                    record_type="response",
+                    payload=payload,
+                    warc_headers_dict={"WARC-Date": warc_date},
+                )
+            )
+
+
+def _write_shard(path: Path, keys: list[str]) -> None:
+    lines = [
+        f'{k} 20250101000000 {{"url": "https://example.org/{i}", "length": "1", "offset": "{i}"}}'
+        for i, k in enumerate(sorted(keys))
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_mmap_cache_search_finds_all_prefix_matches(tmp_path: Path) -> None:
+    shard = tmp_path / "s.cdxj"
+    keys = [f"org,example)/p{i:03d}" for i in range(200)] + ["org,example)/p050"] * 2
+    _write_shard(shard, keys)
+    cache = CdxjMmapCache(max_open=2)
+
+    assert len(cache.search(shard, b"org,example)/p050 ")) == 3
+    assert len(cache.search(shard, b"org,example)/p000 ")) == 1
+    assert len(cache.search(shard, b"org,example)/p199 ")) == 1
+    assert cache.search(shard, b"org,example)/p05 ") == []
+    assert cache.search(shard, b"aaa ") == []
+    assert cache.search(shard, b"zzz ") == []
+
+
+def test_mmap_cache_is_bounded_by_open_budget(tmp_path: Path) -> None:
+    shards = []
+    for i in range(3):
+        shard = tmp_path / f"{i}.cdxj"
+        _write_shard(shard, ["org,example)/a"])
+        shards.append(shard)
+    cache = CdxjMmapCache(max_open=2)
+
+    for shard in shards:
+        assert cache.search(shard, b"org,example)/a ")
+    assert cache.open_count == 2
+
+    # A rewritten shard (new inode) is remapped rather than served stale.
+    replacement = tmp_path / "new.cdxj"
+    _write_shard(replacement, ["org,example)/b"])
+    replacement.replace(shards[2])
+    assert cache.search(shards[2], b"org,example)/a ") == []
+    assert cache.search(shards[2], b"org,example)/b ")
+    cache.close()
+    assert cache.open_count == 0
+
+
+def test_lookup_capture_picks_exact_url_closest_in_time(tmp_path: Path) -> None:
+    output_dir = tmp_path / "job"
+    warc = output_dir / "warcs" / "warc-000001.warc.gz"
+    _write_warc(
+        warc,
+        [
+            ("https://example.org/page", "<html>early</html>", "2025-01-01T00:00:00Z"),
+            ("https://www.example.org/page", "<html>www</html>", "2025-01-02T00:00:00Z"),
+            ("https://example.org/page", "<html>late</html>", "2025-01-03T00:00:00Z"),
+        ],
+    )
+    assert ensure_job_cdxj_shards(output_dir, [warc]).built == 1
+    cache = CdxjMmapCache(max_open=1)
+
+    near_late = datetime(2025, 1, 2, 18, tzinfo=timezone.utc)
+    capture = lookup_capture(warc, "https://example.org/page", near_late, cache=cache)
+    assert capture is not None
+    assert capture.timestamp == "20250103000000"
+
+    capture = lookup_capture(warc, "https://www.example.org/page", near_late, cache=cache)
+    assert capture is not None
+    assert capture.url == "https://www.example.org/page"
+
+    assert lookup_capture(warc, "https://example.org/missing", cache=cache) is None
+
+
+def test_find_record_for_snapshot_uses_shard_without_scanning(tmp_path: Path, monkeypatch) -> None:
+    output_dir = tmp_path / "job"
+    warc = output_dir / "warcs" / "warc-000001.warc.gz"
+    _write_warc(
+        warc,
+        [
+            ("https://example.org/a", "<html>a</html>", "2025-01-01T00:00:00Z"),
+            ("https://example.org/b", "<html>b</html>", "2025-01-01T00:00:00Z"),
+        ],
+    )
+    snapshot = cast(
+        Any,
+        SimpleNamespace(
+            warc_path=str(warc),
+            url="https://example.org/b",
+            capture_timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            warc_record_id=None,
+        ),
+    )
+
+    # Without a shard, the viewer falls back to scanning.
+    record = viewer_module.find_record_for_snapshot(snapshot)
+    assert record is not None and record.body_bytes == b"<html>b</html>"
+
+    ensure_job_cdxj_shards(output_dir, [warc])
+
+    def _no_scan(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("WARC should not be scanned when a shard exists")
+
+    monkeypatch.setattr(viewer_module, "iter_html_records", _no_scan)
+    record = viewer_module.find_record_for_snapshot(snapshot)
+    assert record is not None
+    assert record.url == "https://example.org/b"
+    assert record.body_bytes == b"<html>b</html>"
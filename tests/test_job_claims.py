@@ -0,0 +1,106 @@
+"""Tests for database job claims and leases."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from ha_backend import db as db_module
+from ha_backend.db import Base, get_engine, get_session
+from ha_backend.job_claims import (
+    claim_next_job,
+    release_job_claim,
+    renew_job_lease,
+)
+from ha_backend.models import ArchiveJob, Source
+
+
+def _init_test_db(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "job-claims.db"
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{db_path}")
+
+    db_module._engine = None
+    db_module._SessionLocal = None
+
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def _seed_queued_jobs(count: int) -> list[int]:
+    now = datetime.now(timezone.utc)
+    with get_session() as session:
+        source = Source(code="hc", name="Health Canada", enabled=True)
+        session.add(source)
+        session.flush()
+        jobs = [
+            ArchiveJob(
+                source_id=source.id,
+                name=f"claim-{i}",
+                output_dir=f"/tmp/claim-{i}",
+                status="queued",
+                queued_at=now - timedelta(minutes=count - i),
+            )
+            for i in range(count)
+        ]
+        session.add_all(jobs)
+        session.flush()
+        return [int(j.id) for j in jobs]
+
+
+def _claim(worker_id: str, *, now: datetime | None = None) -> int | None:
+    now = now or datetime.now(timezone.utc)
+    with get_session() as session:
+        candidates = (
+            session.query(ArchiveJob)
+            .filter(ArchiveJob.status.in_(["queued", "retryable"]))
+            .order_by(ArchiveJob.queued_at.asc())
+        )
+        job = claim_next_job(
+            session,
+            candidates,
+            statuses=("queued", "retryable"),
+            worker_id=worker_id,
+            now_utc=now,
+            lease_seconds=60,
+        )
+        return int(job.id) if job is not None else None
+
+
+def test_two_workers_claim_distinct_jobs(tmp_path, monkeypatch) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    first_id, second_id = _seed_queued_jobs(2)
+
+    assert _claim("worker-a") == first_id
+    assert _claim("worker-b") == second_id
+    assert _claim("worker-c") is None
+
+    with get_session() as session:
+        job = session.get(ArchiveJob, first_id)
+        assert job is not None
+        assert job.claimed_by == "worker-a"
+        assert job.claimed_at is not None
+        assert job.lease_expires_at is not None
+
+
+def test_expired_lease_is_reclaimable_and_renewal_detects_loss(tmp_path, monkeypatch) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    (job_id,) = _seed_queued_jobs(1)
+
+    assert _claim("worker-a") == job_id
+    assert renew_job_lease(job_id, worker_id="worker-a", lease_seconds=60) is True
+
+    # Before expiry nobody else can take it; after expiry worker-b can.
+    assert _claim("worker-b") is None
+    later = datetime.now(timezone.utc) + timedelta(minutes=5)
+    assert _claim("worker-b", now=later) == job_id
+
+    assert renew_job_lease(job_id, worker_id="worker-a") is False
+    assert release_job_claim(job_id, worker_id="worker-a") is False
+    assert release_job_claim(job_id, worker_id="worker-b") is True
+
+    with get_session() as session:
+        job = session.get(ArchiveJob, job_id)
+        assert job is not None
+        assert job.claimed_by is None
+        assert job.lease_expires_at is None
@@ -0,0 +1,101 @@
+"""Tests for job status wake-ups (session hooks + local wake FIFO)."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from sqlalchemy import event
+
+from ha_backend import db as db_module
+from ha_backend.db import Base, get_engine, get_session
+from ha_backend.job_events import JobEventListener, _status_wake_events, poke_local_wake
+from ha_backend.models import ArchiveJob, Source
+
+
+def _init_test_db(tmp_path: Path, monkeypatch) -> Path:
+    db_path = tmp_path / "job-events.db"
+    fifo = tmp_path / "run" / "worker-wake.fifo"
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.setenv("HEALTHARCHIVE_WORKER_WAKE_FIFO", str(fifo))
+
+    db_module._engine = None
+    db_module._SessionLocal = None
+
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    return fifo
+
+
+def _seed_source() -> int:
+    with get_session() as session:
+        source = Source(code="hc", name="Health Canada", enabled=True)
+        session.add(source)
+        session.flush()
+        return source.id
+
+
+def test_session_hook_collects_wake_statuses(monkeypatch, tmp_path) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    source_id = _seed_source()
+
+    captured: list[list[dict]] = []
+
+    def _capture(session, flush_context) -> None:
+        captured.append(_status_wake_events(session))
+
+    factory = db_module.get_session_factory()
+    event.listen(factory, "after_flush", _capture)
+    try:
+        with get_session() as session:
+            job = ArchiveJob(source_id=source_id, name="j", output_dir="/tmp/j", status="queued")
+            session.add(job)
+            session.flush()
+            job_id = job.id
+
+        with get_session() as session:
+            fetched = session.get(ArchiveJob, job_id)
+            assert fetched is not None
+            fetched.status = "running"
+            session.flush()
+            fetched.status = "completed"
+    finally:
+        event.remove(factory, "after_flush", _capture)
+
+    assert captured == [
+        [{"job_id": job_id, "status": "queued"}],
+        [],
+        [{"job_id": job_id, "status": "completed"}],
+    ]
+
+
+def test_fifo_listener_wakes_on_committed_status_change(monkeypatch, tmp_path) -> None:
+    fifo = _init_test_db(tmp_path, monkeypatch)
+    source_id = _seed_source()
+
+    # Without a listener there is no FIFO reader; pokes are a silent no-op.
+    assert poke_local_wake() is False
+
+    woke = threading.Event()
+    listener = JobEventListener(woke.set)
+    assert listener.start()
+    try:
+        assert listener.channel == f"fifo:{fifo}"
+
+        # A rolled-back change must not wake the worker.
+        with db_module.get_session_factory()() as session:
+            session.add(
+                ArchiveJob(source_id=source_id, name="r", output_dir="/tmp/r", status="queued")
+            )
+            session.flush()
+            session.rollback()
+        assert not woke.wait(0.3)
+
+        with get_session() as session:
+            session.add(
+                ArchiveJob(source_id=source_id, name="q", output_dir="/tmp/q", status="queued")
+            )
+        assert woke.wait(5)
+    finally:
+        listener.stop()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import httpx
+import pytest
+
+from ha_backend.live_compare import (
+    LiveFetchCache,
+    LiveFetchNotHtml,
+    LiveFetchResult,
+    LiveFetchTooLarge,
+    fetch_live_html_async,
+)
+
+PAGE = b"<html><main><h1>Title</h1><p>Live text</p></main></html>"
+ETAG = '"v1"'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    hits: list[tuple[str, str | None]] = []
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        _StubHandler.hits.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/old":
+            self.send_response(301)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/image":
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", "3")
+            self.end_headers()
+            self.wfile.write(b"png")
+            return
+        if self.path == "/big":
+            body = b"<html>" + b"A" * 2048 + b"</html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server() -> Iterator[str]:
+    _StubHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _fetch(url: str, *, cache: LiveFetchCache | None = None, max_bytes: int = 100_000):
+    async def run() -> LiveFetchResult:
+        async with httpx.AsyncClient() as client:
+            return await fetch_live_html_async(
+                url,
+                timeout_seconds=5,
+                max_redirects=2,
+                max_bytes=max_bytes,
+                user_agent="test",
+                client=client,
+                cache=cache,
+                validate_url=lambda u: u,
+            )
+
+    return asyncio.run(run())
+
+
+def test_fetch_live_html_async_follows_redirects(stub_server) -> None:
+    result = _fetch(f"{stub_server}/old")
+
+    assert result.requested_url == f"{stub_server}/old"
+    assert result.final_url == f"{stub_server}/page"
+    assert result.status_code == 200
+    assert "Live text" in result.html
+    assert [path for path, _ in _StubHandler.hits] == ["/old", "/page"]
+
+
+def test_fetch_live_html_async_rejects_non_html_and_oversized(stub_server) -> None:
+    with pytest.raises(LiveFetchNotHtml):
+        _fetch(f"{stub_server}/image")
+    with pytest.raises(LiveFetchTooLarge):
+        _fetch(f"{stub_server}/big", max_bytes=1024)
+
+
+def test_live_fetch_cache_serves_fresh_and_revalidates_stale(stub_server) -> None:
+    cache = LiveFetchCache(ttl_seconds=60, max_entries=8, max_bytes=1_000_000)
+
+    first = _fetch(f"{stub_server}/old", cache=cache)
+    assert len(_StubHandler.hits) == 2
+
+    # Fresh: served from cache (via the requested-URL alias) without a request.
+    again = _fetch(f"{stub_server}/old", cache=cache)
+    assert len(_StubHandler.hits) == 2
+    assert again.html == first.html
+    assert again.final_url == f"{stub_server}/page"
+
+    # Stale: one conditional GET to the final URL, answered with 304.
+    cache.ttl_seconds = 0
+    revalidated = _fetch(f"{stub_server}/old", cache=cache)
+    assert _StubHandler.hits[-1] == ("/page", ETAG)
+    assert len(_StubHandler.hits) == 3
+    assert revalidated.html == first.html
+    assert revalidated.requested_url == f"{stub_server}/old"
+    assert revalidated.fetched_at >= first.fetched_at
+
+
+def _store(cache: LiveFetchCache, name: str, *, size: int = 1) -> None:
+    cache.store(
+        LiveFetchResult(
+            requested_url=f"https://example.org/{name}?x",
+            final_url=f"https://example.org/{name}",
+            status_code=200,
+            content_type="text/html",
+            bytes_read=size,
+            fetched_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            html=name,
+        ),
+        etag=None,
+        last_modified=None,
+    )
+
+
+def test_live_fetch_cache_evicts_least_recently_used() -> None:
+    cache = LiveFetchCache(ttl_seconds=60, max_entries=1, max_bytes=1_000_000)
+    for name in ("a", "b"):
+        _store(cache, name)
+
+    assert cache.lookup("https://example.org/a?x") is None
+    entry = cache.lookup("https://example.org/b?x")
+    assert entry is not None and entry.result.html == "b"
+
+
+def test_live_fetch_cache_is_bounded_by_bytes() -> None:
+    cache = LiveFetchCache(ttl_seconds=60, max_entries=64, max_bytes=1000)
+    _store(cache, "a", size=400)
+    _store(cache, "b", size=400)
+    assert cache.lookup("https://example.org/a?x") is not None  # now most recent
+    _store(cache, "c", size=400)
+
+    assert cache.lookup("https://example.org/b?x") is None
+    assert cache.lookup("https://example.org/a?x") is not None
+    assert cache.total_bytes == 800
+
+    # Re-storing a URL replaces its size; a body over the budget is not cached.
+    _store(cache, "a", size=100)
+    _store(cache, "huge", size=1001)
+    assert cache.total_bytes == 500
+    assert cache.lookup("https://example.org/huge?x") is None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from ha_backend import ops_collector
+from ha_backend.ops_collector import CollectorSpec, OpsCollector, TickRunner
+
+
+class _FakeRunner:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, ...]] = []
+
+    def __call__(self, args, *posargs, **kwargs):
+        self.calls.append(tuple(args))
+        stdout = "active\n" if "is-active" in args else ""
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+
+def _tiering(name: str, out_dir: Path) -> CollectorSpec:
+    return CollectorSpec(
+        name,
+        "vps-tiering-metrics-textfile.py",
+        60,
+        (
+            "--out-dir",
+            str(out_dir),
+            "--out-file",
+            f"{name}.prom",
+            "--storagebox-mount",
+            str(out_dir / "missing-mount"),
+            "--manifest",
+            str(out_dir / "missing.binds"),
+        ),
+    )
+
+
+def test_tick_shares_read_only_probes_across_collectors(tmp_path) -> None:
+    runner = _FakeRunner()
+    collector = OpsCollector(
+        specs=[
+            _tiering("tiering-a", tmp_path),
+            _tiering("tiering-b", tmp_path),
+            CollectorSpec("missing", "does-not-exist.py", 60),
+            CollectorSpec("flagged", "does-not-exist.py", 60, (), tmp_path / "enabled"),
+        ],
+        out_dir=tmp_path,
+        runner=runner,
+        clock=lambda: 1_000.0,
+    )
+
+    assert collector.run_due() == ["tiering-a", "tiering-b", "missing"]
+
+    # Each distinct probe ran once; the second collector was served from the tick cache.
+    assert len(runner.calls) == len(set(runner.calls))
+    outputs = [
+        [
+            line
+            for line in (tmp_path / f"{name}.prom").read_text().splitlines()
+            if "timestamp" not in line
+        ]
+        for name in ("tiering-a", "tiering-b")
+    ]
+    assert outputs[0] == outputs[1]
+    assert (
+        'healtharchive_systemd_unit_ok{unit="healtharchive-warc-tiering.service"} 1'
+        in (tmp_path / "tiering-a.prom").read_text()
+    )
+
+    metrics = (tmp_path / "healtharchive_ops_collector.prom").read_text()
+    assert 'healtharchive_ops_collector_last_exit_code{collector="tiering-a"} 0' in metrics
+    assert 'healtharchive_ops_collector_last_exit_code{collector="missing"} 1' in metrics
+    assert 'healtharchive_ops_collector_failures_total{collector="missing"} 1' in metrics
+    assert 'healtharchive_ops_collector_enabled{collector="flagged"} 0' in metrics
+    assert 'healtharchive_ops_collector_run_duration_seconds{collector="tiering-b"}' in metrics
+    assert collector.subprocess_cache_hits > collector.subprocess_calls // 2
+
+    # Nothing is due again until the interval elapses.
+    assert collector.run_due(now=1_030.0) == []
+    assert collector.seconds_until_due(now=1_030.0) == 30.0
+
+
+def test_tick_runner_drops_cache_after_mutating_command() -> None:
+    runner = _FakeRunner()
+    tick = TickRunner(runner)
+
+    tick(["systemctl", "is-active", "x.service"], capture_output=True, text=True)
+    tick(["systemctl", "is-active", "x.service"], capture_output=True, text=True)
+    tick(["systemctl", "restart", "x.service"], check=False)
+    tick(["systemctl", "is-active", "x.service"], capture_output=True, text=True)
+    tick(["mount", "-o", "remount", "/srv"], check=False)
+
+    assert runner.calls.count(("systemctl", "is-active", "x.service")) == 2
+    assert runner.calls.count(("mount", "-o", "remount", "/srv")) == 1
+    assert (tick.calls, tick.hits) == (3, 1)
+
+
+def test_hosted_script_uses_the_runner_only_for_that_run(tmp_path) -> None:
+    runner = _FakeRunner()
+    collector = OpsCollector(specs=[_tiering("tiering", tmp_path)], out_dir=tmp_path, runner=runner)
+    collector.run_due(now=0.0)
+
+    assert runner.calls
+    assert ops_collector._HOSTED_RUNNER.get() is None
@@ -54,6 +54,7 @@ def test_metrics_emits_archive_state_counters(tmp_path, monkeypatch) -> None:
                 "container_restarts_done": 3,
                 "vpn_rotations_done": 0,
                 "temp_dirs_host_paths": ["/tmp/a", "/tmp/b"],
+                "monitor": {"lines_total": 900, "lines_per_second": 30.0, "parse_us_per_line": 4.5},
             }
         )
         + "\n",
@@ -103,6 +104,8 @@ def test_metrics_emits_archive_state_counters(tmp_path, monkeypatch) -> None:
     assert f"healtharchive_crawl_running_job_temp_dirs_count{{{labels}}} 2" in content
     assert f"healtharchive_crawl_running_job_new_crawl_phase_count{{{labels}}} 2" in content
     assert f"healtharchive_crawl_running_job_resume_crawl_count{{{labels}}} 1" in content
+    assert f"healtharchive_crawl_running_job_monitor_lines_per_second{{{labels}}} 30.00" in content
+    assert f"healtharchive_crawl_running_job_monitor_parse_us_per_line{{{labels}}} 4.50" in content
 
 
 def test_metrics_emits_indexing_pending_job_age(tmp_path, monkeypatch) -> None:
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "generate_replay_preview.js"
+
+# Minimal stand-in for the "playwright" npm package: pages "render" by writing
+# the URL to the screenshot path, and URLs containing "fail" raise.
+_FAKE_PLAYWRIGHT = """
+const fs = require("fs");
+let open = 0;
+let maxOpen = 0;
+exports.chromium = {
+  launch: async () => ({
+    newPage: async () => {
+      open += 1;
+      maxOpen = Math.max(maxOpen, open);
+      let url = null;
+      return {
+        setDefaultTimeout() {},
+        goto: async (u) => {
+          url = u;
+          await new Promise((r) => setTimeout(r, 20));
+          if (u.includes("fail")) throw new Error("navigation failed");
+        },
+        waitForTimeout: async () => {},
+        evaluate: async () => {},
+        screenshot: async (opts) => fs.writeFileSync(opts.path, `${opts.type}:${url}`),
+        close: async () => { open -= 1; },
+      };
+    },
+    close: async () => {
+      fs.writeFileSync(process.env.HA_FAKE_STATS, JSON.stringify({ maxOpen }));
+    },
+  }),
+};
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_batch_mode_renders_jobs_concurrently_and_reports_timings(tmp_path: Path) -> None:
+    module_dir = tmp_path / "node_modules" / "playwright"
+    module_dir.mkdir(parents=True)
+    (module_dir / "index.js").write_text(_FAKE_PLAYWRIGHT, encoding="utf-8")
+    stats_path = tmp_path / "stats.json"
+
+    jobs = [
+        {
+            "id": f"s{i}",
+            "url": f"https://replay.example/job-1/p{i}",
+            "out": str(tmp_path / f"{i}.jpg"),
+        }
+        for i in range(5)
+    ]
+    jobs[0]["format"] = "png"
+    jobs.append({"id": "bad", "url": "https://replay.example/fail", "out": str(tmp_path / "x.jpg")})
+    manifest = "".join(json.dumps(j) + "\n" for j in jobs)
+
+    node = shutil.which("node")
+    assert node is not None
+    result = subprocess.run(
+        [node, str(SCRIPT), "--batch", "--concurrency", "3"],
+        input=manifest,
+        text=True,
+        capture_output=True,
+        cwd=tmp_path,
+        env={"PATH": str(Path(node).parent), "HA_FAKE_STATS": str(stats_path)},
+        timeout=60,
+    )
+
+    assert result.returncode == 1, result.stderr
+    outcomes = {o["id"]: o for o in map(json.loads, result.stdout.splitlines())}
+    assert set(outcomes) == {"s0", "s1", "s2", "s3", "s4", "bad"}
+    assert all(outcomes[f"s{i}"]["ok"] for i in range(5))
+    assert all(isinstance(o["ms"], int) for o in outcomes.values())
+    assert outcomes["bad"] == {**outcomes["bad"], "ok": False, "error": "navigation failed"}
+
+    assert (tmp_path / "0.jpg").read_text() == "png:https://replay.example/job-1/p0"
+    assert (tmp_path / "1.jpg").read_text() == "jpeg:https://replay.example/job-1/p1"
+    assert json.loads(stats_path.read_text())["maxOpen"] == 3
@@ -109,3 +109,19 @@ def test_worker_auto_start_systemd_template_requires_venv() -> None:
         "/opt/healtharchive-backend/scripts/vps-worker-auto-start.py --apply"
     ) in text
     assert "--reconcile-running-drift" in text
+
+
+def test_ops_collector_reads_argv_and_flags_from_the_per_script_units() -> None:
+    from ha_backend.ops_collector import default_collectors
+
+    specs = {spec.name: spec for spec in default_collectors()}
+    assert specs["crawl-metrics"].script == "vps-crawl-metrics-textfile.py"
+    assert specs["crawl-metrics"].argv == () and specs["crawl-metrics"].enabled_flag is None
+    assert specs["storage-hotpath-auto-recover"].argv == ("--apply",)
+    assert specs["storage-hotpath-auto-recover"].enabled_flag == Path(
+        "/etc/healtharchive/storage-hotpath-auto-recover-enabled"
+    )
+    crawl = specs["crawl-auto-recover"]
+    assert crawl.interval_seconds == 300
+    assert crawl.argv[0] == "--apply" and "--ensure-min-running-jobs" in crawl.argv
+    assert crawl.enabled_flag == Path("/etc/healtharchive/crawl-auto-recover-enabled")
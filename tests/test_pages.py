@@ -17,6 +17,7 @@ from ha_backend.models import Page, Snapshot
 from ha_backend.pages import (
     _strip_query_fragment_expr,
     discover_job_page_groups,
+    merge_job_pages,
     rebuild_pages,
 )
 
@@ -111,6 +112,24 @@ def test_rebuild_pages_aggregations_and_latest_ok(db_session, snapshot_factory):
     assert page.snapshot_count == 3
     assert page.latest_snapshot_id == s3.id  # Absolute latest
     assert page.latest_ok_snapshot_id == s2.id  # Latest 2xx
+    assert page.latest_html_snapshot_id == s3.id
+
+
+def test_rebuild_pages_latest_html_skips_non_html(db_session, snapshot_factory):
+    url = "http://example.com/doc"
+    html = snapshot_factory(
+        url=url, timestamp=datetime(2025, 1, 1), mime_type="TEXT/HTML; charset=utf-8"
+    )
+    pdf = snapshot_factory(url=url, timestamp=datetime(2025, 1, 2), mime_type="application/pdf")
+    assert html.is_html is True
+    assert pdf.is_html is False
+
+    rebuild_pages(db_session)
+
+    page = db_session.scalar(select(Page).where(Page.normalized_url_group == url))
+    assert page.latest_snapshot_id == pdf.id
+    assert page.latest_html_snapshot_id == html.id
+    assert page.latest_html_capture_timestamp == datetime(2025, 1, 1)
 
 
 def test_rebuild_pages_chunking(db_session, snapshot_factory):
@@ -307,3 +326,111 @@ def test_url_normalize_lowercases_host(db_session):
     expr = _strip_query_fragment_expr(literal("http://EXAMPLE.com/Page"), "sqlite")
     res = db_session.scalar(select(expr))
     assert res == "http://example.com/page"
+
+
+def test_merge_job_pages_matches_full_rebuild(db_session, snapshot_factory):
+    """Folding a new job into existing pages gives the same rows as a full rebuild."""
+    url = "http://example.com/merge"
+    other = "http://example.com/merge-other"
+
+    snapshot_factory(url=url, timestamp=datetime(2025, 1, 2), status_code=200)
+    snapshot_factory(url=url, timestamp=datetime(2025, 1, 5), status_code=500)
+    rebuild_pages(db_session)
+
+    # The new job holds an older OK capture, a newer non-OK capture and a
+    # brand-new group.
+    older_ok = snapshot_factory(url=url, timestamp=datetime(2025, 1, 1), status_code=200)
+    newer_err = snapshot_factory(url=url, timestamp=datetime(2025, 1, 6), status_code=404)
+    fresh = snapshot_factory(url=other, timestamp=datetime(2025, 1, 3), status_code=200)
+    job_id = older_ok.job_id
+    newer_err.job_id = job_id
+    fresh.job_id = job_id
+    db_session.commit()
+
+    res = merge_job_pages(db_session, job_id=job_id)
+    assert res.upserted_groups == 2
+
+    def _rows():
+        db_session.expire_all()
+        return sorted(
+            (
+                p.normalized_url_group,
+                p.first_capture_timestamp,
+                p.last_capture_timestamp,
+                p.snapshot_count,
+                p.latest_snapshot_id,
+                p.latest_ok_snapshot_id,
+                p.latest_html_snapshot_id,
+                p.latest_html_capture_timestamp,
+            )
+            for p in db_session.scalars(select(Page)).all()
+        )
+
+    merged = _rows()
+    rebuild_pages(db_session)
+    assert merged == _rows()
+
+    page = db_session.scalar(select(Page).where(Page.normalized_url_group == url))
+    assert page.snapshot_count == 4
+    assert page.latest_snapshot_id == newer_err.id
+    assert page.latest_ok_snapshot_id != older_ok.id
+
+
+def test_index_job_incremental_pages_match_full_rebuild(tmp_path, monkeypatch):
+    """Indexing, then re-indexing, keeps merged Page rows equal to a full rebuild."""
+    from pathlib import Path
+
+    from ha_backend import db as db_module
+    from ha_backend.db import Base, get_engine, get_session
+    from ha_backend.indexing.pipeline import index_job
+    from ha_backend.models import ArchiveJob, Source
+
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1]))
+    from bench.warcgen import WarcSpec, write_synthetic_warcs
+
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{tmp_path / 'pages.db'}")
+    monkeypatch.setattr(db_module, "_engine", None)
+    monkeypatch.setattr(db_module, "_SessionLocal", None)
+    Base.metadata.create_all(get_engine())
+
+    job_ids = []
+    with get_session() as session:
+        source = Source(code="hc", name="Health Canada", enabled=True)
+        session.add(source)
+        session.flush()
+        for name in ("a", "b"):
+            out = tmp_path / name
+            # Same spec for both jobs: every page group is shared, with tied timestamps.
+            write_synthetic_warcs(
+                out / "warcs", WarcSpec(records=24, warcs=1, body_kb_median=1.0, links_per_page=2)
+            )
+            job = ArchiveJob(
+                source_id=source.id, name=name, output_dir=str(out), status="completed"
+            )
+            session.add(job)
+            session.flush()
+            job_ids.append(job.id)
+
+    def _rows():
+        with get_session() as session:
+            return sorted(
+                (
+                    p.normalized_url_group,
+                    p.first_capture_timestamp,
+                    p.last_capture_timestamp,
+                    p.snapshot_count,
+                    p.latest_snapshot_id,
+                    p.latest_ok_snapshot_id,
+                    p.latest_html_snapshot_id,
+                    p.latest_html_capture_timestamp,
+                )
+                for p in session.scalars(select(Page)).all()
+            )
+
+    for job_id in (job_ids[0], job_ids[1], job_ids[0]):
+        assert index_job(job_id) == 0
+        merged = _rows()
+        with get_session() as session:
+            rebuild_pages(session)
+        assert merged == _rows()
+    assert merged
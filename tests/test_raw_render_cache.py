@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+
+from ha_backend.raw_render_cache import RawRenderCache
+
+
+def test_raw_render_cache_replaces_old_tags_and_prunes_oldest(tmp_path) -> None:
+    cache = RawRenderCache(tmp_path, max_bytes=1_000)
+
+    cache.put(1, "a", b"x" * 100)
+    cache.put(1, "b", b"y" * 100)
+    assert cache.get(1, "a") is None
+    assert cache.get(1, "b") == b"y" * 100
+
+    for snapshot_id in range(2, 10):
+        cache.put(snapshot_id, "t", b"z" * 100)
+        path = tmp_path / f"{snapshot_id % 256:02x}" / f"{snapshot_id}-t.html"
+        os.utime(path, (snapshot_id, snapshot_id))
+    os.utime(tmp_path / "01" / "1-b.html", (100, 100))
+
+    cache.put(10, "t", b"z" * 200)
+
+    total = sum(p.stat().st_size for p in tmp_path.glob("*/*.html"))
+    assert total <= 800
+    assert cache.get(2, "t") is None
+    assert cache.get(1, "b") is not None
+    assert cache.get(10, "t") is not None
+    cache.put(11, "t", b"q" * 2_000)
+    assert cache.get(11, "t") is None
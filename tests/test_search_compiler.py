@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ha_backend.models import Snapshot
+from ha_backend.search import build_search_vector, ts_config_for_language
+from ha_backend.search_compiler import compile_query, term_to_tsquery_text
+from ha_backend.search_query import Term, parse_query
+
+# Opt-in: point at a disposable Postgres database (with pg_trgm available) to
+# run the EXPLAIN regression test, e.g.
+#   HEALTHARCHIVE_TEST_POSTGRES_URL=postgresql+psycopg://localhost/ha_explain
+_PG_URL = os.environ.get("HEALTHARCHIVE_TEST_POSTGRES_URL")
+
+
+def _pg_sql(q: str) -> str:
+    compiled = compile_query(parse_query(q), dialect_name="postgresql")
+    return str(
+        compiled.filter.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("term", "expected"),
+    [
+        (Term("Vaccines"), "'vaccines':*"),
+        (Term("covid", field="title"), "'covid':*A"),
+        (Term("covid", field="snippet"), "'covid':*B"),
+        (Term("COVID-19"), "('covid':* <-> '19':*)"),
+        (Term("long covid", is_phrase=True), "('long' <-> 'covid')"),
+        (Term("mask rules", field="title", is_phrase=True), "('mask':A <-> 'rules':A)"),
+        (Term("it's"), "('it':* <-> 's':*)"),
+        (Term("--"), None),
+    ],
+)
+def test_term_to_tsquery_text(term: Term, expected: str | None) -> None:
+    assert term_to_tsquery_text(term) == expected
+
+
+def _fts_and_fallback(sql: str) -> tuple[str, str]:
+    fts, _, fallback = sql.partition(" OR snapshots.search_vector IS NULL AND ")
+    assert fallback, sql
+    return fts, fallback
+
+
+def test_field_query_collapses_into_one_tsquery() -> None:
+    fts, _ = _fts_and_fallback(
+        _pg_sql("(title:covid OR snippet:flu) AND title:guidance NOT title:archived")
+    )
+
+    # One indexable `@@` per language partition (english, french, simple).
+    assert fts.count("@@") == 3
+    for config in ("english", "french", "simple"):
+        assert f"snapshots.search_vector @@ to_tsquery('{config}', " in fts
+    assert fts.count("((''covid'':*A | ''flu'':*B) & ''guidance'':*A & !''archived'':*A)") == 3
+    assert "coalesce(snapshots.search_vector," not in fts
+    assert "ilike" not in fts.lower()
+
+
+def test_legacy_vectors_are_matched_with_simple_query() -> None:
+    fts, _ = _fts_and_fallback(_pg_sql("title:vaccines"))
+
+    current = "coalesce(snapshots.search_vector_version, 2) = 2"
+    legacy = "coalesce(snapshots.search_vector_version, 2) != 2"
+    assert fts.count(current) == 2 and fts.count(legacy) == 2
+    english, _, rest = fts.partition("to_tsquery('english'")
+    assert current in english and legacy not in english
+    # Legacy english/french rows join the 'simple' partition.
+    simple = rest.partition("to_tsquery('french'")[2]
+    assert legacy in simple and "to_tsquery('simple'" in simple
+
+    rank = compile_query(parse_query("vaccines"), dialect_name="postgresql").rank_tsquery
+    assert rank is not None
+    rank_sql = str(
+        rank.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    assert rank_sql.count(current) == 2
+    assert "ELSE to_tsquery('simple'" in rank_sql
+
+
+def test_unprefixed_terms_also_match_url_substrings() -> None:
+    fts, _ = _fts_and_fallback(_pg_sql("covid NOT archived"))
+
+    assert fts.count("@@") == 6
+    assert "snapshots.url ILIKE '%%covid%%'" in fts
+    assert "NOT (" in fts and "snapshots.url ILIKE '%%archived%%'" in fts
+    assert "snippet ILIKE" not in fts
+
+
+def test_rows_without_search_vector_fall_back_to_raw_substring_matching() -> None:
+    _, fallback = _fts_and_fallback(_pg_sql("title:covid NOT masks"))
+
+    assert "@@" not in fallback
+    assert "coalesce(" not in fallback
+    assert "snapshots.title IS NOT NULL AND snapshots.title ILIKE '%%covid%%'" in fallback
+    assert "NOT (snapshots.title IS NOT NULL AND snapshots.title ILIKE '%%masks%%'" in fallback
+    assert "snapshots.snippet IS NOT NULL AND snapshots.snippet ILIKE '%%masks%%'" in fallback
+    assert "snapshots.url ILIKE '%%masks%%'" in fallback
+
+
+def test_url_terms_use_raw_trigram_indexed_columns() -> None:
+    sql, _ = _fts_and_fallback(_pg_sql("title:covid url:flu_shot NOT url:archive"))
+
+    assert sql.count("@@") == 3
+    assert "coalesce(snapshots.url" not in sql
+    assert "coalesce(snapshots.normalized_url_group" not in sql
+    assert "snapshots.url ILIKE '%%flu\\_shot%%'" in sql
+    assert "snapshots.normalized_url_group ILIKE '%%flu\\_shot%%'" in sql
+    assert "snapshots.normalized_url_group IS NOT NULL" in sql
+    assert "NOT (snapshots.url ILIKE '%%archive%%'" in sql
+
+
+def test_rank_tsquery_keeps_only_positive_text_terms() -> None:
+    compiled = compile_query(
+        parse_query("title:covid OR url:flu NOT masks"), dialect_name="postgresql"
+    )
+    assert compiled.rank_tsquery is not None
+    rank_sql = str(
+        compiled.rank_tsquery.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert rank_sql.startswith("CASE WHEN")
+    assert "THEN to_tsquery('english', '''covid'':*A')" in rank_sql
+    assert "THEN to_tsquery('french', '''covid'':*A')" in rank_sql
+    assert "ELSE to_tsquery('simple', '''covid'':*A') END" in rank_sql
+
+    assert compile_query(parse_query("url:flu"), dialect_name="postgresql").rank_tsquery is None
+
+
+def test_non_postgres_dialects_keep_substring_matching() -> None:
+    compiled = compile_query(parse_query("covid url:flu"), dialect_name="sqlite")
+    sql = str(compiled.filter.compile(dialect=sqlite.dialect()))
+
+    assert compiled.rank_tsquery is None
+    assert "@@" not in sql
+    assert "lower(coalesce(snapshots.title, ?)) LIKE lower(?)" in sql
+
+
+@pytest.mark.parametrize(
+    ("language", "expected"),
+    [("en", "english"), ("fr-CA", "french"), ("FR", "french"), ("und", "simple"), (None, "simple")],
+)
+def test_ts_config_for_language(language: str | None, expected: str) -> None:
+    assert ts_config_for_language(language) == expected
+
+
+def test_search_vector_uses_row_language_config() -> None:
+    def pg(expr) -> str:
+        return str(
+            expr.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        )
+
+    literal_sql = pg(build_search_vector(Snapshot.title, None, Snapshot.url, language="fr"))
+    assert "to_tsvector('french', coalesce(snapshots.title, ''))" in literal_sql
+    # URL tokens are never stemmed.
+    assert "to_tsvector('simple', coalesce(snapshots.url, ''))" in literal_sql
+
+    column_sql = pg(
+        build_search_vector(Snapshot.title, None, Snapshot.url, language=Snapshot.language)
+    )
+    assert "CAST(CASE WHEN" in column_sql
+    assert "THEN 'english' WHEN" in column_sql
+    assert "AS REGCONFIG)" in column_sql
+
+
+@pytest.mark.skipif(_PG_URL is None, reason="HEALTHARCHIVE_TEST_POSTGRES_URL is not set")
+def test_explain_uses_search_vector_and_trigram_indexes(monkeypatch) -> None:
+    assert _PG_URL is not None
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", _PG_URL)
+    subprocess.run(  # nosec: B603 - trusted local test command
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=str(Path(__file__).resolve().parents[1]),
+        env=os.environ.copy(),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    engine = create_engine(_PG_URL)
+    # Everything below runs in one transaction that is rolled back, so the
+    # database is left at the migrated-but-empty state.
+    with engine.connect() as conn, conn.begin() as trans:
+        source_id = conn.execute(
+            text(
+                "INSERT INTO sources (code, name, enabled) "
+                "VALUES ('explain', 'Explain', true) RETURNING id"
+            )
+        ).scalar_one()
+        conn.execute(
+            text(
+                """
+                INSERT INTO snapshots (
+                    source_id, url, normalized_url_group, capture_timestamp,
+                    title, snippet, warc_path
+                )
+                SELECT
+                    :source_id,
+                    'https://www.canada.ca/en/health-canada/page-' || i || '.html',
+                    'https://www.canada.ca/en/health-canada/page-' || i || '.html',
+                    now(),
+                    CASE WHEN i % 97 = 0 THEN 'COVID-19 guidance'
+                         ELSE 'Page ' || i || ' about topic ' || (i % 13) END,
+                    'Body text.',
+                    '/warcs/explain.warc.gz'
+                FROM generate_series(1, 5000) AS i
+                """
+            ),
+            {"source_id": source_id},
+        )
+        conn.execute(
+            update(Snapshot)
+            .where(Snapshot.source_id == source_id)
+            .values(
+                search_vector=build_search_vector(
+                    Snapshot.title, Snapshot.snippet, Snapshot.url, language=Snapshot.language
+                )
+            )
+        )
+        conn.exec_driver_sql("ANALYZE snapshots")
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+        def explain(q: str) -> str:
+            compiled = compile_query(parse_query(q), dialect_name="postgresql")
+            stmt = select(func.count(Snapshot.id)).where(compiled.filter)
+            sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            return "\n".join(conn.exec_driver_sql(f"EXPLAIN {sql}").scalars().all())
+
+        plan = explain("covid AND title:guidance NOT masks")
+        assert "ix_snapshots_search_vector" in plan
+
+        plan = explain("url:page-12")
+        assert "ix_snapshots_url_trgm" in plan
+        assert "ix_snapshots_normalized_url_group_trgm" in plan
+
+        trans.rollback()
+    engine.dispose()
+
+
+def test_substring_filters_execute_on_sqlite() -> None:
+    from datetime import datetime, timezone
+
+    from sqlalchemy.orm import Session
+
+    from ha_backend.db import Base
+    from ha_backend.models import Source
+    from ha_backend.search_compiler import _compile_substring, _ilike_raw
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    rows = {
+        "covid-title": ("https://x.ca/a", "COVID-19 guidance", None),
+        "covid-url": ("https://x.ca/covid/b", None, "Masks"),
+        "masks": ("https://x.ca/c", "Guidance", "Masks required"),
+        "empty": ("https://x.ca/d", None, None),
+    }
+    with Session(engine) as session:
+        source = Source(code="t", name="T", enabled=True)
+        session.add(source)
+        session.flush()
+        ids = {}
+        for name, (url, title, snippet) in rows.items():
+            snap = Snapshot(
+                source_id=source.id,
+                url=url,
+                capture_timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                title=title,
+                snippet=snippet,
+                warc_path="/w.warc.gz",
+            )
+            session.add(snap)
+            session.flush()
+            ids[snap.id] = name
+
+        def matches(predicate) -> set[str]:
+            return {ids[i] for i in session.scalars(select(Snapshot.id).where(predicate))}
+
+        for q, expected in [
+            ("covid", {"covid-title", "covid-url"}),
+            ("title:covid", {"covid-title"}),
+            ("guidance NOT masks", {"covid-title"}),
+            ("NOT title:guidance", {"covid-url", "empty"}),
+            ("url:covid OR snippet:required", {"covid-url", "masks"}),
+        ]:
+            node = parse_query(q)
+            sqlite_filter = compile_query(node, dialect_name="sqlite").filter
+            # The Postgres fallback for rows without a search_vector agrees,
+            # NULL title/snippet included.
+            assert matches(sqlite_filter) == expected, q
+            assert matches(_compile_substring(node, _ilike_raw)) == expected, q
+    engine.dispose()
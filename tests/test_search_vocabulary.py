@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from ha_backend import db as db_module
+from ha_backend.db import Base, get_engine, get_session
+from ha_backend.models import SearchVocabularyTerm, Snapshot, Source
+from ha_backend.runtime_metrics import SEARCH_METRICS
+from ha_backend.search_vocabulary import (
+    extract_title_terms,
+    rebuild_search_vocabulary,
+    suggest_query,
+    trigram_similarity,
+)
+
+
+def _init_test_app(tmp_path: Path, monkeypatch) -> TestClient:
+    db_path = tmp_path / "search_vocab.db"
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{db_path}")
+
+    db_module._engine = None
+    db_module._SessionLocal = None
+
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    from ha_backend.api import app
+
+    return TestClient(app)
+
+
+def _seed() -> None:
+    with get_session() as session:
+        hc = Source(code="hc", name="Health Canada", enabled=True)
+        session.add(hc)
+        session.flush()
+        titles = [
+            "Vaccines for children",
+            "COVID-19 vaccines and boosters",
+            "Coronavirus disease (COVID-19)",
+            "Influenza (flu) vaccine",
+        ]
+        for i, title in enumerate(titles):
+            session.add(
+                Snapshot(
+                    job_id=None,
+                    source_id=hc.id,
+                    url=f"https://www.canada.ca/en/page-{i}.html",
+                    normalized_url_group=f"https://www.canada.ca/en/page-{i}.html",
+                    capture_timestamp=datetime(2025, 1, 1 + i, tzinfo=timezone.utc),
+                    mime_type="text/html",
+                    status_code=200,
+                    title=title,
+                    snippet="Guidance.",
+                    language="en",
+                    warc_path="/warcs/x.warc.gz",
+                )
+            )
+        session.flush()
+        rebuild_search_vocabulary(session)
+
+
+def test_extract_title_terms_and_trigram_similarity() -> None:
+    assert extract_title_terms("COVID-19 vaccines and boosters") == {
+        "covid",
+        "vaccines",
+        "and",
+        "boosters",
+    }
+    assert extract_title_terms(None) == set()
+    assert trigram_similarity("vaccine", "vaccine") == 1.0
+    assert trigram_similarity("vacine", "vaccine") > 0.6
+    assert trigram_similarity("flu", "vaccine") == 0.0
+
+
+def test_rebuild_counts_document_frequency(tmp_path, monkeypatch) -> None:
+    _init_test_app(tmp_path, monkeypatch)
+    _seed()
+
+    with get_session() as session:
+        freq = dict(session.query(SearchVocabularyTerm.term, SearchVocabularyTerm.doc_freq).all())
+        assert freq["vaccines"] == 2
+        assert freq["coronavirus"] == 1
+        assert "19" not in freq
+
+        assert suggest_query(session, "coronovirus vacines") == "coronavirus vaccines"
+        assert suggest_query(session, "Vaccines") is None
+        assert suggest_query(session, "zzzzqqq") is None
+
+
+def test_search_returns_corrected_results_and_suggestion(tmp_path, monkeypatch) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    _seed()
+    before = SEARCH_METRICS.relevance_corrected
+
+    resp = client.get("/api/search", params={"q": "coronovirus"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["suggestions"] == ["coronavirus"]
+    assert [r["title"] for r in body["results"]] == ["Coronavirus disease (COVID-19)"]
+    assert SEARCH_METRICS.relevance_corrected == before + 1
+
+    body = client.get("/api/search", params={"q": "vaccines"}).json()
+    assert body["suggestions"] == []
+    assert body["total"] == 2
+
+
+def test_index_job_merges_new_job_terms_and_rebuilds_on_reindex(tmp_path, monkeypatch) -> None:
+    import ha_backend.indexing.pipeline as pipeline
+    import ha_backend.search_vocabulary as search_vocabulary
+    from ha_backend.indexing.warc_reader import ArchiveRecord
+    from ha_backend.models import ArchiveJob
+
+    _init_test_app(tmp_path, monkeypatch)
+    _seed()
+    out = tmp_path / "job"
+    (out / "warcs").mkdir(parents=True)
+    (out / "warcs" / "a.warc").write_bytes(b"WARC/1.0\r\n")
+    with get_session() as session:
+        source = session.query(Source).one()
+        job = ArchiveJob(source_id=source.id, name="j", output_dir=str(out), status="completed")
+        session.add(job)
+        session.flush()
+        job_id = job.id
+
+    def fake_records(warc_path, record_observer=None):
+        for i, title in enumerate(["Vaccines for adults", "Measles outbreak"]):
+            html = f"<html><head><title>{title}</title></head><body>x</body></html>"
+            yield ArchiveRecord(
+                url=f"https://www.canada.ca/en/new-{i}.html",
+                capture_timestamp=datetime(2025, 2, 1, tzinfo=timezone.utc),
+                mime_type="text/html",
+                headers={"Content-Type": "text/html"},
+                body_bytes=html.encode(),
+                warc_record_id=f"rec-{i}",
+                warc_path=warc_path,
+                status_code=200,
+            )
+
+    calls: list[str] = []
+    for name in ("merge_job_search_vocabulary", "rebuild_search_vocabulary"):
+        real = getattr(search_vocabulary, name)
+
+        def spy(*args, _name=name, _real=real, **kwargs):
+            calls.append(_name)
+            return _real(*args, **kwargs)
+
+        monkeypatch.setattr(search_vocabulary, name, spy)
+    monkeypatch.setattr(pipeline, "discover_warcs_for_job", lambda job: [out / "warcs" / "a.warc"])
+    monkeypatch.setattr(pipeline, "iter_html_records", fake_records)
+    monkeypatch.setattr(pipeline, "_ensure_stable_warcs_available", lambda *a: None)
+
+    def freq() -> dict[str, int]:
+        with get_session() as session:
+            return dict(session.query(SearchVocabularyTerm.term, SearchVocabularyTerm.doc_freq))
+
+    assert pipeline.index_job(job_id) == 0
+    assert calls == ["merge_job_search_vocabulary"]
+    merged = freq()
+    assert merged["vaccines"] == 3 and merged["measles"] == 1 and merged["adults"] == 1
+
+    # Re-indexing replaces the job's snapshots, so counts are recomputed.
+    assert pipeline.index_job(job_id) == 0
+    assert calls == ["merge_job_search_vocabulary", "rebuild_search_vocabulary"]
+    assert freq() == merged
@@ -146,3 +146,75 @@ def test_raw_snapshot_missing_warc_returns_404(tmp_path, monkeypatch) -> None:
     assert resp.status_code == 404
     body = resp.json()
     assert "Underlying WARC file" in body["detail"]
+
+
+def _seed_raw_snapshot(tmp_path: Path, html_body: str) -> tuple[int, Path]:
+    warc_file = tmp_path / "warcs" / "cached.warc.gz"
+    url = "https://example.org/cached"
+    record_id = _write_test_warc(warc_file, url, html_body)
+
+    with get_session() as session:
+        src = Source(code="test", name="Test Source", enabled=True)
+        session.add(src)
+        session.flush()
+        snap = Snapshot(
+            job_id=None,
+            source_id=src.id,
+            url=url,
+            normalized_url_group=url,
+            capture_timestamp=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+            mime_type="text/html",
+            status_code=200,
+            title="Cached Page",
+            language="en",
+            warc_path=str(warc_file),
+            warc_record_id=record_id,
+            content_hash="abc123",
+        )
+        session.add(snap)
+        session.flush()
+        return int(snap.id), warc_file
+
+
+def test_raw_snapshot_etag_short_circuits_before_warc_io(tmp_path, monkeypatch) -> None:
+    client = _init_test_app(tmp_path, monkeypatch)
+    snapshot_id, warc_file = _seed_raw_snapshot(
+        tmp_path, '<html><head><title>x</title></head><body class="x"><h1>Café</h1></body></html>'
+    )
+
+    resp = client.get(f"/api/snapshots/raw/{snapshot_id}")
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    assert etag.startswith('"raw-')
+    assert "max-age=86400" in resp.headers["cache-control"]
+    # Banner is spliced right after <body ...>; the archived bytes are untouched.
+    assert resp.text.index('<body class="x">') < resp.text.index('id="ha-replay-banner"')
+    assert resp.text.index('id="ha-replay-banner"') < resp.text.index("<h1>Café</h1>")
+
+    warc_file.unlink()
+    not_modified = client.get(
+        f"/api/snapshots/raw/{snapshot_id}", headers={"If-None-Match": f'W/"other", {etag}'}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+    missing = client.get(f"/api/snapshots/raw/{snapshot_id}", headers={"If-None-Match": '"old"'})
+    assert missing.status_code == 404
+
+
+def test_raw_snapshot_render_cache_serves_without_warc(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HEALTHARCHIVE_RAW_RENDER_CACHE_DIR", str(tmp_path / "render-cache"))
+    client = _init_test_app(tmp_path, monkeypatch)
+    snapshot_id, warc_file = _seed_raw_snapshot(
+        tmp_path, "<html><body><p>Cached body</p></body></html>"
+    )
+
+    first = client.get(f"/api/snapshots/raw/{snapshot_id}")
+    assert first.status_code == 200
+    assert list((tmp_path / "render-cache").glob(f"*/{snapshot_id}-raw-*.html"))
+
+    warc_file.unlink()
+    second = client.get(f"/api/snapshots/raw/{snapshot_id}")
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
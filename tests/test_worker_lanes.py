@@ -0,0 +1,245 @@
+"""Tests for the worker's independent crawl/index lanes."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from ha_backend import db as db_module
+from ha_backend.db import Base, get_engine, get_session
+from ha_backend.models import ArchiveJob, Source
+from ha_backend.worker.main import WorkerLanes
+
+
+def _init_test_db(tmp_path: Path, monkeypatch) -> None:
+    """Point the ORM at a throwaway SQLite database and create all tables."""
+    db_path = tmp_path / "worker-lanes.db"
+    monkeypatch.setenv("HEALTHARCHIVE_DATABASE_URL", f"sqlite:///{db_path}")
+    monkeypatch.setenv("HEALTHARCHIVE_JOB_LOCK_DIR", str(tmp_path / "locks"))
+
+    db_module._engine = None
+    db_module._SessionLocal = None
+
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def _seed_jobs(tmp_path: Path) -> tuple[int, int]:
+    with get_session() as session:
+        source = Source(code="hc", name="Health Canada", enabled=True)
+        session.add(source)
+        session.flush()
+
+        crawl_job = ArchiveJob(
+            source_id=source.id,
+            name="lane-crawl",
+            output_dir=str(tmp_path / "jobs" / "crawl"),
+            status="queued",
+        )
+        index_job = ArchiveJob(
+            source_id=source.id,
+            name="lane-index",
+            output_dir=str(tmp_path / "jobs" / "index"),
+            status="completed",
+        )
+        session.add_all([crawl_job, index_job])
+        session.flush()
+        return crawl_job.id, index_job.id
+
+
+class _MockStatVFS:
+    f_frsize = 4096
+    f_blocks = 1000000
+    f_bavail = 500000  # 50% used
+
+
+def test_index_lane_runs_while_crawl_is_in_flight(monkeypatch, tmp_path) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    monkeypatch.setattr("os.statvfs", lambda path: _MockStatVFS())
+    crawl_id, index_id = _seed_jobs(tmp_path)
+
+    release_crawl = threading.Event()
+    indexed: list[int] = []
+
+    def blocking_run_persistent_job(jid: int) -> int:
+        with get_session() as session:
+            j = session.get(ArchiveJob, jid)
+            assert j is not None
+            j.status = "running"
+        assert release_crawl.wait(timeout=10)
+        with get_session() as session:
+            j = session.get(ArchiveJob, jid)
+            assert j is not None
+            j.status = "completed"
+            j.crawler_exit_code = 0
+        return 0
+
+    def fake_index_job(jid: int) -> int:
+        indexed.append(jid)
+        with get_session() as session:
+            j = session.get(ArchiveJob, jid)
+            assert j is not None
+            j.status = "indexed"
+        return 0
+
+    monkeypatch.setattr("ha_backend.worker.main.run_persistent_job", blocking_run_persistent_job)
+    monkeypatch.setattr("ha_backend.worker.main.index_job", fake_index_job)
+
+    lanes = WorkerLanes(crawl_concurrency=1, index_concurrency=1, index_in_subprocess=False)
+    try:
+        assert lanes.fill() == 2
+        assert lanes.inflight() == {"crawl": [crawl_id], "index": [index_id]}
+
+        # The already-completed job is indexed without waiting for the crawl.
+        lanes.wait(5)
+        lanes.fill()
+        assert indexed == [index_id]
+        assert lanes.inflight()["crawl"] == [crawl_id]
+
+        # Once the crawl finishes, the index lane picks the freshly completed job.
+        release_crawl.set()
+        lanes.wait(5)
+        assert lanes.fill() == 1
+        lanes.wait(5)
+    finally:
+        release_crawl.set()
+        lanes.drain()
+
+    assert indexed == [index_id, crawl_id]
+    with get_session() as session:
+        for jid in (crawl_id, index_id):
+            job = session.get(ArchiveJob, jid)
+            assert job is not None
+            assert job.status == "indexed"
+            # Claims are released once each phase finishes.
+            assert job.claimed_by is None
+
+
+def test_lanes_skip_admission_without_disk_headroom(monkeypatch, tmp_path) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    _seed_jobs(tmp_path)
+
+    class FullStatVFS(_MockStatVFS):
+        f_bavail = 50000  # 95% used
+
+    monkeypatch.setattr("os.statvfs", lambda path: FullStatVFS())
+
+    lanes = WorkerLanes(crawl_concurrency=1, index_concurrency=1, index_in_subprocess=False)
+    try:
+        assert lanes.fill() == 0
+        assert lanes.inflight() == {"crawl": [], "index": []}
+    finally:
+        lanes.drain()
+
+
+def test_request_stop_drains_in_flight_crawl(monkeypatch, tmp_path) -> None:
+    _init_test_db(tmp_path, monkeypatch)
+    monkeypatch.setattr("os.statvfs", lambda path: _MockStatVFS())
+    crawl_id, _ = _seed_jobs(tmp_path)
+
+    started = threading.Event()
+    finished: list[int] = []
+
+    def slow_run_persistent_job(jid: int) -> int:
+        started.set()
+        threading.Event().wait(0.2)
+        with get_session() as session:
+            j = session.get(ArchiveJob, jid)
+            assert j is not None
+            j.status = "completed"
+        finished.append(jid)
+        return 0
+
+    monkeypatch.setattr("ha_backend.worker.main.run_persistent_job", slow_run_persistent_job)
+
+    lanes = WorkerLanes(crawl_concurrency=1, index_concurrency=0)
+    runner = threading.Thread(target=lanes.run, kwargs={"poll_interval": 1})
+    runner.start()
+    assert started.wait(timeout=5)
+    lanes.request_stop()
+    runner.join(timeout=10)
+
+    assert not runner.is_alive()
+    assert finished == [crawl_id]
+    assert lanes.fill() == 0
+
+
+def test_run_once_indexes_under_the_crawl_claim(monkeypatch, tmp_path, caplog) -> None:
+    from ha_backend.job_claims import get_worker_id
+    from ha_backend.worker.main import _claim_index_job, _process_single_job
+
+    _init_test_db(tmp_path, monkeypatch)
+    monkeypatch.setattr("os.statvfs", lambda path: _MockStatVFS())
+    crawl_id, index_id = _seed_jobs(tmp_path)
+    with get_session() as session:
+        other = session.get(ArchiveJob, index_id)
+        assert other is not None
+        other.status = "indexed"
+
+    def fake_run_persistent_job(jid: int) -> int:
+        with get_session() as session:
+            j = session.get(ArchiveJob, jid)
+            assert j is not None
+            j.status = "completed"
+            j.crawler_exit_code = 0
+        return 0
+
+    claims_during_index: list[object] = []
+
+    def fake_index_job(jid: int) -> int:
+        with get_session() as session:
+            j = session.get(ArchiveJob, jid)
+            assert j is not None
+            claims_during_index.append(j.claimed_by)
+        # Another worker's index lane cannot take the job mid-run.
+        claims_during_index.append(_claim_index_job(worker_id="other-worker"))
+        return 0
+
+    monkeypatch.setattr("ha_backend.worker.main.run_persistent_job", fake_run_persistent_job)
+    monkeypatch.setattr("ha_backend.worker.main.index_job", fake_index_job)
+
+    with caplog.at_level("WARNING", logger="healtharchive"):
+        assert _process_single_job() is True
+
+    assert claims_during_index == [get_worker_id(), None]
+    assert not [r for r in caplog.records if "lease" in r.getMessage().lower()]
+    with get_session() as session:
+        job = session.get(ArchiveJob, crawl_id)
+        assert job is not None
+        assert job.claimed_by is None
+
+
+def test_index_lane_cools_down_jobs_locked_elsewhere(monkeypatch, tmp_path) -> None:
+    from ha_backend.jobs import _job_lock
+
+    _init_test_db(tmp_path, monkeypatch)
+    monkeypatch.setattr("os.statvfs", lambda path: _MockStatVFS())
+    _, index_id = _seed_jobs(tmp_path)
+
+    indexed: list[int] = []
+
+    def fake_index_job(jid: int) -> int:
+        indexed.append(jid)
+        return 0
+
+    monkeypatch.setattr("ha_backend.worker.main.index_job", fake_index_job)
+
+    lanes = WorkerLanes(crawl_concurrency=0, index_concurrency=1, index_in_subprocess=False)
+    try:
+        with _job_lock(index_id):
+            assert lanes.fill() == 1
+            lanes.wait(5)
+            # The finished phase released the claim, but the lane does not
+            # re-claim the still-locked job on the next pass.
+            assert lanes.fill() == 0
+            assert lanes.inflight() == {"crawl": [], "index": []}
+        assert indexed == []
+
+        # Once the cooldown has passed the job is picked up again.
+        monkeypatch.setattr("ha_backend.worker.main.time.monotonic", lambda: float("inf"))
+        assert lanes.fill() == 1
+        lanes.wait(5)
+    finally:
+        lanes.drain()
+    assert indexed == [index_id]